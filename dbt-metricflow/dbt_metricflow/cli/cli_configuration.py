@@ -1,21 +1,27 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
 import os
 import pathlib
+import typing
 from logging.handlers import TimedRotatingFileHandler
 from typing import Dict, Optional
 
-from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
 from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
-from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
 
 from dbt_metricflow.cli import PACKAGE_NAME
 from dbt_metricflow.cli.cli_errors import LoadSemanticManifestException
-from dbt_metricflow.cli.dbt_connectors.adapter_backed_client import AdapterBackedSqlClient
-from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts, dbtProjectMetadata
-from metricflow.engine.metricflow_engine import MetricFlowEngine
-from metricflow.protocols.sql_client import SqlClient
+
+if typing.TYPE_CHECKING:
+    # The modules for dbt and the engine take seconds to import, so they're imported when first used to keep commands
+    # like `mf --help` fast.
+    from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+    from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+
+    from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts, dbtProjectMetadata
+    from metricflow.engine.metricflow_engine import MetricFlowEngine
+    from metricflow.protocols.sql_client import SqlClient
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +31,9 @@ class CLIConfiguration:
 
     DBT_PROFILES_DIR_ENV_VAR_NAME = "DBT_PROFILES_DIR"
     DBT_PROJECT_DIR_ENV_VAR_NAME = "DBT_PROJECT_DIR"
+    LINKABLE_SPEC_INDEX_SNAPSHOT_PATH_ENV_VAR_NAME = "MF_LINKABLE_SPEC_INDEX_SNAPSHOT_PATH"
+    DEFAULT_LINKABLE_SPEC_INDEX_SNAPSHOT_FILE_NAME = "metricflow_linkable_spec_index.bin"
+    DAEMON_SOCKET_PATH_ENV_VAR_NAME = "MF_DAEMON_SOCKET_PATH"
 
     def __init__(self) -> None:  # noqa: D107
         self.verbose = False
@@ -34,6 +43,8 @@ class CLIConfiguration:
         self._sql_client: Optional[SqlClient] = None
         self._semantic_manifest: Optional[SemanticManifest] = None
         self._semantic_manifest_lookup: Optional[SemanticManifestLookup] = None
+        # The modification time of the semantic manifest file when it was loaded.
+        self._semantic_manifest_mtime_ns: Optional[int] = None
         self._is_setup = False
 
     @property
@@ -81,6 +92,8 @@ class CLIConfiguration:
         if not dbt_project_yaml_path.exists():
             raise LoadSemanticManifestException(f"Missing: {str(dbt_project_yaml_path)!r}")
 
+        from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtProjectMetadata
+
         try:
             self._dbt_project_metadata = dbtProjectMetadata.load_from_paths(
                 profiles_path=dbt_profiles_path,
@@ -152,10 +165,48 @@ class CLIConfiguration:
     @property
     def dbt_artifacts(self) -> dbtArtifacts:
         """Property accessor for all dbt artifacts, used for powering the sql client (among other things)."""
+        from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
+
         if self._dbt_artifacts is None:
+            self._semantic_manifest_mtime_ns = self._get_semantic_manifest_mtime_ns()
             self._dbt_artifacts = dbtArtifacts.load_from_project_metadata(self.dbt_project_metadata)
         return self._dbt_artifacts
 
+    def _get_semantic_manifest_mtime_ns(self) -> Optional[int]:
+        from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
+
+        semantic_manifest_path = dbtArtifacts.semantic_manifest_path(self.dbt_project_metadata.project_path)
+        if not semantic_manifest_path.exists():
+            return None
+        return semantic_manifest_path.stat().st_mtime_ns
+
+    def reload_semantic_manifest_if_changed(self) -> bool:
+        """If the semantic manifest file was modified since it was loaded, load it again and return True.
+
+        This is used by the daemon to pick up changes (e.g. after `dbt parse`) without restarting. If the engine was
+        already created, it's updated using the new version of the manifest.
+        """
+        from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
+
+        if self._dbt_artifacts is None:
+            return False
+        semantic_manifest_mtime_ns = self._get_semantic_manifest_mtime_ns()
+        if semantic_manifest_mtime_ns is None or semantic_manifest_mtime_ns == self._semantic_manifest_mtime_ns:
+            return False
+
+        logger.info(LazyFormat("Reloading the semantic manifest", project_path=self.dbt_project_metadata.project_path))
+        semantic_manifest = dbtArtifacts.build_semantic_manifest_from_dbt_project_root(
+            project_root=self.dbt_project_metadata.project_path
+        )
+        self._semantic_manifest_mtime_ns = semantic_manifest_mtime_ns
+        self._dbt_artifacts = dataclasses.replace(self._dbt_artifacts, semantic_manifest=semantic_manifest)
+        if self._mf is not None:
+            self._mf.update_semantic_manifest(semantic_manifest)
+            self._semantic_manifest_lookup = self._mf.semantic_manifest_lookup
+        else:
+            self._semantic_manifest_lookup = None
+        return True
+
     @property
     def log_file_path(self) -> pathlib.Path:
         """Returns the location of the log file path for this CLI invocation."""
@@ -167,6 +218,8 @@ class CLIConfiguration:
     @property
     def sql_client(self) -> SqlClient:
         """Property accessor for the sql_client class used in the CLI."""
+        from dbt_metricflow.cli.dbt_connectors.adapter_backed_client import AdapterBackedSqlClient
+
         if self._sql_client is None:
             self._sql_client = AdapterBackedSqlClient(self.dbt_artifacts.adapter)
 
@@ -200,6 +253,8 @@ class CLIConfiguration:
 
     @property
     def mf(self) -> MetricFlowEngine:  # noqa: D102
+        from metricflow.engine.metricflow_engine import MetricFlowEngine
+
         if self._mf is None:
             self._mf = MetricFlowEngine(
                 semantic_manifest_lookup=self.semantic_manifest_lookup,
@@ -208,9 +263,36 @@ class CLIConfiguration:
         assert self._mf is not None
         return self._mf
 
+    @property
+    def linkable_spec_index_snapshot_path(self) -> pathlib.Path:
+        """Returns the path of the snapshot that's used to speed up the creation of the `SemanticManifestLookup`.
+
+        This can be set using an environment variable. Otherwise, the snapshot is stored in the dbt target directory.
+        """
+        snapshot_path_env_var = os.environ.get(CLIConfiguration.LINKABLE_SPEC_INDEX_SNAPSHOT_PATH_ENV_VAR_NAME)
+        if snapshot_path_env_var is not None:
+            return pathlib.Path(snapshot_path_env_var)
+        return pathlib.Path(
+            self.dbt_project_metadata.project_path,
+            self.dbt_project_metadata.dbt_paths.target_path,
+            CLIConfiguration.DEFAULT_LINKABLE_SPEC_INDEX_SNAPSHOT_FILE_NAME,
+        )
+
     def _build_semantic_manifest_lookup(self) -> None:
-        """Get the path to the models and create a corresponding SemanticManifestLookup."""
-        self._semantic_manifest_lookup = SemanticManifestLookup(self.semantic_manifest)
+        """Get the path to the models and create a corresponding SemanticManifestLookup.
+
+        If a snapshot of the index has been built (e.g. via `mf build-index-snapshot`), it's used to speed up
+        initialization. A snapshot for a different manifest is ignored.
+        """
+        from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+
+        snapshot_path = self.linkable_spec_index_snapshot_path
+        if snapshot_path.exists():
+            self._semantic_manifest_lookup = SemanticManifestLookup.create_using_index_snapshot(
+                semantic_manifest=self.semantic_manifest, snapshot_path=snapshot_path
+            )
+        else:
+            self._semantic_manifest_lookup = SemanticManifestLookup(self.semantic_manifest)
 
     @property
     def semantic_manifest_lookup(self) -> SemanticManifestLookup:  # noqa: D102
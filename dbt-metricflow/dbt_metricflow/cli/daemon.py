@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import click
+from click.testing import CliRunner
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+
+from dbt_metricflow.cli.cli_configuration import CLIConfiguration
+
+logger = logging.getLogger(__name__)
+
+# Requests and responses are sent as a single line of JSON.
+_ENCODING = "utf-8"
+
+
+@dataclass(frozen=True)
+class DaemonCommandResult:
+    """The result of a CLI command that was run by the daemon.
+
+    Attributes:
+        output: What the command wrote to the console.
+        exit_code: The exit code of the command.
+    """
+
+    output: str
+    exit_code: int
+
+
+class MetricFlowDaemon:
+    """Runs CLI commands in a long-lived process so that the engine and the adapter connection are reused.
+
+    Setting up the CLI configuration (loading the dbt project, building the `SemanticManifestLookup`, and creating the
+    `MetricFlowEngine`) usually takes much longer than the command. The daemon does the setup once, and then listens on
+    a Unix domain socket for commands from CLI invocations (see `run_command_using_daemon`). Before each command, the
+    semantic manifest is reloaded if the file has changed. Commands from CLI invocations for a different dbt project
+    are rejected so that the client runs the command in its own process. The socket is only accessible by the user
+    running the daemon.
+
+    Commands are run one at a time as the console output of a command is captured by replacing `sys.stdout`.
+    """
+
+    def __init__(self, cfg: CLIConfiguration, cli: click.Command, socket_path: Path, dbt_project_path: Path) -> None:
+        """Initializer.
+
+        Args:
+            cfg: The configuration that is used to run the commands. It should have already been set up.
+            cli: The CLI group that's used to run the commands.
+            socket_path: The path of the Unix domain socket to listen on.
+            dbt_project_path: The directory of the dbt project that `cfg` was set up for.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("The daemon requires support for Unix domain sockets.")
+        self._cfg = cfg
+        self._cli = cli
+        self._socket_path = socket_path
+        self._dbt_project_path = dbt_project_path.resolve()
+        self._cli_runner = CliRunner()
+        self._server: Optional[socketserver.UnixStreamServer] = None
+
+    def serve_forever(self) -> None:
+        """Listen for commands until `shutdown` is called or a stop request is received."""
+        if self._socket_path.exists():
+            if run_command_using_daemon(self._socket_path, args=None) is not None:
+                raise RuntimeError(f"A daemon is already listening on {str(self._socket_path)!r}")
+            # A socket file without a listening process is left behind if the daemon was killed.
+            self._socket_path.unlink()
+
+        daemon = self
+
+        class _RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                response: Dict[str, object]
+                try:
+                    request = json.loads(self.rfile.readline().decode(_ENCODING))
+                    result = daemon._handle_request(
+                        args=request["args"],
+                        cwd=Path(request["cwd"]),
+                        dbt_project_path=Path(request["dbt_project_path"]),
+                        stop=bool(request["stop"]),
+                    )
+                    if result is None:
+                        response = {"output": "", "exit_code": 1, "accepted": False}
+                    else:
+                        response = {"output": result.output, "exit_code": result.exit_code, "accepted": True}
+                except Exception as e:
+                    logger.error(LazyFormat("Unable to handle a request"), exc_info=True)
+                    response = {"output": f"❌ The daemon was unable to run the command: {e!r}\n", "exit_code": 1}
+                self.wfile.write((json.dumps(response) + "\n").encode(_ENCODING))
+
+        self._socket_path.parent.mkdir(parents=True, exist_ok=True)
+        with socketserver.UnixStreamServer(str(self._socket_path), _RequestHandler) as server:
+            # Commands run with the permissions of the daemon, so don't allow other users to connect.
+            os.chmod(self._socket_path, 0o600)
+            self._server = server
+            try:
+                logger.info(LazyFormat("Daemon is listening", socket_path=self._socket_path))
+                server.serve_forever()
+            finally:
+                self._server = None
+                self._socket_path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """Stop serving requests. This needs to be called from a thread other than the one in `serve_forever`."""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _handle_request(
+        self, args: Optional[Sequence[str]], cwd: Path, dbt_project_path: Path, stop: bool
+    ) -> Optional[DaemonCommandResult]:
+        """Run the command, or return None if the command is for a different dbt project."""
+        if stop:
+            # `shutdown` blocks until `serve_forever` returns, so it can't be called from the request handler.
+            threading.Thread(target=self.shutdown).start()
+            return DaemonCommandResult(output="Stopped the daemon.\n", exit_code=0)
+        if args is None:
+            # A request without arguments checks whether the daemon is running.
+            return DaemonCommandResult(output="", exit_code=0)
+        if dbt_project_path.resolve() != self._dbt_project_path:
+            logger.info(
+                LazyFormat(
+                    "Rejecting a command for a different dbt project",
+                    client_dbt_project_path=dbt_project_path,
+                    daemon_dbt_project_path=self._dbt_project_path,
+                )
+            )
+            return None
+
+        self._cfg.reload_semantic_manifest_if_changed()
+        logger.info(LazyFormat("Running command for client", args=args))
+        current_dir = os.getcwd()
+        # Relative paths in the arguments (e.g. `--csv`) should be resolved using the directory of the client.
+        os.chdir(cwd)
+        try:
+            result = self._cli_runner.invoke(self._cli, args, obj=self._cfg)
+        finally:
+            os.chdir(current_dir)
+        if result.exception is not None and not isinstance(result.exception, SystemExit):
+            logger.error(LazyFormat("Command failed", args=args), exc_info=result.exc_info)
+        return DaemonCommandResult(output=result.output, exit_code=result.exit_code)
+
+
+def run_command_using_daemon(
+    socket_path: Path,
+    args: Optional[Sequence[str]],
+    cwd: Optional[Path] = None,
+    dbt_project_path: Optional[Path] = None,
+    stop: bool = False,
+) -> Optional[DaemonCommandResult]:
+    """Run a CLI command using the daemon listening on the given socket.
+
+    Args:
+        socket_path: The socket that the daemon is listening on.
+        args: The arguments of the command, as they would be passed to `mf`. If None, only check that the daemon is
+        running.
+        cwd: The directory that relative paths in the arguments are relative to. Defaults to the current directory.
+        dbt_project_path: The directory of the dbt project that the command is for. As with `CLIConfiguration.setup`,
+        defaults to the value of the environment variable `DBT_PROJECT_DIR`, or `cwd`.
+        stop: If set, stop the daemon instead of running a command.
+
+    Returns:
+        The result of the command, or None if a daemon is not listening on the socket or if the daemon is for a
+        different dbt project.
+    """
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+    cwd = cwd or Path.cwd()
+    if dbt_project_path is None:
+        dbt_project_dir_env_var = os.environ.get(CLIConfiguration.DBT_PROJECT_DIR_ENV_VAR_NAME)
+        dbt_project_path = Path(dbt_project_dir_env_var) if dbt_project_dir_env_var is not None else cwd
+    request = {
+        "args": list(args) if args is not None else None,
+        "cwd": str(cwd),
+        "dbt_project_path": str(cwd.joinpath(dbt_project_path)),
+        "stop": stop,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        try:
+            client_socket.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            logger.debug(LazyFormat("A daemon is not listening on the socket", socket_path=socket_path))
+            return None
+        with client_socket.makefile("rwb") as socket_file:
+            socket_file.write((json.dumps(request) + "\n").encode(_ENCODING))
+            socket_file.flush()
+            response = json.loads(socket_file.readline().decode(_ENCODING))
+    if not response.get("accepted", True):
+        logger.debug(LazyFormat("The daemon is for a different dbt project", socket_path=socket_path))
+        return None
+    return DaemonCommandResult(output=response["output"], exit_code=response["exit_code"])
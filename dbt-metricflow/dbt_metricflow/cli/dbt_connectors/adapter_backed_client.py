@@ -3,8 +3,10 @@ from __future__ import annotations
 import enum
 import logging
 import time
+from typing import Iterator
 
 from dbt.adapters.base import BaseAdapter
+from dbt.adapters.sql import SQLConnectionManager
 from dbt_common.exceptions.base import DbtDatabaseError
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from metricflow_semantics.errors.error_classes import SqlBindParametersNotSupportedError
@@ -13,15 +15,8 @@ from metricflow_semantics.random_id import random_id
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
 
 from metricflow.data_table.mf_table import MetricFlowDataTable
-from metricflow.protocols.sql_client import SqlEngine
-from metricflow.sql.render.big_query import BigQuerySqlPlanRenderer
-from metricflow.sql.render.databricks import DatabricksSqlPlanRenderer
-from metricflow.sql.render.duckdb_renderer import DuckDbSqlPlanRenderer
-from metricflow.sql.render.postgres import PostgresSQLSqlPlanRenderer
-from metricflow.sql.render.redshift import RedshiftSqlPlanRenderer
-from metricflow.sql.render.snowflake import SnowflakeSqlPlanRenderer
+from metricflow.protocols.sql_client import DEFAULT_QUERY_BATCH_SIZE, SqlEngine
 from metricflow.sql.render.sql_plan_renderer import SqlPlanRenderer
-from metricflow.sql.render.trino import TrinoSqlPlanRenderer
 from metricflow.sql_request.sql_request_attributes import SqlRequestId
 
 logger = logging.getLogger(__name__)
@@ -65,20 +60,37 @@ class SupportedAdapterTypes(enum.Enum):
 
     @property
     def sql_plan_renderer(self) -> SqlPlanRenderer:
-        """Return the SqlPlanRenderer corresponding to the supported adapter type."""
+        """Return the SqlPlanRenderer corresponding to the supported adapter type.
+
+        Only the renderer for the adapter type is imported since only one adapter is used in a process.
+        """
         if self is SupportedAdapterTypes.BIGQUERY:
+            from metricflow.sql.render.big_query import BigQuerySqlPlanRenderer
+
             return BigQuerySqlPlanRenderer()
         elif self is SupportedAdapterTypes.DATABRICKS:
+            from metricflow.sql.render.databricks import DatabricksSqlPlanRenderer
+
             return DatabricksSqlPlanRenderer()
         elif self is SupportedAdapterTypes.POSTGRES:
+            from metricflow.sql.render.postgres import PostgresSQLSqlPlanRenderer
+
             return PostgresSQLSqlPlanRenderer()
         elif self is SupportedAdapterTypes.REDSHIFT:
+            from metricflow.sql.render.redshift import RedshiftSqlPlanRenderer
+
             return RedshiftSqlPlanRenderer()
         elif self is SupportedAdapterTypes.SNOWFLAKE:
+            from metricflow.sql.render.snowflake import SnowflakeSqlPlanRenderer
+
             return SnowflakeSqlPlanRenderer()
         elif self is SupportedAdapterTypes.DUCKDB:
+            from metricflow.sql.render.duckdb_renderer import DuckDbSqlPlanRenderer
+
             return DuckDbSqlPlanRenderer()
         elif self is SupportedAdapterTypes.TRINO:
+            from metricflow.sql.render.trino import TrinoSqlPlanRenderer
+
             return TrinoSqlPlanRenderer()
         else:
             assert_values_exhausted(self)
@@ -124,6 +136,14 @@ class AdapterBackedSqlClient:
         """Dialect-specific SQL query plan renderer used for converting MetricFlow's query plan to executable SQL."""
         return self._sql_plan_renderer
 
+    @property
+    def fetches_batches_from_cursor(self) -> bool:
+        """Whether `query_in_batches` fetches rows as they're needed, instead of fetching the whole result first.
+
+        Adapters that are not SQL-based (e.g. BigQuery) don't expose a DB-API cursor.
+        """
+        return isinstance(self._adapter.connections, SQLConnectionManager)
+
     def query(
         self,
         stmt: str,
@@ -152,10 +172,11 @@ class AdapterBackedSqlClient:
             logger.info(LazyFormat(lambda: f"query() returned from dbt Adapter with response {result[0]}"))
 
         agate_data = result[1]
-        rows = [row.values() for row in agate_data.rows]
-        data_table = MetricFlowDataTable.create_from_rows(
+        # `agate` stores the values of each column in a tuple, so those can be passed through without building a
+        # tuple for each row.
+        data_table = MetricFlowDataTable.create_from_columns(
             column_names=agate_data.column_names,
-            rows=rows,
+            columns=[column.values() for column in agate_data.columns],
         )
         stop = time.perf_counter()
 
@@ -166,6 +187,72 @@ class AdapterBackedSqlClient:
         )
         return data_table
 
+    def query_in_batches(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+        batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+    ) -> Iterator[MetricFlowDataTable]:
+        """Query statement; results are fetched from the cursor and returned as tables of at most `batch_size` rows.
+
+        Args:
+            stmt: The SQL query statement to run. This should produce output via a SELECT
+            sql_bind_parameter_set: The parameter replacement mapping for filling in concrete values for SQL query
+            parameters.
+            batch_size: The maximum number of rows to fetch from the warehouse at a time.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"The batch size should be a positive integer, but got: {batch_size}")
+        if sql_bind_parameter_set.param_dict:
+            raise SqlBindParametersNotSupportedError(
+                f"Invalid query statement - we do not support queries with bind parameters through dbt adapters! "
+                f"Bind params: {sql_bind_parameter_set.param_dict}"
+            )
+
+        # See `fetches_batches_from_cursor`. Without a cursor, fetch the whole result and split it up.
+        connection_manager = self._adapter.connections
+        if not isinstance(connection_manager, SQLConnectionManager):
+            data_table = self.query(stmt, sql_bind_parameter_set=sql_bind_parameter_set)
+            for start_row_index in range(0, data_table.row_count, batch_size):
+                yield MetricFlowDataTable.create_from_columns(
+                    column_names=data_table.column_names,
+                    columns=[
+                        column_values[start_row_index : start_row_index + batch_size]
+                        for column_values in data_table.columns
+                    ],
+                )
+            return
+
+        start = time.perf_counter()
+        request_id = SqlRequestId(f"mf_rid__{random_id()}")
+        logger.info(
+            LazyFormat(
+                "Running query_in_batches() statement",
+                statement=stmt,
+                param_dict=sql_bind_parameter_set.param_dict,
+                batch_size=batch_size,
+            )
+        )
+        returned_row_count = 0
+        with self._adapter.connection_named(f"MetricFlow_request_{request_id}"):
+            _, cursor = connection_manager.add_query(sql=stmt, auto_begin=True)
+            column_names = tuple(column_description[0] for column_description in cursor.description or ())
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if len(rows) == 0:
+                    break
+                returned_row_count += len(rows)
+                yield MetricFlowDataTable.create_from_rows(column_names=column_names, rows=rows)
+
+        stop = time.perf_counter()
+        logger.info(
+            LazyFormat(
+                "Finished running query_in_batches()",
+                runtime=f"{stop - start:.2f}s",
+                returned_row_count=returned_row_count,
+            )
+        )
+
     def execute(
         self,
         stmt: str,
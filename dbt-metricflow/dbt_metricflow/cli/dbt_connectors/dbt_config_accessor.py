@@ -126,11 +126,16 @@ class dbtArtifacts:
             semantic_manifest=semantic_manifest,
         )
 
+    @staticmethod
+    def semantic_manifest_path(project_root: Path) -> Path:
+        """Return the path of the semantic manifest artifact in the dbt project root."""
+        DEFAULT_TARGET_PATH = "target/semantic_manifest.json"
+        return Path(project_root, DEFAULT_TARGET_PATH).resolve()
+
     @staticmethod
     def build_semantic_manifest_from_dbt_project_root(project_root: Path) -> SemanticManifest:
         """In the dbt project root, retrieve the manifest path and parse the SemanticManifest."""
-        DEFAULT_TARGET_PATH = "target/semantic_manifest.json"
-        full_path_to_manifest = Path(project_root, DEFAULT_TARGET_PATH).resolve()
+        full_path_to_manifest = dbtArtifacts.semantic_manifest_path(project_root)
         if not full_path_to_manifest.exists():
             raise LoadSemanticManifestException(
                 "\n".join(
@@ -3,43 +3,48 @@ from __future__ import annotations
 import csv as csv_module
 import datetime as dt
 import logging
+import os
 import signal
 import sys
 import tempfile
 import textwrap
 import time
+import typing
 import warnings
-from importlib.metadata import version as pkg_version
 from pathlib import Path
-from typing import Callable, List, Optional, Sequence
+from typing import Callable, Iterator, List, Optional, Sequence, TextIO, Tuple
 
 import click
-import jinja2
-from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
-from dbt_semantic_interfaces.validations.semantic_manifest_validator import SemanticManifestValidator
-from dbt_semantic_interfaces.validations.validator_helpers import SemanticManifestValidationResults
 from halo import Halo
-from metricflow_semantics.dag.dag_visualization import display_dag_as_svg
 from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
-from update_checker import UpdateChecker
+from typing_extensions import override
 
 import dbt_metricflow.cli.custom_click_types as click_custom
 from dbt_metricflow.cli import PACKAGE_NAME
 from dbt_metricflow.cli.cli_configuration import CLIConfiguration
 from dbt_metricflow.cli.constants import MAX_LIST_OBJECT_ELEMENTS
-from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
-from dbt_metricflow.cli.tutorial import (
-    dbtMetricFlowTutorialHelper,
-)
+from dbt_metricflow.cli.daemon import MetricFlowDaemon, run_command_using_daemon
 from dbt_metricflow.cli.utils import (
     exception_handler,
     query_options,
     start_end_time_options,
 )
-from metricflow.engine.metricflow_engine import MetricFlowExplainResult, MetricFlowQueryRequest, MetricFlowQueryResult
 from metricflow.telemetry.models import TelemetryLevel
 from metricflow.telemetry.reporter import TelemetryReporter, log_call
-from metricflow.validation.data_warehouse_model_validator import DataWarehouseModelValidator
+
+if typing.TYPE_CHECKING:
+    # Modules that are only needed by some commands are imported in the commands so that the CLI starts quickly (see
+    # `tests_metricflow/test_import_time.py`).
+    from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+    from dbt_semantic_interfaces.validations.validator_helpers import SemanticManifestValidationResults
+
+    from metricflow.data_table.mf_table import MetricFlowDataTable
+    from metricflow.engine.metricflow_engine import (
+        MetricFlowExplainResult,
+        MetricFlowQueryResult,
+        MetricFlowQueryStreamResult,
+    )
+    from metricflow.validation.data_warehouse_model_validator import DataWarehouseModelValidator
 
 logger = logging.getLogger(__name__)
 
@@ -47,13 +52,44 @@ pass_config = click.make_pass_decorator(CLIConfiguration, ensure=True)
 _telemetry_reporter = TelemetryReporter(report_levels_higher_or_equal_to=TelemetryLevel.USAGE)
 _telemetry_reporter.add_python_log_handler()
 
+_CLI_ARGS_META_KEY = "dbt_metricflow.cli_args"
+
+
+class _CliGroup(click.Group):
+    """A group that keeps the command-line arguments so that the command can be forwarded to the daemon."""
+
+    @override
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        ctx.meta[_CLI_ARGS_META_KEY] = tuple(args)
+        return super().parse_args(ctx, args)
+
+
+def _daemon_socket_path_from_env() -> Optional[Path]:
+    socket_path_env_var = os.environ.get(CLIConfiguration.DAEMON_SOCKET_PATH_ENV_VAR_NAME)
+    return Path(socket_path_env_var) if socket_path_env_var else None
 
-@click.group()
+
+@click.group(cls=_CliGroup)
 @click.option("-v", "--verbose", is_flag=True)
 @click.version_option()
 @pass_config
+@click.pass_context
 @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
-def cli(cfg: CLIConfiguration, verbose: bool) -> None:  # noqa: D103
+def cli(ctx: click.Context, cfg: CLIConfiguration, verbose: bool) -> None:  # noqa: D103
+    # If a daemon is running, it has a configuration that's already set up, so let it run the command.
+    daemon_socket_path = _daemon_socket_path_from_env()
+    if daemon_socket_path is not None and not cfg.is_setup and ctx.invoked_subcommand != daemon.name:
+        cli_args: Tuple[str, ...] = ctx.meta.get(_CLI_ARGS_META_KEY, ())
+        daemon_result = run_command_using_daemon(daemon_socket_path, args=cli_args)
+        if daemon_result is not None:
+            click.echo(daemon_result.output, nl=False)
+            ctx.exit(daemon_result.exit_code)
+        logger.debug(LazyFormat("Daemon is not running, so running the command in this process"))
+
+    from importlib.metadata import version as pkg_version
+
+    from update_checker import UpdateChecker
+
     # Some HTTP logging callback somewhere is failing to close its SSL connections correctly.
     # For now, filter those warnings so they don't pop up in CLI stderr
     # note - this should be addressed as adapter connection issues might produce these as well
@@ -99,6 +135,71 @@ def cli(cfg: CLIConfiguration, verbose: bool) -> None:  # noqa: D103
     signal.signal(signal.SIGTERM, exit_signal_handler)
 
 
+@cli.group()
+def daemon() -> None:
+    """Run a background process that keeps the semantic manifest and the warehouse connection loaded.
+
+    When the environment variable `MF_DAEMON_SOCKET_PATH` is set and a daemon is listening on that socket, other
+    commands are run by the daemon, which avoids loading the dbt project for each command.
+    """
+    pass
+
+
+def _get_daemon_socket_path(socket_path: Optional[Path]) -> Path:
+    socket_path = socket_path or _daemon_socket_path_from_env()
+    if socket_path is None:
+        click.echo(
+            f"❌ Either `--socket-path` or the environment variable `{CLIConfiguration.DAEMON_SOCKET_PATH_ENV_VAR_NAME}` "
+            f"should be specified."
+        )
+        exit(1)
+    return socket_path
+
+
+@daemon.command(name="start")
+@click.option(
+    "--socket-path",
+    required=False,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="The Unix domain socket to listen on. Defaults to the value of the environment variable `MF_DAEMON_SOCKET_PATH`.",
+)
+@pass_config
+@exception_handler
+@log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+def daemon_start(cfg: CLIConfiguration, socket_path: Optional[Path] = None) -> None:
+    """Start the daemon in the foreground (e.g. run `mf daemon start &` to run it in the background)."""
+    socket_path = _get_daemon_socket_path(socket_path)
+    if not cfg.is_setup:
+        cfg.setup()
+    spinner = Halo(text="Loading the semantic manifest and connecting to the data warehouse...", spinner="dots")
+    spinner.start()
+    # Create the engine before listening so that the first command doesn't need to wait for it.
+    cfg.mf
+    spinner.succeed(f"🚀 Daemon is listening on {str(socket_path)!r}")
+    MetricFlowDaemon(
+        cfg=cfg, cli=cli, socket_path=socket_path, dbt_project_path=cfg.dbt_project_metadata.project_path
+    ).serve_forever()
+
+
+@daemon.command(name="stop")
+@click.option(
+    "--socket-path",
+    required=False,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="The Unix domain socket that the daemon is listening on. Defaults to the value of the environment variable "
+    "`MF_DAEMON_SOCKET_PATH`.",
+)
+@log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+def daemon_stop(socket_path: Optional[Path] = None) -> None:
+    """Stop the daemon."""
+    socket_path = _get_daemon_socket_path(socket_path)
+    daemon_result = run_command_using_daemon(socket_path, args=None, stop=True)
+    if daemon_result is None:
+        click.echo(f"A daemon is not listening on {str(socket_path)!r}")
+        return
+    click.echo(daemon_result.output, nl=False)
+
+
 @cli.command()
 @click.option("-m", "--message", is_flag=True, help="Output the final steps dialogue")
 # @click.option("--skip-dw", is_flag=True, help="Skip the data warehouse health checks") # TODO: re-enable this
@@ -108,6 +209,8 @@ def cli(cfg: CLIConfiguration, verbose: bool) -> None:  # noqa: D103
 @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
 def tutorial(ctx: click.core.Context, message: bool, clean: bool, yes: bool) -> None:
     """Click command to run the tutorial."""
+    from dbt_metricflow.cli.tutorial import dbtMetricFlowTutorialHelper
+
     dbtMetricFlowTutorialHelper.run_tutorial(message=message, clean=clean, yes=yes)
 
 
@@ -194,6 +297,8 @@ def query(
     quiet: bool = False,
 ) -> None:
     """Create a new query with MetricFlow and assembles a MetricFlowQueryResult."""
+    from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+
     if not cfg.is_setup:
         cfg.setup()
 
@@ -220,9 +325,25 @@ def query(
 
     explain_result: Optional[MetricFlowExplainResult] = None
     query_result: Optional[MetricFlowQueryResult] = None
+    query_stream_result: Optional[MetricFlowQueryStreamResult] = None
+    csv_row_count = 0
 
     if explain:
         explain_result = cfg.mf.explain(mf_request=mf_request)
+    elif csv is not None:
+        from dbt_metricflow.cli.dbt_connectors.adapter_backed_client import AdapterBackedSqlClient
+
+        sql_client = cfg.sql_client
+        if isinstance(sql_client, AdapterBackedSqlClient) and not sql_client.fetches_batches_from_cursor:
+            click.secho(
+                f"‼️ Warning: The {sql_client.sql_engine_type.value} adapter doesn't support fetching results in "
+                f"batches, so the whole result will be loaded into memory before it's written to the CSV file.",
+                fg="yellow",
+                err=True,
+            )
+        # Write the result as it's fetched so that memory usage does not depend on the size of the result.
+        query_stream_result = cfg.mf.query_stream(mf_request=mf_request)
+        csv_row_count = _write_data_table_batches_to_csv(csv, query_stream_result.result_batches)
     else:
         query_result = cfg.mf.query(mf_request=mf_request)
 
@@ -237,6 +358,8 @@ def query(
             else explain_result.sql_statement.sql
         )
         if show_dataflow_plan:
+            import jinja2
+
             _click_echo("🔎 Generated Dataflow Plan + SQL (remove --explain to see data):", quiet=quiet)
             click.echo(
                 textwrap.indent(
@@ -261,6 +384,8 @@ def query(
             )
         click.echo(sql)
         if display_plans:
+            from metricflow_semantics.dag.dag_visualization import display_dag_as_svg
+
             _click_echo("Creating temporary directory for storing visualization output.", quiet=quiet)
             temp_path = tempfile.mkdtemp()
             svg_path = display_dag_as_svg(explain_result.dataflow_plan, temp_path)
@@ -268,27 +393,58 @@ def query(
             click.echo(f"Plan SVG saved to: {svg_path}")
         exit()
 
+    if query_stream_result is not None:
+        if csv_row_count == 0:
+            _click_echo("🕳 Query returned an empty result set", quiet=quiet)
+        else:
+            _click_echo(f"🖨 Wrote query output to {csv}", quiet=quiet)
+        if display_plans:
+            from metricflow_semantics.dag.dag_visualization import display_dag_as_svg
+
+            temp_path = tempfile.mkdtemp()
+            svg_path = display_dag_as_svg(query_stream_result.dataflow_plan, temp_path)
+            click.echo(f"Plan SVG saved to: {svg_path}")
+        return
+
     assert query_result
     df = query_result.result_df
     # Show the data if returned successfully
     if df is not None:
         if df.row_count == 0:
             _click_echo("🕳 Query returned an empty result set", quiet=quiet)
-        elif csv is not None:
-            with open(csv, "w") as csv_fp:
-                csv_writer = csv_module.writer(csv_fp)
-                csv_writer.writerow(df.column_names)
-                for row in df.rows:
-                    csv_writer.writerow(row)
-            _click_echo(f"🖨 Wrote query output to {csv}", quiet=quiet)
         else:
             click.echo(df.text_format(decimals))
         if display_plans:
+            from metricflow_semantics.dag.dag_visualization import display_dag_as_svg
+
             temp_path = tempfile.mkdtemp()
             svg_path = display_dag_as_svg(query_result.dataflow_plan, temp_path)
             click.echo(f"Plan SVG saved to: {svg_path}")
 
 
+def _write_data_table_batches_to_csv(csv_path: Path, data_table_batches: Iterator[MetricFlowDataTable]) -> int:
+    """Write the batches to a CSV file and return the number of rows written.
+
+    The file is only created if there is at least one row in the result.
+    """
+    row_count = 0
+    csv_fp: Optional[TextIO] = None
+    try:
+        for data_table in data_table_batches:
+            if data_table.row_count == 0:
+                continue
+            if csv_fp is None:
+                csv_fp = open(csv_path, "w")
+                csv_writer = csv_module.writer(csv_fp)
+                csv_writer.writerow(data_table.column_names)
+            csv_writer.writerows(data_table.rows)
+            row_count += data_table.row_count
+    finally:
+        if csv_fp is not None:
+            csv_fp.close()
+    return row_count
+
+
 @cli.group(name="list")
 @pass_config
 @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
@@ -421,6 +577,91 @@ def health_checks(cfg: CLIConfiguration) -> None:
             click.echo(f"• ✅ {click.style(test, bold=True, fg=('green'))}: Success!")
 
 
+@cli.command()
+@click.option(
+    "--output",
+    required=False,
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Path to write the snapshot to. Defaults to the path that is checked when the CLI starts.",
+)
+@pass_config
+@exception_handler
+@log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+def build_index_snapshot(cfg: CLIConfiguration, output: Optional[Path] = None) -> None:
+    """Precompute the index of queryable elements to speed up the start of subsequent commands."""
+    from metricflow_semantics.model.semantics.linkable_spec_index_snapshot import LinkableSpecIndexSnapshot
+
+    if not cfg.is_setup:
+        cfg.setup()
+    snapshot_path = output or cfg.linkable_spec_index_snapshot_path
+    spinner = Halo(text="🏗 Building the index of queryable elements...", spinner="dots")
+    spinner.start()
+    start_time = time.time()
+    LinkableSpecIndexSnapshot.create(cfg.semantic_manifest).write(snapshot_path)
+    spinner.succeed(f"🖨 Wrote index snapshot to {str(snapshot_path)!r} in {time.time() - start_time:.2f}s")
+
+
+@cli.command()
+@query_options
+@click.option("--saved-query", required=False, help="Specify the name of the saved query to use for the query")
+@click.option(
+    "--repeat",
+    required=False,
+    default=2,
+    type=click.IntRange(min=1),
+    help="The number of times to generate the SQL for the query before showing the cache stats",
+)
+@click.option(
+    "--estimate-sizes",
+    is_flag=True,
+    default=False,
+    help="Estimate the memory used by caches that don't track it. This can be slow for large caches.",
+)
+@pass_config
+@exception_handler
+@log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+def cache_stats(
+    cfg: CLIConfiguration,
+    metrics: Optional[Sequence[str]] = None,
+    group_by: Optional[Sequence[str]] = None,
+    where: Optional[str] = None,
+    start_time: Optional[dt.datetime] = None,
+    end_time: Optional[dt.datetime] = None,
+    order: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    saved_query: Optional[str] = None,
+    repeat: int = 2,
+    estimate_sizes: bool = False,
+) -> None:
+    """Debug command that generates the SQL for a query and shows the usage of the internal caches."""
+    from metricflow.engine.metricflow_engine import MetricFlowQueryRequest
+
+    if not cfg.is_setup:
+        cfg.setup()
+    if not metrics and saved_query is None:
+        click.echo("❌ Either `--metrics` or `--saved-query` should be specified.")
+        exit(1)
+
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        saved_query_name=saved_query,
+        metric_names=metrics,
+        group_by_names=group_by,
+        limit=limit,
+        time_constraint_start=start_time,
+        time_constraint_end=end_time,
+        where_constraints=[where] if where else None,
+        order_by_names=order,
+    )
+    start_time_for_queries = time.perf_counter()
+    for _ in range(repeat):
+        cfg.mf.explain(mf_request=mf_request)
+    click.echo(
+        f"📈 Cache stats after generating the SQL for the query {repeat} time(s) in "
+        f"{time.perf_counter() - start_time_for_queries:.2f}s:\n"
+    )
+    click.echo(cfg.mf.get_process_cache_report(include_size_estimates=estimate_sizes).text_format())
+
+
 @list_command_group.command()
 @click.option("--dimension", required=True, type=str, help="Dimension to query values from")
 @click.option(
@@ -514,6 +755,8 @@ def _data_warehouse_validations_runner(
     dw_validator: DataWarehouseModelValidator, manifest: SemanticManifest, timeout: Optional[int]
 ) -> SemanticManifestValidationResults:
     """Helper which calls the individual data warehouse validations to run and prints collected issues."""
+    from dbt_semantic_interfaces.validations.validator_helpers import SemanticManifestValidationResults
+
     semantic_model_results = _run_dw_validations(
         dw_validator.validate_semantic_models, manifest=manifest, validation_type="semantic models", timeout=timeout
     )
@@ -556,6 +799,19 @@ def _data_warehouse_validations_runner(
     default=1,
     help="Optional. Uses the number of workers specified to run the semantic validations. Should only be used for exceptionally large configs",
 )
+@click.option(
+    "--parallelism",
+    required=False,
+    type=click.IntRange(min=1),
+    default=1,
+    help="Optional. The maximum number of data warehouse validation queries to run at the same time. Default 1.",
+)
+@click.option(
+    "--dw-task-timeout",
+    required=False,
+    type=float,
+    help="Optional timeout in seconds for each data warehouse validation query. Default None.",
+)
 @pass_config
 @exception_handler
 @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
@@ -566,8 +822,16 @@ def validate_configs(
     show_all: bool = False,
     verbose_issues: bool = False,
     semantic_validation_workers: int = 1,
+    parallelism: int = 1,
+    dw_task_timeout: Optional[float] = None,
 ) -> None:
     """Perform validations against the defined model configurations."""
+    from dbt_semantic_interfaces.validations.semantic_manifest_validator import SemanticManifestValidator
+    from dbt_semantic_interfaces.validations.validator_helpers import SemanticManifestValidationResults
+
+    from dbt_metricflow.cli.dbt_connectors.dbt_config_accessor import dbtArtifacts
+    from metricflow.validation.data_warehouse_model_validator import DataWarehouseModelValidator
+
     if not cfg.is_setup:
         cfg.setup()
 
@@ -608,7 +872,9 @@ def validate_configs(
     dw_results = SemanticManifestValidationResults()
     if not skip_dw:
         # fetch dbt adapters. This rebuilds the manifest again, but whatever.
-        dw_validator = DataWarehouseModelValidator(sql_client=cfg.sql_client)
+        dw_validator = DataWarehouseModelValidator(
+            sql_client=cfg.sql_client, parallelism=parallelism, task_timeout=dw_task_timeout
+        )
         dw_results = _data_warehouse_validations_runner(
             dw_validator=dw_validator, manifest=semantic_manifest, timeout=dw_timeout
         )
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import threading
+from enum import Enum
+from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
+
+from metricflow_semantics.collection_helpers.cache_registry import (
+    GLOBAL_CACHE_REGISTRY,
+    CacheStats,
+    InstrumentedCache,
+    estimate_deep_size_bytes,
+)
+
+KeyT = TypeVar("KeyT")
+ValueT = TypeVar("ValueT")
+
+
+class CacheEvictionPolicy(Enum):
+    """Determines which entry is evicted when a cache is full."""
+
+    # Evict the entry that was least-recently retrieved or stored.
+    LRU = "lru"
+    # Evict the entry that was stored first.
+    FIFO = "fifo"
+
+
+class BoundedCache(InstrumentedCache, Generic[KeyT, ValueT]):
+    """A thread-safe cache with limits on the number of entries and on the estimated size of the values.
+
+    Entries can be pinned so that they are never evicted (e.g. for values that were computed during initialization).
+    Pinned entries are not included when checking the limits, but are reported in the stats.
+    """
+
+    def __init__(
+        self,
+        max_items: Optional[int] = None,
+        max_size_bytes: Optional[int] = None,
+        eviction_policy: CacheEvictionPolicy = CacheEvictionPolicy.LRU,
+        size_estimator: Optional[Callable[[ValueT], int]] = None,
+        cache_name: Optional[str] = None,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            max_items: If specified, the maximum number of unpinned entries to keep.
+            max_size_bytes: If specified, the maximum total estimated size of the unpinned values to keep. Requires
+                `size_estimator`.
+            eviction_policy: Determines the entry to evict when a limit is hit.
+            size_estimator: A function that returns the approximate size of a value in bytes.
+            cache_name: The name to use when registering with `GLOBAL_CACHE_REGISTRY`.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError(f"`max_items` should be at least 1. Got: {max_items}")
+        if max_size_bytes is not None:
+            if max_size_bytes < 1:
+                raise ValueError(f"`max_size_bytes` should be at least 1. Got: {max_size_bytes}")
+            if size_estimator is None:
+                raise ValueError("`size_estimator` is required when `max_size_bytes` is set.")
+
+        self._max_items = max_items
+        self._max_size_bytes = max_size_bytes
+        self._eviction_policy = eviction_policy
+        self._size_estimator = size_estimator
+        self._cache_name = cache_name or BoundedCache.__name__
+
+        self._lock = threading.Lock()
+        # Maps the key to the value and the estimated size. Dictionaries iterate in insertion order, so the first item
+        # is the next one to evict.
+        self._unpinned_entries: Dict[KeyT, Tuple[ValueT, int]] = {}
+        self._pinned_entries: Dict[KeyT, Tuple[ValueT, int]] = {}
+        self._unpinned_size_bytes = 0
+        self._pinned_size_bytes = 0
+        self._hit_count = 0
+        self._miss_count = 0
+        self._eviction_count = 0
+        GLOBAL_CACHE_REGISTRY.register(self._cache_name, self)
+
+    def _estimate_size(self, value: ValueT) -> int:
+        if self._size_estimator is None:
+            return 0
+        return self._size_estimator(value)
+
+    def get(self, key: KeyT) -> Optional[ValueT]:  # noqa: D102
+        with self._lock:
+            pinned_entry = self._pinned_entries.get(key)
+            if pinned_entry is not None:
+                self._hit_count += 1
+                return pinned_entry[0]
+
+            entry = self._unpinned_entries.get(key)
+            if entry is None:
+                self._miss_count += 1
+                return None
+
+            self._hit_count += 1
+            if self._eviction_policy is CacheEvictionPolicy.LRU:
+                del self._unpinned_entries[key]
+                self._unpinned_entries[key] = entry
+            elif self._eviction_policy is CacheEvictionPolicy.FIFO:
+                pass
+            else:
+                assert_values_exhausted(self._eviction_policy)
+            return entry[0]
+
+    def set(self, key: KeyT, value: ValueT) -> None:
+        """Store the value, evicting other unpinned entries if needed to stay within the limits."""
+        size = self._estimate_size(value)
+        with self._lock:
+            if key in self._pinned_entries:
+                return
+            previous_entry = self._unpinned_entries.pop(key, None)
+            if previous_entry is not None:
+                self._unpinned_size_bytes -= previous_entry[1]
+
+            # A value that's larger than the limit by itself is not stored.
+            if self._max_size_bytes is not None and size > self._max_size_bytes:
+                return
+
+            while len(self._unpinned_entries) > 0 and (
+                (self._max_items is not None and len(self._unpinned_entries) >= self._max_items)
+                or (self._max_size_bytes is not None and self._unpinned_size_bytes + size > self._max_size_bytes)
+            ):
+                key_to_evict = next(iter(self._unpinned_entries))
+                _, evicted_size = self._unpinned_entries.pop(key_to_evict)
+                self._unpinned_size_bytes -= evicted_size
+                self._eviction_count += 1
+
+            self._unpinned_entries[key] = (value, size)
+            self._unpinned_size_bytes += size
+
+    def pin(self, key: KeyT, value: ValueT) -> None:
+        """Store the value so that it's never evicted."""
+        size = self._estimate_size(value)
+        with self._lock:
+            previous_entry = self._unpinned_entries.pop(key, None)
+            if previous_entry is not None:
+                self._unpinned_size_bytes -= previous_entry[1]
+            previous_pinned_entry = self._pinned_entries.get(key)
+            if previous_pinned_entry is not None:
+                self._pinned_size_bytes -= previous_pinned_entry[1]
+            self._pinned_entries[key] = (value, size)
+            self._pinned_size_bytes += size
+
+    def clear(self) -> None:
+        """Remove all unpinned entries."""
+        with self._lock:
+            self._unpinned_entries.clear()
+            self._unpinned_size_bytes = 0
+
+    @property
+    def stats(self) -> CacheStats:  # noqa: D102
+        with self._lock:
+            return CacheStats(
+                hit_count=self._hit_count,
+                miss_count=self._miss_count,
+                eviction_count=self._eviction_count,
+                item_count=len(self._pinned_entries) + len(self._unpinned_entries),
+                pinned_item_count=len(self._pinned_entries),
+                estimated_size_bytes=self._pinned_size_bytes + self._unpinned_size_bytes,
+            )
+
+    def estimate_size_bytes(self) -> int:  # noqa: D102
+        if self._size_estimator is not None:
+            return self.stats.estimated_size_bytes
+        with self._lock:
+            entries = tuple(self._pinned_entries.items()) + tuple(self._unpinned_entries.items())
+        return estimate_deep_size_bytes(entries)
+
+    def copy(self) -> BoundedCache[KeyT, ValueT]:
+        """Return a cache with the same configuration and entries, but with reset stats."""
+        cache_copy = BoundedCache[KeyT, ValueT](
+            max_items=self._max_items,
+            max_size_bytes=self._max_size_bytes,
+            eviction_policy=self._eviction_policy,
+            size_estimator=self._size_estimator,
+            cache_name=self._cache_name,
+        )
+        with self._lock:
+            cache_copy._unpinned_entries = dict(self._unpinned_entries)
+            cache_copy._pinned_entries = dict(self._pinned_entries)
+            cache_copy._unpinned_size_bytes = self._unpinned_size_bytes
+            cache_copy._pinned_size_bytes = self._pinned_size_bytes
+        return cache_copy
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import dataclasses
+import sys
+import threading
+import types
+import weakref
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Protocol, Set, Tuple
+
+from metricflow_semantics.helpers.table_helpers import IsolatedTabulateRunner
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Describes the usage of a cache.
+
+    Attributes:
+        hit_count: Number of lookups that found an entry.
+        miss_count: Number of lookups that did not find an entry.
+        eviction_count: Number of entries removed to stay within the configured limits.
+        item_count: Number of entries currently in the cache, including pinned entries.
+        pinned_item_count: Number of entries that are exempt from eviction.
+        estimated_size_bytes: Estimated memory used by the cached values. This is 0 if the cache does not have a way
+            to estimate the size of values.
+    """
+
+    hit_count: int
+    miss_count: int
+    eviction_count: int
+    item_count: int
+    pinned_item_count: int
+    estimated_size_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that found an entry, or 0 if there haven't been any lookups."""
+        lookup_count = self.hit_count + self.miss_count
+        return self.hit_count / lookup_count if lookup_count > 0 else 0.0
+
+    def merge(self, other: CacheStats) -> CacheStats:
+        """Combine the stats of two caches, e.g. two instances of the same cache."""
+        return CacheStats(
+            hit_count=self.hit_count + other.hit_count,
+            miss_count=self.miss_count + other.miss_count,
+            eviction_count=self.eviction_count + other.eviction_count,
+            item_count=self.item_count + other.item_count,
+            pinned_item_count=self.pinned_item_count + other.pinned_item_count,
+            estimated_size_bytes=self.estimated_size_bytes + other.estimated_size_bytes,
+        )
+
+    @staticmethod
+    def empty() -> CacheStats:  # noqa: D102
+        return CacheStats(
+            hit_count=0, miss_count=0, eviction_count=0, item_count=0, pinned_item_count=0, estimated_size_bytes=0
+        )
+
+
+class InstrumentedCache(Protocol):
+    """A cache that can report how it's used so that it can be included in a `CacheRegistry` report."""
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats:
+        """Return the current stats. This should be cheap to call, so `estimated_size_bytes` can be 0."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def estimate_size_bytes(self) -> int:
+        """Return the estimated memory used by the entries in the cache. This can be slow for large caches."""
+        raise NotImplementedError
+
+
+def estimate_deep_size_bytes(objects: Iterable[object]) -> int:
+    """Estimate the memory used by the given objects, including the objects that they reference.
+
+    Objects that are referenced multiple times are only counted once, and classes, modules, and functions are excluded
+    as they are shared. Since the estimate is computed by traversing all referenced objects, this should not be called
+    in performance-sensitive code.
+    """
+    seen_object_ids: Set[int] = set()
+    objects_to_visit: List[object] = list(objects)
+    total_size = 0
+    while len(objects_to_visit) > 0:
+        obj = objects_to_visit.pop()
+        if id(obj) in seen_object_ids or isinstance(
+            obj, (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+        ):
+            continue
+        seen_object_ids.add(id(obj))
+        total_size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            objects_to_visit.extend(obj.keys())
+            objects_to_visit.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            objects_to_visit.extend(obj)
+        elif isinstance(obj, (str, bytes, int, float, bool)):
+            continue
+
+        instance_dict = getattr(obj, "__dict__", None)
+        if isinstance(instance_dict, dict):
+            objects_to_visit.append(instance_dict)
+        for slot_name in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, slot_name):
+                objects_to_visit.append(getattr(obj, slot_name))
+
+    return total_size
+
+
+class _FunctionCacheAdapter(InstrumentedCache):
+    """Reports the usage of a function decorated with `functools.lru_cache`."""
+
+    def __init__(self, cached_function: object) -> None:  # noqa: D107
+        self._cached_function = cached_function
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return the stats of the function cache.
+
+        The function cache does not report evictions, but each miss adds an entry, so the number of evictions is
+        derived from the number of misses and the number of entries.
+        """
+        cache_info = self._cached_function.cache_info()  # type: ignore[attr-defined]
+        return CacheStats(
+            hit_count=cache_info.hits,
+            miss_count=cache_info.misses,
+            eviction_count=max(0, cache_info.misses - cache_info.currsize),
+            item_count=cache_info.currsize,
+            pinned_item_count=0,
+            estimated_size_bytes=0,
+        )
+
+    def estimate_size_bytes(self) -> int:
+        """The entries of a function cache can't be accessed, so the size can't be estimated."""
+        return 0
+
+
+@dataclass(frozen=True)
+class CacheReportEntry:
+    """Describes the usage of the caches registered with the same name.
+
+    Attributes:
+        cache_name: The name used to register the caches.
+        instance_count: The number of live caches that were registered with the name.
+        stats: The combined stats of those caches.
+    """
+
+    cache_name: str
+    instance_count: int
+    stats: CacheStats
+
+
+@dataclass(frozen=True)
+class CacheReport:
+    """Describes the usage of all caches in a registry."""
+
+    entries: Tuple[CacheReportEntry, ...]
+
+    def get_entry(self, cache_name: str) -> CacheReportEntry:  # noqa: D102
+        for entry in self.entries:
+            if entry.cache_name == cache_name:
+                return entry
+        raise KeyError(f"No entry for cache {cache_name!r} in the report. Available caches: {self.cache_names}")
+
+    @property
+    def cache_names(self) -> Tuple[str, ...]:  # noqa: D102
+        return tuple(entry.cache_name for entry in self.entries)
+
+    def text_format(self) -> str:
+        """Return a text table with a row for each cache."""
+        return IsolatedTabulateRunner.tabulate(
+            tabular_data=[
+                (
+                    entry.cache_name,
+                    str(entry.instance_count),
+                    str(entry.stats.hit_count),
+                    str(entry.stats.miss_count),
+                    f"{entry.stats.hit_rate:.1%}",
+                    str(entry.stats.eviction_count),
+                    str(entry.stats.item_count),
+                    str(entry.stats.estimated_size_bytes),
+                )
+                for entry in self.entries
+            ],
+            headers=("Cache", "Instances", "Hits", "Misses", "Hit Rate", "Evictions", "Items", "Est. Bytes"),
+            column_alignment=("left",) + ("right",) * 7,
+        )
+
+
+class CacheRegistry:
+    """Tracks caches so that their usage can be reported in one place (e.g. to tune the cache sizes).
+
+    Caches register themselves when they are created. Caches are held using weak references, so registration does not
+    keep a cache alive, and the stats of caches that have been garbage collected are not included in the report.
+    Caches of the same kind (e.g. a cache in each instance of a class) should be registered with the same name so that
+    the report combines them.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        self._lock = threading.Lock()
+        self._cache_name_to_caches: Dict[str, weakref.WeakSet[InstrumentedCache]] = {}
+        # Function caches are held using strong references as they live as long as the function.
+        self._cache_name_to_function_caches: Dict[str, List[_FunctionCacheAdapter]] = {}
+
+    def register(self, cache_name: str, cache: InstrumentedCache) -> None:
+        """Add the cache to the registry."""
+        with self._lock:
+            caches = self._cache_name_to_caches.get(cache_name)
+            if caches is None:
+                caches = weakref.WeakSet()
+                self._cache_name_to_caches[cache_name] = caches
+            caches.add(cache)
+
+    def register_function_cache(self, cache_name: str, cached_function: object) -> None:
+        """Add a function decorated with `functools.lru_cache` to the registry."""
+        with self._lock:
+            self._cache_name_to_function_caches.setdefault(cache_name, []).append(
+                _FunctionCacheAdapter(cached_function)
+            )
+
+    def create_report(self, include_size_estimates: bool = False) -> CacheReport:
+        """Return the stats of the registered caches.
+
+        Args:
+            include_size_estimates: If set, estimate the memory used by caches that don't track it. This requires
+                traversing the entries of those caches, so it can be slow.
+        """
+        with self._lock:
+            cache_name_to_caches: Dict[str, List[InstrumentedCache]] = {
+                cache_name: list(caches) for cache_name, caches in self._cache_name_to_caches.items()
+            }
+            for cache_name, function_caches in self._cache_name_to_function_caches.items():
+                cache_name_to_caches.setdefault(cache_name, []).extend(function_caches)
+
+        entries: List[CacheReportEntry] = []
+        for cache_name, caches in sorted(cache_name_to_caches.items()):
+            if len(caches) == 0:
+                continue
+            combined_stats = CacheStats.empty()
+            for cache in caches:
+                stats = cache.stats
+                if include_size_estimates and stats.estimated_size_bytes == 0:
+                    stats = dataclasses.replace(stats, estimated_size_bytes=cache.estimate_size_bytes())
+                combined_stats = combined_stats.merge(stats)
+            entries.append(CacheReportEntry(cache_name=cache_name, instance_count=len(caches), stats=combined_stats))
+        return CacheReport(entries=tuple(entries))
+
+
+# The registry that caches in MetricFlow register with.
+GLOBAL_CACHE_REGISTRY = CacheRegistry()
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import functools
 import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Callable, Dict, Generic, Optional, TypeVar
 
+from metricflow_semantics.collection_helpers.cache_registry import (
+    GLOBAL_CACHE_REGISTRY,
+    CacheStats,
+    InstrumentedCache,
+    estimate_deep_size_bytes,
+)
+
 if TYPE_CHECKING:
     # Hack: ensure type checking is not erased for parameters in methods decorated with @lru_cache.
     F = TypeVar("F", bound=Callable)
@@ -11,54 +20,94 @@ if TYPE_CHECKING:
         pass
 
 else:
-    from functools import lru_cache as typed_lru_cache  # noqa: F401
+
+    def typed_lru_cache(f):
+        """Wraps `functools.lru_cache` to register the cache with `GLOBAL_CACHE_REGISTRY`."""
+        cached_function = functools.lru_cache(f)
+        GLOBAL_CACHE_REGISTRY.register_function_cache(f.__qualname__, cached_function)
+        return cached_function
+
 
 KeyT = TypeVar("KeyT")
 ValueT = TypeVar("ValueT")
 
 
-class LruCache(Generic[KeyT, ValueT]):
+class LruCache(InstrumentedCache, Generic[KeyT, ValueT]):
     """An LRU cache based on the insertion order of dictionaries.
 
-    Since Python dictionaries iterate in the order that keys were inserted, they are used as the basis of this cache.
-    When an item is retrieved, the item in the dictionary is removed then re-inserted.
+    An `OrderedDict` is used as the basis of this cache, and when an item is retrieved, it is moved to the end. Since
+    each of those operations is atomic, retrieval does not acquire the lock. This keeps reads fast when the cache is
+    shared between threads. The lock is only used when adding items, as eviction requires multiple steps.
 
     This cache is used instead of the `fuctools.lru_cache` decorator for class instance methods as `lru_cache` keeps a
     reference to the instance, preventing garbage collection of the instance using the decorator until the eviction of
     the associated entry.
+
+    Since the counters for the stats are updated without the lock, they are approximate when the cache is used
+    concurrently.
     """
 
-    def __init__(self, max_cache_items: int, cache_dict: Optional[Dict[KeyT, ValueT]] = None) -> None:
+    def __init__(
+        self, max_cache_items: int, cache_dict: Optional[Dict[KeyT, ValueT]] = None, cache_name: Optional[str] = None
+    ) -> None:
         """Initializer.
 
         Args:
             max_cache_items: Limit of cache items to store. Once the limit is hit, the oldest item is evicted.
             cache_dict: For shared use cases - the dictionary to use for the cache.
+            cache_name: The name to use when registering with `GLOBAL_CACHE_REGISTRY`.
         """
         self._lock = threading.Lock()
         self._max_cache_items = max_cache_items
-        self._cache_dict: Dict[KeyT, ValueT] = cache_dict or {}
+        self._cache_dict: OrderedDict[KeyT, ValueT] = OrderedDict(cache_dict or {})
+        self._cache_name = cache_name or LruCache.__name__
+        self._hit_count = 0
+        self._miss_count = 0
+        self._eviction_count = 0
+        GLOBAL_CACHE_REGISTRY.register(self._cache_name, self)
 
     def get(self, key: KeyT) -> Optional[ValueT]:  # noqa: D102
-        with self._lock:
-            value = self._cache_dict.get(key)
-            if value is not None:
-                del self._cache_dict[key]
-                self._cache_dict[key] = value
-                return value
-
+        value = self._cache_dict.get(key)
+        if value is None:
+            self._miss_count += 1
             return None
 
+        self._hit_count += 1
+        try:
+            self._cache_dict.move_to_end(key)
+        except KeyError:
+            # The item was evicted by another thread after it was retrieved.
+            pass
+        return value
+
     def set(self, key: KeyT, value: ValueT) -> None:  # noqa: D102
         with self._lock:
             if key in self._cache_dict:
                 return
 
             while len(self._cache_dict) >= self._max_cache_items:
-                key_to_delete = next(iter(self._cache_dict))
-                del self._cache_dict[key_to_delete]
+                self._cache_dict.popitem(last=False)
+                self._eviction_count += 1
 
             self._cache_dict[key] = value
 
+    @property
+    def stats(self) -> CacheStats:  # noqa: D102
+        return CacheStats(
+            hit_count=self._hit_count,
+            miss_count=self._miss_count,
+            eviction_count=self._eviction_count,
+            item_count=len(self._cache_dict),
+            pinned_item_count=0,
+            estimated_size_bytes=0,
+        )
+
+    def estimate_size_bytes(self) -> int:  # noqa: D102
+        with self._lock:
+            entries = tuple(self._cache_dict.items())
+        return estimate_deep_size_bytes(entries)
+
     def copy(self) -> LruCache:  # noqa: D102
-        return LruCache(max_cache_items=self._max_cache_items, cache_dict=dict(self._cache_dict))
+        return LruCache(
+            max_cache_items=self._max_cache_items, cache_dict=dict(self._cache_dict), cache_name=self._cache_name
+        )
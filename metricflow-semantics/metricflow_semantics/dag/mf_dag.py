@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import dataclasses
+import datetime
+import hashlib
 import html
 import logging
 import textwrap
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Generic, Optional, Sequence, Tuple, TypeVar
+from enum import Enum
+from typing import Any, Generic, Hashable, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar
 
 import jinja2
+from dbt_semantic_interfaces.implementations.base import HashableBaseModel
 from typing_extensions import override
 
 from metricflow_semantics.dag.dag_to_text import MetricFlowDagTextFormatter
@@ -129,6 +134,41 @@ class DagNode(MetricFlowPrettyFormattable, Generic[DagNodeT], ABC):
         """Return a text representation that shows the structure of the DAG component starting from this node."""
         return formatter.dag_component_to_text(self)
 
+    @property
+    def functional_parameters(self) -> Tuple[object, ...]:
+        """The values, aside from the parent nodes, that determine the output of this node.
+
+        These are used to compute the `structural_hash`. By default, these are the values of the dataclass fields other
+        than `parent_nodes`. The node ID is not a field, so it's not included.
+        """
+        return tuple(getattr(self, field.name) for field in dataclasses.fields(self) if field.name != "parent_nodes")
+
+    @property
+    def structural_hash(self) -> str:
+        """A digest of this node and its ancestors that doesn't depend on the node IDs.
+
+        The digest is computed from the functional parameters of this node and the structural hashes of the parent nodes
+        (i.e. a Merkle hash), so nodes that are built separately but have the same parameters and equivalent parents
+        have the same hash. Unlike `hash()`, the value is the same across processes, so it can be used as a key in a
+        shared cache. The value is computed on first access and then stored, so each node in a DAG is hashed once even
+        if it's shared by many branches.
+        """
+        structural_hash = getattr(self, "_structural_hash", None)
+        if structural_hash is None:
+            structural_key = (
+                self.__class__.__name__,
+                _structural_fingerprint(self.functional_parameters),
+                tuple(parent_node.structural_hash for parent_node in self.parent_nodes),
+            )
+            structural_hash = hashlib.sha256(repr(structural_key).encode("utf-8")).hexdigest()
+            # Set via `__setattr__` as this is a frozen dataclass. Concurrent calls compute the same value.
+            object.__setattr__(self, "_structural_hash", structural_hash)
+        return structural_hash
+
+    def structurally_identical(self, other_node: DagNode) -> bool:
+        """Returns true if this node and the other node have the same functional parameters and equivalent parents."""
+        return self is other_node or self.structural_hash == other_node.structural_hash
+
     @override
     def pretty_format(self, format_context: PrettyFormatContext) -> Optional[str]:
         return f"{self.__class__.__name__}(node_id={self.node_id.id_str})"
@@ -174,6 +214,48 @@ def make_graphviz_label(
     )
 
 
+def _structural_fingerprint(value: object) -> Hashable:
+    """Convert a field value into a value with a stable `repr` for computing the structural hash of a `DagNode`.
+
+    DAG nodes are replaced by their structural hash, and collections / dataclasses are converted recursively since they
+    may contain nodes (e.g. a description of a join that contains the node to join to). Unordered collections are
+    sorted so that equal values produce the same `repr`. Pydantic objects from the semantic manifest are described by
+    their JSON.
+
+    Other values raise a `TypeError` as their `repr` may not describe the value (e.g. the default `object.__repr__`
+    only has the class name and the memory address). Nodes with those values should override `functional_parameters`.
+    """
+    if isinstance(value, DagNode):
+        return value.structural_hash
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, Enum):
+        return value.__class__.__name__, value.name
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.__class__.__name__, value.isoformat()
+    if isinstance(value, HashableBaseModel):
+        # e.g. the time window of a cumulative metric.
+        return value.__class__.__name__, value.json(sort_keys=True)
+    if isinstance(value, (tuple, list)):
+        return tuple(_structural_fingerprint(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted((_structural_fingerprint(item) for item in value), key=repr))
+    if isinstance(value, Mapping):
+        return tuple(
+            sorted(
+                ((_structural_fingerprint(key), _structural_fingerprint(item)) for key, item in value.items()), key=repr
+            )
+        )
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (value.__class__.__name__,) + tuple(
+            _structural_fingerprint(getattr(value, field.name)) for field in dataclasses.fields(value)
+        )
+    raise TypeError(
+        f"Unable to compute a structural fingerprint for a value of type {value.__class__.__name__!r}. The node that "
+        f"contains it should override `functional_parameters`."
+    )
+
+
 @dataclass(frozen=True)
 class DagId:
     """Unique identifier for DAGs."""
@@ -211,3 +293,21 @@ class MetricFlowDag(Generic[DagNodeT]):
     def structure_text(self, formatter: MetricFlowDagTextFormatter = MetricFlowDagTextFormatter()) -> str:
         """Return a text representation that shows the structure of this DAG."""
         return formatter.dag_to_text(self)
+
+    def all_nodes(self) -> Sequence[DagNodeT]:
+        """Return the nodes in this DAG, starting from the sink nodes.
+
+        Each node is included once, even if it's the parent of multiple nodes, so this takes linear time in the number
+        of nodes.
+        """
+        seen_nodes: Set[DagNodeT] = set()
+        nodes: List[DagNodeT] = []
+        nodes_to_visit: List[DagNodeT] = list(reversed(self._sink_nodes))
+        while len(nodes_to_visit) > 0:
+            node = nodes_to_visit.pop()
+            if node in seen_nodes:
+                continue
+            seen_nodes.add(node)
+            nodes.append(node)
+            nodes_to_visit.extend(reversed(node.parent_nodes))
+        return nodes
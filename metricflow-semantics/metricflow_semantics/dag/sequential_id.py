@@ -3,15 +3,13 @@ from __future__ import annotations
 import logging
 from contextlib import contextmanager
 from contextvars import ContextVar
-from functools import cached_property
-from typing import Generator, Mapping, Optional
+from typing import Dict, Generator, Tuple
 
 from typing_extensions import override
 
-from metricflow_semantics.collection_helpers.mf_type_aliases import AnyLengthTuple, MappingItem
+from metricflow_semantics.collection_helpers.mf_type_aliases import AnyLengthTuple
 from metricflow_semantics.dag.id_prefix import IdPrefix
 from metricflow_semantics.experimental.dataclass_helpers import fast_frozen_dataclass
-from metricflow_semantics.helpers.mapping_helpers import mf_items_to_dict, mf_mapping_to_items
 from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 
 logger = logging.getLogger(__name__)
@@ -33,28 +31,38 @@ class SequentialId:
         return self.str_value
 
 
-@fast_frozen_dataclass()
 class _IdGenerationState:
-    """Keeps track of the next IDs to return for a given prefix.
+    """Describes how to number IDs in a section opened by `SequentialIdGenerator.id_number_space`.
 
-    Since this is used in a context variable, it can't be mutable or else mutations will be visible between contexts.
+    The next values for each prefix are not stored here. Instead, they're stored in context variables (one per prefix)
+    so that copies of a context (e.g. for a new thread or `asyncio` task) keep separate numbering. States are compared by
+    identity to find the next values that were set while the state was in use.
     """
 
-    default_start_value: int
-    prefix_to_next_value_items: AnyLengthTuple[MappingItem[IdPrefix, int]]
+    __slots__ = ("default_start_value",)
 
-    @cached_property
-    def prefix_to_next_value(self) -> Mapping[IdPrefix, int]:
-        return mf_items_to_dict(self.prefix_to_next_value_items)
+    def __init__(self, default_start_value: int) -> None:
+        self.default_start_value = default_start_value
 
     @staticmethod
-    def create(
-        default_start_value: int, prefix_to_next_value: Optional[Mapping[IdPrefix, int]] = None
-    ) -> _IdGenerationState:
-        return _IdGenerationState(
-            default_start_value=default_start_value,
-            prefix_to_next_value_items=mf_mapping_to_items(prefix_to_next_value or {}),
+    def create(default_start_value: int) -> _IdGenerationState:
+        return _IdGenerationState(default_start_value=default_start_value)
+
+
+# For a given prefix, the next value to use in each state where an ID was generated.
+_NextValueItems = AnyLengthTuple[Tuple[_IdGenerationState, int]]
+
+_prefix_to_next_value_items_var: Dict[IdPrefix, ContextVar[_NextValueItems]] = {}
+
+
+def _get_next_value_items_var(id_prefix: IdPrefix) -> ContextVar[_NextValueItems]:
+    next_value_items_var = _prefix_to_next_value_items_var.get(id_prefix)
+    if next_value_items_var is None:
+        # `setdefault` is atomic, so all threads use the same variable for a prefix.
+        next_value_items_var = _prefix_to_next_value_items_var.setdefault(
+            id_prefix, ContextVar(f"_next_value_items_{id_prefix.str_value}")
         )
+    return next_value_items_var
 
 
 class _IdGenerationStateStack:
@@ -75,18 +83,18 @@ class _IdGenerationStateStack:
     )
 
     @classmethod
-    def _get_stack_items(cls) -> AnyLengthTuple[_IdGenerationState]:
+    def get_stack_items(cls) -> AnyLengthTuple[_IdGenerationState]:
         if cls._state_stack_items.get(None) is None:
             cls._state_stack_items.set((_IdGenerationState.create(default_start_value=0),))
         return cls._state_stack_items.get()
 
     @classmethod
     def push_state(cls, id_generation_state: _IdGenerationState) -> None:
-        cls._state_stack_items.set(cls._get_stack_items() + (id_generation_state,))
+        cls._state_stack_items.set(cls.get_stack_items() + (id_generation_state,))
 
     @classmethod
     def pop_state(cls) -> None:
-        initial_items = cls._get_stack_items()
+        initial_items = cls.get_stack_items()
         state_stack_size = len(initial_items)
         if state_stack_size <= 1:
             logger.error(
@@ -104,12 +112,12 @@ class _IdGenerationStateStack:
 
     @classmethod
     def get_current_state(cls) -> _IdGenerationState:
-        return cls._get_stack_items()[-1]
+        return cls.get_stack_items()[-1]
 
     @classmethod
     def replace_current_state(cls, updated_state: _IdGenerationState) -> None:
         """Remove the current state and replace it the new state."""
-        cls._state_stack_items.set(cls._get_stack_items()[:-1] + (updated_state,))
+        cls._state_stack_items.set(cls.get_stack_items()[:-1] + (updated_state,))
 
 
 class SequentialIdGenerator:
@@ -117,13 +125,27 @@ class SequentialIdGenerator:
 
     @classmethod
     def create_next_id(cls, id_prefix: IdPrefix) -> SequentialId:  # noqa: D102
-        id_generation_state = _IdGenerationStateStack.get_current_state()
-        next_index = id_generation_state.prefix_to_next_value.get(id_prefix) or id_generation_state.default_start_value
-        updated_state = _IdGenerationState.create(
-            default_start_value=id_generation_state.default_start_value,
-            prefix_to_next_value={**id_generation_state.prefix_to_next_value, **{id_prefix: next_index + 1}},
+        state_stack_items = _IdGenerationStateStack.get_stack_items()
+        current_state = state_stack_items[-1]
+        next_value_items_var = _get_next_value_items_var(id_prefix)
+        next_value_items = next_value_items_var.get(())
+
+        next_index = current_state.default_start_value
+        for state, next_value in reversed(next_value_items):
+            if state is current_state:
+                next_index = next_value
+                break
+
+        # Values are only kept for the states in the stack so that numbering can resume after exiting a section. The
+        # stack is short, so this is fast.
+        next_value_items_var.set(
+            tuple(
+                item
+                for item in next_value_items
+                if item[0] is not current_state and any(item[0] is state for state in state_stack_items)
+            )
+            + ((current_state, next_index + 1),)
         )
-        _IdGenerationStateStack.replace_current_state(updated_state)
 
         return SequentialId(id_prefix=id_prefix, index=next_index)
 
@@ -142,5 +164,7 @@ class SequentialIdGenerator:
         On exit, resume ID numbering from prior to entering the context.
         """
         _IdGenerationStateStack.push_state(_IdGenerationState.create(default_start_value=start_value))
-        yield None
-        _IdGenerationStateStack.pop_state()
+        try:
+            yield None
+        finally:
+            _IdGenerationStateStack.pop_state()
@@ -3,6 +3,12 @@ from __future__ import annotations
 import logging
 from typing import Generic, Optional, TypeVar
 
+from metricflow_semantics.collection_helpers.cache_registry import (
+    GLOBAL_CACHE_REGISTRY,
+    CacheStats,
+    InstrumentedCache,
+    estimate_deep_size_bytes,
+)
 from metricflow_semantics.collection_helpers.mf_type_aliases import ValueT
 from metricflow_semantics.experimental.dataclass_helpers import fast_frozen_dataclass
 
@@ -22,7 +28,7 @@ class ResultContainer(Generic[ValueT]):
 ResultCacheKeyT = TypeVar("ResultCacheKeyT")
 
 
-class ResultCache(Generic[ResultCacheKeyT, ValueT]):
+class ResultCache(InstrumentedCache, Generic[ResultCacheKeyT, ValueT]):
     """Cache class to simplify checking / getting / setting the cache for a result.
 
     Usual pattern:
@@ -44,15 +50,26 @@ class ResultCache(Generic[ResultCacheKeyT, ValueT]):
     given the cache key. Without the lock, there may be repeated compute, and this shouldn't be used where the caller
     expects the same exact object.
 
-    This is a WIP - there may be easier patterns. This could also be used for instrumenting cache hit rates.
+    Lookups are counted so that the hit rate is included in `GLOBAL_CACHE_REGISTRY` reports. Similar to the results,
+    the counts may be approximate when the cache is used concurrently.
+
+    This is a WIP - there may be easier patterns.
     """
 
-    def __init__(self) -> None:  # noqa: D107
+    def __init__(self, cache_name: Optional[str] = None) -> None:  # noqa: D107
         self._cache_dict: dict[ResultCacheKeyT, ResultContainer[ValueT]] = {}
+        self._hit_count = 0
+        self._miss_count = 0
+        GLOBAL_CACHE_REGISTRY.register(cache_name or ResultCache.__name__, self)
 
     def get(self, key: ResultCacheKeyT) -> Optional[ResultContainer[ValueT]]:
         """Returns the cache item for a given key. Also see `ResultContainer`."""
-        return self._cache_dict.get(key)
+        result = self._cache_dict.get(key)
+        if result is None:
+            self._miss_count += 1
+        else:
+            self._hit_count += 1
+        return result
 
     def set_and_get(self, key: ResultCacheKeyT, value: ValueT) -> ValueT:
         """Set the result for the given key and return the same result.
@@ -61,3 +78,17 @@ class ResultCache(Generic[ResultCacheKeyT, ValueT]):
         """
         self._cache_dict[key] = ResultContainer(value=value)
         return value
+
+    @property
+    def stats(self) -> CacheStats:  # noqa: D102
+        return CacheStats(
+            hit_count=self._hit_count,
+            miss_count=self._miss_count,
+            eviction_count=0,
+            item_count=len(self._cache_dict),
+            pinned_item_count=0,
+            estimated_size_bytes=0,
+        )
+
+    def estimate_size_bytes(self) -> int:  # noqa: D102
+        return estimate_deep_size_bytes(tuple(self._cache_dict.items()))
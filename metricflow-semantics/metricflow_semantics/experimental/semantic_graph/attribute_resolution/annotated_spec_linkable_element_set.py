@@ -18,6 +18,7 @@ from metricflow_semantics.model.semantics.element_filter import LinkableElementF
 from metricflow_semantics.model.semantics.linkable_element_set_base import AnnotatedSpec, BaseLinkableElementSet
 from metricflow_semantics.specs.instance_spec import InstanceSpec, LinkableInstanceSpec
 from metricflow_semantics.specs.patterns.spec_pattern import SpecPattern
+from metricflow_semantics.specs.patterns.spec_pattern_candidate_index import SpecPatternCandidateIndex
 
 logger = logging.getLogger(__name__)
 
@@ -150,18 +151,26 @@ class AnnotatedSpecLinkableElementSet(BaseLinkableElementSet, SerializableDatacl
         if len(spec_patterns) == 0:
             return self
 
-        spec_to_annotated_spec: dict[InstanceSpec, AnnotatedSpec] = {
-            annotated_spec.spec: annotated_spec for annotated_spec in self.annotated_specs
-        }
-        specs = tuple(spec_to_annotated_spec.keys())
-        for spec_pattern in spec_patterns:
-            matched_specs = tuple(spec_pattern.match(specs))
-            specs = matched_specs
+        # The index can only be used for the first pattern as the others match the output of the previous one.
+        specs: Sequence[InstanceSpec] = spec_patterns[0].match_index(self.spec_pattern_candidate_index)
+        for spec_pattern in spec_patterns[1:]:
+            specs = spec_pattern.match(specs)
 
+        spec_to_annotated_spec = self._spec_to_annotated_spec
         return AnnotatedSpecLinkableElementSet(
             annotated_specs=tuple(spec_to_annotated_spec[matched_spec] for matched_spec in specs)
         )
 
+    @cached_property
+    def _spec_to_annotated_spec(self) -> Mapping[InstanceSpec, AnnotatedSpec]:
+        return {annotated_spec.spec: annotated_spec for annotated_spec in self.annotated_specs}
+
+    @override
+    @cached_property
+    def spec_pattern_candidate_index(self) -> SpecPatternCandidateIndex:
+        # Use the keys of the mapping as there can be multiple annotated specs with the same spec.
+        return SpecPatternCandidateIndex(tuple(self._spec_to_annotated_spec.keys()))
+
     @override
     @cached_property
     def derived_from_semantic_models(self) -> Sequence[SemanticModelReference]:
@@ -71,15 +71,15 @@ class SemanticGraphLinkableSpecResolver(LinkableSpecResolver):
 
         self._result_cache_for_measure: ResultCache[
             tuple[MeasureReference, Optional[LinkableElementFilter]], BaseLinkableElementSet
-        ] = ResultCache()
+        ] = ResultCache(cache_name="SemanticGraphLinkableSpecResolver.linkable_element_set_for_measure")
 
         self._result_cache_for_metrics: ResultCache[
             tuple[FrozenOrderedSet[MetricReference], Optional[LinkableElementFilter]], BaseLinkableElementSet
-        ] = ResultCache()
+        ] = ResultCache(cache_name="SemanticGraphLinkableSpecResolver.linkable_element_set_for_metrics")
 
         self._result_cache_for_distinct_values: ResultCache[
             tuple[Optional[LinkableElementFilter]], BaseLinkableElementSet
-        ] = ResultCache()
+        ] = ResultCache(cache_name="SemanticGraphLinkableSpecResolver.linkable_element_set_for_distinct_values")
 
     @override
     def get_linkable_element_set_for_measure(
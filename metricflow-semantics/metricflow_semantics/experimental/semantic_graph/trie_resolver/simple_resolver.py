@@ -65,7 +65,9 @@ class SimpleTrieResolver(DunderNameTrieResolver):
         """
         super().__init__(semantic_graph=semantic_graph, path_finder=path_finder)
         self._verbose_debug_logs = False
-        self._result_cache: ResultCache[TrieCacheKey, DunderNameTrie] = ResultCache()
+        self._result_cache: ResultCache[TrieCacheKey, DunderNameTrie] = ResultCache(
+            cache_name="SimpleTrieResolver.result"
+        )
         self._max_path_model_count = max_path_model_count
 
     @override
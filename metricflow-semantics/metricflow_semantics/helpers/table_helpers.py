@@ -6,8 +6,6 @@ import threading
 from types import ModuleType
 from typing import Mapping, Optional, Sequence, Union
 
-import tabulate
-
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +60,9 @@ class IsolatedTabulateRunner:
                 "Generating text table without required options set as there was an error loading the "
                 "`tabulate` module."
             )
+            # Imported here as `tabulate` is only needed to display results.
+            import tabulate
+
             return tabulate.tabulate(
                 tabular_data=tabular_data,
                 headers=headers,
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, Union
+
+from dbt_semantic_interfaces.implementations.base import HashableBaseModel
+from dbt_semantic_interfaces.protocols import Metric, SavedQuery, SemanticModel
+from dbt_semantic_interfaces.protocols.project_configuration import ProjectConfiguration
+from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+
+
+@dataclass(frozen=True)
+class SemanticManifestDiff:
+    """Describes the changes between two versions of a semantic manifest by the names of the changed objects.
+
+    Attributes:
+        changed_semantic_model_names: The semantic models that were added, removed, or modified.
+        changed_metric_names: The metrics that were added, removed, or modified.
+        changed_saved_query_names: The saved queries that were added, removed, or modified.
+        project_configuration_changed: Whether the project configuration (e.g. the time spines) was modified.
+    """
+
+    changed_semantic_model_names: FrozenSet[str]
+    changed_metric_names: FrozenSet[str]
+    changed_saved_query_names: FrozenSet[str]
+    project_configuration_changed: bool
+
+    @staticmethod
+    def create(
+        previous_semantic_manifest: SemanticManifest, updated_semantic_manifest: SemanticManifest
+    ) -> SemanticManifestDiff:
+        """Compare the objects in the manifests.
+
+        Objects are compared using their serialized form, so this is much faster than building objects from the
+        manifest (e.g. the `LinkableSpecIndex`).
+        """
+        return SemanticManifestDiff(
+            changed_semantic_model_names=SemanticManifestDiff._changed_names(
+                previous_semantic_manifest.semantic_models, updated_semantic_manifest.semantic_models
+            ),
+            changed_metric_names=SemanticManifestDiff._changed_names(
+                previous_semantic_manifest.metrics, updated_semantic_manifest.metrics
+            ),
+            changed_saved_query_names=SemanticManifestDiff._changed_names(
+                previous_semantic_manifest.saved_queries, updated_semantic_manifest.saved_queries
+            ),
+            project_configuration_changed=_serialize(previous_semantic_manifest.project_configuration)
+            != _serialize(updated_semantic_manifest.project_configuration),
+        )
+
+    @staticmethod
+    def _changed_names(
+        previous_objects: Iterable[Union[SemanticModel, Metric, SavedQuery]],
+        updated_objects: Iterable[Union[SemanticModel, Metric, SavedQuery]],
+    ) -> FrozenSet[str]:
+        previous_name_to_serialized_object: Dict[str, str] = {
+            previous_object.name: _serialize(previous_object) for previous_object in previous_objects
+        }
+        updated_name_to_serialized_object: Dict[str, str] = {
+            updated_object.name: _serialize(updated_object) for updated_object in updated_objects
+        }
+        return frozenset(
+            name
+            for name in previous_name_to_serialized_object.keys() | updated_name_to_serialized_object.keys()
+            if previous_name_to_serialized_object.get(name) != updated_name_to_serialized_object.get(name)
+        )
+
+    @property
+    def has_changes(self) -> bool:  # noqa: D102
+        return (
+            len(self.changed_semantic_model_names) > 0
+            or len(self.changed_metric_names) > 0
+            or len(self.changed_saved_query_names) > 0
+            or self.project_configuration_changed
+        )
+
+
+def _serialize(manifest_object: Union[SemanticModel, Metric, SavedQuery, ProjectConfiguration]) -> str:
+    # Similar to `compute_semantic_manifest_fingerprint`.
+    if isinstance(manifest_object, HashableBaseModel):
+        return manifest_object.json(sort_keys=True)
+    return repr(manifest_object)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import hashlib
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+
+
+def compute_semantic_manifest_fingerprint(semantic_manifest: SemanticManifest) -> str:
+    """Return a hash of the contents of the semantic manifest.
+
+    This can be used to check whether objects derived from a manifest (e.g. cached query plans) are still valid.
+    For manifests that aren't `PydanticSemanticManifest`, the `repr` is used, which is deterministic for
+    dataclass-based implementations.
+    """
+    if isinstance(semantic_manifest, PydanticSemanticManifest):
+        serialized_manifest = semantic_manifest.json(sort_keys=True)
+    else:
+        serialized_manifest = repr(semantic_manifest)
+    return hashlib.sha256(serialized_manifest.encode("utf-8")).hexdigest()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from functools import cached_property
+from pathlib import Path
+from typing import Optional, Tuple
 
 from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
 
@@ -15,9 +17,16 @@ from metricflow_semantics.experimental.semantic_graph.attribute_resolution.sg_li
 )
 from metricflow_semantics.experimental.semantic_graph.builder.graph_builder import SemanticGraphBuilder
 from metricflow_semantics.experimental.semantic_graph.sg_interfaces import SemanticGraphEdge, SemanticGraphNode
+from metricflow_semantics.model.semantic_manifest_fingerprint import compute_semantic_manifest_fingerprint
 from metricflow_semantics.model.semantics.linkable_spec_index import LinkableSpecIndex
+from metricflow_semantics.model.semantics.linkable_spec_index_builder import LinkableSpecIndexBuilder
+from metricflow_semantics.model.semantics.linkable_spec_index_snapshot import LinkableSpecIndexSnapshot
+from metricflow_semantics.model.semantics.manifest_object_lookup import SemanticManifestObjectLookup
 from metricflow_semantics.model.semantics.metric_lookup import MetricLookup
+from metricflow_semantics.model.semantics.semantic_model_join_evaluator import MAX_JOIN_HOPS
 from metricflow_semantics.model.semantics.semantic_model_lookup import SemanticModelLookup
+from metricflow_semantics.query.similarity import FuzzyMatchIndexCache
+from metricflow_semantics.specs.metric_spec import MetricSpec
 from metricflow_semantics.time.time_spine_source import TimeSpineSource
 
 logger = logging.getLogger(__name__)
@@ -31,6 +40,8 @@ class SemanticManifestLookup:
         semantic_manifest: SemanticManifest,
         linkable_spec_index: Optional[LinkableSpecIndex] = None,
         use_semantic_graph: Optional[bool] = None,
+        linkable_spec_index_max_workers: int = 1,
+        previous_semantic_manifest_lookup: Optional[SemanticManifestLookup] = None,
     ) -> None:
         """Initializer.
 
@@ -39,6 +50,11 @@ class SemanticManifestLookup:
             linkable_spec_index: If provided, use this to initialize internal data structures. The index can be
             precomputed and stored to improve initialization times. It must be generated for the given manifest - no
             checks are performed and there will be incorrect results if there's a mismatch.
+            linkable_spec_index_max_workers: If `linkable_spec_index` is not provided, the number of processes to use
+            to build the index. See `LinkableSpecIndexBuilder.build_index`.
+            previous_semantic_manifest_lookup: If `linkable_spec_index` is not provided, the lookup for a previous
+            version of the manifest. The parts of its index that are not affected by the changes to the manifest are
+            reused to build the index. See `LinkableSpecIndexBuilder.build_index_using_previous_index`.
         """
         self._semantic_manifest = semantic_manifest
         self._time_spine_sources = TimeSpineSource.build_standard_time_spine_sources(semantic_manifest)
@@ -54,6 +70,7 @@ class SemanticManifestLookup:
             )
             use_semantic_graph = False
 
+        self._linkable_spec_index: Optional[LinkableSpecIndex] = None
         if use_semantic_graph:
             pathfinder = MetricflowPathfinder[SemanticGraphNode, SemanticGraphEdge, AttributeRecipeWriterPath]()
             manifest_object_lookup = ManifestObjectLookup(semantic_manifest)
@@ -74,25 +91,65 @@ class SemanticManifestLookup:
             )
             return
 
-        if linkable_spec_index is not None:
-            self._metric_lookup = MetricLookup.create_using_index(
-                semantic_manifest=self._semantic_manifest,
+        if linkable_spec_index is None:
+            linkable_spec_index_builder = LinkableSpecIndexBuilder(
+                semantic_manifest=semantic_manifest,
                 semantic_model_lookup=self._semantic_model_lookup,
-                custom_granularities=self.custom_granularities,
-                linkable_spec_index=linkable_spec_index,
+                manifest_object_lookup=SemanticManifestObjectLookup(semantic_manifest),
+                max_entity_links=MAX_JOIN_HOPS,
             )
-            return
-
-        self._metric_lookup = MetricLookup.create(
+            previous_linkable_spec_index = (
+                previous_semantic_manifest_lookup.linkable_spec_index
+                if previous_semantic_manifest_lookup is not None
+                else None
+            )
+            if previous_semantic_manifest_lookup is not None and previous_linkable_spec_index is not None:
+                linkable_spec_index = linkable_spec_index_builder.build_index_using_previous_index(
+                    previous_index=previous_linkable_spec_index,
+                    previous_semantic_manifest=previous_semantic_manifest_lookup.semantic_manifest,
+                )
+            else:
+                linkable_spec_index = linkable_spec_index_builder.build_index(
+                    max_workers=linkable_spec_index_max_workers
+                )
+
+        self._linkable_spec_index = linkable_spec_index
+        self._metric_lookup = MetricLookup.create_using_index(
             semantic_manifest=self._semantic_manifest,
             semantic_model_lookup=self._semantic_model_lookup,
             custom_granularities=self.custom_granularities,
+            linkable_spec_index=linkable_spec_index,
+        )
+
+    @staticmethod
+    def create_using_index_snapshot(
+        semantic_manifest: SemanticManifest,
+        snapshot_path: Path,
+        write_snapshot_on_create: bool = False,
+    ) -> SemanticManifestLookup:
+        """Create the lookup using the `LinkableSpecIndex` stored at the given path.
+
+        If the snapshot is missing or was built for a different manifest, the index is rebuilt. See
+        `LinkableSpecIndexSnapshot.load_or_create`.
+        """
+        snapshot = LinkableSpecIndexSnapshot.load_or_create(
+            semantic_manifest=semantic_manifest,
+            snapshot_path=snapshot_path,
+            write_snapshot_on_create=write_snapshot_on_create,
+        )
+        return SemanticManifestLookup(
+            semantic_manifest=semantic_manifest, linkable_spec_index=snapshot.linkable_spec_index
         )
 
     @property
     def semantic_manifest(self) -> SemanticManifest:  # noqa: D102
         return self._semantic_manifest
 
+    @cached_property
+    def semantic_manifest_fingerprint(self) -> str:
+        """A hash of the contents of the semantic manifest - see `compute_semantic_manifest_fingerprint`."""
+        return compute_semantic_manifest_fingerprint(self._semantic_manifest)
+
     @property
     def semantic_model_lookup(self) -> SemanticModelLookup:  # noqa: D102
         return self._semantic_model_lookup
@@ -100,3 +157,23 @@ class SemanticManifestLookup:
     @property
     def metric_lookup(self) -> MetricLookup:  # noqa: D102
         return self._metric_lookup
+
+    @property
+    def linkable_spec_index(self) -> Optional[LinkableSpecIndex]:
+        """The index used to resolve group-by items, or None if the semantic graph is used instead."""
+        return self._linkable_spec_index
+
+    @cached_property
+    def metric_specs(self) -> Tuple[MetricSpec, ...]:
+        """Specs for the metrics in the manifest, sorted by name.
+
+        The same object is returned for each call so that it can be used as a key for `fuzzy_match_index_cache`.
+        """
+        return tuple(
+            MetricSpec.from_reference(metric_reference) for metric_reference in self._metric_lookup.metric_references
+        )
+
+    @cached_property
+    def fuzzy_match_index_cache(self) -> FuzzyMatchIndexCache:
+        """Indexes of names in the manifest that are used to generate suggestions for invalid query inputs."""
+        return FuzzyMatchIndexCache()
@@ -5,7 +5,7 @@ import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Dict, List, Sequence, Set, Tuple
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.references import SemanticModelReference
@@ -234,10 +234,24 @@ class LinkableElementSet(BaseLinkableElementSet):
         key_to_linkable_entities: Dict[ElementPathKey, Tuple[LinkableEntity, ...]] = {}
         key_to_linkable_metrics: Dict[ElementPathKey, Tuple[LinkableMetric, ...]] = {}
 
-        for path_key, linkable_dimensions in self.path_key_to_linkable_dimensions.items():
-            if element_names is not None and path_key.element_name not in element_names:
-                continue
+        path_key_to_linkable_dimensions = self.path_key_to_linkable_dimensions
+        path_key_to_linkable_entities = self.path_key_to_linkable_entities
+        path_key_to_linkable_metrics = self.path_key_to_linkable_metrics
+        if element_names is not None:
+            # Use the index to avoid checking every element as this is called with large sets to get the elements for a
+            # group-by item in a query.
+            element_set_with_names = self._create_from_specs(
+                spec
+                for element_name in element_names
+                for spec in self.spec_pattern_candidate_index.get_candidates(
+                    element_types=LinkableElementType, element_name=element_name
+                )
+            )
+            path_key_to_linkable_dimensions = element_set_with_names.path_key_to_linkable_dimensions
+            path_key_to_linkable_entities = element_set_with_names.path_key_to_linkable_entities
+            path_key_to_linkable_metrics = element_set_with_names.path_key_to_linkable_metrics
 
+        for path_key, linkable_dimensions in path_key_to_linkable_dimensions.items():
             filtered_linkable_dimensions = tuple(
                 linkable_dimension
                 for linkable_dimension in linkable_dimensions
@@ -251,10 +265,7 @@ class LinkableElementSet(BaseLinkableElementSet):
             if len(filtered_linkable_dimensions) > 0:
                 key_to_linkable_dimensions[path_key] = filtered_linkable_dimensions
 
-        for path_key, linkable_entities in self.path_key_to_linkable_entities.items():
-            if element_names is not None and path_key.element_name not in element_names:
-                continue
-
+        for path_key, linkable_entities in path_key_to_linkable_entities.items():
             filtered_linkable_entities = tuple(
                 linkable_entity
                 for linkable_entity in linkable_entities
@@ -268,10 +279,7 @@ class LinkableElementSet(BaseLinkableElementSet):
             if len(filtered_linkable_entities) > 0:
                 key_to_linkable_entities[path_key] = filtered_linkable_entities
 
-        for path_key, linkable_metrics in self.path_key_to_linkable_metrics.items():
-            if element_names is not None and path_key.element_name not in element_names:
-                continue
-
+        for path_key, linkable_metrics in path_key_to_linkable_metrics.items():
             filtered_linkable_metrics = tuple(
                 linkable_metric
                 for linkable_metric in linkable_metrics
@@ -337,20 +345,58 @@ class LinkableElementSet(BaseLinkableElementSet):
             + len(self.path_key_to_linkable_metrics.keys())
         )
 
+    @cached_property
+    def _path_keys(self) -> Sequence[ElementPathKey]:
+        return (
+            tuple(self.path_key_to_linkable_dimensions.keys())
+            + tuple(self.path_key_to_linkable_entities.keys())
+            + tuple(self.path_key_to_linkable_metrics.keys())
+        )
+
     @cached_property
     def specs(self) -> Sequence[LinkableInstanceSpec]:
         """Converts the items in a `LinkableElementSet` to their corresponding spec objects."""
         specs: List[LinkableInstanceSpec] = []
 
-        for path_key in (
-            tuple(self.path_key_to_linkable_dimensions.keys())
-            + tuple(self.path_key_to_linkable_entities.keys())
-            + tuple(self.path_key_to_linkable_metrics.keys())
-        ):
+        for path_key in self._path_keys:
             specs.append(LinkableElementSet._path_key_to_spec(path_key))
 
         return specs
 
+    @cached_property
+    def _spec_to_path_key_position(self) -> Dict[InstanceSpec, int]:
+        """Maps the specs to the position of the corresponding path key (i.e. the position in `specs`)."""
+        return {spec: position for position, spec in enumerate(self.specs)}
+
+    def _create_from_specs(self, specs: Iterable[InstanceSpec]) -> LinkableElementSet:
+        """Create a set with the elements in this set that correspond to the given specs.
+
+        The order of the path keys is retained as some callers depend on the order of `specs`.
+        """
+        path_key_to_linkable_dimensions: Dict[ElementPathKey, Tuple[LinkableDimension, ...]] = {}
+        path_key_to_linkable_entities: Dict[ElementPathKey, Tuple[LinkableEntity, ...]] = {}
+        path_key_to_linkable_metrics: Dict[ElementPathKey, Tuple[LinkableMetric, ...]] = {}
+
+        path_keys = self._path_keys
+        spec_to_path_key_position = self._spec_to_path_key_position
+        for position in sorted({spec_to_path_key_position[spec] for spec in specs}):
+            path_key = path_keys[position]
+            element_type = path_key.element_type
+            if element_type is LinkableElementType.DIMENSION or element_type is LinkableElementType.TIME_DIMENSION:
+                path_key_to_linkable_dimensions[path_key] = self.path_key_to_linkable_dimensions[path_key]
+            elif element_type is LinkableElementType.ENTITY:
+                path_key_to_linkable_entities[path_key] = self.path_key_to_linkable_entities[path_key]
+            elif element_type is LinkableElementType.METRIC:
+                path_key_to_linkable_metrics[path_key] = self.path_key_to_linkable_metrics[path_key]
+            else:
+                assert_values_exhausted(element_type)
+
+        return LinkableElementSet(
+            path_key_to_linkable_dimensions=path_key_to_linkable_dimensions,
+            path_key_to_linkable_entities=path_key_to_linkable_entities,
+            path_key_to_linkable_metrics=path_key_to_linkable_metrics,
+        )
+
     @override
     @cached_property
     def annotated_specs(self) -> Sequence[AnnotatedSpec]:
@@ -432,31 +478,14 @@ class LinkableElementSet(BaseLinkableElementSet):
         # Spec patterns need all specs to match properly e.g. `MinimumTimeGrainPattern`.
         matching_specs: Sequence[InstanceSpec] = self.specs
 
-        for spec_pattern in spec_patterns:
-            matching_specs = spec_pattern.match(matching_specs)
-        specs_to_include = set(matching_specs)
+        for i, spec_pattern in enumerate(spec_patterns):
+            if i == 0:
+                # The index can only be used for the first pattern as the others match the output of the previous one.
+                matching_specs = spec_pattern.match_index(self.spec_pattern_candidate_index)
+            else:
+                matching_specs = spec_pattern.match(matching_specs)
 
-        path_key_to_linkable_dimensions: Dict[ElementPathKey, Tuple[LinkableDimension, ...]] = {}
-        path_key_to_linkable_entities: Dict[ElementPathKey, Tuple[LinkableEntity, ...]] = {}
-        path_key_to_linkable_metrics: Dict[ElementPathKey, Tuple[LinkableMetric, ...]] = {}
-
-        for path_key, linkable_dimensions in self.path_key_to_linkable_dimensions.items():
-            if LinkableElementSet._path_key_to_spec(path_key) in specs_to_include:
-                path_key_to_linkable_dimensions[path_key] = linkable_dimensions
-
-        for path_key, linkable_entities in self.path_key_to_linkable_entities.items():
-            if LinkableElementSet._path_key_to_spec(path_key) in specs_to_include:
-                path_key_to_linkable_entities[path_key] = linkable_entities
-
-        for path_key, linkable_metrics in self.path_key_to_linkable_metrics.items():
-            if LinkableElementSet._path_key_to_spec(path_key) in specs_to_include:
-                path_key_to_linkable_metrics[path_key] = linkable_metrics
-
-        filtered_elements = LinkableElementSet(
-            path_key_to_linkable_dimensions=path_key_to_linkable_dimensions,
-            path_key_to_linkable_entities=path_key_to_linkable_entities,
-            path_key_to_linkable_metrics=path_key_to_linkable_metrics,
-        )
+        filtered_elements = self._create_from_specs(matching_specs)
         logger.debug(
             LazyFormat(lambda: f"Filtering valid linkable elements took: {time.perf_counter() - start_time:.2f}s")
         )
@@ -27,6 +27,7 @@ from metricflow_semantics.specs.entity_spec import EntitySpec
 from metricflow_semantics.specs.group_by_metric_spec import GroupByMetricSpec
 from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
 from metricflow_semantics.specs.patterns.spec_pattern import SpecPattern
+from metricflow_semantics.specs.patterns.spec_pattern_candidate_index import SpecPatternCandidateIndex
 from metricflow_semantics.specs.time_dimension_spec import TimeDimensionSpec
 from metricflow_semantics.time.granularity import ExpandedTimeGranularity
 
@@ -80,6 +81,11 @@ class BaseLinkableElementSet(SemanticModelDerivation, ABC):
         """Return the annotated specs represented by this."""
         raise NotImplementedError
 
+    @cached_property
+    def spec_pattern_candidate_index(self) -> SpecPatternCandidateIndex:
+        """An index of `specs` that's shared by the spec patterns used with this set to avoid checking every spec."""
+        return SpecPatternCandidateIndex(self.specs)
+
     @abstractmethod
     def filter_by_spec_patterns(self, spec_patterns: Sequence[SpecPattern]) -> Self:
         """Filter the elements in the set by the given spec patters.
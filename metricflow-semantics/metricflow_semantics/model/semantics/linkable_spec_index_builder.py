@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import logging
+import math
 import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
@@ -26,6 +29,7 @@ from metricflow_semantics.errors.error_classes import UnknownMetricError
 from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.mf_logging.pretty_print import mf_pformat
 from metricflow_semantics.model.linkable_element_property import LinkableElementProperty
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff
 from metricflow_semantics.model.semantic_model_derivation import SemanticModelDerivation
 from metricflow_semantics.model.semantics.element_filter import LinkableElementFilter
 from metricflow_semantics.model.semantics.linkable_element import (
@@ -92,79 +96,37 @@ class LinkableSpecIndexBuilder:
             measure_to_metric_time_elements={},
         )
 
-    def build_index(self) -> LinkableSpecIndex:  # noqa: D102
-        start_time = time.perf_counter()
-        for metric in self._semantic_manifest.metrics:
-            linkable_sets_for_measure: List[LinkableElementSet] = []
-            for measure in metric.measure_references:
-                if metric.type is MetricType.CUMULATIVE:
-                    linkable_sets_for_measure.append(
-                        self._get_linkable_element_set_for_measure(
-                            measure,
-                            LinkableElementFilter(without_any_of=frozenset({LinkableElementProperty.DATE_PART})),
-                        )
-                    )
-                elif (
-                    metric.type is MetricType.SIMPLE
-                    or metric.type is MetricType.DERIVED
-                    or metric.type is MetricType.RATIO
-                ):
-                    linkable_sets_for_measure.append(self._get_linkable_element_set_for_measure(measure))
-                elif metric.type is MetricType.CONVERSION:
-                    conversion_type_params = metric.type_params.conversion_type_params
-                    assert (
-                        conversion_type_params
-                    ), "A conversion metric should have type_params.conversion_type_params defined."
-                    if measure == conversion_type_params.base_measure.measure_reference:
-                        # Only can query against the base measure's linkable elements
-                        # as it joins everything back to the base measure data set so
-                        # there is no way of getting the conversion elements
-                        linkable_sets_for_measure.append(self._get_linkable_element_set_for_measure(measure))
-                else:
-                    assert_values_exhausted(metric.type)
+    def build_index(self, max_workers: int = 1) -> LinkableSpecIndex:
+        """Build the index.
 
-            self._linkable_spec_index.metric_to_linkable_element_sets[metric.name] = linkable_sets_for_measure
+        Args:
+            max_workers: If greater than 1, the per-metric work is split across a pool of this many processes. The
+            resulting index is the same as the one built in a single process.
+        """
+        start_time = time.perf_counter()
+        # The element sets for metrics can be set from a previous index in `build_index_using_previous_index`.
+        metrics_without_element_sets = tuple(
+            metric
+            for metric in self._semantic_manifest.metrics
+            if metric.name not in self._linkable_spec_index.metric_to_linkable_element_sets
+        )
+        if max_workers > 1 and len(metrics_without_element_sets) == len(self._semantic_manifest.metrics) > 1:
+            self._build_metric_elements_in_process_pool(max_workers)
+        else:
+            for metric in metrics_without_element_sets:
+                self._linkable_spec_index.metric_to_linkable_element_sets[
+                    metric.name
+                ] = self._get_linkable_element_sets_for_metric(metric)
+
+            # Populate storage dicts with linkable metrics. This loop must happen after the one above so that
+            # _metric_to_linkable_element_sets is populated with entities and dimensions.
+            for metric in self._semantic_manifest.metrics:
+                for metric_subquery_join_path_element in self._get_metric_subquery_join_path_elements(metric):
+                    self._linkable_spec_index.joinable_metrics_for_entities[
+                        metric_subquery_join_path_element.join_on_entity
+                    ].add(metric_subquery_join_path_element)
 
-        # Populate storage dicts with linkable metrics. This loop must happen after the one above so that
-        # _metric_to_linkable_element_sets is populated with entities and dimensions.
         linkable_metrics_start_time = time.perf_counter()
-        for metric in self._semantic_manifest.metrics:
-            # Cumulative metrics and time offset metrics require grouping by metric_time, which is not yet available for
-            # linkable metrics. So skip those.
-            if self._metric_requires_metric_time(metric):
-                continue
-            metric_reference = MetricReference(metric.name)
-            linkable_element_set_for_metric = self.get_linkable_elements_for_metrics([metric_reference])
-
-            defined_from_semantic_models = tuple(
-                self._semantic_model_lookup.measure_lookup.get_properties(
-                    input_measure.measure_reference
-                ).model_reference
-                for input_measure in metric.input_measures
-            )
-
-            for linkable_entities in linkable_element_set_for_metric.path_key_to_linkable_entities.values():
-                for linkable_entity in linkable_entities:
-                    # TODO: some users encounter a situation in which the entity reference is in the entity links. Debug why.
-                    if linkable_entity.reference in linkable_entity.entity_links:
-                        logger.debug(
-                            LazyFormat(
-                                lambda: f"Found entity reference in entity links for linkable entity: {linkable_entity}"
-                            )
-                        )
-                        continue
-                    metric_subquery_join_path_element = MetricSubqueryJoinPathElement(
-                        metric_reference=metric_reference,
-                        derived_from_semantic_models=defined_from_semantic_models,
-                        join_on_entity=linkable_entity.reference,
-                        entity_links=linkable_entity.entity_links,
-                        metric_to_entity_join_path=(linkable_entity.join_path if linkable_entity.join_path else None),
-                    )
-                    self._linkable_spec_index.joinable_metrics_for_entities[linkable_entity.reference].add(
-                        metric_subquery_join_path_element
-                    )
-                    # TODO: update _metric_to_linkable_element_sets to have linkable metrics
-
         # If no metrics are specified, the query interface supports querying distinct values for dimensions, entities,
         # and group by metrics.
         linkable_element_sets_for_no_metrics_queries: List[LinkableElementSet] = []
@@ -195,6 +157,292 @@ class LinkableSpecIndexBuilder:
 
         return self._linkable_spec_index
 
+    def build_index_using_previous_index(
+        self, previous_index: LinkableSpecIndex, previous_semantic_manifest: SemanticManifest
+    ) -> LinkableSpecIndex:
+        """Build the index, reusing the parts of an index that was built for a previous version of the manifest.
+
+        Only the parts for the semantic models and the metrics that are affected by the changes are rebuilt. The
+        elements that can be joined to a semantic model depend on the semantic models within the join limit, so those
+        parts are rebuilt for all semantic models near a changed one. The resulting index is the same as the one built
+        by `build_index`.
+        """
+        start_time = time.perf_counter()
+        manifest_diff = SemanticManifestDiff.create(
+            previous_semantic_manifest=previous_semantic_manifest, updated_semantic_manifest=self._semantic_manifest
+        )
+        if manifest_diff.project_configuration_changed:
+            # The time spines affect the elements for all measures.
+            return self.build_index()
+
+        changed_semantic_model_references = frozenset(
+            SemanticModelReference(semantic_model_name)
+            for semantic_model_name in manifest_diff.changed_semantic_model_names
+        )
+        # The changed semantic models were joinable to the ones nearby in the previous manifest, and are joinable to
+        # the ones nearby in the updated manifest.
+        semantic_model_references_with_changed_joins = self._get_semantic_models_within_join_limit(
+            semantic_manifest=previous_semantic_manifest,
+            semantic_model_references=changed_semantic_model_references,
+        ).union(
+            self._get_semantic_models_within_join_limit(
+                semantic_manifest=self._semantic_manifest,
+                semantic_model_references=changed_semantic_model_references,
+            )
+        )
+        unchanged_semantic_model_references = {
+            semantic_model.reference
+            for semantic_model in self._semantic_manifest.semantic_models
+            if semantic_model.reference not in changed_semantic_model_references
+        }
+        unchanged_measure_references = {
+            measure.reference
+            for semantic_model in self._semantic_manifest.semantic_models
+            if semantic_model.reference in unchanged_semantic_model_references
+            for measure in semantic_model.measures
+        }
+
+        index = self._linkable_spec_index
+        for (
+            semantic_model_reference,
+            local_elements,
+        ) in previous_index.semantic_model_reference_to_local_elements.items():
+            if semantic_model_reference in unchanged_semantic_model_references:
+                index.semantic_model_reference_to_local_elements[semantic_model_reference] = local_elements
+        for (
+            semantic_model_reference,
+            joined_elements,
+        ) in previous_index.semantic_model_reference_to_joined_elements.items():
+            if (
+                semantic_model_reference in unchanged_semantic_model_references
+                and semantic_model_reference not in semantic_model_references_with_changed_joins
+            ):
+                index.semantic_model_reference_to_joined_elements[semantic_model_reference] = joined_elements
+        for measure_reference, metric_time_elements in previous_index.measure_to_metric_time_elements.items():
+            if measure_reference is None or measure_reference in unchanged_measure_references:
+                index.measure_to_metric_time_elements[measure_reference] = metric_time_elements
+
+        reused_metric_count = 0
+        for metric in self._semantic_manifest.metrics:
+            previous_linkable_element_sets = previous_index.metric_to_linkable_element_sets.get(metric.name)
+            if (
+                previous_linkable_element_sets is None
+                or metric.name in manifest_diff.changed_metric_names
+                or any(
+                    self._manifest_object_lookup.get_semantic_model_containing_measure(measure_reference).reference
+                    in semantic_model_references_with_changed_joins
+                    for measure_reference in metric.measure_references
+                )
+            ):
+                continue
+            index.metric_to_linkable_element_sets[metric.name] = list(previous_linkable_element_sets)
+            reused_metric_count += 1
+
+        # The linkable metrics depend on the element sets for all metrics, so they are always rebuilt.
+        result = self.build_index()
+        logger.debug(
+            LazyFormat(
+                "Built index using previous index",
+                changed_semantic_model_count=len(changed_semantic_model_references),
+                semantic_model_with_changed_joins_count=len(semantic_model_references_with_changed_joins),
+                reused_metric_count=reused_metric_count,
+                runtime=lambda: f"{time.perf_counter() - start_time:.2f}s",
+            )
+        )
+        return result
+
+    def _get_semantic_models_within_join_limit(
+        self, semantic_manifest: SemanticManifest, semantic_model_references: FrozenSet[SemanticModelReference]
+    ) -> FrozenSet[SemanticModelReference]:
+        """Return the given semantic models and the ones that are within the join limit of them.
+
+        Semantic models are considered joinable if they have an entity with the same name, so this is a superset of the
+        semantic models that can be joined.
+        """
+        entity_name_to_semantic_model_references: Dict[str, List[SemanticModelReference]] = defaultdict(list)
+        for semantic_model in semantic_manifest.semantic_models:
+            for entity in semantic_model.entities:
+                entity_name_to_semantic_model_references[entity.name].append(semantic_model.reference)
+        semantic_model_reference_to_entity_names = {
+            semantic_model.reference: tuple(entity.name for entity in semantic_model.entities)
+            for semantic_model in semantic_manifest.semantic_models
+        }
+
+        result = set(semantic_model_references)
+        current_semantic_model_references = set(semantic_model_references)
+        for _ in range(self._max_entity_links):
+            next_semantic_model_references = {
+                next_semantic_model_reference
+                for semantic_model_reference in current_semantic_model_references
+                for entity_name in semantic_model_reference_to_entity_names.get(semantic_model_reference, ())
+                for next_semantic_model_reference in entity_name_to_semantic_model_references[entity_name]
+            }.difference(result)
+            if len(next_semantic_model_references) == 0:
+                break
+            result.update(next_semantic_model_references)
+            current_semantic_model_references = next_semantic_model_references
+
+        return frozenset(result)
+
+    def _get_linkable_element_sets_for_metric(self, metric: Metric) -> List[LinkableElementSet]:
+        linkable_sets_for_measure: List[LinkableElementSet] = []
+        for measure in metric.measure_references:
+            if metric.type is MetricType.CUMULATIVE:
+                linkable_sets_for_measure.append(
+                    self._get_linkable_element_set_for_measure(
+                        measure,
+                        LinkableElementFilter(without_any_of=frozenset({LinkableElementProperty.DATE_PART})),
+                    )
+                )
+            elif (
+                metric.type is MetricType.SIMPLE or metric.type is MetricType.DERIVED or metric.type is MetricType.RATIO
+            ):
+                linkable_sets_for_measure.append(self._get_linkable_element_set_for_measure(measure))
+            elif metric.type is MetricType.CONVERSION:
+                conversion_type_params = metric.type_params.conversion_type_params
+                assert (
+                    conversion_type_params
+                ), "A conversion metric should have type_params.conversion_type_params defined."
+                if measure == conversion_type_params.base_measure.measure_reference:
+                    # Only can query against the base measure's linkable elements
+                    # as it joins everything back to the base measure data set so
+                    # there is no way of getting the conversion elements
+                    linkable_sets_for_measure.append(self._get_linkable_element_set_for_measure(measure))
+            else:
+                assert_values_exhausted(metric.type)
+        return linkable_sets_for_measure
+
+    def _get_metric_subquery_join_path_elements(self, metric: Metric) -> Sequence[MetricSubqueryJoinPathElement]:
+        """Return the elements describing how the metric can be joined as a linkable metric, in a consistent order.
+
+        The linkable element sets for the metric must already be in the index.
+        """
+        # Cumulative metrics and time offset metrics require grouping by metric_time, which is not yet available for
+        # linkable metrics. So skip those.
+        if self._metric_requires_metric_time(metric):
+            return ()
+        metric_reference = MetricReference(metric.name)
+        linkable_element_set_for_metric = self.get_linkable_elements_for_metrics([metric_reference])
+
+        defined_from_semantic_models = tuple(
+            self._semantic_model_lookup.measure_lookup.get_properties(input_measure.measure_reference).model_reference
+            for input_measure in metric.input_measures
+        )
+
+        metric_subquery_join_path_elements: List[MetricSubqueryJoinPathElement] = []
+        for linkable_entities in linkable_element_set_for_metric.path_key_to_linkable_entities.values():
+            for linkable_entity in linkable_entities:
+                # TODO: some users encounter a situation in which the entity reference is in the entity links. Debug why.
+                if linkable_entity.reference in linkable_entity.entity_links:
+                    logger.debug(
+                        LazyFormat(
+                            lambda: f"Found entity reference in entity links for linkable entity: {linkable_entity}"
+                        )
+                    )
+                    continue
+                metric_subquery_join_path_elements.append(
+                    MetricSubqueryJoinPathElement(
+                        metric_reference=metric_reference,
+                        derived_from_semantic_models=defined_from_semantic_models,
+                        join_on_entity=linkable_entity.reference,
+                        entity_links=linkable_entity.entity_links,
+                        metric_to_entity_join_path=(linkable_entity.join_path if linkable_entity.join_path else None),
+                    )
+                )
+                # TODO: update _metric_to_linkable_element_sets to have linkable metrics
+        return metric_subquery_join_path_elements
+
+    def _build_metric_elements_in_process_pool(self, max_workers: int) -> None:
+        """Populate the per-metric parts of the index using a pool of processes.
+
+        The metrics are split into contiguous chunks, and each process builds the linkable element sets and the
+        linkable metrics for a chunk. The results are merged in the order of the metrics in the manifest so that the
+        index is the same as the one built in a single process.
+        """
+        metric_names = tuple(metric.name for metric in self._semantic_manifest.metrics)
+        # Use more chunks than processes as the work for each metric varies.
+        chunk_size = max(1, math.ceil(len(metric_names) / (max_workers * 4)))
+        metric_name_chunks = tuple(
+            metric_names[chunk_start : chunk_start + chunk_size]
+            for chunk_start in range(0, len(metric_names), chunk_size)
+        )
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(metric_name_chunks)),
+            initializer=_initialize_index_builder_process,
+            initargs=(self,),
+        ) as executor:
+            chunk_results = tuple(executor.map(_build_metric_chunk, metric_name_chunks))
+
+        index = self._linkable_spec_index
+        for chunk_result in chunk_results:
+            # Looking up linkable metrics adds the entity to `joinable_metrics_for_entities`, so repeat the lookups in
+            # the same order to get the same keys in the same order.
+            for entity_reference in chunk_result.looked_up_entity_references:
+                index.joinable_metrics_for_entities.setdefault(entity_reference, set())
+            for metric_name, linkable_element_sets in chunk_result.metric_to_linkable_element_sets:
+                index.metric_to_linkable_element_sets[metric_name] = list(linkable_element_sets)
+            for semantic_model_reference, joined_elements in chunk_result.semantic_model_reference_to_joined_elements:
+                index.semantic_model_reference_to_joined_elements.setdefault(semantic_model_reference, joined_elements)
+            for semantic_model_reference, local_elements in chunk_result.semantic_model_reference_to_local_elements:
+                index.semantic_model_reference_to_local_elements.setdefault(semantic_model_reference, local_elements)
+            for measure_reference, metric_time_elements in chunk_result.measure_to_metric_time_elements:
+                index.measure_to_metric_time_elements.setdefault(measure_reference, metric_time_elements)
+
+        # Linkable metrics are added after all element sets, as in the single-process build.
+        for chunk_result in chunk_results:
+            for metric_subquery_join_path_element in chunk_result.metric_subquery_join_path_elements:
+                index.joinable_metrics_for_entities[metric_subquery_join_path_element.join_on_entity].add(
+                    metric_subquery_join_path_element
+                )
+
+    def _build_metric_chunk(self, metric_names: Sequence[str]) -> _MetricChunkResult:
+        """Build the per-metric parts of the index for the given metrics. Runs in a worker process."""
+        index = self._linkable_spec_index
+        known_joined_elements = set(index.semantic_model_reference_to_joined_elements)
+        known_local_elements = set(index.semantic_model_reference_to_local_elements)
+        known_metric_time_elements = set(index.measure_to_metric_time_elements)
+        known_entity_references = set(index.joinable_metrics_for_entities)
+
+        metrics = tuple(
+            self._manifest_object_lookup.get_metric_by_reference(MetricReference(metric_name))
+            for metric_name in metric_names
+        )
+        for metric in metrics:
+            index.metric_to_linkable_element_sets[metric.name] = self._get_linkable_element_sets_for_metric(metric)
+
+        # The linkable metrics are returned instead of being added to the index of this process, as the element sets
+        # for the other chunks built by this process can't include them.
+        metric_subquery_join_path_elements: List[MetricSubqueryJoinPathElement] = []
+        for metric in metrics:
+            metric_subquery_join_path_elements.extend(self._get_metric_subquery_join_path_elements(metric))
+
+        return _MetricChunkResult(
+            metric_to_linkable_element_sets=tuple(
+                (metric.name, tuple(index.metric_to_linkable_element_sets[metric.name])) for metric in metrics
+            ),
+            metric_subquery_join_path_elements=tuple(metric_subquery_join_path_elements),
+            looked_up_entity_references=tuple(
+                entity_reference
+                for entity_reference in index.joinable_metrics_for_entities
+                if entity_reference not in known_entity_references
+            ),
+            semantic_model_reference_to_joined_elements=tuple(
+                item
+                for item in index.semantic_model_reference_to_joined_elements.items()
+                if item[0] not in known_joined_elements
+            ),
+            semantic_model_reference_to_local_elements=tuple(
+                item
+                for item in index.semantic_model_reference_to_local_elements.items()
+                if item[0] not in known_local_elements
+            ),
+            measure_to_metric_time_elements=tuple(
+                item
+                for item in index.measure_to_metric_time_elements.items()
+                if item[0] not in known_metric_time_elements
+            ),
+        )
+
     def _generate_linkable_time_dimensions(
         self,
         semantic_model_origin: SemanticModelReference,
@@ -838,3 +1086,33 @@ class LinkableSpecIndexBuilder:
                 semantic_model=semantic_model, using_join_path=join_path
             ).path_key_to_linkable_metrics,
         )
+
+
+@dataclass(frozen=True)
+class _MetricChunkResult:
+    """The per-metric parts of the index built by a worker process for a chunk of metrics.
+
+    The cache entries and the entities that were looked up for linkable metrics only include the ones that were added
+    to the index while building the chunk.
+    """
+
+    metric_to_linkable_element_sets: Tuple[Tuple[str, Tuple[LinkableElementSet, ...]], ...]
+    metric_subquery_join_path_elements: Tuple[MetricSubqueryJoinPathElement, ...]
+    looked_up_entity_references: Tuple[EntityReference, ...]
+    semantic_model_reference_to_joined_elements: Tuple[Tuple[SemanticModelReference, LinkableElementSet], ...]
+    semantic_model_reference_to_local_elements: Tuple[Tuple[SemanticModelReference, LinkableElementSet], ...]
+    measure_to_metric_time_elements: Tuple[Tuple[Optional[MeasureReference], LinkableElementSet], ...]
+
+
+# The builder used by a worker process in `LinkableSpecIndexBuilder._build_metric_elements_in_process_pool`.
+_process_index_builder: Optional[LinkableSpecIndexBuilder] = None
+
+
+def _initialize_index_builder_process(index_builder: LinkableSpecIndexBuilder) -> None:
+    global _process_index_builder
+    _process_index_builder = index_builder
+
+
+def _build_metric_chunk(metric_names: Sequence[str]) -> _MetricChunkResult:
+    assert _process_index_builder is not None, "The worker process was not initialized with an index builder"
+    return _process_index_builder._build_metric_chunk(metric_names)
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import logging
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+
+from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+
+from metricflow_semantics.__about__ import __version__
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.model.semantic_manifest_fingerprint import compute_semantic_manifest_fingerprint
+from metricflow_semantics.model.semantics.linkable_spec_index import LinkableSpecIndex
+from metricflow_semantics.model.semantics.linkable_spec_index_builder import LinkableSpecIndexBuilder
+from metricflow_semantics.model.semantics.manifest_object_lookup import SemanticManifestObjectLookup
+from metricflow_semantics.model.semantics.semantic_model_join_evaluator import MAX_JOIN_HOPS
+from metricflow_semantics.model.semantics.semantic_model_lookup import SemanticModelLookup
+from metricflow_semantics.time.time_spine_source import TimeSpineSource
+
+logger = logging.getLogger(__name__)
+
+
+class LinkableSpecIndexSnapshotError(Exception):
+    """Raised when a snapshot file is not a valid snapshot or was written using a different format or package version."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class LinkableSpecIndexSnapshot:
+    """A `LinkableSpecIndex` along with the fingerprint of the manifest that it was built for.
+
+    Building the index for a large manifest can take a significant amount of time, so the snapshot can be built offline
+    and loaded when initializing `SemanticManifestLookup`.
+
+    The file format is a fixed-size header (magic bytes, format version, package fingerprint, and the manifest
+    fingerprint) followed by the pickled index. The header can be read without loading the index, so mismatched snapshots
+    are cheap to detect. The package fingerprint identifies the versions of the packages that define the pickled classes,
+    as those classes can change between releases without a change to the format version. Since the index is pickled,
+    snapshots should only be loaded from trusted locations.
+    """
+
+    manifest_fingerprint: str
+    linkable_spec_index: LinkableSpecIndex
+
+    # Increment when the structure of `LinkableSpecIndex` or the objects that it contains changes.
+    FORMAT_VERSION = 2
+    _MAGIC = b"MFLSIDX\x00"
+    # Magic bytes, the format version, the package fingerprint, and the SHA-256 hex digest of the manifest.
+    _HEADER_STRUCT = struct.Struct(">8sI64s64s")
+    # The packages that define the classes in the pickled index.
+    _PICKLED_CLASS_PACKAGE_NAMES = ("metricflow-semantics", "dbt-semantic-interfaces")
+
+    @staticmethod
+    def package_fingerprint() -> str:
+        """Return a hash of the versions of the packages that define the classes in the pickled index."""
+        package_versions = []
+        for package_name in LinkableSpecIndexSnapshot._PICKLED_CLASS_PACKAGE_NAMES:
+            if package_name == "metricflow-semantics":
+                # Use the version in the source as the package may not be installed (e.g. during development).
+                package_version = __version__
+            else:
+                try:
+                    package_version = importlib.metadata.version(package_name)
+                except importlib.metadata.PackageNotFoundError:
+                    package_version = "unknown"
+            package_versions.append(f"{package_name}=={package_version}")
+        return hashlib.sha256("\n".join(package_versions).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def create(semantic_manifest: SemanticManifest) -> LinkableSpecIndexSnapshot:
+        """Build the index for the given manifest."""
+        start_time = time.perf_counter()
+        time_spine_sources = TimeSpineSource.build_standard_time_spine_sources(semantic_manifest)
+        custom_granularities = TimeSpineSource.build_custom_granularities(list(time_spine_sources.values()))
+        linkable_spec_index_builder = LinkableSpecIndexBuilder(
+            semantic_manifest=semantic_manifest,
+            semantic_model_lookup=SemanticModelLookup(
+                model=semantic_manifest, custom_granularities=custom_granularities
+            ),
+            manifest_object_lookup=SemanticManifestObjectLookup(semantic_manifest),
+            max_entity_links=MAX_JOIN_HOPS,
+        )
+        snapshot = LinkableSpecIndexSnapshot(
+            manifest_fingerprint=compute_semantic_manifest_fingerprint(semantic_manifest),
+            linkable_spec_index=linkable_spec_index_builder.build_index(),
+        )
+        logger.info(
+            LazyFormat("Built linkable-spec index snapshot", runtime=f"{time.perf_counter() - start_time:.2f}s")
+        )
+        return snapshot
+
+    def write(self, snapshot_path: Path) -> None:
+        """Write the snapshot to the given path.
+
+        The file is replaced atomically, so processes reading the file concurrently see either the old or the new file.
+        """
+        header = LinkableSpecIndexSnapshot._HEADER_STRUCT.pack(
+            LinkableSpecIndexSnapshot._MAGIC,
+            LinkableSpecIndexSnapshot.FORMAT_VERSION,
+            LinkableSpecIndexSnapshot.package_fingerprint().encode("ascii"),
+            self.manifest_fingerprint.encode("ascii"),
+        )
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=snapshot_path.parent, prefix=f".{snapshot_path.name}.")
+        try:
+            with os.fdopen(file_descriptor, "wb") as snapshot_file:
+                snapshot_file.write(header)
+                pickle.dump(self.linkable_spec_index, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, snapshot_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+        logger.info(LazyFormat("Wrote linkable-spec index snapshot", snapshot_path=str(snapshot_path)))
+
+    @staticmethod
+    def _parse_header(header: bytes, snapshot_path: Path) -> Tuple[int, str]:
+        if len(header) < LinkableSpecIndexSnapshot._HEADER_STRUCT.size:
+            raise LinkableSpecIndexSnapshotError(f"{str(snapshot_path)!r} is too short to be an index snapshot.")
+        (
+            magic,
+            format_version,
+            package_fingerprint,
+            manifest_fingerprint,
+        ) = LinkableSpecIndexSnapshot._HEADER_STRUCT.unpack_from(header)
+        if magic != LinkableSpecIndexSnapshot._MAGIC:
+            raise LinkableSpecIndexSnapshotError(f"{str(snapshot_path)!r} is not an index snapshot.")
+        if format_version != LinkableSpecIndexSnapshot.FORMAT_VERSION:
+            raise LinkableSpecIndexSnapshotError(
+                f"{str(snapshot_path)!r} was written using format version {format_version}, but the supported version"
+                f" is {LinkableSpecIndexSnapshot.FORMAT_VERSION}."
+            )
+        if package_fingerprint.decode("ascii") != LinkableSpecIndexSnapshot.package_fingerprint():
+            raise LinkableSpecIndexSnapshotError(
+                f"{str(snapshot_path)!r} was written using different versions of"
+                f" {' / '.join(LinkableSpecIndexSnapshot._PICKLED_CLASS_PACKAGE_NAMES)}."
+            )
+        return format_version, manifest_fingerprint.decode("ascii")
+
+    @staticmethod
+    def read_manifest_fingerprint(snapshot_path: Path) -> str:
+        """Read the manifest fingerprint from the header of the snapshot without loading the index."""
+        with open(snapshot_path, "rb") as snapshot_file:
+            header = snapshot_file.read(LinkableSpecIndexSnapshot._HEADER_STRUCT.size)
+        _, manifest_fingerprint = LinkableSpecIndexSnapshot._parse_header(header, snapshot_path)
+        return manifest_fingerprint
+
+    @staticmethod
+    def read(snapshot_path: Path) -> LinkableSpecIndexSnapshot:
+        """Load the snapshot at the given path.
+
+        The file is memory-mapped so that the index is deserialized without an intermediate copy of the file contents.
+        """
+        start_time = time.perf_counter()
+        with open(snapshot_path, "rb") as snapshot_file:
+            if os.fstat(snapshot_file.fileno()).st_size < LinkableSpecIndexSnapshot._HEADER_STRUCT.size:
+                raise LinkableSpecIndexSnapshotError(f"{str(snapshot_path)!r} is too short to be an index snapshot.")
+            with mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                _, manifest_fingerprint = LinkableSpecIndexSnapshot._parse_header(
+                    mapped_file[: LinkableSpecIndexSnapshot._HEADER_STRUCT.size], snapshot_path
+                )
+                mapped_file.seek(LinkableSpecIndexSnapshot._HEADER_STRUCT.size)
+                try:
+                    linkable_spec_index = pickle.load(mapped_file)
+                except Exception as e:
+                    raise LinkableSpecIndexSnapshotError(f"Unable to load the index in {str(snapshot_path)!r}.") from e
+
+        if not isinstance(linkable_spec_index, LinkableSpecIndex):
+            raise LinkableSpecIndexSnapshotError(
+                f"{str(snapshot_path)!r} contains an unexpected object of type {type(linkable_spec_index)}."
+            )
+        logger.info(
+            LazyFormat(
+                "Loaded linkable-spec index snapshot",
+                snapshot_path=str(snapshot_path),
+                runtime=f"{time.perf_counter() - start_time:.2f}s",
+            )
+        )
+        return LinkableSpecIndexSnapshot(
+            manifest_fingerprint=manifest_fingerprint, linkable_spec_index=linkable_spec_index
+        )
+
+    @staticmethod
+    def load_or_create(
+        semantic_manifest: SemanticManifest,
+        snapshot_path: Path,
+        write_snapshot_on_create: bool = False,
+    ) -> LinkableSpecIndexSnapshot:
+        """Load the snapshot at the given path if it was built for the given manifest, otherwise build the index.
+
+        Args:
+            semantic_manifest: The manifest that the index should be for.
+            snapshot_path: The path to the snapshot file.
+            write_snapshot_on_create: If the index had to be built, write it to `snapshot_path` so that it can be
+                loaded the next time.
+        """
+        manifest_fingerprint = compute_semantic_manifest_fingerprint(semantic_manifest)
+        if snapshot_path.exists():
+            try:
+                snapshot_manifest_fingerprint = LinkableSpecIndexSnapshot.read_manifest_fingerprint(snapshot_path)
+                if snapshot_manifest_fingerprint == manifest_fingerprint:
+                    return LinkableSpecIndexSnapshot.read(snapshot_path)
+                logger.warning(
+                    LazyFormat(
+                        "The linkable-spec index snapshot was built for a different manifest, so the index will be"
+                        " rebuilt",
+                        snapshot_path=str(snapshot_path),
+                        snapshot_manifest_fingerprint=snapshot_manifest_fingerprint,
+                        manifest_fingerprint=manifest_fingerprint,
+                    )
+                )
+            except LinkableSpecIndexSnapshotError:
+                logger.warning(
+                    LazyFormat(
+                        "Unable to load the linkable-spec index snapshot, so the index will be rebuilt",
+                        snapshot_path=str(snapshot_path),
+                    ),
+                    exc_info=True,
+                )
+        else:
+            logger.info(
+                LazyFormat(
+                    "Linkable-spec index snapshot does not exist, building index", snapshot_path=str(snapshot_path)
+                )
+            )
+
+        snapshot = LinkableSpecIndexSnapshot.create(semantic_manifest)
+        if write_snapshot_on_create:
+            snapshot.write(snapshot_path)
+        return snapshot
@@ -40,6 +40,7 @@ class MetricLookup:
         semantic_manifest: SemanticManifest,
         semantic_model_lookup: SemanticModelLookup,
         custom_granularities: Dict[str, ExpandedTimeGranularity],
+        linkable_spec_index_max_workers: int = 1,
     ) -> MetricLookup:
         manifest_object_lookup = SemanticManifestObjectLookup(semantic_manifest)
 
@@ -49,7 +50,7 @@ class MetricLookup:
             manifest_object_lookup=manifest_object_lookup,
             max_entity_links=MAX_JOIN_HOPS,
         )
-        linkable_spec_index = linkable_spec_index_builder.build_index()
+        linkable_spec_index = linkable_spec_index_builder.build_index(max_workers=linkable_spec_index_max_workers)
         return MetricLookup.create_using_index(
             semantic_manifest=semantic_manifest,
             semantic_model_lookup=semantic_model_lookup,
@@ -116,13 +117,13 @@ class MetricLookup:
 
         self._linkable_elements_including_group_by_metrics_cache = LruCache[
             Tuple[MeasureReference, LinkableElementFilter], BaseLinkableElementSet
-        ](128)
+        ](128, cache_name="MetricLookup.linkable_elements_including_group_by_metrics")
         self._linkable_elements_for_no_metrics_query_cache = LruCache[LinkableElementFilter, BaseLinkableElementSet](
-            128
+            128, cache_name="MetricLookup.linkable_elements_for_no_metrics_query"
         )
         self._linkable_elements_for_metrics_cache = LruCache[
             Tuple[Sequence[MetricReference], LinkableElementFilter], BaseLinkableElementSet
-        ](128)
+        ](128, cache_name="MetricLookup.linkable_elements_for_metrics")
 
     def linkable_elements_for_measure(
         self,
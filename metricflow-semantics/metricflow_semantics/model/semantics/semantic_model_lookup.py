@@ -30,6 +30,7 @@ from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
 from metricflow_semantics.specs.measure_spec import MeasureSpec
 from metricflow_semantics.specs.non_additive_dimension_spec import NonAdditiveDimensionSpec
 from metricflow_semantics.specs.time_dimension_spec import DEFAULT_TIME_GRANULARITY, TimeDimensionSpec
+from metricflow_semantics.specs.where_filter.where_filter_template_cache import WhereFilterTemplateCache
 from metricflow_semantics.time.granularity import ExpandedTimeGranularity
 
 logger = logging.getLogger(__name__)
@@ -70,6 +71,11 @@ class SemanticModelLookup:
         """Returns all the custom_granularity names."""
         return tuple(self.custom_granularities.keys())
 
+    @cached_property
+    def where_filter_template_cache(self) -> WhereFilterTemplateCache:
+        """Cache for processing the Jinja templates in where filters, shared by query resolution and plan building."""
+        return WhereFilterTemplateCache(custom_granularity_names=self.custom_granularity_names)
+
     def get_dimension_references(self) -> Sequence[DimensionReference]:
         """Retrieve all dimension references from the collection of semantic models."""
         return tuple(self._dimension_index.keys())
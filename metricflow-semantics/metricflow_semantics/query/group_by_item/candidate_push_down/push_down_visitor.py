@@ -224,7 +224,7 @@ class _PushDownGroupByItemCandidatesVisitor(GroupByItemResolutionNodeVisitor[Pus
                     candidate_specs = self._group_by_item_resolver_for_query.resolve_available_items(
                         source_spec_patterns=self._suggestion_generator.candidate_filters
                     ).specs
-                    input_suggestions = self._suggestion_generator.input_suggestions(tuple(candidate_specs))
+                    input_suggestions = self._suggestion_generator.input_suggestions(candidate_specs)
 
                 return PushDownResult(
                     candidate_set=GroupByItemCandidateSet.empty_instance(),
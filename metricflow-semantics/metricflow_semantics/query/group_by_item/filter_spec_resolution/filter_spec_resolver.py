@@ -330,8 +330,10 @@ class _ResolveWhereFilterSpecVisitor(GroupByItemResolutionNodeVisitor[FilterSpec
         for location, where_filters in where_filters_and_locations.items():
             for where_filter in where_filters:
                 try:
-                    filter_call_parameter_sets = where_filter.call_parameter_sets(
-                        custom_granularity_names=self._manifest_lookup.semantic_model_lookup.custom_granularity_names
+                    filter_call_parameter_sets = (
+                        self._manifest_lookup.semantic_model_lookup.where_filter_template_cache.get_call_parameter_sets(
+                            where_filter.where_sql_template
+                        )
                     )
                 except Exception as e:
                     non_parsable_resolutions.append(
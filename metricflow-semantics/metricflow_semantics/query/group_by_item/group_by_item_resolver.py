@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Optional, Sequence, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 
 from dbt_semantic_interfaces.call_parameter_sets import TimeDimensionCallParameterSet
 from dbt_semantic_interfaces.naming.keywords import METRIC_TIME_ELEMENT_NAME
@@ -10,6 +10,7 @@ from dbt_semantic_interfaces.references import SemanticModelReference, TimeDimen
 from dbt_semantic_interfaces.type_enums import TimeGranularity
 from typing_extensions import override
 
+from metricflow_semantics.dag.mf_dag import NodeId
 from metricflow_semantics.helpers.string_helpers import mf_indent
 from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.mf_logging.pretty_print import mf_pformat
@@ -87,6 +88,9 @@ class GroupByItemResolver:
     ) -> None:
         self._manifest_lookup = manifest_lookup
         self._resolution_dag = resolution_dag
+        # Suggestions for each invalid input in a query use the available items, so the results are kept to avoid
+        # repeating the push-down and so that the same specs object can be used as a key for the fuzzy-match index.
+        self._available_items_cache: Dict[Tuple[NodeId, Tuple[SpecPattern, ...]], AvailableGroupByItemsResolution] = {}
 
     def resolve_matching_item_for_querying(
         self,
@@ -168,6 +172,7 @@ class GroupByItemResolver:
             input_naming_scheme=ObjectBuilderNamingScheme(),
             input_str=input_str,
             candidate_filters=QueryItemSuggestionGenerator.FILTER_ITEM_CANDIDATE_FILTERS,
+            fuzzy_match_index_cache=self._manifest_lookup.fuzzy_match_index_cache,
         )
 
         push_down_visitor = _PushDownGroupByItemCandidatesVisitor(
@@ -227,6 +232,11 @@ class GroupByItemResolver:
         if resolution_node is None:
             resolution_node = self._resolution_dag.sink_node
 
+        cache_key = (resolution_node.node_id, tuple(source_spec_patterns))
+        cached_result = self._available_items_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         push_down_visitor = _PushDownGroupByItemCandidatesVisitor(
             manifest_lookup=self._manifest_lookup,
             source_spec_patterns=source_spec_patterns,
@@ -236,10 +246,12 @@ class GroupByItemResolver:
 
         push_down_result: PushDownResult = resolution_node.accept(push_down_visitor)
 
-        return AvailableGroupByItemsResolution(
+        result = AvailableGroupByItemsResolution(
             specs=tuple(push_down_result.candidate_set.specs),
             issue_set=push_down_result.issue_set,
         )
+        self._available_items_cache[cache_key] = result
+        return result
 
     def resolve_min_metric_time_grain(self) -> TimeGranularity:
         """Returns the finest base time grain of metric_time for querying."""
@@ -17,6 +17,7 @@ from dbt_semantic_interfaces.references import SemanticModelReference
 from dbt_semantic_interfaces.type_enums import TimeGranularity
 
 from metricflow_semantics.assert_one_arg import assert_at_most_one_arg_set
+from metricflow_semantics.collection_helpers.bounded_cache import BoundedCache
 from metricflow_semantics.errors.error_classes import InvalidQueryException
 from metricflow_semantics.filters.time_constraint import TimeRangeConstraint
 from metricflow_semantics.helpers.string_helpers import mf_indent
@@ -42,7 +43,11 @@ from metricflow_semantics.query.group_by_item.group_by_item_resolver import Grou
 from metricflow_semantics.query.group_by_item.resolution_dag.dag import GroupByItemResolutionDag
 from metricflow_semantics.query.issues.issues_base import MetricFlowQueryResolutionIssueSet
 from metricflow_semantics.query.issues.parsing.string_input_parsing_issue import StringInputParsingIssue
-from metricflow_semantics.query.query_resolution import InputToIssueSetMapping, InputToIssueSetMappingItem
+from metricflow_semantics.query.query_resolution import (
+    InputToIssueSetMapping,
+    InputToIssueSetMappingItem,
+    MetricFlowQueryResolution,
+)
 from metricflow_semantics.query.query_resolver import MetricFlowQueryResolver
 from metricflow_semantics.query.resolver_inputs.base_resolver_inputs import MetricFlowQueryResolverInput
 from metricflow_semantics.query.resolver_inputs.query_resolver_inputs import (
@@ -79,16 +84,41 @@ class MetricFlowQueryParser:
     TODO: Add fuzzy match results.
     """
 
-    def __init__(  # noqa: D107
+    def __init__(
         self,
         semantic_manifest_lookup: SemanticManifestLookup,
         where_filter_pattern_factory: WhereFilterPatternFactory = DefaultWhereFilterPatternFactory(),
+        query_resolution_cache_size: int = 1000,
     ) -> None:
+        """Initializer.
+
+        Args:
+            semantic_manifest_lookup: The lookup for the manifest that queries are resolved against.
+            where_filter_pattern_factory: Creates the patterns used to resolve the group-by items in filters.
+            query_resolution_cache_size: The maximum number of query resolutions to keep. Resolving the group-by items
+            in a query is the most expensive part of parsing, so the resolution is cached by the inputs that it
+            depends on. The time constraint and the limit are applied to the cached resolution.
+        """
         self._manifest_lookup = semantic_manifest_lookup
         self._metric_naming_schemes = (MetricNamingScheme(), ObjectBuilderNamingScheme())
         self._group_by_item_naming_schemes = (ObjectBuilderNamingScheme(), DunderNamingScheme())
         self._where_filter_pattern_factory = where_filter_pattern_factory
         self._time_period_adjuster = DateutilTimePeriodAdjuster()
+        self._query_resolution_cache_size = query_resolution_cache_size
+        self._query_resolution_cache = BoundedCache[_QueryResolutionCacheKey, MetricFlowQueryResolution](
+            max_items=query_resolution_cache_size, cache_name="MetricFlowQueryParser.query_resolution"
+        )
+
+    def with_semantic_manifest_lookup(self, semantic_manifest_lookup: SemanticManifestLookup) -> MetricFlowQueryParser:
+        """Return a parser for another version of the manifest that uses the same options as this parser.
+
+        The cached query resolutions are for this version of the manifest, so they are not copied.
+        """
+        return MetricFlowQueryParser(
+            semantic_manifest_lookup=semantic_manifest_lookup,
+            where_filter_pattern_factory=self._where_filter_pattern_factory,
+            query_resolution_cache_size=self._query_resolution_cache_size,
+        )
 
     def parse_and_validate_saved_query(
         self,
@@ -447,6 +477,105 @@ class MetricFlowQueryParser:
         assert_at_most_one_arg_set(order_by_names=order_by_names, order_by=order_by)
         assert_at_most_one_arg_set(where_constraints=where_constraints, where_constraint_strs=where_constraint_strs)
 
+        where_sql_templates: List[str] = []
+        if where_constraints is not None:
+            where_sql_templates.extend(constraint.where_sql_template for constraint in where_constraints)
+        if where_constraint_strs is not None:
+            where_sql_templates.extend(where_constraint_strs)
+
+        cache_key: Optional[_QueryResolutionCacheKey] = _QueryResolutionCacheKey(
+            metric_names=tuple(metric_names or ()),
+            metrics=tuple(metrics or ()),
+            group_by_names=tuple(group_by_names or ()),
+            group_by=tuple(group_by or ()),
+            where_sql_templates=tuple(where_sql_templates),
+            order_by_names=tuple(order_by_names or ()),
+            order_by=tuple(order_by or ()),
+            min_max_only=min_max_only,
+            apply_group_by=apply_group_by,
+        )
+        # An invalid limit is an error that needs to be reported by the resolver, so those queries are not cached.
+        if limit is not None and (limit < 0 or min_max_only):
+            cache_key = None
+        # Query parameters can be user-defined objects that are not hashable.
+        try:
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+
+        query_resolution = self._query_resolution_cache.get(cache_key) if cache_key is not None else None
+        if query_resolution is None:
+            query_resolution = self._resolve_query(
+                metric_names=metric_names,
+                metrics=metrics,
+                group_by_names=group_by_names,
+                group_by=group_by,
+                # When caching, the limit is applied to the query spec after the lookup so that it's not in the key.
+                limit=limit if cache_key is None else None,
+                where_sql_templates=where_sql_templates,
+                order_by_names=order_by_names,
+                order_by=order_by,
+                min_max_only=min_max_only,
+                apply_group_by=apply_group_by,
+            )
+            # `_resolve_query` raises an exception if there are errors, so only valid resolutions are cached.
+            if cache_key is not None:
+                self._query_resolution_cache.set(cache_key, query_resolution)
+        else:
+            logger.debug(LazyFormat("Using cached query resolution", cache_key=cache_key))
+
+        query_spec = query_resolution.checked_query_spec
+        if cache_key is not None and limit is not None:
+            query_spec = query_spec.with_limit(limit)
+        assert query_resolution.resolution_dag is not None
+        if time_constraint_start is not None or time_constraint_end is not None:
+            if time_constraint_start is None:
+                time_constraint_start = TimeRangeConstraint.ALL_TIME_BEGIN()
+                logger.debug(
+                    LazyFormat(lambda: f"time_constraint_start was None, so it was set to {time_constraint_start}")
+                )
+            if time_constraint_end is None:
+                time_constraint_end = TimeRangeConstraint.ALL_TIME_END()
+                logger.debug(
+                    LazyFormat(lambda: f"time_constraint_end was None, so it was set to {time_constraint_end}")
+                )
+
+            time_constraint = TimeRangeConstraint(
+                start_time=time_constraint_start,
+                end_time=time_constraint_end,
+            )
+
+            time_constraint = self._adjust_time_constraint(
+                resolution_dag=query_resolution.resolution_dag,
+                time_dimension_specs_in_query=query_spec.time_dimension_specs,
+                time_constraint=time_constraint,
+            )
+            logger.debug(LazyFormat(lambda: f"Time constraint after adjustment is: {time_constraint}"))
+
+            return ParseQueryResult(
+                query_spec=query_spec.with_time_range_constraint(time_constraint),
+                queried_semantic_models=query_resolution.queried_semantic_models,
+            )
+
+        return ParseQueryResult(
+            query_spec=query_spec,
+            queried_semantic_models=query_resolution.queried_semantic_models,
+        )
+
+    def _resolve_query(
+        self,
+        metric_names: Optional[Sequence[str]],
+        metrics: Optional[Sequence[MetricQueryParameter]],
+        group_by_names: Optional[Sequence[str]],
+        group_by: Optional[Tuple[GroupByQueryParameter, ...]],
+        limit: Optional[int],
+        where_sql_templates: Sequence[str],
+        order_by_names: Optional[Sequence[str]],
+        order_by: Optional[Sequence[OrderByQueryParameter]],
+        min_max_only: bool,
+        apply_group_by: bool,
+    ) -> MetricFlowQueryResolution:
+        """Resolve the query inputs to specs. Raises an `InvalidQueryException` if there are errors."""
         metric_names = metric_names or ()
         metrics = metrics or ()
 
@@ -545,25 +674,13 @@ class MetricFlowQueryParser:
                 )
             )
 
-        where_filters: List[PydanticWhereFilter] = []
-
-        if where_constraints is not None:
-            where_filters.extend(
-                [
-                    PydanticWhereFilter(where_sql_template=constraint.where_sql_template)
-                    for constraint in where_constraints
-                ]
-            )
-        if where_constraint_strs is not None:
-            where_filters.extend(
-                [
-                    PydanticWhereFilter(where_sql_template=where_constraint_str)
-                    for where_constraint_str in where_constraint_strs
+        resolver_input_for_filter = ResolverInputForQueryLevelWhereFilterIntersection(
+            where_filter_intersection=PydanticWhereFilterIntersection(
+                where_filters=[
+                    PydanticWhereFilter(where_sql_template=where_sql_template)
+                    for where_sql_template in where_sql_templates
                 ]
             )
-
-        resolver_input_for_filter = ResolverInputForQueryLevelWhereFilterIntersection(
-            where_filter_intersection=PydanticWhereFilterIntersection(where_filters=where_filters)
         )
 
         query_resolver = MetricFlowQueryResolver(
@@ -602,41 +719,7 @@ class MetricFlowQueryParser:
             ),
         )
 
-        query_spec = query_resolution.checked_query_spec
-        assert query_resolution.resolution_dag is not None
-        if time_constraint_start is not None or time_constraint_end is not None:
-            if time_constraint_start is None:
-                time_constraint_start = TimeRangeConstraint.ALL_TIME_BEGIN()
-                logger.debug(
-                    LazyFormat(lambda: f"time_constraint_start was None, so it was set to {time_constraint_start}")
-                )
-            if time_constraint_end is None:
-                time_constraint_end = TimeRangeConstraint.ALL_TIME_END()
-                logger.debug(
-                    LazyFormat(lambda: f"time_constraint_end was None, so it was set to {time_constraint_end}")
-                )
-
-            time_constraint = TimeRangeConstraint(
-                start_time=time_constraint_start,
-                end_time=time_constraint_end,
-            )
-
-            time_constraint = self._adjust_time_constraint(
-                resolution_dag=query_resolution.resolution_dag,
-                time_dimension_specs_in_query=query_spec.time_dimension_specs,
-                time_constraint=time_constraint,
-            )
-            logger.debug(LazyFormat(lambda: f"Time constraint after adjustment is: {time_constraint}"))
-
-            return ParseQueryResult(
-                query_spec=query_spec.with_time_range_constraint(time_constraint),
-                queried_semantic_models=query_resolution.queried_semantic_models,
-            )
-
-        return ParseQueryResult(
-            query_spec=query_spec,
-            queried_semantic_models=query_resolution.queried_semantic_models,
-        )
+        return query_resolution
 
     def build_query_spec_for_group_by_metric_source_node(
         self, group_by_metric_spec: GroupByMetricSpec
@@ -648,6 +731,24 @@ class MetricFlowQueryParser:
         ).query_spec
 
 
+@dataclass(frozen=True)
+class _QueryResolutionCacheKey:
+    """The query inputs that the query resolution depends on.
+
+    Saved queries are expanded into these inputs before resolution, so they share entries with equivalent queries.
+    """
+
+    metric_names: Tuple[str, ...]
+    metrics: Tuple[MetricQueryParameter, ...]
+    group_by_names: Tuple[str, ...]
+    group_by: Tuple[GroupByQueryParameter, ...]
+    where_sql_templates: Tuple[str, ...]
+    order_by_names: Tuple[str, ...]
+    order_by: Tuple[OrderByQueryParameter, ...]
+    min_max_only: bool
+    apply_group_by: bool
+
+
 @dataclass(frozen=True)
 class ParseQueryResult:
     """Result of parsing a MetricFlow query."""
@@ -163,8 +163,8 @@ class MetricFlowQueryResolver:
             )
         return ResolveMetricOrGroupByItemsResult(input_to_issue_set_mapping=InputToIssueSetMapping.empty_instance())
 
-    @staticmethod
     def _resolve_group_by_item_input(
+        self,
         group_by_item_input: ResolverInputForGroupByItem,
         group_by_item_resolver: GroupByItemResolver,
     ) -> GroupByItemResolution:
@@ -172,6 +172,7 @@ class MetricFlowQueryResolver:
             input_naming_scheme=group_by_item_input.input_obj_naming_scheme,
             input_str=str(group_by_item_input.input_obj),
             candidate_filters=QueryItemSuggestionGenerator.GROUP_BY_ITEM_CANDIDATE_FILTERS,
+            fuzzy_match_index_cache=self._manifest_lookup.fuzzy_match_index_cache,
         )
         resolution = group_by_item_resolver.resolve_matching_item_for_querying(
             spec_pattern=group_by_item_input.spec_pattern,
@@ -205,10 +206,7 @@ class MetricFlowQueryResolver:
         The order of outputs should be the same as the order of inputs.
         """
         # Build a list of metrics that are available from the manifest.
-        available_metric_specs = tuple(
-            MetricSpec.from_reference(metric_reference)
-            for metric_reference in self._manifest_lookup.metric_lookup.metric_references
-        )
+        available_metric_specs = self._manifest_lookup.metric_specs
         metric_specs: List[MetricSpec] = []
         input_to_issue_set_mapping_items: List[InputToIssueSetMappingItem] = []
         alias_to_metrics: Dict[str, List[Tuple[ResolverInputForMetric, MetricReference]]] = defaultdict(list)
@@ -231,6 +229,7 @@ class MetricFlowQueryResolver:
                     input_naming_scheme=MetricNamingScheme(),
                     input_str=str(metric_input.input_obj),
                     candidate_filters=(),
+                    fuzzy_match_index_cache=self._manifest_lookup.fuzzy_match_index_cache,
                 )
                 metric_suggestions = suggestion_generator.input_suggestions(candidate_specs=available_metric_specs)
                 input_to_issue_set_mapping_items.append(
@@ -279,7 +278,7 @@ class MetricFlowQueryResolver:
         linkable_element_sets: List[BaseLinkableElementSet] = []
 
         for group_by_item_input in group_by_item_inputs:
-            resolution = MetricFlowQueryResolver._resolve_group_by_item_input(
+            resolution = self._resolve_group_by_item_input(
                 group_by_item_resolver=group_by_item_resolver,
                 group_by_item_input=group_by_item_input,
             )
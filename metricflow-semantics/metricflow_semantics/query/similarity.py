@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+from collections import Counter, defaultdict
 from dataclasses import dataclass
-from typing import Sequence
+from typing import AbstractSet, Callable, Dict, FrozenSet, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-import rapidfuzz.fuzz
-import rapidfuzz.process
+from metricflow_semantics.collection_helpers.bounded_cache import BoundedCache
 
 
 @dataclass(frozen=True)
@@ -25,7 +25,17 @@ def top_fuzzy_matches(
     """
     # In the case of a tie in score, items will be returned in the order they were passed in.
     # Sort candidate item inputs first for consistent results.
-    sorted_candidate_items = sorted(candidate_items)
+    return _score_sorted_candidate_items(item, sorted(candidate_items), max_matches)
+
+
+def _score_sorted_candidate_items(
+    item: str,
+    sorted_candidate_items: Sequence[str],
+    max_matches: int,
+) -> Sequence[ScoredItem]:
+    # Imported here as suggestions are only needed for queries with errors.
+    import rapidfuzz.fuzz
+    import rapidfuzz.process
 
     scored_items = []
 
@@ -51,3 +61,202 @@ def top_fuzzy_matches(
         scored_items.append(ScoredItem(item_str=value, score=score))
 
     return scored_items
+
+
+@dataclass(frozen=True)
+class _CandidateBuckets:
+    """The candidates of a `FuzzyMatchIndex` grouped for a search. The indexes are positions in the sorted candidates.
+
+    Attributes:
+        ngram_to_candidate_indexes: The candidates grouped by the character n-grams that they contain.
+        single_token_candidate_items: The candidates without whitespace, in sorted order.
+        single_token_candidate_indexes: The indexes of the candidates in `single_token_candidate_items`.
+        multi_token_candidate_indexes: The indexes of the other candidates.
+    """
+
+    ngram_to_candidate_indexes: Mapping[str, Sequence[int]]
+    single_token_candidate_items: Sequence[str]
+    single_token_candidate_indexes: Sequence[int]
+    multi_token_candidate_indexes: Sequence[int]
+
+
+class FuzzyMatchIndex:
+    """An index of candidate items that finds fuzzy matches faster than `top_fuzzy_matches` for large candidate sets.
+
+    Scoring every candidate with `token_set_ratio` is slow when there are many of them (e.g. the group-by items in a
+    large manifest), so a search narrows down the candidates while giving the same results as `top_fuzzy_matches`:
+
+    * The candidates are bucketed by the character n-grams that they contain, and the candidates that share the most
+      n-grams with the item are scored first. If there are enough matches in this shortlist, the lowest score of those
+      is a lower bound for the scores of the top matches of all candidates.
+    * Element names don't contain whitespace, so they are a single token. For two single-token items,
+      `token_set_ratio` is the same as `ratio` (aside from rounding), and `rapidfuzz` can skip candidates for `ratio`
+      using the lower bound (e.g. when the lengths are too different). Only the candidates that reach the bound, and
+      the candidates with whitespace, are scored using `token_set_ratio`.
+
+    Building the buckets takes longer than scoring all candidates once, so the first search scores all candidates and
+    the buckets are built when the index is searched again.
+    """
+
+    # Allows for rounding differences between `ratio` and `token_set_ratio`, and for the limited precision of
+    # `score_cutoff` when `rapidfuzz` scores candidates in batches. The candidates that are included because of this are
+    # scored again, so this only affects how many candidates are scored.
+    _SCORE_TOLERANCE = 0.1
+
+    def __init__(self, candidate_items: Iterable[str], ngram_length: int = 3, max_shortlist_size: int = 500) -> None:
+        """Initializer.
+
+        Args:
+            candidate_items: The items to search for matches.
+            ngram_length: The length of the character n-grams used to bucket the candidates.
+            max_shortlist_size: The maximum number of candidates in the shortlist for a search.
+        """
+        self._sorted_candidate_items = tuple(sorted(set(candidate_items)))
+        self._ngram_length = ngram_length
+        self._max_shortlist_size = max_shortlist_size
+        # Built on the second search. Set once built, so concurrent searches don't see partially-built buckets.
+        self._candidate_buckets: Optional[_CandidateBuckets] = None
+        self._search_count = 0
+
+    def _get_candidate_buckets(self) -> _CandidateBuckets:
+        candidate_buckets = self._candidate_buckets
+        if candidate_buckets is not None:
+            return candidate_buckets
+
+        ngram_to_candidate_indexes: Dict[str, List[int]] = defaultdict(list)
+        single_token_candidate_indexes: List[int] = []
+        multi_token_candidate_indexes: List[int] = []
+        for candidate_index, candidate_item in enumerate(self._sorted_candidate_items):
+            for ngram in self._ngrams(candidate_item):
+                ngram_to_candidate_indexes[ngram].append(candidate_index)
+            if FuzzyMatchIndex._is_single_token(candidate_item):
+                single_token_candidate_indexes.append(candidate_index)
+            else:
+                multi_token_candidate_indexes.append(candidate_index)
+        candidate_buckets = _CandidateBuckets(
+            ngram_to_candidate_indexes=ngram_to_candidate_indexes,
+            single_token_candidate_items=tuple(
+                self._sorted_candidate_items[candidate_index] for candidate_index in single_token_candidate_indexes
+            ),
+            single_token_candidate_indexes=single_token_candidate_indexes,
+            multi_token_candidate_indexes=multi_token_candidate_indexes,
+        )
+        self._candidate_buckets = candidate_buckets
+        return candidate_buckets
+
+    def _ngrams(self, item: str) -> FrozenSet[str]:
+        # Pad the item so that items shorter than the n-gram length have n-grams, and so that the start and end of the
+        # item are weighted more.
+        padded_item = f" {item.lower()} "
+        if len(padded_item) <= self._ngram_length:
+            return frozenset((padded_item,))
+        return frozenset(
+            padded_item[i : i + self._ngram_length] for i in range(len(padded_item) - self._ngram_length + 1)
+        )
+
+    @staticmethod
+    def _is_single_token(item: str) -> bool:
+        # `rapidfuzz` splits items into tokens using the same whitespace characters as `str.isspace`.
+        return len(item) > 0 and not any(character.isspace() for character in item)
+
+    def _candidates_with_min_score(
+        self, candidate_buckets: _CandidateBuckets, item: str, min_score: float
+    ) -> Sequence[str]:
+        """Return the candidates (in sorted order) that can have a score of at least `min_score` for the item."""
+        if not FuzzyMatchIndex._is_single_token(item):
+            return self._sorted_candidate_items
+
+        import rapidfuzz.fuzz
+        import rapidfuzz.process
+
+        candidate_indexes = list(candidate_buckets.multi_token_candidate_indexes)
+        candidate_indexes.extend(
+            candidate_buckets.single_token_candidate_indexes[single_token_index]
+            for _, _, single_token_index in rapidfuzz.process.extract(
+                item,
+                candidate_buckets.single_token_candidate_items,
+                scorer=rapidfuzz.fuzz.ratio,
+                score_cutoff=max(min_score - FuzzyMatchIndex._SCORE_TOLERANCE, 0),
+                limit=None,
+            )
+        )
+        # Keep the sorted order so that ties are broken the same way as `top_fuzzy_matches`.
+        return tuple(self._sorted_candidate_items[candidate_index] for candidate_index in sorted(candidate_indexes))
+
+    def top_fuzzy_matches(self, item: str, max_matches: int = 6) -> Sequence[ScoredItem]:
+        """Return the top candidates that fuzzy match the given item. See `top_fuzzy_matches`."""
+        self._search_count += 1
+        if len(self._sorted_candidate_items) <= self._max_shortlist_size or self._search_count == 1:
+            return _score_sorted_candidate_items(item, self._sorted_candidate_items, max_matches)
+
+        candidate_buckets = self._get_candidate_buckets()
+        candidate_index_to_shared_ngram_count: Counter[int] = Counter()
+        for ngram in self._ngrams(item):
+            candidate_index_to_shared_ngram_count.update(candidate_buckets.ngram_to_candidate_indexes.get(ngram, ()))
+        shortlist_matches = _score_sorted_candidate_items(
+            item,
+            tuple(
+                self._sorted_candidate_items[candidate_index]
+                for candidate_index, _ in candidate_index_to_shared_ngram_count.most_common(self._max_shortlist_size)
+            ),
+            max_matches,
+        )
+        if len(shortlist_matches) < max_matches:
+            return _score_sorted_candidate_items(item, self._sorted_candidate_items, max_matches)
+
+        # The top matches of all candidates have scores that are at least the lowest score in the shortlist matches.
+        return _score_sorted_candidate_items(
+            item,
+            self._candidates_with_min_score(
+                candidate_buckets, item, min_score=min(scored_item.score for scored_item in shortlist_matches)
+            ),
+            max_matches,
+        )
+
+
+class FuzzyMatchIndexCache:
+    """Keeps the `FuzzyMatchIndex` for recently used sets of candidates so that the index is only built once.
+
+    Suggestions for errors are generated from sets of candidates that repeat across queries (e.g. the metrics in the
+    manifest or the group-by items available for a metric), so an instance should be kept for each manifest.
+    """
+
+    def __init__(self, max_indexes: int = 100) -> None:  # noqa: D107
+        self._candidate_items_to_index = BoundedCache[FrozenSet[str], FuzzyMatchIndex](
+            max_items=max_indexes, cache_name="FuzzyMatchIndexCache.index"
+        )
+        self._candidates_id_to_index = BoundedCache[Tuple[int, Hashable], Tuple[object, FuzzyMatchIndex]](
+            max_items=max_indexes, cache_name="FuzzyMatchIndexCache.index_by_candidates_id"
+        )
+
+    def get_index(self, candidate_items: AbstractSet[str]) -> FuzzyMatchIndex:
+        """Return the index for the given candidates, building it if necessary."""
+        cache_key = frozenset(candidate_items)
+        index = self._candidate_items_to_index.get(cache_key)
+        if index is None:
+            index = FuzzyMatchIndex(cache_key)
+            self._candidate_items_to_index.set(cache_key, index)
+        return index
+
+    def get_index_for_candidates(
+        self,
+        candidates: object,
+        conversion_key: Hashable,
+        convert_to_candidate_items: Callable[[], AbstractSet[str]],
+    ) -> FuzzyMatchIndex:
+        """Return the index for the items converted from `candidates`, converting only if it's a new object.
+
+        Args:
+            candidates: The object that the candidate items are converted from (e.g. a sequence of specs).
+            conversion_key: Identifies how `candidates` are converted to items.
+            convert_to_candidate_items: Returns the candidate items for `candidates`.
+        """
+        # The key uses the ID of the object, so the object is stored with the index to check for ID reuse.
+        cache_key = (id(candidates), conversion_key)
+        cached_candidates_and_index = self._candidates_id_to_index.get(cache_key)
+        if cached_candidates_and_index is not None and cached_candidates_and_index[0] is candidates:
+            return cached_candidates_and_index[1]
+
+        index = self.get_index(convert_to_candidate_items())
+        self._candidates_id_to_index.set(cache_key, (candidates, index))
+        return index
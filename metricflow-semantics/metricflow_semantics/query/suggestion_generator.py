@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Sequence, Tuple
+from typing import Optional, Sequence, Set, Tuple
 
 from metricflow_semantics.naming.naming_scheme import QueryItemNamingScheme
-from metricflow_semantics.query.similarity import top_fuzzy_matches
+from metricflow_semantics.query.similarity import FuzzyMatchIndex, FuzzyMatchIndexCache
 from metricflow_semantics.specs.instance_spec import InstanceSpec
 from metricflow_semantics.specs.patterns.minimum_time_grain import MinimumTimeGrainPattern
 from metricflow_semantics.specs.patterns.no_group_by_metric import NoGroupByMetricPattern
@@ -31,15 +31,25 @@ class QueryItemSuggestionGenerator:
         NoGroupByMetricPattern(),
     )
 
-    def __init__(  # noqa: D107
+    def __init__(
         self,
         input_naming_scheme: QueryItemNamingScheme,
         input_str: str,
         candidate_filters: Sequence[SpecPattern],
+        fuzzy_match_index_cache: Optional[FuzzyMatchIndexCache] = None,
     ) -> None:
+        """Initializer.
+
+        Args:
+            input_naming_scheme: The naming scheme used to convert the candidate specs to strings.
+            input_str: The string that the user provided.
+            candidate_filters: The filters to apply to the candidate specs.
+            fuzzy_match_index_cache: If provided, reuse the fuzzy-match index for the candidates from this cache.
+        """
         self._input_naming_scheme = input_naming_scheme
         self._input_str = input_str
         self._candidate_filters = candidate_filters
+        self._fuzzy_match_index_cache = fuzzy_match_index_cache
 
     @property
     def candidate_filters(self) -> Sequence[SpecPattern]:
@@ -51,9 +61,24 @@ class QueryItemSuggestionGenerator:
         candidate_specs: Sequence[InstanceSpec],
         max_suggestions: int = 6,
     ) -> Sequence[str]:
-        """Return the best specs that match the given pattern from candidate_specs and match the candidate_filer."""
-        # Use edit distance to figure out the closest matches, so convert the specs to strings.
+        """Return the best specs that match the given pattern from candidate_specs and match the candidate_filer.
+
+        If a cache was provided, passing the same `candidate_specs` object again skips converting the specs to strings.
+        """
+        if self._fuzzy_match_index_cache is not None:
+            fuzzy_match_index = self._fuzzy_match_index_cache.get_index_for_candidates(
+                candidates=candidate_specs,
+                conversion_key=(type(self._input_naming_scheme), tuple(self._candidate_filters)),
+                convert_to_candidate_items=lambda: self._candidate_strs(candidate_specs),
+            )
+        else:
+            fuzzy_match_index = FuzzyMatchIndex(self._candidate_strs(candidate_specs))
+        fuzzy_matches = fuzzy_match_index.top_fuzzy_matches(item=self._input_str, max_matches=max_suggestions)
+
+        return tuple(scored_item.item_str for scored_item in fuzzy_matches)
 
+    def _candidate_strs(self, candidate_specs: Sequence[InstanceSpec]) -> Set[str]:
+        # Use edit distance to figure out the closest matches, so convert the specs to strings.
         for candidate_filter in self._candidate_filters:
             candidate_specs = candidate_filter.match(candidate_specs)
 
@@ -63,11 +88,4 @@ class QueryItemSuggestionGenerator:
 
             if candidate_str is not None:
                 candidate_strs.add(candidate_str)
-
-        fuzzy_matches = top_fuzzy_matches(
-            item=self._input_str,
-            candidate_items=tuple(candidate_strs),
-            max_matches=max_suggestions,
-        )
-
-        return tuple(scored_item.item_str for scored_item in fuzzy_matches)
+        return candidate_strs
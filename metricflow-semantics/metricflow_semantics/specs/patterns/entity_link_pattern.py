@@ -12,8 +12,10 @@ from typing_extensions import override
 
 from metricflow_semantics.model.linkable_element_property import LinkableElementProperty
 from metricflow_semantics.model.semantics.element_filter import LinkableElementFilter
+from metricflow_semantics.model.semantics.linkable_element import LinkableElementType
 from metricflow_semantics.specs.instance_spec import InstanceSpec, LinkableInstanceSpec
 from metricflow_semantics.specs.patterns.spec_pattern import SpecPattern
+from metricflow_semantics.specs.patterns.spec_pattern_candidate_index import SpecPatternCandidateIndex
 from metricflow_semantics.specs.spec_set import group_specs_by_type
 
 logger = logging.getLogger(__name__)
@@ -154,6 +156,28 @@ class EntityLinkPattern(SpecPattern):
 
         return matching_specs
 
+    @property
+    def candidate_element_types(self) -> FrozenSet[LinkableElementType]:
+        """The types of elements that this pattern can match."""
+        return frozenset(LinkableElementType)
+
+    @override
+    def match_index(self, candidate_index: SpecPatternCandidateIndex) -> Sequence[LinkableInstanceSpec]:
+        fields_to_compare = self.parameter_set.fields_to_compare
+        if ParameterSetField.ELEMENT_NAME not in fields_to_compare:
+            return self.match(candidate_index.candidate_specs)
+
+        # The other fields are checked by `match`, but only a few candidates have the same element name.
+        return self.match(
+            candidate_index.get_candidates(
+                element_types=self.candidate_element_types,
+                element_name=self.parameter_set.element_name,
+                entity_link_suffix=(
+                    self.parameter_set.entity_links if ParameterSetField.ENTITY_LINKS in fields_to_compare else None
+                ),
+            )
+        )
+
     @property
     @override
     def element_pre_filter(self) -> LinkableElementFilter:
@@ -7,6 +7,7 @@ from metricflow_semantics.model.semantics.element_filter import LinkableElementF
 
 if TYPE_CHECKING:
     from metricflow_semantics.specs.instance_spec import InstanceSpec
+    from metricflow_semantics.specs.patterns.spec_pattern_candidate_index import SpecPatternCandidateIndex
 
 
 class SpecPattern(ABC):
@@ -20,6 +21,13 @@ class SpecPattern(ABC):
         """Given candidate specs, return the ones that match this pattern."""
         raise NotImplementedError
 
+    def match_index(self, candidate_index: SpecPatternCandidateIndex) -> Sequence[InstanceSpec]:
+        """Similar to `match`, but the given index of the candidates can be used to avoid checking every candidate.
+
+        By default, this matches against all candidates in the index.
+        """
+        return self.match(candidate_index.candidate_specs)
+
     def matches_any(self, candidate_specs: Sequence[InstanceSpec]) -> bool:
         """Returns true if this spec matches any of the given specs."""
         return len(self.match(candidate_specs)) > 0
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from dbt_semantic_interfaces.references import EntityReference
+
+from metricflow_semantics.model.semantics.linkable_element import LinkableElementType
+from metricflow_semantics.specs.instance_spec import InstanceSpec, LinkableInstanceSpec
+from metricflow_semantics.specs.spec_set import group_specs_by_type
+
+
+@dataclass(frozen=True)
+class _CandidateLookup:
+    """The lookup tables for `SpecPatternCandidateIndex`.
+
+    Attributes:
+        element_type_to_specs: The candidates grouped by element type.
+        element_name_key_to_specs: The candidates grouped by (element type, element name).
+        entity_link_suffix_key_to_specs: The candidates grouped by (element type, element name, entity-link suffix)
+            for every suffix of the entity links.
+        entity_link_suffix_to_min_link_count: For each (element type, entity-link suffix), the smallest number of
+            entity links in the candidates with that suffix.
+    """
+
+    element_type_to_specs: Mapping[LinkableElementType, Sequence[LinkableInstanceSpec]]
+    element_name_key_to_specs: Mapping[Tuple[LinkableElementType, str], Sequence[LinkableInstanceSpec]]
+    entity_link_suffix_key_to_specs: Mapping[
+        Tuple[LinkableElementType, str, Tuple[EntityReference, ...]], Sequence[LinkableInstanceSpec]
+    ]
+    entity_link_suffix_to_min_link_count: Mapping[Tuple[LinkableElementType, Tuple[EntityReference, ...]], int]
+
+
+class SpecPatternCandidateIndex:
+    """An index of candidate specs that allows a `SpecPattern` to find matches without checking every candidate.
+
+    Patterns like `EntityLinkPattern` select specs by the element name and a suffix of the entity links. When the
+    candidates are all group-by items available for a measure, there can be many of them, so the candidates are grouped
+    by those keys to make a lookup similar in cost to a dict access. The remaining fields (e.g. the time granularity and
+    the date part) are compared by the pattern as there are only a few candidates with the same element name and entity
+    links.
+
+    The index is built on first use, and it should be shared by all patterns that are matched against the same
+    candidates (e.g. by using `LinkableElementSet.spec_pattern_candidate_index`).
+    """
+
+    def __init__(self, candidate_specs: Sequence[InstanceSpec]) -> None:  # noqa: D107
+        self._candidate_specs = candidate_specs
+        # Set once the lookup is fully built so that concurrent readers never see a partially-built lookup.
+        self._lookup: Optional[_CandidateLookup] = None
+
+    @property
+    def candidate_specs(self) -> Sequence[InstanceSpec]:
+        """The specs that were used to build this index."""
+        return self._candidate_specs
+
+    def _get_lookup(self) -> _CandidateLookup:
+        lookup = self._lookup
+        if lookup is not None:
+            return lookup
+
+        spec_set = group_specs_by_type(self._candidate_specs)
+        # Ordered the same way as `InstanceSpecSet.linkable_specs` so that the candidates are returned in the same
+        # order as `group_specs_by_type`.
+        element_type_to_specs: Dict[LinkableElementType, Sequence[LinkableInstanceSpec]] = {
+            LinkableElementType.DIMENSION: spec_set.dimension_specs,
+            LinkableElementType.TIME_DIMENSION: spec_set.time_dimension_specs,
+            LinkableElementType.ENTITY: spec_set.entity_specs,
+            LinkableElementType.METRIC: spec_set.group_by_metric_specs,
+        }
+        element_name_key_to_specs: Dict[Tuple[LinkableElementType, str], List[LinkableInstanceSpec]] = defaultdict(list)
+        entity_link_suffix_key_to_specs: Dict[
+            Tuple[LinkableElementType, str, Tuple[EntityReference, ...]], List[LinkableInstanceSpec]
+        ] = defaultdict(list)
+        entity_link_suffix_to_min_link_count: Dict[Tuple[LinkableElementType, Tuple[EntityReference, ...]], int] = {}
+        for element_type, specs in element_type_to_specs.items():
+            for spec in specs:
+                element_name_key_to_specs[(element_type, spec.element_name)].append(spec)
+                entity_links = spec.entity_links
+                link_count = len(entity_links)
+                # Specs without entity links only match patterns without entity links.
+                for suffix_length in range(1, link_count + 1) if link_count > 0 else (0,):
+                    entity_link_suffix = entity_links[link_count - suffix_length :]
+                    entity_link_suffix_key_to_specs[(element_type, spec.element_name, entity_link_suffix)].append(spec)
+                    min_link_count_key = (element_type, entity_link_suffix)
+                    min_link_count = entity_link_suffix_to_min_link_count.get(min_link_count_key)
+                    if min_link_count is None or link_count < min_link_count:
+                        entity_link_suffix_to_min_link_count[min_link_count_key] = link_count
+
+        # If another thread built the lookup at the same time, the results are the same, so either can be kept.
+        lookup = _CandidateLookup(
+            element_type_to_specs=element_type_to_specs,
+            element_name_key_to_specs=element_name_key_to_specs,
+            entity_link_suffix_key_to_specs=entity_link_suffix_key_to_specs,
+            entity_link_suffix_to_min_link_count=entity_link_suffix_to_min_link_count,
+        )
+        self._lookup = lookup
+        return lookup
+
+    def get_candidates(
+        self,
+        element_types: Iterable[LinkableElementType],
+        element_name: Optional[str],
+        entity_link_suffix: Optional[Tuple[EntityReference, ...]] = None,
+    ) -> Sequence[LinkableInstanceSpec]:
+        """Return the candidates of the given types with the given element name.
+
+        If `entity_link_suffix` is specified, only the candidates where the entity links end with the suffix are
+        returned. Of those, only the ones with the fewest entity links among all candidates of the given types that end
+        with the suffix are returned, as described in `EntityLinkPattern`.
+        """
+        lookup = self._get_lookup()
+        if element_name is None:
+            return ()
+
+        element_type_set = frozenset(element_types)
+        element_types = tuple(
+            element_type for element_type in lookup.element_type_to_specs if element_type in element_type_set
+        )
+        if entity_link_suffix is None:
+            candidates: List[LinkableInstanceSpec] = []
+            for element_type in element_types:
+                candidates.extend(lookup.element_name_key_to_specs.get((element_type, element_name), ()))
+            return candidates
+
+        min_link_counts = tuple(
+            lookup.entity_link_suffix_to_min_link_count[(element_type, entity_link_suffix)]
+            for element_type in element_types
+            if (element_type, entity_link_suffix) in lookup.entity_link_suffix_to_min_link_count
+        )
+        if len(min_link_counts) == 0:
+            return ()
+        min_link_count = min(min_link_counts)
+
+        return tuple(
+            spec
+            for element_type in element_types
+            for spec in lookup.entity_link_suffix_key_to_specs.get((element_type, element_name, entity_link_suffix), ())
+            if len(spec.entity_links) == min_link_count
+        )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Sequence, Tuple
+from typing import FrozenSet, Optional, Sequence, Tuple
 
 from dbt_semantic_interfaces.call_parameter_sets import (
     DimensionCallParameterSet,
@@ -15,6 +15,7 @@ from typing_extensions import override
 
 from metricflow_semantics.model.linkable_element_property import LinkableElementProperty
 from metricflow_semantics.model.semantics.element_filter import LinkableElementFilter
+from metricflow_semantics.model.semantics.linkable_element import LinkableElementType
 from metricflow_semantics.naming.linkable_spec_name import StructuredLinkableSpecName
 from metricflow_semantics.specs.instance_spec import InstanceSpec, LinkableInstanceSpec
 from metricflow_semantics.specs.patterns.entity_link_pattern import (
@@ -38,6 +39,11 @@ class DimensionPattern(EntityLinkPattern):
         filtered_specs: Sequence[LinkableInstanceSpec] = spec_set.dimension_specs + spec_set.time_dimension_specs
         return super().match(filtered_specs)
 
+    @property
+    @override
+    def candidate_element_types(self) -> FrozenSet[LinkableElementType]:
+        return frozenset({LinkableElementType.DIMENSION, LinkableElementType.TIME_DIMENSION})
+
     @staticmethod
     def from_call_parameter_set(  # noqa: D102
         dimension_call_parameter_set: DimensionCallParameterSet,
@@ -75,6 +81,11 @@ class TimeDimensionPattern(EntityLinkPattern):
         spec_set = group_specs_by_type(candidate_specs)
         return super().match(spec_set.time_dimension_specs)
 
+    @property
+    @override
+    def candidate_element_types(self) -> FrozenSet[LinkableElementType]:
+        return frozenset({LinkableElementType.TIME_DIMENSION})
+
     @staticmethod
     def get_fields_to_compare(
         time_granularity_name: Optional[str], date_part: Optional[DatePart]
@@ -136,6 +147,11 @@ class EntityPattern(EntityLinkPattern):
         spec_set = group_specs_by_type(candidate_specs)
         return super().match(spec_set.entity_specs)
 
+    @property
+    @override
+    def candidate_element_types(self) -> FrozenSet[LinkableElementType]:
+        return frozenset({LinkableElementType.ENTITY})
+
     @staticmethod
     def from_call_parameter_set(entity_call_parameter_set: EntityCallParameterSet) -> EntityPattern:  # noqa: D102
         return EntityPattern(
@@ -165,6 +181,11 @@ class GroupByMetricPattern(EntityLinkPattern):
         spec_set = group_specs_by_type(candidate_specs)
         return super().match(spec_set.group_by_metric_specs)
 
+    @property
+    @override
+    def candidate_element_types(self) -> FrozenSet[LinkableElementType]:
+        return frozenset({LinkableElementType.METRIC})
+
     @staticmethod
     def from_call_parameter_set(  # noqa: D102
         metric_call_parameter_set: MetricCallParameterSet,
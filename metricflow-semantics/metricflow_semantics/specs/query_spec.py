@@ -71,6 +71,24 @@ class MetricFlowQuerySpec(SerializableDataclass):
             filter_spec_resolution_lookup=self.filter_spec_resolution_lookup,
         )
 
+    def with_limit(self, limit: Optional[int]) -> MetricFlowQuerySpec:
+        """Return a query spec that's the same as self but with a different limit."""
+        return MetricFlowQuerySpec(
+            metric_specs=self.metric_specs,
+            dimension_specs=self.dimension_specs,
+            entity_specs=self.entity_specs,
+            time_dimension_specs=self.time_dimension_specs,
+            group_by_metric_specs=self.group_by_metric_specs,
+            order_by_specs=self.order_by_specs,
+            time_range_constraint=self.time_range_constraint,
+            limit=limit,
+            filter_intersection=self.filter_intersection,
+            filter_spec_resolution_lookup=self.filter_spec_resolution_lookup,
+            min_max_only=self.min_max_only,
+            apply_group_by=self.apply_group_by,
+            spec_output_order=self.spec_output_order,
+        )
+
     def without_aliases(self) -> MetricFlowQuerySpec:
         """Return a query spec that's the same as self but with all aliases removed."""
         return MetricFlowQuerySpec(
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import jinja2
+from dbt_semantic_interfaces.call_parameter_sets import JinjaCallParameterSets
+from dbt_semantic_interfaces.parsing.where_filter.jinja_object_parser import JinjaObjectParser, QueryItemLocation
+
+from metricflow_semantics.collection_helpers.bounded_cache import BoundedCache
+
+
+class WhereFilterTemplateCache:
+    """Caches the results of processing the Jinja template in where filters, keyed by the template text.
+
+    Filters defined in the manifest (e.g. in metric definitions) are processed for every query that uses them, so this
+    avoids lexing and compiling the same template repeatedly. Two results are cached for a template:
+
+    * The compiled template, which is rendered to create the SQL for the filter.
+    * The parameters of the `Dimension(...)`, `TimeDimension(...)`, `Entity(...)`, and `Metric(...)` calls in the
+      template, which are used to resolve the group-by items in the filter.
+
+    The parameters depend on the custom granularities in the manifest, so an instance should only be used with the
+    manifest that it was created for. Errors from processing a template are not cached.
+    """
+
+    def __init__(self, custom_granularity_names: Sequence[str], max_templates: int = 1000) -> None:
+        """Initializer.
+
+        Args:
+            custom_granularity_names: The names of the custom granularities in the manifest.
+            max_templates: The maximum number of templates to keep results for.
+        """
+        self._custom_granularity_names = tuple(custom_granularity_names)
+        self._jinja_environment = jinja2.Environment(undefined=jinja2.StrictUndefined)
+        self._template_text_to_compiled_template = BoundedCache[str, jinja2.Template](
+            max_items=max_templates, cache_name="WhereFilterTemplateCache.compiled_template"
+        )
+        self._template_text_to_call_parameter_sets = BoundedCache[str, JinjaCallParameterSets](
+            max_items=max_templates, cache_name="WhereFilterTemplateCache.call_parameter_sets"
+        )
+
+    def get_compiled_template(self, where_sql_template: str) -> jinja2.Template:
+        """Return the compiled template. Raises `jinja2.exceptions.TemplateSyntaxError` if the template is invalid."""
+        compiled_template = self._template_text_to_compiled_template.get(where_sql_template)
+        if compiled_template is None:
+            compiled_template = self._jinja_environment.from_string(where_sql_template)
+            self._template_text_to_compiled_template.set(where_sql_template, compiled_template)
+        return compiled_template
+
+    def get_call_parameter_sets(self, where_sql_template: str) -> JinjaCallParameterSets:
+        """Return the parameters of the object-builder calls in the template.
+
+        Raises `ParseJinjaObjectException` if the template can't be parsed.
+        """
+        call_parameter_sets = self._template_text_to_call_parameter_sets.get(where_sql_template)
+        if call_parameter_sets is None:
+            call_parameter_sets = JinjaObjectParser.parse_call_parameter_sets(
+                where_sql_template=where_sql_template,
+                custom_granularity_names=self._custom_granularity_names,
+                query_item_location=QueryItemLocation.NON_ORDER_BY,
+            )
+            self._template_text_to_call_parameter_sets.set(where_sql_template, call_parameter_sets)
+        return call_parameter_sets
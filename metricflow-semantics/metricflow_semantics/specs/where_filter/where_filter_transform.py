@@ -92,7 +92,10 @@ class WhereSpecFactory:
             try:
                 # If there was an error with the template, it should have been caught while resolving the specs for
                 # the filters during query resolution.
-                where_sql = jinja2.Template(where_filter.where_sql_template, undefined=jinja2.StrictUndefined).render(
+                compiled_template = self._semantic_model_lookup.where_filter_template_cache.get_compiled_template(
+                    where_filter.where_sql_template
+                )
+                where_sql = compiled_template.render(
                     {
                         "Dimension": dimension_factory.create,
                         "TimeDimension": time_dimension_factory.create,
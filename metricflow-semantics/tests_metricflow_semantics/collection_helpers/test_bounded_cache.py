@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from metricflow_semantics.collection_helpers.bounded_cache import BoundedCache, CacheEvictionPolicy
+from metricflow_semantics.collection_helpers.cache_registry import CacheStats
+
+
+def test_lru_eviction() -> None:  # noqa: D103
+    cache = BoundedCache[str, str](max_items=2)
+    cache.set("key_0", "value_0")
+    cache.set("key_1", "value_1")
+    # Get "key_0" so that it's not evicted next.
+    assert cache.get("key_0") == "value_0"
+    cache.set("key_2", "value_2")
+
+    assert cache.get("key_1") is None
+    assert cache.get("key_0") == "value_0"
+    assert cache.get("key_2") == "value_2"
+    assert cache.stats == CacheStats(
+        hit_count=3, miss_count=1, eviction_count=1, item_count=2, pinned_item_count=0, estimated_size_bytes=0
+    )
+
+
+def test_fifo_eviction() -> None:  # noqa: D103
+    cache = BoundedCache[str, str](max_items=2, eviction_policy=CacheEvictionPolicy.FIFO)
+    cache.set("key_0", "value_0")
+    cache.set("key_1", "value_1")
+    assert cache.get("key_0") == "value_0"
+    cache.set("key_2", "value_2")
+
+    assert cache.get("key_0") is None
+    assert cache.get("key_1") == "value_1"
+
+
+def test_size_limit() -> None:  # noqa: D103
+    cache = BoundedCache[str, str](max_size_bytes=10, size_estimator=len)
+    cache.set("key_0", "a" * 4)
+    cache.set("key_1", "b" * 4)
+    cache.set("key_2", "c" * 4)
+    assert cache.get("key_0") is None
+    assert cache.stats.estimated_size_bytes == 8
+
+    # Values larger than the limit are not stored.
+    cache.set("key_3", "d" * 11)
+    assert cache.get("key_3") is None
+    assert cache.get("key_2") == "c" * 4
+
+
+def test_pinned_entries() -> None:  # noqa: D103
+    cache = BoundedCache[str, str](max_items=1)
+    cache.pin("pinned_key", "pinned_value")
+    cache.set("key_0", "value_0")
+    cache.set("key_1", "value_1")
+    cache.clear()
+
+    assert cache.get("pinned_key") == "pinned_value"
+    assert cache.get("key_1") is None
+    assert cache.stats.item_count == 1
+    assert cache.stats.pinned_item_count == 1
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import gc
+
+from metricflow_semantics.collection_helpers.cache_registry import CacheRegistry, CacheStats, estimate_deep_size_bytes
+from metricflow_semantics.collection_helpers.lru_cache import LruCache, typed_lru_cache
+from metricflow_semantics.experimental.cache.mf_cache import ResultCache
+
+
+def _create_lru_cache(cache_registry: CacheRegistry, cache_name: str) -> LruCache[str, str]:
+    cache = LruCache[str, str](2)
+    cache_registry.register(cache_name, cache)
+    return cache
+
+
+def test_lru_cache_stats() -> None:  # noqa: D103
+    cache = LruCache[str, str](2)
+    assert cache.get("a") is None
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"
+    # Evicts "b" as "a" was retrieved more recently.
+    cache.set("c", "C")
+    assert cache.get("b") is None
+
+    assert cache.stats == CacheStats(
+        hit_count=1, miss_count=2, eviction_count=1, item_count=2, pinned_item_count=0, estimated_size_bytes=0
+    )
+    assert cache.estimate_size_bytes() > 0
+
+
+def test_result_cache_stats() -> None:  # noqa: D103
+    cache = ResultCache[str, str]()
+    assert cache.get("a") is None
+    cache.set_and_get("a", "A")
+    result = cache.get("a")
+    assert result is not None and result.value == "A"
+
+    assert cache.stats == CacheStats(
+        hit_count=1, miss_count=1, eviction_count=0, item_count=1, pinned_item_count=0, estimated_size_bytes=0
+    )
+
+
+def test_report_combines_instances() -> None:  # noqa: D103
+    cache_registry = CacheRegistry()
+    first_cache = _create_lru_cache(cache_registry, "example")
+    second_cache = _create_lru_cache(cache_registry, "example")
+    other_cache = _create_lru_cache(cache_registry, "other")
+    first_cache.set("a", "A")
+    first_cache.get("a")
+    second_cache.get("a")
+    other_cache.get("a")
+
+    report = cache_registry.create_report()
+    assert report.cache_names == ("example", "other")
+    example_entry = report.get_entry("example")
+    assert example_entry.instance_count == 2
+    assert example_entry.stats == CacheStats(
+        hit_count=1, miss_count=1, eviction_count=0, item_count=1, pinned_item_count=0, estimated_size_bytes=0
+    )
+    assert example_entry.stats.hit_rate == 0.5
+    assert cache_registry.create_report(include_size_estimates=True).get_entry("example").stats.estimated_size_bytes > 0
+    assert "example" in report.text_format()
+
+    # Registration should not keep the caches alive.
+    del first_cache, second_cache
+    gc.collect()
+    assert cache_registry.create_report().cache_names == ("other",)
+
+
+def test_function_cache() -> None:  # noqa: D103
+    cache_registry = CacheRegistry()
+
+    @typed_lru_cache
+    def _double(value: int) -> int:
+        return value * 2
+
+    cache_registry.register_function_cache("double", _double)
+    _double(1)
+    _double(1)
+    _double(2)
+    assert cache_registry.create_report().get_entry("double").stats == CacheStats(
+        hit_count=1, miss_count=2, eviction_count=0, item_count=2, pinned_item_count=0, estimated_size_bytes=0
+    )
+
+
+def test_estimate_deep_size_bytes() -> None:  # noqa: D103
+    shared_value = "x" * 1000
+    assert estimate_deep_size_bytes([(shared_value,)]) > 1000
+    # Objects that are referenced multiple times should only be counted once.
+    assert estimate_deep_size_bytes([(shared_value, shared_value)]) < 2000
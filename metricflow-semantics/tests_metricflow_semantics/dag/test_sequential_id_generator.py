@@ -55,3 +55,32 @@ def test_sequential_id_generator_in_async_tasks() -> None:
             )
 
         asyncio.run(main())
+
+
+def test_id_number_space() -> None:
+    """Test that numbering resumes from the prior values after exiting a number space."""
+    id_prefix = DynamicIdPrefix(_ID_PREFIX)
+    with SequentialIdGenerator.id_number_space(0):
+        assert SequentialIdGenerator.create_next_id(id_prefix).index == 0
+        with SequentialIdGenerator.id_number_space(100):
+            assert SequentialIdGenerator.create_next_id(id_prefix).index == 100
+            assert SequentialIdGenerator.create_next_id(id_prefix).index == 101
+        assert SequentialIdGenerator.create_next_id(id_prefix).index == 1
+
+
+def test_sequential_id_generator_in_copied_context() -> None:
+    """Test that generating IDs in a thread with a copy of the context does not change the numbering in the caller."""
+    id_prefix = DynamicIdPrefix(_ID_PREFIX)
+
+    async def _generate_ids_in_thread() -> None:
+        with SequentialIdGenerator.id_number_space(0):
+            assert SequentialIdGenerator.create_next_id(id_prefix).index == 0
+            # `to_thread` runs the function with a copy of the context.
+            thread_ids = await asyncio.gather(
+                asyncio.to_thread(SequentialIdGenerator.create_next_id, id_prefix),
+                asyncio.to_thread(SequentialIdGenerator.create_next_id, id_prefix),
+            )
+            assert [generated_id.index for generated_id in thread_ids] == [1, 1]
+            assert SequentialIdGenerator.create_next_id(id_prefix).index == 1
+
+    asyncio.run(_generate_ids_in_thread())
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+from dbt_semantic_interfaces.implementations.elements.dimension import PydanticDimension
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from dbt_semantic_interfaces.type_enums import DimensionType
+from metricflow_semantics.model.semantics.linkable_spec_index import LinkableSpecIndex
+from metricflow_semantics.model.semantics.linkable_spec_index_builder import LinkableSpecIndexBuilder
+from metricflow_semantics.model.semantics.manifest_object_lookup import SemanticManifestObjectLookup
+from metricflow_semantics.model.semantics.semantic_model_join_evaluator import MAX_JOIN_HOPS
+
+from tests_metricflow_semantics.model.test_semantic_model_container import build_semantic_model_lookup_from_manifest
+
+
+def _build_index(semantic_manifest: PydanticSemanticManifest, max_workers: int) -> LinkableSpecIndex:
+    return LinkableSpecIndexBuilder(
+        semantic_manifest=semantic_manifest,
+        semantic_model_lookup=build_semantic_model_lookup_from_manifest(semantic_manifest),
+        manifest_object_lookup=SemanticManifestObjectLookup(semantic_manifest),
+        max_entity_links=MAX_JOIN_HOPS,
+    ).build_index(max_workers=max_workers)
+
+
+def test_build_index_in_process_pool(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Check that building the index with multiple processes gives the same result as with a single process."""
+    index = _build_index(simple_semantic_manifest, max_workers=1)
+    index_built_in_process_pool = _build_index(simple_semantic_manifest, max_workers=3)
+
+    assert index_built_in_process_pool == index
+    # The order of the linkable metrics determines the order of elements in the element sets built from them.
+    assert tuple(
+        (entity_reference, tuple(metric_subquery_join_path_elements))
+        for entity_reference, metric_subquery_join_path_elements in index_built_in_process_pool.joinable_metrics_for_entities.items()
+    ) == tuple(
+        (entity_reference, tuple(metric_subquery_join_path_elements))
+        for entity_reference, metric_subquery_join_path_elements in index.joinable_metrics_for_entities.items()
+    )
+
+
+@pytest.mark.parametrize("changed_object_type", ["semantic_model", "metric"])
+def test_build_index_using_previous_index(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest, changed_object_type: str
+) -> None:
+    updated_semantic_manifest = simple_semantic_manifest.copy(deep=True)
+    if changed_object_type == "semantic_model":
+        listings_semantic_model = next(
+            semantic_model
+            for semantic_model in updated_semantic_manifest.semantic_models
+            if semantic_model.name == "listings_latest"
+        )
+        listings_semantic_model.dimensions.append(
+            PydanticDimension(name="capacity_tier", type=DimensionType.CATEGORICAL, expr="capacity / 4")
+        )
+    elif changed_object_type == "metric":
+        bookings_metric = next(metric for metric in updated_semantic_manifest.metrics if metric.name == "bookings")
+        bookings_metric.description = "Updated description"
+    else:
+        raise ValueError(f"Unexpected {changed_object_type=}")
+
+    previous_index = _build_index(simple_semantic_manifest, max_workers=1)
+    index = LinkableSpecIndexBuilder(
+        semantic_manifest=updated_semantic_manifest,
+        semantic_model_lookup=build_semantic_model_lookup_from_manifest(updated_semantic_manifest),
+        manifest_object_lookup=SemanticManifestObjectLookup(updated_semantic_manifest),
+        max_entity_links=MAX_JOIN_HOPS,
+    ).build_index_using_previous_index(
+        previous_index=previous_index, previous_semantic_manifest=simple_semantic_manifest
+    )
+
+    assert index == _build_index(updated_semantic_manifest, max_workers=1)
+    if changed_object_type == "metric":
+        # The element sets for the other metrics should have been reused.
+        assert all(
+            element_set is previous_element_set
+            for element_set, previous_element_set in zip(
+                index.metric_to_linkable_element_sets["listings"],
+                previous_index.metric_to_linkable_element_sets["listings"],
+            )
+        )
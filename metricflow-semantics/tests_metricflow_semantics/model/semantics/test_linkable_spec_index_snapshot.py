@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from dbt_semantic_interfaces.references import MetricReference
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.model.semantics.element_filter import LinkableElementFilter
+from metricflow_semantics.model.semantics.linkable_spec_index_snapshot import (
+    LinkableSpecIndexSnapshot,
+    LinkableSpecIndexSnapshotError,
+)
+
+
+@pytest.fixture(scope="module")
+def simple_manifest_snapshot(simple_semantic_manifest: PydanticSemanticManifest) -> LinkableSpecIndexSnapshot:
+    """Snapshot for the simple manifest - created once as building the index takes a few seconds."""
+    return LinkableSpecIndexSnapshot.create(simple_semantic_manifest)
+
+
+def test_write_and_read(simple_manifest_snapshot: LinkableSpecIndexSnapshot, tmp_path: Path) -> None:  # noqa: D103
+    snapshot_path = tmp_path.joinpath("index.snapshot")
+    simple_manifest_snapshot.write(snapshot_path)
+
+    assert (
+        LinkableSpecIndexSnapshot.read_manifest_fingerprint(snapshot_path)
+        == simple_manifest_snapshot.manifest_fingerprint
+    )
+    assert LinkableSpecIndexSnapshot.read(snapshot_path) == simple_manifest_snapshot
+
+
+def test_invalid_snapshot(tmp_path: Path) -> None:  # noqa: D103
+    snapshot_path = tmp_path.joinpath("index.snapshot")
+    snapshot_path.write_bytes(b"not a snapshot" * 10)
+    with pytest.raises(LinkableSpecIndexSnapshotError):
+        LinkableSpecIndexSnapshot.read(snapshot_path)
+
+    snapshot_path.write_bytes(b"")
+    with pytest.raises(LinkableSpecIndexSnapshotError):
+        LinkableSpecIndexSnapshot.read(snapshot_path)
+
+
+def test_load_or_create(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+    simple_manifest_snapshot: LinkableSpecIndexSnapshot,
+    tmp_path: Path,
+) -> None:
+    snapshot_path = tmp_path.joinpath("index.snapshot")
+    # A snapshot for a different manifest should be ignored and overwritten.
+    LinkableSpecIndexSnapshot(
+        manifest_fingerprint="0" * 64, linkable_spec_index=simple_manifest_snapshot.linkable_spec_index
+    ).write(snapshot_path)
+
+    snapshot = LinkableSpecIndexSnapshot.load_or_create(
+        semantic_manifest=simple_semantic_manifest, snapshot_path=snapshot_path, write_snapshot_on_create=True
+    )
+    assert snapshot == simple_manifest_snapshot
+    assert (
+        LinkableSpecIndexSnapshot.read_manifest_fingerprint(snapshot_path)
+        == simple_manifest_snapshot.manifest_fingerprint
+    )
+
+
+def test_load_or_create_with_snapshot_from_another_release(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+    simple_manifest_snapshot: LinkableSpecIndexSnapshot,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    snapshot_path = tmp_path.joinpath("index.snapshot")
+    with monkeypatch.context() as patch_context:
+        patch_context.setattr(LinkableSpecIndexSnapshot, "package_fingerprint", staticmethod(lambda: "0" * 64))
+        simple_manifest_snapshot.write(snapshot_path)
+
+    # The snapshot is for the same manifest, but it should be rebuilt and overwritten.
+    with pytest.raises(LinkableSpecIndexSnapshotError, match="different versions"):
+        LinkableSpecIndexSnapshot.read(snapshot_path)
+    snapshot = LinkableSpecIndexSnapshot.load_or_create(
+        semantic_manifest=simple_semantic_manifest, snapshot_path=snapshot_path, write_snapshot_on_create=True
+    )
+    assert snapshot == simple_manifest_snapshot
+    assert LinkableSpecIndexSnapshot.read(snapshot_path) == simple_manifest_snapshot
+
+
+def test_create_lookup_using_snapshot(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+    simple_manifest_snapshot: LinkableSpecIndexSnapshot,
+    tmp_path: Path,
+) -> None:
+    snapshot_path = tmp_path.joinpath("index.snapshot")
+    simple_manifest_snapshot.write(snapshot_path)
+
+    semantic_manifest_lookup = SemanticManifestLookup.create_using_index_snapshot(
+        semantic_manifest=simple_semantic_manifest, snapshot_path=snapshot_path
+    )
+    assert semantic_manifest_lookup.semantic_manifest_fingerprint == simple_manifest_snapshot.manifest_fingerprint
+    metric_references = (MetricReference("bookings"),)
+    element_filter = LinkableElementFilter()
+    assert set(
+        semantic_manifest_lookup.metric_lookup.linkable_elements_for_metrics(metric_references, element_filter).specs
+    ) == set(
+        SemanticManifestLookup(simple_semantic_manifest)
+        .metric_lookup.linkable_elements_for_metrics(metric_references, element_filter)
+        .specs
+    )
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dbt_semantic_interfaces.implementations.elements.dimension import PydanticDimension
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from dbt_semantic_interfaces.type_enums import DimensionType
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff
+
+
+def test_semantic_manifest_diff(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D103
+    assert not SemanticManifestDiff.create(
+        simple_semantic_manifest, simple_semantic_manifest.copy(deep=True)
+    ).has_changes
+
+    updated_semantic_manifest = simple_semantic_manifest.copy(deep=True)
+    updated_semantic_manifest.semantic_models[0].dimensions.append(
+        PydanticDimension(name="new_dimension", type=DimensionType.CATEGORICAL)
+    )
+    updated_semantic_manifest.metrics = [
+        metric for metric in updated_semantic_manifest.metrics if metric.name != "bookings_per_listing"
+    ]
+    updated_semantic_manifest.project_configuration.time_spines = []
+
+    manifest_diff = SemanticManifestDiff.create(simple_semantic_manifest, updated_semantic_manifest)
+    assert manifest_diff == SemanticManifestDiff(
+        changed_semantic_model_names=frozenset((simple_semantic_manifest.semantic_models[0].name,)),
+        changed_metric_names=frozenset(("bookings_per_listing",)),
+        changed_saved_query_names=frozenset(),
+        project_configuration_changed=True,
+    )
+    assert manifest_diff.has_changes
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import itertools
+import random
+import string
+from typing import FrozenSet
+
+from metricflow_semantics.query.similarity import FuzzyMatchIndex, FuzzyMatchIndexCache, top_fuzzy_matches
+
+_ENTITY_NAMES = ("listing", "user", "booking", "host", "guest", "company", "account", "lux_listing", "view")
+_ELEMENT_NAMES = (
+    "country_latest",
+    "capacity_latest",
+    "is_lux_latest",
+    "home_state_latest",
+    "is_instant",
+    "price",
+    "created_at",
+    "ds",
+    "account_type",
+    "company_name",
+    "region",
+    "bio_added_ts",
+)
+
+
+def _candidate_items() -> FrozenSet[str]:
+    return frozenset(
+        f"{entity_0}__{entity_1}__{element_name}"
+        for entity_0, entity_1, element_name in itertools.product(_ENTITY_NAMES, _ENTITY_NAMES, _ELEMENT_NAMES)
+    ).union(f"{entity_name}__{element_name}" for entity_name in _ENTITY_NAMES for element_name in _ELEMENT_NAMES)
+
+
+def test_matches() -> None:
+    """Check that repeated searches of the index give the same results as scoring all candidates."""
+    candidate_items = _candidate_items()
+    index = FuzzyMatchIndex(candidate_items)
+
+    for item in (
+        "listing__country_latset",
+        "user__listing__home_stat_latest",
+        "bookng__is_instant",
+        "company__account_type",
+        "guest__host__priced",
+        "viewz__ds",
+        "zzz",
+    ):
+        for _ in range(2):
+            assert index.top_fuzzy_matches(item) == top_fuzzy_matches(item, tuple(candidate_items))
+
+
+def test_matches_for_large_candidate_set() -> None:
+    """Check that the index gives the same results as scoring all candidates when there are many candidates."""
+    rng = random.Random(0)
+    words = tuple("".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9))) for _ in range(2000))
+    # Include some candidates with whitespace, as those are scored differently by the index.
+    candidate_items = tuple(
+        sorted(
+            {"__".join(rng.choices(words, k=rng.randint(1, 3))) + "_" + rng.choice(words) for _ in range(20000)}.union(
+                " ".join(rng.choices(words, k=2)) for _ in range(200)
+            )
+        )
+    )
+    index = FuzzyMatchIndex(candidate_items)
+
+    items = [candidate_items[i][:-2] + "xx" for i in range(0, len(candidate_items), 997)]
+    items.extend(candidate_items[i].replace("_", " ", 1) for i in range(0, len(candidate_items), 4999))
+    items.extend(("zzz", "a", words[0], f"{words[1]} {words[2]}"))
+    for item in items:
+        for _ in range(2):
+            assert index.top_fuzzy_matches(item) == top_fuzzy_matches(item, candidate_items)
+
+
+def test_index_cache() -> None:  # noqa: D103
+    cache = FuzzyMatchIndexCache(max_indexes=1)
+    index = cache.get_index({"bookings", "views"})
+
+    assert cache.get_index({"views", "bookings"}) is index
+    assert cache.get_index({"bookings"}) is not index
+    assert cache.get_index({"bookings", "views"}) is not index
+
+
+def test_index_cache_for_candidates() -> None:
+    """Check that the conversion to candidate items is skipped only for the same object and conversion key."""
+    cache = FuzzyMatchIndexCache()
+    candidates = ["bookings", "views"]
+    conversion_count = 0
+
+    def _convert() -> FrozenSet[str]:
+        nonlocal conversion_count
+        conversion_count += 1
+        return frozenset(candidates)
+
+    index = cache.get_index_for_candidates(candidates, conversion_key="key", convert_to_candidate_items=_convert)
+    assert (
+        cache.get_index_for_candidates(candidates, conversion_key="key", convert_to_candidate_items=_convert) is index
+    )
+    assert conversion_count == 1
+
+    # An equal but different object is converted again, but the index for the same items is reused.
+    assert (
+        cache.get_index_for_candidates(list(candidates), conversion_key="key", convert_to_candidate_items=_convert)
+        is index
+    )
+    assert conversion_count == 2
+
+    cache.get_index_for_candidates(candidates, conversion_key="other_key", convert_to_candidate_items=_convert)
+    assert conversion_count == 3
@@ -580,3 +580,48 @@ def test_parse_and_validate_metric_with_duplicate_metric_alias(
                 DimensionOrEntityParameter(name="revenue_instance__country", alias="revenue"),
             ),
         )
+
+
+def test_query_resolution_cache(bookings_query_parser: MetricFlowQueryParser) -> None:
+    """Test that repeated queries reuse the resolution, and that the limit and time constraint are still applied."""
+    metric_names = ("bookings",)
+    group_by_names = (MTD,)
+    where_constraint_strs = ("{{ Dimension('booking__is_instant') }}",)
+
+    query_spec = bookings_query_parser.parse_and_validate_query(
+        metric_names=metric_names, group_by_names=group_by_names, where_constraint_strs=where_constraint_strs
+    ).query_spec
+    assert (
+        bookings_query_parser.parse_and_validate_query(
+            metric_names=metric_names, group_by_names=group_by_names, where_constraint_strs=where_constraint_strs
+        ).query_spec
+        is query_spec
+    )
+
+    query_spec_with_limit = bookings_query_parser.parse_and_validate_query(
+        metric_names=metric_names,
+        group_by_names=group_by_names,
+        where_constraint_strs=where_constraint_strs,
+        limit=10,
+    ).query_spec
+    assert query_spec_with_limit.limit == 10
+    assert query_spec_with_limit.with_limit(None) == query_spec
+
+    query_spec_with_time_constraint = bookings_query_parser.parse_and_validate_query(
+        metric_names=metric_names,
+        group_by_names=group_by_names,
+        where_constraint_strs=where_constraint_strs,
+        time_constraint_start=as_datetime("2020-01-15"),
+        time_constraint_end=as_datetime("2020-02-15"),
+    ).query_spec
+    assert query_spec_with_time_constraint.time_range_constraint is not None
+    assert query_spec_with_time_constraint.time_dimension_specs == query_spec.time_dimension_specs
+
+    # Errors in the inputs that are not part of the cache key should still be reported.
+    with pytest.raises(InvalidQueryException, match="The limit -1 is not >= 0"):
+        bookings_query_parser.parse_and_validate_query(
+            metric_names=metric_names,
+            group_by_names=group_by_names,
+            where_constraint_strs=where_constraint_strs,
+            limit=-1,
+        )
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import logging
+from typing import Sequence
+
+import pytest
+from dbt_semantic_interfaces.call_parameter_sets import (
+    DimensionCallParameterSet,
+    EntityCallParameterSet,
+    MetricCallParameterSet,
+    TimeDimensionCallParameterSet,
+)
+from dbt_semantic_interfaces.naming.keywords import METRIC_TIME_ELEMENT_NAME
+from dbt_semantic_interfaces.protocols.dimension import DimensionType
+from dbt_semantic_interfaces.references import (
+    DimensionReference,
+    EntityReference,
+    LinkableElementReference,
+    MetricReference,
+    SemanticModelReference,
+    TimeDimensionReference,
+)
+from dbt_semantic_interfaces.type_enums import TimeGranularity
+from dbt_semantic_interfaces.type_enums.date_part import DatePart
+from metricflow_semantics.model.linkable_element_property import LinkableElementProperty
+from metricflow_semantics.model.semantics.element_filter import LinkableElementFilter
+from metricflow_semantics.model.semantics.linkable_element import LinkableDimension, SemanticModelJoinPath
+from metricflow_semantics.model.semantics.linkable_element_set import LinkableElementSet
+from metricflow_semantics.specs.dimension_spec import DimensionSpec
+from metricflow_semantics.specs.entity_spec import EntitySpec
+from metricflow_semantics.specs.group_by_metric_spec import GroupByMetricSpec
+from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
+from metricflow_semantics.specs.patterns.entity_link_pattern import (
+    EntityLinkPattern,
+    ParameterSetField,
+    SpecPatternParameterSet,
+)
+from metricflow_semantics.specs.patterns.spec_pattern import SpecPattern
+from metricflow_semantics.specs.patterns.spec_pattern_candidate_index import SpecPatternCandidateIndex
+from metricflow_semantics.specs.patterns.typed_patterns import (
+    DimensionPattern,
+    EntityPattern,
+    GroupByMetricPattern,
+    TimeDimensionPattern,
+)
+from metricflow_semantics.specs.time_dimension_spec import TimeDimensionSpec
+from metricflow_semantics.test_helpers.metric_time_dimension import MTD_SPEC_DAY, MTD_SPEC_MONTH, MTD_SPEC_WEEK
+
+logger = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="session")
+def specs() -> Sequence[LinkableInstanceSpec]:  # noqa: D103
+    return (
+        MTD_SPEC_DAY,
+        MTD_SPEC_WEEK,
+        MTD_SPEC_MONTH,
+        TimeDimensionSpec(
+            element_name="created_at",
+            entity_links=(EntityReference("booking"), EntityReference("listing")),
+            date_part=DatePart.YEAR,
+        ),
+        DimensionSpec(element_name="country", entity_links=(EntityReference("listing"),)),
+        DimensionSpec(element_name="country", entity_links=(EntityReference("booking"), EntityReference("listing"))),
+        DimensionSpec(element_name="country", entity_links=(EntityReference("user"),)),
+        DimensionSpec(element_name="capacity", entity_links=(EntityReference("booking"), EntityReference("listing"))),
+        EntitySpec(element_name="listing", entity_links=(EntityReference("booking"),)),
+        EntitySpec(element_name="listing", entity_links=()),
+        GroupByMetricSpec(
+            element_name="bookings",
+            entity_links=(EntityReference("listing"),),
+            metric_subquery_entity_links=(EntityReference("listing"),),
+        ),
+        GroupByMetricSpec(
+            element_name="bookings",
+            entity_links=(EntityReference("booking"), EntityReference("listing")),
+            metric_subquery_entity_links=(EntityReference("listing"),),
+        ),
+    )
+
+
+def _check_match_index(specs: Sequence[LinkableInstanceSpec], pattern: SpecPattern) -> None:
+    """Check that matching using the index produces the same result as matching against all candidates."""
+    expected_matches = tuple(pattern.match(specs))
+    assert tuple(pattern.match_index(SpecPatternCandidateIndex(specs))) == expected_matches
+
+
+def test_match_index(specs: Sequence[LinkableInstanceSpec]) -> None:  # noqa: D103
+    patterns: Sequence[SpecPattern] = (
+        DimensionPattern.from_call_parameter_set(
+            DimensionCallParameterSet(
+                dimension_reference=DimensionReference("country"), entity_path=(EntityReference("listing"),)
+            )
+        ),
+        DimensionPattern.from_call_parameter_set(
+            DimensionCallParameterSet(dimension_reference=DimensionReference("country"), entity_path=())
+        ),
+        TimeDimensionPattern.from_call_parameter_set(
+            TimeDimensionCallParameterSet(
+                time_dimension_reference=TimeDimensionReference(METRIC_TIME_ELEMENT_NAME),
+                entity_path=(),
+                time_granularity_name=TimeGranularity.WEEK.value,
+            )
+        ),
+        TimeDimensionPattern.from_call_parameter_set(
+            TimeDimensionCallParameterSet(
+                time_dimension_reference=TimeDimensionReference("created_at"),
+                entity_path=(EntityReference("listing"),),
+                date_part=DatePart.YEAR,
+            )
+        ),
+        EntityPattern.from_call_parameter_set(
+            EntityCallParameterSet(entity_reference=EntityReference("listing"), entity_path=())
+        ),
+        EntityPattern.from_call_parameter_set(
+            EntityCallParameterSet(
+                entity_reference=EntityReference("listing"), entity_path=(EntityReference("booking"),)
+            )
+        ),
+        GroupByMetricPattern.from_call_parameter_set(
+            MetricCallParameterSet(
+                metric_reference=MetricReference("bookings"), group_by=(LinkableElementReference("listing"),)
+            )
+        ),
+        EntityLinkPattern(
+            SpecPatternParameterSet.from_parameters(
+                fields_to_compare=(ParameterSetField.ELEMENT_NAME,), element_name="country"
+            )
+        ),
+    )
+    for pattern in patterns:
+        _check_match_index(specs, pattern)
+
+
+def test_empty_entity_links(specs: Sequence[LinkableInstanceSpec]) -> None:
+    """Check that a pattern without entity links only matches candidates without entity links.
+
+    This differs from a suffix match as `entity_links[-0:]` is the whole tuple.
+    """
+    pattern = EntityPattern.from_call_parameter_set(
+        EntityCallParameterSet(entity_reference=EntityReference("listing"), entity_path=())
+    )
+    expected_matches = (EntitySpec(element_name="listing", entity_links=()),)
+    assert tuple(pattern.match(specs)) == expected_matches
+    assert tuple(pattern.match_index(SpecPatternCandidateIndex(specs))) == expected_matches
+
+    # There are no dimensions without entity links.
+    _check_match_index(
+        specs,
+        DimensionPattern.from_call_parameter_set(
+            DimensionCallParameterSet(dimension_reference=DimensionReference("country"), entity_path=())
+        ),
+    )
+
+
+def test_shortest_entity_links_across_element_names(specs: Sequence[LinkableInstanceSpec]) -> None:
+    """Check the case where a candidate with another element name has fewer entity links for the suffix."""
+    pattern = DimensionPattern.from_call_parameter_set(
+        DimensionCallParameterSet(
+            dimension_reference=DimensionReference("capacity"), entity_path=(EntityReference("listing"),)
+        )
+    )
+    # `listing__country` has fewer entity links than `booking__listing__capacity`, so nothing matches.
+    assert tuple(pattern.match(specs)) == ()
+    _check_match_index(specs, pattern)
+
+
+def test_filter_by_element_names_retains_order() -> None:
+    """Check that filtering a `LinkableElementSet` by element names (which uses the index) retains the order."""
+    semantic_model = SemanticModelReference("listings_source")
+    linkable_dimensions = tuple(
+        LinkableDimension.create(
+            properties=frozenset({LinkableElementProperty.JOINED}),
+            defined_in_semantic_model=semantic_model,
+            element_name=element_name,
+            dimension_type=DimensionType.CATEGORICAL,
+            entity_links=tuple(EntityReference(entity_name) for entity_name in entity_names),
+            join_path=SemanticModelJoinPath(left_semantic_model_reference=semantic_model),
+        )
+        for element_name, entity_names in (
+            ("country", ("user",)),
+            ("capacity", ("listing",)),
+            ("is_lux", ("listing",)),
+            ("country", ("listing",)),
+            ("capacity", ("booking", "listing")),
+        )
+    )
+    linkable_element_set = LinkableElementSet(
+        path_key_to_linkable_dimensions={
+            linkable_dimension.path_key: (linkable_dimension,) for linkable_dimension in linkable_dimensions
+        }
+    )
+    element_names = frozenset({"capacity", "country"})
+
+    filtered_set = linkable_element_set.filter(LinkableElementFilter(element_names=element_names))
+
+    assert tuple(filtered_set.path_key_to_linkable_dimensions) == tuple(
+        linkable_dimension.path_key
+        for linkable_dimension in linkable_dimensions
+        if linkable_dimension.element_name in element_names
+    )
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import jinja2
+import pytest
+from dbt_semantic_interfaces.call_parameter_sets import ParseJinjaObjectException
+from dbt_semantic_interfaces.implementations.filters.where_filter import PydanticWhereFilter
+from metricflow_semantics.specs.where_filter.where_filter_template_cache import WhereFilterTemplateCache
+
+_WHERE_SQL_TEMPLATE = (
+    "{{ Dimension('booking__is_instant') }} AND {{ TimeDimension('metric_time', 'martian_day') }} > '2020-01-01'"
+)
+
+
+def test_compiled_template() -> None:  # noqa: D103
+    cache = WhereFilterTemplateCache(custom_granularity_names=("martian_day",))
+    compiled_template = cache.get_compiled_template("{{ Dimension('booking__is_instant') }}")
+
+    assert cache.get_compiled_template("{{ Dimension('booking__is_instant') }}") is compiled_template
+    assert compiled_template.render({"Dimension": lambda name: name.upper()}) == "BOOKING__IS_INSTANT"
+
+    # Undefined variables should result in errors.
+    with pytest.raises(jinja2.exceptions.UndefinedError):
+        compiled_template.render({})
+
+
+def test_call_parameter_sets() -> None:  # noqa: D103
+    cache = WhereFilterTemplateCache(custom_granularity_names=("martian_day",))
+    call_parameter_sets = cache.get_call_parameter_sets(_WHERE_SQL_TEMPLATE)
+
+    assert cache.get_call_parameter_sets(_WHERE_SQL_TEMPLATE) is call_parameter_sets
+    assert call_parameter_sets == PydanticWhereFilter(where_sql_template=_WHERE_SQL_TEMPLATE).call_parameter_sets(
+        custom_granularity_names=("martian_day",)
+    )
+    assert len(call_parameter_sets.dimension_call_parameter_sets) == 1
+    assert len(call_parameter_sets.time_dimension_call_parameter_sets) == 1
+
+
+def test_errors_are_not_cached() -> None:  # noqa: D103
+    cache = WhereFilterTemplateCache(custom_granularity_names=())
+    invalid_template = "{{ Dimension('booking__is_instant') "
+
+    for _ in range(2):
+        with pytest.raises(jinja2.exceptions.TemplateSyntaxError):
+            cache.get_compiled_template(invalid_template)
+        with pytest.raises(ParseJinjaObjectException):
+            cache.get_call_parameter_sets(invalid_template)
+
+
+def test_max_templates() -> None:  # noqa: D103
+    cache = WhereFilterTemplateCache(custom_granularity_names=(), max_templates=1)
+    compiled_template = cache.get_compiled_template("{{ Entity('listing') }}")
+    cache.get_compiled_template("{{ Entity('user') }}")
+
+    assert cache.get_compiled_template("{{ Entity('listing') }}") is not compiled_template
@@ -6,14 +6,15 @@ import logging
 import typing
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+from functools import cached_property
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
 
 from metricflow_semantics.helpers.string_helpers import mf_indent
 from metricflow_semantics.helpers.table_helpers import IsolatedTabulateRunner
 from metricflow_semantics.mf_logging.pretty_print import mf_pformat, mf_pformat_dict
 from typing_extensions import Self
 
-from metricflow.data_table.column_types import CellValue, InputCellValue, row_cell_types
+from metricflow.data_table.column_types import CellValue, InputCellValue
 from metricflow.data_table.mf_column import ColumnDescription
 
 if typing.TYPE_CHECKING:
@@ -33,38 +34,56 @@ class MetricFlowDataTable:
     When constructing the table, additional input types (as described by `InputCellValue`) can be used, but those
     additional types will be converted into one of the `CellValue` types.
 
+    The values are stored by column so that validation and type inference can be done once per column, and so that
+    column-oriented results (e.g. from a SQL client) can be passed in without building a tuple for each row. `rows`
+    is still available, but it's computed on first access.
+
     Don't use `=` to compare tables as there many be NaNs. Instead, use `check_data_tables_are_equal`.
     """
 
     column_descriptions: Tuple[ColumnDescription, ...]
-    rows: Tuple[Tuple[CellValue, ...], ...]
+    columns: Tuple[Tuple[CellValue, ...], ...]
 
     def __post_init__(self) -> None:  # noqa: D105
         expected_column_count = self.column_count
-        for row_index, row in enumerate(self.rows):
-            # Check that the number of columns in the rows match.
-            row_column_count = len(row)
-            assert row_column_count == expected_column_count, (
-                f"Row at index {row_index} has {row_column_count} columns instead of {expected_column_count}. "
-                f"Row is:"
-                f"\n{mf_indent(mf_pformat(row))}"
-            )
-            # Check that the type of the object in the rows match.
-            for column_index, cell_value in enumerate(row):
-                expected_cell_value_type = self.column_descriptions[column_index].column_type
-                assert cell_value is None or isinstance(cell_value, expected_cell_value_type), mf_pformat_dict(
-                    "Cell value type mismatch.",
-                    {
-                        "row_index": row_index,
-                        "column_index": column_index,
-                        "expected_cell_value_type": expected_cell_value_type,
-                        "actual_cell_value_type": type(cell_value),
-                        "cell_value": cell_value,
-                    },
+        assert len(self.columns) == expected_column_count, (
+            f"Table has {len(self.columns)} columns of values but {expected_column_count} column descriptions. "
+            f"Column descriptions are:"
+            f"\n{mf_indent(mf_pformat(self.column_descriptions))}"
+        )
+        expected_row_count = self.row_count
+        for column_index, column_values in enumerate(self.columns):
+            # Check that the number of rows in the columns match.
+            assert (
+                len(column_values) == expected_row_count
+            ), f"Column at index {column_index} has {len(column_values)} rows instead of {expected_row_count}."
+            # Check that the type of the objects in the column match. Since a column generally has only one or two
+            # types, check the set of types instead of each value.
+            expected_cell_value_type = self.column_descriptions[column_index].column_type
+            for cell_value_type in {type(cell_value) for cell_value in column_values}:
+                if cell_value_type is type(None) or issubclass(cell_value_type, expected_cell_value_type):
+                    continue
+                row_index = next(
+                    row_index
+                    for row_index, cell_value in enumerate(column_values)
+                    if type(cell_value) is cell_value_type
                 )
-                # Check that datetimes don't have a timezone set.
-                if isinstance(cell_value, datetime.datetime):
-                    assert cell_value.tzinfo is None, mf_pformat_dict(
+                raise AssertionError(
+                    mf_pformat_dict(
+                        "Cell value type mismatch.",
+                        {
+                            "row_index": row_index,
+                            "column_index": column_index,
+                            "expected_cell_value_type": expected_cell_value_type,
+                            "actual_cell_value_type": cell_value_type,
+                            "cell_value": column_values[row_index],
+                        },
+                    )
+                )
+            # Check that datetimes don't have a timezone set.
+            if issubclass(expected_cell_value_type, datetime.datetime):
+                for row_index, cell_value in enumerate(column_values):
+                    assert cell_value is None or cell_value.tzinfo is None, mf_pformat_dict(  # type: ignore[union-attr]
                         "Time zone provided for datetime.",
                         {
                             "row_index": row_index,
@@ -79,7 +98,14 @@ class MetricFlowDataTable:
 
     @property
     def row_count(self) -> int:  # noqa: D102
-        return len(self.rows)
+        if len(self.columns) == 0:
+            return 0
+        return len(self.columns[0])
+
+    @cached_property
+    def rows(self) -> Tuple[Tuple[CellValue, ...], ...]:
+        """Return the values in the table by row. This is computed from the columns on first access."""
+        return tuple(zip(*self.columns))
 
     def column_name_index(self, column_name: str) -> int:
         """Return the index of the column that matches the given name. Raises `ValueError` if the name is invalid."""
@@ -96,24 +122,18 @@ class MetricFlowDataTable:
         return tuple(column_description.column_name for column_description in self.column_descriptions)
 
     def column_values_iterator(self, column_index: int) -> Iterator[CellValue]:
-        """Returns an iterator for values of the column at the tiven index."""
-        return (row[column_index] for row in self.rows)
+        """Returns an iterator for values of the column at the given index."""
+        return iter(self.columns[column_index])
 
-    def _sorted_by_column_name(self) -> MetricFlowDataTable:  # noqa: D102
-        new_rows: List[List[CellValue]] = [[] for _ in range(self.row_count)]
-        sorted_column_names = sorted(self.column_names)
-        for column_name in sorted_column_names:
-            old_column_index = self.column_name_index(column_name)
-            for row_index, cell_value in enumerate(self.column_values_iterator(old_column_index)):
-                new_rows[row_index].append(cell_value)
+    def column_values(self, column_index: int) -> Sequence[CellValue]:
+        """Returns the values of the column at the given index without copying."""
+        return self.columns[column_index]
 
+    def _sorted_by_column_name(self) -> MetricFlowDataTable:  # noqa: D102
+        sorted_column_indexes = tuple(self.column_name_index(column_name) for column_name in sorted(self.column_names))
         return MetricFlowDataTable(
-            column_descriptions=tuple(
-                self.column_descriptions[self.column_name_index(column_name)] for column_name in sorted_column_names
-            ),
-            rows=tuple(
-                tuple(row_dict[column_index] for column_index in range(self.column_count)) for row_dict in new_rows
-            ),
+            column_descriptions=tuple(self.column_descriptions[column_index] for column_index in sorted_column_indexes),
+            columns=tuple(self.columns[column_index] for column_index in sorted_column_indexes),
         )
 
     def _sorted_by_row(self) -> MetricFlowDataTable:  # noqa: D102
@@ -122,12 +142,18 @@ class MetricFlowDataTable:
                 return cell.isoformat()
             return str(cell)
 
-        def _row_sort_key(row: Tuple[CellValue, ...]) -> Tuple[str, ...]:
-            return tuple(_cell_sort_key(cell) for cell in row)
+        # Compute the sort key one column at a time, then sort the row indexes.
+        column_sort_keys = tuple(
+            tuple(_cell_sort_key(cell) for cell in column_values) for column_values in self.columns
+        )
+        row_sort_keys = tuple(zip(*column_sort_keys))
+        sorted_row_indexes = sorted(range(self.row_count), key=lambda row_index: row_sort_keys[row_index])
 
         return MetricFlowDataTable(
             column_descriptions=self.column_descriptions,
-            rows=tuple(sorted((row for row in self.rows), key=_row_sort_key)),
+            columns=tuple(
+                tuple(column_values[row_index] for row_index in sorted_row_indexes) for column_values in self.columns
+            ),
         )
 
     def sorted(self) -> MetricFlowDataTable:
@@ -136,23 +162,24 @@ class MetricFlowDataTable:
 
     def text_format(self, float_decimals: Optional[int] = None) -> str:
         """Return a text version of this table that is suitable for printing."""
-        str_rows: List[List[Optional[str]]] = []
-
-        for row in self.rows:
-            str_row: List[Optional[str]] = []
-            for column_index, cell_value in enumerate(row):
+        str_columns: List[List[Optional[str]]] = []
+        # Use `g` (general number format) by default.
+        float_format = f".{float_decimals}f" if float_decimals is not None else "g"
+        for column_description, column_values in zip(self.column_descriptions, self.columns):
+            is_float_column = column_description.column_type in {float, Decimal}
+            str_column: List[Optional[str]] = []
+            for cell_value in column_values:
                 if cell_value is None:
-                    str_row.append(None)
-                elif self.column_descriptions[column_index].column_type in {float, Decimal}:
-                    # Use `g` (general number format) by default.
-                    float_format = f".{float_decimals}f" if float_decimals is not None else "g"
-                    str_row.append(format(cell_value, float_format))
+                    str_column.append(None)
+                elif is_float_column:
+                    str_column.append(format(cell_value, float_format))
                 elif isinstance(cell_value, datetime.datetime):
-                    str_row.append(cell_value.isoformat())
+                    str_column.append(cell_value.isoformat())
                 else:
-                    str_row.append(str(cell_value))
+                    str_column.append(str(cell_value))
+            str_columns.append(str_column)
 
-            str_rows.append(str_row)
+        str_rows: List[List[Optional[str]]] = [list(str_row) for str_row in zip(*str_columns)]
 
         column_alignment: List[str] = []
         # Align numeric values by the decimal point, otherwise to the left.
@@ -176,11 +203,11 @@ class MetricFlowDataTable:
             column_descriptions=tuple(
                 column_description.with_lower_case_column_name() for column_description in self.column_descriptions
             ),
-            rows=self.rows,
+            columns=self.columns,
         )
 
     def get_cell_value(self, row_index: int, column_index: int) -> CellValue:  # noqa: D102
-        return self.rows[row_index][column_index]
+        return self.columns[column_index][row_index]
 
     @staticmethod
     def create_from_rows(  # noqa: D102
@@ -191,92 +218,96 @@ class MetricFlowDataTable:
             builder.add_row(row)
         return builder.build()
 
+    @staticmethod
+    def create_from_columns(
+        column_names: Sequence[str], columns: Sequence[Sequence[InputCellValue]]
+    ) -> MetricFlowDataTable:
+        """Create a table from values that are already grouped by column.
 
-class _MetricFlowDataTableBuilder:
-    """Helps build `MetricFlowDataTable`, one row at a time.
+        If the values in a column are already of a supported type, the column is used as-is without copying. This
+        is useful for SQL clients that return results by column.
+        """
+        return _MetricFlowDataTableBuilder(column_names).add_columns(columns).build()
 
-    This validates each row as it is input to give better error messages.
-    """
 
-    def __init__(self, column_names: Sequence[str]) -> None:  # noqa: D107
-        self._rows: List[Tuple[CellValue, ...]] = []
-        self._column_names = tuple(column_names)
+# Cell types that don't need any conversion to be stored in the table.
+_SUPPORTED_CELL_TYPES: FrozenSet[Type] = frozenset((type(None), float, bool, int, str))
 
-    def _build_table_from_rows(self) -> MetricFlowDataTable:  # noqa: D102
-        # Figure out the type of the column based on the types of the values in the rows.
-        # Can't use the type of the columns in the first row because it might contain None, so iterate through the rows
-        # and use the first non-None type.
-        column_types_so_far: Optional[Tuple[Type[CellValue], ...]] = None
-        cell_value: CellValue
-        for row in self._rows:
-            if column_types_so_far is None:
-                column_types_so_far = row_cell_types(row)
-                continue
 
-            # If the types of the objects in the row are the same, no need for updates.
-            row_column_types = row_cell_types(row)
-            if row_column_types == column_types_so_far:
-                continue
+def _convert_cell_to_supported_type(cell_value: InputCellValue) -> CellValue:
+    """Since only a limited set of types are supported, convert the input type to the supported type."""
+    if (
+        cell_value is None
+        or isinstance(cell_value, float)
+        or isinstance(cell_value, bool)
+        or isinstance(cell_value, int)
+        or isinstance(cell_value, str)
+    ):
+        return cell_value
 
-            # Types of objects in the row are different from what's known so far.
-            # They can only be different in that one can be None and other can be not None.
-            updated_column_types: List[Type[CellValue]] = []
-            for column_type_so_far, cell_type, cell_value in itertools.zip_longest(
-                column_types_so_far, row_column_types, row
-            ):
-                if column_type_so_far is cell_type:
-                    updated_column_types.append(column_type_so_far)
-                elif column_type_so_far is type(None) and cell_type is not None:
-                    updated_column_types.append(cell_type)
-                elif column_type_so_far is not None and cell_type is type(None):
-                    updated_column_types.append(column_type_so_far)
-                else:
-                    raise ValueError(f"Expected cell type {column_type_so_far} but got: {cell_type}")
+    if isinstance(cell_value, datetime.datetime):
+        return cell_value.replace(tzinfo=None)
 
-            column_types_so_far = tuple(updated_column_types)
+    if isinstance(cell_value, Decimal):
+        return float(cell_value)
 
-        # Empty table case.
-        if column_types_so_far is None:
-            column_types_so_far = tuple(type(None) for _ in range(len(self._column_names)))
+    if isinstance(cell_value, datetime.date):
+        return datetime.datetime.combine(cell_value, datetime.datetime.min.time())
 
-        final_column_types = column_types_so_far
+    raise ValueError(f"Row cell has unexpected type: {repr(cell_value)}")
 
-        return MetricFlowDataTable(
-            column_descriptions=tuple(
-                ColumnDescription(column_name=column_name, column_type=column_type)
-                for column_name, column_type in itertools.zip_longest(self._column_names, final_column_types)
-            ),
-            rows=tuple(self._rows),
-        )
 
-    def _convert_row_to_supported_types(self, row: Sequence[InputCellValue]) -> Sequence[CellValue]:
-        """Since only a limited set of types are supported, convert the input type to the supported type."""
-        updated_row: List[CellValue] = []
-        for cell_value in row:
-            if (
-                cell_value is None
-                or isinstance(cell_value, float)
-                or isinstance(cell_value, bool)
-                or isinstance(cell_value, int)
-                or isinstance(cell_value, str)
-            ):
-                updated_row.append(cell_value)
-                continue
+class _MetricFlowDataTableBuilder:
+    """Helps build `MetricFlowDataTable`, one row or one batch of columns at a time.
 
-            if isinstance(cell_value, datetime.datetime):
-                updated_row.append(cell_value.replace(tzinfo=None))
-                continue
+    This validates each row as it is input to give better error messages. Type conversion and inference is done
+    once per column when the table is built.
+    """
 
-            if isinstance(cell_value, Decimal):
-                updated_row.append(float(cell_value))
-                continue
+    def __init__(self, column_names: Sequence[str]) -> None:  # noqa: D107
+        self._column_names = tuple(column_names)
+        self._pending_rows: List[Tuple[InputCellValue, ...]] = []
+        self._column_batches: List[List[Sequence[InputCellValue]]] = [[] for _ in self._column_names]
 
-            if isinstance(cell_value, datetime.date):
-                updated_row.append(datetime.datetime.combine(cell_value, datetime.datetime.min.time()))
-                continue
+    def _flush_pending_rows(self) -> None:
+        if len(self._pending_rows) == 0:
+            return
+        for column_index, column_values in enumerate(zip(*self._pending_rows)):
+            self._column_batches[column_index].append(column_values)
+        self._pending_rows = []
 
-            raise ValueError(f"Row cell has unexpected type: {repr(cell_value)}")
-        return updated_row
+    @staticmethod
+    def _convert_column_to_supported_types(column_values: Sequence[InputCellValue]) -> Tuple[CellValue, ...]:
+        """Convert the values in a column to a supported type, avoiding a copy if no conversion is needed."""
+        column_value_types = {type(cell_value) for cell_value in column_values}
+        if column_value_types.issubset(_SUPPORTED_CELL_TYPES):
+            # `tuple()` returns the same object if the input is already a tuple.
+            return tuple(typing.cast(Sequence[CellValue], column_values))
+        return tuple(_convert_cell_to_supported_type(cell_value) for cell_value in column_values)
+
+    @staticmethod
+    def _infer_column_type(column_values: Sequence[CellValue]) -> Type[CellValue]:
+        """Figure out the type of the column based on the types of the values in the column.
+
+        The values in a column can only be of one type, or `None`.
+        """
+        column_value_types = {type(cell_value) for cell_value in column_values}
+        column_value_types.discard(type(None))
+        if len(column_value_types) == 0:
+            return type(None)
+        if len(column_value_types) == 1:
+            return next(iter(column_value_types))
+
+        # Report the first type that doesn't match for a consistent error message.
+        column_type_so_far: Optional[Type[CellValue]] = None
+        for cell_value in column_values:
+            if cell_value is None:
+                continue
+            if column_type_so_far is None:
+                column_type_so_far = type(cell_value)
+            elif type(cell_value) is not column_type_so_far:
+                raise ValueError(f"Expected cell type {column_type_so_far} but got: {type(cell_value)}")
+        raise AssertionError(f"Did not find mismatched types in a column with types: {column_value_types}")
 
     def add_row(self, row: Sequence[InputCellValue], parse_strings: bool = False) -> Self:  # noqa: D102
         row = tuple(row)
@@ -287,8 +318,41 @@ class _MetricFlowDataTableBuilder:
                 f"Input row has {actual_column_count} columns, but expected {expected_column_count} columns. Row is:"
                 f"\n{mf_indent(mf_pformat(row))}"
             )
-        self._rows.append(tuple(self._convert_row_to_supported_types(row)))
+        self._pending_rows.append(row)
+        return self
+
+    def add_columns(self, columns: Sequence[Sequence[InputCellValue]]) -> Self:
+        """Add a batch of rows that are grouped by column."""
+        expected_column_count = len(self._column_names)
+        actual_column_count = len(columns)
+        if actual_column_count != expected_column_count:
+            raise ValueError(
+                f"Input has {actual_column_count} columns, but expected {expected_column_count} columns. Column "
+                f"names are:\n{mf_indent(mf_pformat(self._column_names))}"
+            )
+        row_counts = {len(column_values) for column_values in columns}
+        if len(row_counts) > 1:
+            raise ValueError(f"Input columns have different lengths: {sorted(row_counts)}")
+
+        self._flush_pending_rows()
+        for column_index, column_values in enumerate(columns):
+            self._column_batches[column_index].append(column_values)
         return self
 
     def build(self) -> MetricFlowDataTable:  # noqa: D102
-        return self._build_table_from_rows()
+        self._flush_pending_rows()
+        columns: List[Tuple[CellValue, ...]] = []
+        for column_batches in self._column_batches:
+            if len(column_batches) == 1:
+                column_values: Sequence[InputCellValue] = column_batches[0]
+            else:
+                column_values = tuple(itertools.chain.from_iterable(column_batches))
+            columns.append(self._convert_column_to_supported_types(column_values))
+
+        return MetricFlowDataTable(
+            column_descriptions=tuple(
+                ColumnDescription(column_name=column_name, column_type=self._infer_column_type(column_values))
+                for column_name, column_values in zip(self._column_names, columns)
+            ),
+            columns=tuple(columns),
+        )
@@ -48,10 +48,10 @@ class DataflowPlanBuilderCache:
         self, find_source_node_recipe_cache_size: int = 1000, build_any_metric_output_node_cache_size: int = 1000
     ) -> None:
         self._find_source_node_recipe_cache = LruCache[FindSourceNodeRecipeParameterSet, FindSourceNodeRecipeResult](
-            find_source_node_recipe_cache_size
+            find_source_node_recipe_cache_size, cache_name="DataflowPlanBuilderCache.find_source_node_recipe"
         )
         self._build_any_metric_output_node_cache = LruCache[BuildAnyMetricOutputNodeParameterSet, DataflowPlanNode](
-            build_any_metric_output_node_cache_size
+            build_any_metric_output_node_cache_size, cache_name="DataflowPlanBuilderCache.build_any_metric_output_node"
         )
 
         assert find_source_node_recipe_cache_size > 0
@@ -1778,20 +1778,27 @@ class DataflowPlanBuilder:
                     predicate_pushdown_state, time_range_constraint=measure_time_constraint
                 )
 
-            find_recipe_start_time = time.perf_counter()
-            measure_recipe = self._find_source_node_recipe(
-                FindSourceNodeRecipeParameterSet(
-                    measure_spec_properties=measure_properties,
-                    predicate_pushdown_state=measure_pushdown_state,
-                    linkable_spec_set=required_linkable_specs,
+            measure_recipe = self._find_materialized_aggregate_recipe(
+                metric_input_measure_spec=metric_input_measure_spec,
+                queried_linkable_specs=queried_linkable_specs,
+                measure_properties=measure_properties,
+                predicate_pushdown_state=measure_pushdown_state,
+            )
+            if measure_recipe is None:
+                find_recipe_start_time = time.perf_counter()
+                measure_recipe = self._find_source_node_recipe(
+                    FindSourceNodeRecipeParameterSet(
+                        measure_spec_properties=measure_properties,
+                        predicate_pushdown_state=measure_pushdown_state,
+                        linkable_spec_set=required_linkable_specs,
+                    )
                 )
-            )
-            logger.debug(
-                LazyFormat(
-                    lambda: f"With {len(self._source_node_set.source_nodes_for_metric_queries)} source nodes, finding a recipe "
-                    f"took {time.perf_counter() - find_recipe_start_time:.2f}s"
+                logger.debug(
+                    LazyFormat(
+                        lambda: f"With {len(self._source_node_set.source_nodes_for_metric_queries)} source nodes, finding a recipe "
+                        f"took {time.perf_counter() - find_recipe_start_time:.2f}s"
+                    )
                 )
-            )
 
         logger.debug(LazyFormat(lambda: f"Using recipe:\n{mf_indent(mf_pformat(measure_recipe))}"))
 
@@ -1800,6 +1807,18 @@ class DataflowPlanBuilder:
                 f"Unable to join all items in request. Measure: {measure_spec.element_name}; Specs to join: {required_linkable_specs}"
             )
 
+        where_filter_specs = tuple(
+            filter_spec
+            for filter_spec in metric_input_measure_spec.filter_spec_set.all_filter_specs
+            if filter_spec not in measure_recipe.applied_where_filter_specs
+        )
+        if len(measure_recipe.applied_where_filter_specs) > 0:
+            required_linkable_specs = self.__get_required_linkable_specs(
+                queried_linkable_specs=queried_linkable_specs,
+                filter_specs=where_filter_specs,
+                measure_spec_properties=measure_properties,
+            )
+
         queried_agg_time_dimension_specs = queried_linkable_specs.included_agg_time_dimension_specs_for_measure(
             measure_reference=measure_spec.reference, semantic_model_lookup=self._semantic_model_lookup
         )
@@ -1856,7 +1875,7 @@ class DataflowPlanBuilder:
             source_node=unaggregated_measure_node,
             join_targets=measure_recipe.join_targets,
             custom_granularity_specs=custom_granularity_specs_to_join,
-            where_filter_specs=metric_input_measure_spec.filter_spec_set.all_filter_specs,
+            where_filter_specs=where_filter_specs,
             time_range_constraint=time_range_constraint_to_apply,
             filter_to_specs=InstanceSpecSet(measure_specs=(measure_spec,)).merge(
                 InstanceSpecSet.create_from_specs(queried_linkable_specs.as_tuple)
@@ -1889,6 +1908,87 @@ class DataflowPlanBuilder:
 
         return aggregate_measures_node
 
+    def _find_materialized_aggregate_recipe(
+        self,
+        metric_input_measure_spec: MetricInputMeasureSpec,
+        queried_linkable_specs: LinkableSpecSet,
+        measure_properties: MeasureSpecProperties,
+        predicate_pushdown_state: PredicatePushdownState,
+    ) -> Optional[SourceNodeRecipe]:
+        """Find a materialized aggregate that can be read instead of the semantic model to get the measure.
+
+        An aggregate can be used if it contains the measure and all group-by items needed for the query and the filters,
+        and if the filters that were applied to build the aggregate are also in the query. Joins to the aggregate are
+        not supported. When there are multiple aggregates that can be used, the one with the fewest group-by items is
+        chosen as it should have the fewest rows to aggregate.
+        """
+        if (
+            len(self._source_node_set.materialized_aggregate_nodes) == 0
+            # Cumulative metrics and offsets join the rows to a time spine before aggregation.
+            or metric_input_measure_spec.cumulative_description is not None
+            or metric_input_measure_spec.before_aggregation_time_spine_join_description is not None
+        ):
+            return None
+
+        measure_spec = metric_input_measure_spec.measure_spec
+        filter_specs = metric_input_measure_spec.filter_spec_set.all_filter_specs
+        for materialized_aggregate, materialized_aggregate_node in sorted(
+            self._source_node_set.materialized_aggregate_nodes.items(),
+            key=lambda item: len(item[0].group_by_specs),
+        ):
+            if any(filter_spec not in filter_specs for filter_spec in materialized_aggregate.where_filter_specs):
+                continue
+            spec_set = self._node_data_set_resolver.get_output_data_set(
+                materialized_aggregate_node
+            ).instance_set.spec_set
+            if measure_spec not in spec_set.measure_specs:
+                continue
+
+            remaining_filter_specs = tuple(
+                filter_spec
+                for filter_spec in filter_specs
+                if filter_spec not in materialized_aggregate.where_filter_specs
+            )
+            linkable_specs_to_satisfy = self.__get_required_linkable_specs(
+                queried_linkable_specs=queried_linkable_specs,
+                filter_specs=remaining_filter_specs,
+                measure_spec_properties=measure_properties,
+            ).replace_custom_granularity_with_base_granularity()
+            if any(spec not in spec_set.linkable_specs for spec in linkable_specs_to_satisfy.as_tuple):
+                continue
+
+            source_node: DataflowPlanNode = materialized_aggregate_node
+            if predicate_pushdown_state.has_pushdown_potential:
+                # The time range constraint should select the same rows as it would for the semantic model, so the
+                # aggregate needs `metric_time` at the grain of the aggregation time dimension.
+                if predicate_pushdown_state.has_time_range_constraint_to_push_down and (
+                    DataSet.metric_time_dimension_spec(
+                        ExpandedTimeGranularity.from_time_granularity(measure_properties.agg_time_dimension_grain)
+                    )
+                    not in spec_set.time_dimension_specs
+                ):
+                    continue
+                node_processor = PreJoinNodeProcessor(
+                    semantic_model_lookup=self._semantic_model_lookup,
+                    node_data_set_resolver=self._node_data_set_resolver,
+                )
+                source_node = node_processor.apply_matching_filter_predicates(
+                    source_nodes=(source_node,),
+                    predicate_pushdown_state=predicate_pushdown_state,
+                    metric_time_dimension_reference=self._metric_time_dimension_reference,
+                )[0]
+
+            logger.debug(LazyFormat("Using a materialized aggregate", materialized_aggregate=materialized_aggregate))
+            return SourceNodeRecipe(
+                source_node=source_node,
+                required_local_linkable_specs=linkable_specs_to_satisfy,
+                join_linkable_instances_recipes=(),
+                all_linkable_specs_required_for_source_nodes=linkable_specs_to_satisfy,
+                applied_where_filter_specs=materialized_aggregate.where_filter_specs,
+            )
+
+        return None
+
     def _build_pre_aggregation_plan(
         self,
         source_node: DataflowPlanNode,
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Tuple
+
+from dbt_semantic_interfaces.references import MeasureReference
+from dbt_semantic_interfaces.type_enums import AggregationType
+from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
+from metricflow_semantics.specs.where_filter.where_filter_spec import WhereFilterSpec
+from metricflow_semantics.sql.sql_table import SqlTable
+
+# Aggregation types where aggregating the pre-aggregated values gives the same result as aggregating the rows.
+REAGGREGATABLE_AGGREGATION_TYPES = frozenset((AggregationType.SUM, AggregationType.MIN, AggregationType.MAX))
+
+
+@dataclass(frozen=True)
+class MaterializedAggregate:
+    """A table in the warehouse that contains measures that were pre-aggregated by a set of group-by items.
+
+    When a query only needs group-by items and filters that are covered by the table, the measures can be read from the
+    table and aggregated again instead of aggregating the rows of the semantic model. This is only possible for
+    measures that are additive and that are aggregated using SUM, MIN, or MAX.
+
+    The table should have a column for each measure that is named after the measure, and a column for each group-by
+    item that is named using the column association resolver (e.g. `metric_time__day` or `listing__country_latest`).
+
+    Attributes:
+        sql_table: The table that contains the pre-aggregated measures.
+        measure_references: The measures in the table. These must be defined in the same semantic model.
+        group_by_specs: The group-by items that the measures were aggregated by. A time dimension can be used to
+        satisfy queries at the same or at a coarser grain.
+        where_filter_specs: The filters that were applied to the rows before aggregation. The table is only used for
+        queries that have all of these filters.
+    """
+
+    sql_table: SqlTable
+    measure_references: Tuple[MeasureReference, ...]
+    group_by_specs: Tuple[LinkableInstanceSpec, ...]
+    where_filter_specs: Tuple[WhereFilterSpec, ...] = ()
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Mapping, Sequence, Tuple
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Sequence, Tuple
 
 from dbt_semantic_interfaces.references import TimeDimensionReference
 from dbt_semantic_interfaces.type_enums import TimeGranularity
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow_semantics.query.query_parser import MetricFlowQueryParser
 from metricflow_semantics.specs.column_assoc import ColumnAssociationResolver
 from metricflow_semantics.specs.group_by_metric_spec import GroupByMetricSpec
 from metricflow_semantics.specs.query_spec import MetricFlowQuerySpec
+from metricflow_semantics.specs.spec_set import group_specs_by_type
 from metricflow_semantics.time.time_spine_source import TimeSpineSource
 
+from metricflow.dataflow.builder.materialized_aggregate import REAGGREGATABLE_AGGREGATION_TYPES, MaterializedAggregate
 from metricflow.dataflow.dataflow_plan import DataflowPlanNode
 from metricflow.dataflow.nodes.metric_time_transform import MetricTimeDimensionTransformNode
 from metricflow.dataflow.nodes.read_sql_source import ReadSqlSourceNode
@@ -42,12 +45,16 @@ class SourceNodeSet:
     # Provides time spines that can be used to satisfy metric_time without metrics.
     time_spine_metric_time_nodes: Mapping[TimeGranularity, MetricTimeDimensionTransformNode]
 
+    # Provides tables with pre-aggregated measures that can be used instead of the nodes for the semantic models.
+    materialized_aggregate_nodes: Mapping[MaterializedAggregate, ReadSqlSourceNode] = field(default_factory=dict)
+
     @property
     def all_nodes(self) -> Sequence[DataflowPlanNode]:  # noqa: D102
         return (
             self.source_nodes_for_metric_queries
             + self.source_nodes_for_group_by_item_queries
             + self.time_spine_metric_time_nodes_tuple
+            + tuple(self.materialized_aggregate_nodes.values())
         )
 
     @property
@@ -65,6 +72,7 @@ class SourceNodeBuilder:
     ) -> None:
         self._semantic_manifest_lookup = semantic_manifest_lookup
         data_set_converter = SemanticModelToDataSetConverter(column_association_resolver)
+        self._data_set_converter = data_set_converter
         self.time_spine_sources = TimeSpineSource.build_standard_time_spine_sources(
             semantic_manifest_lookup.semantic_manifest
         )
@@ -82,8 +90,12 @@ class SourceNodeBuilder:
 
         self._query_parser = MetricFlowQueryParser(semantic_manifest_lookup)
 
-    def create_from_data_sets(self, data_sets: Sequence[SemanticModelDataSet]) -> SourceNodeSet:
-        """Creates a `SourceNodeSet` from SemanticModelDataSets."""
+    def create_from_data_sets(
+        self,
+        data_sets: Sequence[SemanticModelDataSet],
+        materialized_aggregates: Sequence[MaterializedAggregate] = (),
+    ) -> SourceNodeSet:
+        """Creates a `SourceNodeSet` from SemanticModelDataSets and the tables with pre-aggregated measures."""
         group_by_item_source_nodes: List[DataflowPlanNode] = []
         source_nodes_for_metric_queries: List[DataflowPlanNode] = []
 
@@ -109,11 +121,76 @@ class SourceNodeBuilder:
                     )
                     source_nodes_for_metric_queries.append(metric_time_transform_node)
 
+        materialized_aggregate_nodes: Dict[MaterializedAggregate, ReadSqlSourceNode] = {}
+        for materialized_aggregate in materialized_aggregates:
+            materialized_aggregate_nodes[materialized_aggregate] = self._create_materialized_aggregate_node(
+                materialized_aggregate
+            )
+
         return SourceNodeSet(
             time_spine_metric_time_nodes=self._time_spine_metric_time_nodes,
             time_spine_read_nodes=self._time_spine_read_nodes,
             source_nodes_for_group_by_item_queries=tuple(group_by_item_source_nodes),
             source_nodes_for_metric_queries=tuple(source_nodes_for_metric_queries),
+            materialized_aggregate_nodes=materialized_aggregate_nodes,
+        )
+
+    def _create_materialized_aggregate_node(self, materialized_aggregate: MaterializedAggregate) -> ReadSqlSourceNode:
+        """Check that the measures in the aggregate can be aggregated again and create the node to read it."""
+        measure_lookup = self._semantic_manifest_lookup.semantic_model_lookup.measure_lookup
+        if len(materialized_aggregate.measure_references) == 0:
+            raise ValueError(
+                LazyFormat(
+                    "A materialized aggregate must contain measures.", materialized_aggregate=materialized_aggregate
+                )
+            )
+        semantic_model_references = {
+            measure_lookup.get_properties(measure_reference).model_reference
+            for measure_reference in materialized_aggregate.measure_references
+        }
+        if len(semantic_model_references) != 1:
+            raise ValueError(
+                LazyFormat(
+                    "The measures in a materialized aggregate must be defined in the same semantic model.",
+                    materialized_aggregate=materialized_aggregate,
+                    semantic_model_references=semantic_model_references,
+                )
+            )
+        measures = tuple(
+            measure_lookup.get_measure(measure_reference)
+            for measure_reference in materialized_aggregate.measure_references
+        )
+        for measure in measures:
+            if measure.agg not in REAGGREGATABLE_AGGREGATION_TYPES or measure.non_additive_dimension is not None:
+                raise ValueError(
+                    LazyFormat(
+                        "A materialized aggregate can only contain additive measures that are aggregated using one of "
+                        "the listed types.",
+                        measure_reference=measure.reference,
+                        agg=measure.agg,
+                        non_additive_dimension=measure.non_additive_dimension,
+                        reaggregatable_aggregation_types=sorted(agg.value for agg in REAGGREGATABLE_AGGREGATION_TYPES),
+                    )
+                )
+        spec_set = group_specs_by_type(materialized_aggregate.group_by_specs)
+        if len(spec_set.group_by_metric_specs) > 0 or any(
+            time_dimension_spec.has_custom_grain for time_dimension_spec in spec_set.time_dimension_specs
+        ):
+            raise ValueError(
+                LazyFormat(
+                    "A materialized aggregate can't be grouped by metrics or by time dimensions with custom "
+                    "granularities.",
+                    group_by_specs=materialized_aggregate.group_by_specs,
+                )
+            )
+
+        return ReadSqlSourceNode.create(
+            self._data_set_converter.create_materialized_aggregate_data_set(
+                semantic_model_name=semantic_model_references.pop().semantic_model_name,
+                measures=measures,
+                group_by_specs=materialized_aggregate.group_by_specs,
+                sql_table=materialized_aggregate.sql_table,
+            )
         )
 
     def build_source_node_inputs_for_group_by_metric(
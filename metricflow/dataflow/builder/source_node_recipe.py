@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import List, Tuple
 
 from metricflow_semantics.specs.linkable_spec_set import LinkableSpecSet
+from metricflow_semantics.specs.where_filter.where_filter_spec import WhereFilterSpec
 
 from metricflow.dataflow.builder.node_evaluator import JoinLinkableInstancesRecipe
 from metricflow.dataflow.dataflow_plan import DataflowPlanNode
@@ -18,6 +19,8 @@ class SourceNodeRecipe:
     required_local_linkable_specs: LinkableSpecSet
     join_linkable_instances_recipes: Tuple[JoinLinkableInstancesRecipe, ...]
     all_linkable_specs_required_for_source_nodes: LinkableSpecSet
+    # Filters that were already applied to the rows of the source node (e.g. for a materialized aggregate).
+    applied_where_filter_specs: Tuple[WhereFilterSpec, ...] = ()
 
     @property
     def join_targets(self) -> List[JoinDescription]:
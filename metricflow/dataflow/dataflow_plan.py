@@ -7,9 +7,8 @@ import logging
 import typing
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import FrozenSet, Optional, Sequence, Set, Type, TypeVar
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Type, TypeVar
 
-import more_itertools
 from metricflow_semantics.dag.id_prefix import StaticIdPrefix
 from metricflow_semantics.dag.mf_dag import DagId, DagNode, MetricFlowDag
 from metricflow_semantics.experimental.comparison_helpers import ComparisonOtherType
@@ -110,29 +109,38 @@ class DataflowPlan(MetricFlowDag[DataflowPlanNode]):
 
     @property
     def node_count(self) -> int:
-        """Returns the number of nodes in the DataflowPlan."""
-        return len(DataflowPlan.__all_nodes_in_subgraph(self.sink_node))
+        """Returns the number of nodes in the DataflowPlan.
 
-    @staticmethod
-    def __all_nodes_in_subgraph(node: DataflowPlanNode) -> Sequence[DataflowPlanNode]:
-        """Node accessor for retrieving a flattened sequence of all nodes in the subgraph upstream of the input node.
-
-        Useful for gathering nodes for subtype-agnostic operations, such as common property access or simple counts.
+        A node that is shared by multiple branches is counted once for each path from the sink node to it. See
+        `unique_node_count` to count those nodes once.
         """
-        flattened_parent_subgraphs = tuple(
-            more_itertools.collapse(
-                DataflowPlan.__all_nodes_in_subgraph(parent_node) for parent_node in node.parent_nodes
-            )
-        )
-        return (node,) + flattened_parent_subgraphs
+        # The count for each node is computed once, after the counts of its parents, so that shared subgraphs are not
+        # traversed repeatedly.
+        node_to_count: Dict[DataflowPlanNode, int] = {}
+        nodes_to_count: List[DataflowPlanNode] = [self.sink_node]
+        while len(nodes_to_count) > 0:
+            node = nodes_to_count[-1]
+            if node in node_to_count:
+                nodes_to_count.pop()
+                continue
+            uncounted_parent_nodes = [
+                parent_node for parent_node in node.parent_nodes if parent_node not in node_to_count
+            ]
+            if len(uncounted_parent_nodes) > 0:
+                nodes_to_count.extend(uncounted_parent_nodes)
+                continue
+            nodes_to_count.pop()
+            node_to_count[node] = 1 + sum(node_to_count[parent_node] for parent_node in node.parent_nodes)
+        return node_to_count[self.sink_node]
+
+    @property
+    def unique_node_count(self) -> int:
+        """Returns the number of distinct nodes in the DataflowPlan."""
+        return len(self.all_nodes())
 
     @property
     def source_semantic_models(self) -> FrozenSet[SemanticModelReference]:
         """Return the complete set of source semantic models for this DataflowPlan."""
         return frozenset(
-            [
-                node._input_semantic_model
-                for node in DataflowPlan.__all_nodes_in_subgraph(self.sink_node)
-                if node._input_semantic_model is not None
-            ]
+            [node._input_semantic_model for node in self.all_nodes() if node._input_semantic_model is not None]
         )
@@ -41,7 +41,12 @@ class DataflowPlanAnalyzer:
 
 
 class _CountDataflowNodeVisitor(DataflowPlanNodeVisitorWithDefaultHandler[None]):
-    """Helper visitor to build a dict from a node in the plan to the number of times it appears in the plan."""
+    """Helper visitor to build a dict from a node in the plan to the number of nodes that use it as a parent.
+
+    The parents of a node are only visited the first time the node is seen, so nodes that are shared by many branches
+    are not traversed repeatedly. A node that appears in multiple branches of the plan has a count greater than 1, or
+    is only reachable through a node that does.
+    """
 
     def __init__(self) -> None:
         self._node_to_count: Dict[DataflowPlanNode, int] = defaultdict(int)
@@ -51,9 +56,12 @@ class _CountDataflowNodeVisitor(DataflowPlanNodeVisitorWithDefaultHandler[None])
 
     @override
     def _default_handler(self, node: DataflowPlanNode) -> None:
+        previously_visited = node in self._node_to_count
+        self._node_to_count[node] += 1
+        if previously_visited:
+            return
         for parent_node in node.parent_nodes:
             parent_node.accept(self)
-        self._node_to_count[node] += 1
 
 
 class _FindLargestCommonBranchesVisitor(DataflowPlanNodeVisitorWithDefaultHandler[FrozenSet[DataflowPlanNode]]):
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import textwrap
 from dataclasses import dataclass
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Tuple
 
 import jinja2
 from dbt_semantic_interfaces.references import SemanticModelReference
@@ -69,6 +69,12 @@ class ReadSqlSourceNode(DataflowPlanNode):
     def displayed_properties(self) -> Sequence[DisplayedProperty]:  # noqa: D102
         return tuple(super().displayed_properties) + (DisplayedProperty("data_set", self.data_set),)
 
+    @override
+    @property
+    def functional_parameters(self) -> Tuple[object, ...]:
+        # `SqlDataSet` is not a dataclass, so describe it by the SQL that it reads and the instances that it outputs.
+        return self.data_set.sql_node, self.data_set.instance_set
+
     def functionally_identical(self, other_node: DataflowPlanNode) -> bool:  # noqa: D102
         return isinstance(other_node, self.__class__) and other_node.data_set == self.data_set
 
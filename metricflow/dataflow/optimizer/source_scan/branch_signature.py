@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import Dict, Hashable, Tuple
+
+from metricflow.dataflow.dataflow_plan import DataflowPlanNode
+from metricflow.dataflow.nodes.constrain_time import ConstrainTimeRangeNode
+from metricflow.dataflow.nodes.read_sql_source import ReadSqlSourceNode
+from metricflow.dataflow.nodes.where_filter import WhereConstraintNode
+
+BranchSignature = Tuple[Hashable, ...]
+
+
+class BranchSignatureResolver:
+    """Computes a signature for a branch that can be used to quickly rule out combining two branches.
+
+    Running the `ComputeMetricsBranchCombiner` on a pair of branches traverses both branches, so trying to combine every
+    pair of parent branches of a `CombineAggregatedOutputsNode` is slow for queries with many metrics. The signature
+    of a branch contains the properties that the combiner requires to be the same between two branches:
+
+    * The type of each node in the branch and the structure of the branch.
+    * The semantic model that each `ReadSqlSourceNode` reads from.
+    * The filter in each `WhereConstraintNode`.
+    * The time range in each `ConstrainTimeRangeNode`.
+
+    If two branches have different signatures, the combiner would not be able to combine them. Two branches with the
+    same signature may still not be combinable (e.g. different group-by items), so the combiner still needs to run on
+    those. The combined branch has the same signature as the branches that were combined as the combiner does not change
+    those properties.
+
+    Signatures are cached by node, so an instance should only be used for the duration of an optimization.
+    """
+
+    def __init__(self) -> None:  # noqa: D107
+        # Nodes use identity for equality / hashing, so this is cheap to look up.
+        self._node_to_signature: Dict[DataflowPlanNode, BranchSignature] = {}
+
+    def get_signature(self, branch: DataflowPlanNode) -> BranchSignature:
+        """Return the signature for the branch ending at the given node."""
+        signature = self._node_to_signature.get(branch)
+        if signature is not None:
+            return signature
+
+        signature = (
+            branch.__class__.__name__,
+            BranchSignatureResolver._node_properties(branch),
+            tuple(self.get_signature(parent_node) for parent_node in branch.parent_nodes),
+        )
+        self._node_to_signature[branch] = signature
+        return signature
+
+    @staticmethod
+    def _node_properties(node: DataflowPlanNode) -> Hashable:
+        """Return the properties of the node that are compared by the combiner, or `None` if not needed."""
+        if isinstance(node, ReadSqlSourceNode):
+            return node.data_set.semantic_model_reference
+        elif isinstance(node, WhereConstraintNode):
+            return node.where.where_sql, node.always_apply
+        elif isinstance(node, ConstrainTimeRangeNode):
+            return node.time_range_constraint
+        return None
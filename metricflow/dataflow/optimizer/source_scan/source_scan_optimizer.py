@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Sequence
 
@@ -37,6 +38,7 @@ from metricflow.dataflow.nodes.window_reaggregation_node import WindowReaggregat
 from metricflow.dataflow.nodes.write_to_data_table import WriteToResultDataTableNode
 from metricflow.dataflow.nodes.write_to_table import WriteToResultTableNode
 from metricflow.dataflow.optimizer.dataflow_plan_optimizer import DataflowPlanOptimizer
+from metricflow.dataflow.optimizer.source_scan.branch_signature import BranchSignature, BranchSignatureResolver
 from metricflow.dataflow.optimizer.source_scan.cm_branch_combiner import (
     ComputeMetricsBranchCombiner,
     ComputeMetricsBranchCombinerResult,
@@ -115,6 +117,7 @@ class SourceScanOptimizer(
 
     def __init__(self) -> None:  # noqa: D107
         self._node_to_result: Dict[DataflowPlanNode, OptimizeBranchResult] = {}
+        self._branch_signature_resolver = BranchSignatureResolver()
 
     def _log_visit_node_type(self, node: DataflowPlanNode) -> None:
         logger.debug(LazyFormat(lambda: f"Visiting {node.node_id}"))
@@ -262,25 +265,30 @@ class SourceScanOptimizer(
         # Try to combine (using ComputeMetricsBranchCombiner) as many parent branches as possible in a
         # greedy N^2 approach. The optimality of this approach needs more thought to prove conclusively, but given
         # the seemingly transitive properties of the combination operation, this seems reasonable.
+        #
+        # To avoid running the combiner on branches that can't be combined, branches are grouped by signature and a
+        # branch is only combined with the branches in the same group. Since branches in different groups can't be
+        # combined, this produces the same result as trying all branches.
         combined_parent_branches: List[DataflowPlanNode] = []
+        signature_to_branch_indexes: Dict[BranchSignature, List[int]] = defaultdict(list)
         for optimized_parent_branch in optimized_parent_branches:
+            branch_indexes = signature_to_branch_indexes[
+                self._branch_signature_resolver.get_signature(optimized_parent_branch)
+            ]
             combination_results = SourceScanOptimizer._combine_branches(
-                left_branches=combined_parent_branches, right_branch=optimized_parent_branch
+                left_branches=[combined_parent_branches[i] for i in branch_indexes],
+                right_branch=optimized_parent_branch,
             )
 
             # If optimized_parent_branch couldn't be combined with any of the existing ones, add it to the list.
             if not any(x.combined_branch is not None for x in combination_results):
+                branch_indexes.append(len(combined_parent_branches))
                 combined_parent_branches.append(optimized_parent_branch)
             # Otherwise, replaced the branch with the one that was combined in combined_parent_branches
             else:
-                combined_parent_branches = [
-                    (
-                        branch_combination_result.left_branch
-                        if branch_combination_result.combined_branch is None
-                        else branch_combination_result.combined_branch
-                    )
-                    for branch_combination_result in combination_results
-                ]
+                for branch_index, branch_combination_result in zip(branch_indexes, combination_results):
+                    if branch_combination_result.combined_branch is not None:
+                        combined_parent_branches[branch_index] = branch_combination_result.combined_branch
 
         logger.debug(
             LazyFormat(
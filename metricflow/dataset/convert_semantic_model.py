@@ -31,6 +31,8 @@ from metricflow_semantics.model.spec_converters import MeasureConverter
 from metricflow_semantics.specs.column_assoc import ColumnAssociationResolver
 from metricflow_semantics.specs.dimension_spec import DimensionSpec
 from metricflow_semantics.specs.entity_spec import EntitySpec
+from metricflow_semantics.specs.instance_spec import LinkableInstanceSpec
+from metricflow_semantics.specs.spec_set import group_specs_by_type
 from metricflow_semantics.specs.time_dimension_spec import DEFAULT_TIME_GRANULARITY, TimeDimensionSpec
 from metricflow_semantics.sql.sql_exprs import (
     SqlColumnReference,
@@ -571,3 +573,141 @@ class SemanticModelToDataSetConverter:
                 from_source_alias=from_source_alias,
             ),
         )
+
+    def create_materialized_aggregate_data_set(
+        self,
+        semantic_model_name: str,
+        measures: Sequence[Measure],
+        group_by_specs: Sequence[LinkableInstanceSpec],
+        sql_table: SqlTable,
+    ) -> SqlDataSet:
+        """Create a data set for a table containing measures that were pre-aggregated by the given group-by items.
+
+        The instances are defined from the semantic model of the measures so that the data set can be used in place of
+        the data set for the semantic model. Time dimensions are also included at coarser grains and as date parts.
+        """
+        from_source_alias = SequentialIdGenerator.create_next_id(
+            DynamicIdPrefix(prefix=f"{sql_table.table_name}_src")
+        ).str_value
+        select_columns: List[SqlSelectColumn] = []
+
+        measure_instances: List[MeasureInstance] = []
+        for measure in measures:
+            measure_spec = MeasureConverter.convert_to_measure_spec(measure=measure)
+            measure_instance = MeasureInstance(
+                associated_columns=(self._column_association_resolver.resolve_spec(measure_spec),),
+                spec=measure_spec,
+                defined_from=(
+                    SemanticModelElementReference(
+                        semantic_model_name=semantic_model_name, element_name=measure.reference.element_name
+                    ),
+                ),
+                aggregation_state=AggregationState.NON_AGGREGATED,
+            )
+            measure_instances.append(measure_instance)
+            select_columns.append(
+                SqlSelectColumn(
+                    expr=SemanticModelToDataSetConverter._make_element_sql_expr(
+                        table_alias=from_source_alias, element_name=measure.reference.element_name
+                    ),
+                    column_alias=measure_instance.associated_column.column_name,
+                )
+            )
+
+        spec_set = group_specs_by_type(group_by_specs)
+        dimension_instances: List[DimensionInstance] = []
+        for dimension_spec in spec_set.dimension_specs:
+            dimension_instance = DimensionInstance(
+                associated_columns=(self._column_association_resolver.resolve_spec(dimension_spec),),
+                spec=dimension_spec,
+                defined_from=(
+                    SemanticModelElementReference(
+                        semantic_model_name=semantic_model_name, element_name=dimension_spec.element_name
+                    ),
+                ),
+            )
+            dimension_instances.append(dimension_instance)
+            select_columns.append(
+                SqlSelectColumn(
+                    expr=SemanticModelToDataSetConverter._make_element_sql_expr(
+                        table_alias=from_source_alias, element_name=dimension_instance.associated_column.column_name
+                    ),
+                    column_alias=dimension_instance.associated_column.column_name,
+                )
+            )
+
+        entity_instances: List[EntityInstance] = []
+        for entity_spec in spec_set.entity_specs:
+            entity_instance = EntityInstance(
+                associated_columns=(self._column_association_resolver.resolve_spec(entity_spec),),
+                spec=entity_spec,
+                defined_from=(
+                    SemanticModelElementReference(
+                        semantic_model_name=semantic_model_name, element_name=entity_spec.element_name
+                    ),
+                ),
+            )
+            entity_instances.append(entity_instance)
+            select_columns.append(
+                SqlSelectColumn(
+                    expr=SemanticModelToDataSetConverter._make_element_sql_expr(
+                        table_alias=from_source_alias, element_name=entity_instance.associated_column.column_name
+                    ),
+                    column_alias=entity_instance.associated_column.column_name,
+                )
+            )
+
+        time_dimension_instances: List[TimeDimensionInstance] = []
+        dimension_select_exprs: List[SqlExpressionNode] = []
+        for time_dimension_spec in spec_set.time_dimension_specs:
+            time_dimension_instance = self._create_time_dimension_instance(
+                semantic_model_name=semantic_model_name,
+                element_name=time_dimension_spec.element_name,
+                entity_links=time_dimension_spec.entity_links,
+                time_granularity=time_dimension_spec.time_granularity,
+                date_part=time_dimension_spec.date_part,
+            )
+            time_dimension_instances.append(time_dimension_instance)
+            dimension_select_expr = SemanticModelToDataSetConverter._make_element_sql_expr(
+                table_alias=from_source_alias, element_name=time_dimension_instance.associated_column.column_name
+            )
+            dimension_select_exprs.append(dimension_select_expr)
+            select_columns.append(
+                SqlSelectColumn(
+                    expr=dimension_select_expr, column_alias=time_dimension_instance.associated_column.column_name
+                )
+            )
+
+        # Add the coarser grains and the date parts that weren't already included as columns in the table.
+        included_time_dimension_specs = set(spec_set.time_dimension_specs)
+        for time_dimension_spec, dimension_select_expr in zip(spec_set.time_dimension_specs, dimension_select_exprs):
+            if time_dimension_spec.date_part is not None or time_dimension_spec.time_granularity is None:
+                continue
+            new_instances, new_columns = self._build_time_dimension_instances_and_columns(
+                defined_time_granularity=time_dimension_spec.time_granularity.base_granularity,
+                element_name=time_dimension_spec.element_name,
+                entity_links=time_dimension_spec.entity_links,
+                dimension_select_expr=dimension_select_expr,
+                semantic_model_name=semantic_model_name,
+            )
+            for new_instance, new_column in zip(new_instances, new_columns):
+                if new_instance.spec in included_time_dimension_specs:
+                    continue
+                included_time_dimension_specs.add(new_instance.spec)
+                time_dimension_instances.append(new_instance)
+                select_columns.append(new_column)
+
+        return SqlDataSet(
+            instance_set=InstanceSet(
+                measure_instances=tuple(measure_instances),
+                dimension_instances=tuple(dimension_instances),
+                time_dimension_instances=tuple(time_dimension_instances),
+                entity_instances=tuple(entity_instances),
+            ),
+            sql_select_node=SqlSelectStatementNode.create(
+                description=f"Read Elements From Materialized Aggregate '{sql_table.sql}'",
+                select_columns=tuple(select_columns),
+                from_source=SqlTableNode.create(sql_table=sql_table),
+                from_source_alias=from_source_alias,
+            ),
+        )
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import enum
+import hashlib
+import logging
+import pickle
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
+from metricflow_semantics.collection_helpers.bounded_cache import BoundedCache
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.specs.query_spec import MetricFlowQuerySpec
+from metricflow_semantics.time.time_source import TimeSource
+
+from metricflow.__about__ import __version__
+from metricflow.dataflow.dataflow_plan import DataflowPlan
+from metricflow.plan_conversion.convert_to_sql_plan import ConvertToSqlPlanResult
+from metricflow.protocols.sql_client import SqlEngine
+from metricflow.sql.optimizer.optimization_levels import SqlOptimizationLevel
+from metricflow.sql.render.sql_plan_renderer import SqlPlanRenderResult
+
+logger = logging.getLogger(__name__)
+
+
+def create_canonical_text(obj: object) -> str:
+    """Return a string that represents the value of the given object and that is stable across processes.
+
+    This is used to generate cache keys from query requests. Unordered collections are sorted, and dataclasses are
+    described using their fields so that equal values produce the same text.
+
+    Raises a `TypeError` for other types, as their `repr` may not be stable across processes or may not include all
+    fields (e.g. the default `repr` of an object includes its address). Using it would lead to missed or incorrect
+    cache hits.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return repr(obj)
+    elif isinstance(obj, enum.Enum):
+        return f"{type(obj).__name__}.{obj.name}"
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return f"{type(obj).__name__}({obj.isoformat()})"
+    elif isinstance(obj, (list, tuple)):
+        return "(" + ", ".join(create_canonical_text(item) for item in obj) + ")"
+    elif isinstance(obj, (set, frozenset)):
+        return "{" + ", ".join(sorted(create_canonical_text(item) for item in obj)) + "}"
+    elif isinstance(obj, dict):
+        return (
+            "{"
+            + ", ".join(
+                sorted(f"{create_canonical_text(key)}: {create_canonical_text(value)}" for key, value in obj.items())
+            )
+            + "}"
+        )
+    elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        field_texts = [
+            f"{field.name}={create_canonical_text(getattr(obj, field.name))}" for field in dataclasses.fields(obj)
+        ]
+        return f"{type(obj).__name__}(" + ", ".join(field_texts) + ")"
+    raise TypeError(f"Unable to create canonical text for an object of type {type(obj)}: {obj!r}")
+
+
+@dataclass(frozen=True)
+class CompiledQueryCacheKey:
+    """Identifies the compiled form of a query.
+
+    Attributes:
+        request_text: The canonical text of the query request, excluding parameters that don't affect the generated SQL
+            (e.g. the request ID). The engine also stores entries using the structural hash of the dataflow plan, so
+            this can also describe the plan.
+        manifest_fingerprint: Hash of the semantic manifest that the query was compiled against.
+        sql_engine: The engine that the SQL was generated for.
+        sql_optimization_level: The optimization level used to generate the SQL.
+        materialized_aggregates_fingerprint: Hash of the materialized aggregates that the engine can route queries to,
+            as the generated SQL reads from those tables when possible.
+        metricflow_version: The version of MetricFlow that compiled the query, as the generated SQL can differ between
+            versions.
+    """
+
+    request_text: str
+    manifest_fingerprint: str
+    sql_engine: SqlEngine
+    sql_optimization_level: SqlOptimizationLevel
+    materialized_aggregates_fingerprint: str
+    metricflow_version: str = __version__
+
+    @property
+    def digest(self) -> str:
+        """A hash of the fields in this key, used to store entries in the on-disk tier."""
+        return hashlib.sha256(
+            "\n".join(
+                (
+                    self.request_text,
+                    self.manifest_fingerprint,
+                    self.sql_engine.name,
+                    self.sql_optimization_level.name,
+                    self.materialized_aggregates_fingerprint,
+                    self.metricflow_version,
+                )
+            ).encode("utf-8")
+        ).hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledQuery:
+    """The outputs of compiling a query request to SQL.
+
+    These don't reference the SQL client, so they can be pickled and shared between processes. The execution plan is
+    created from these when needed.
+    """
+
+    query_spec: MetricFlowQuerySpec
+    dataflow_plan: DataflowPlan
+    convert_to_sql_plan_result: ConvertToSqlPlanResult
+    render_sql_result: SqlPlanRenderResult
+
+
+class CompiledQueryCacheTier(enum.Enum):
+    """The tier of the cache where an entry was found."""
+
+    MEMORY = "memory"
+    DISK = "disk"
+
+
+@dataclass(frozen=True)
+class CompiledQueryCacheStats:
+    """Counters describing how the compiled-query cache has been used."""
+
+    memory_hit_count: int
+    disk_hit_count: int
+    miss_count: int
+
+    @property
+    def hit_count(self) -> int:  # noqa: D102
+        return self.memory_hit_count + self.disk_hit_count
+
+
+class CompiledQueryCache:
+    """Caches the results of compiling query requests to SQL.
+
+    Entries are stored in an in-memory LRU tier, and if a path is given, in an SQLite database that can be shared by
+    multiple processes (e.g. workers of a server). Entries from the disk tier are promoted to the memory tier on a hit.
+    The memory tier is a `BoundedCache`, so its usage is included in cache registry reports.
+
+    If `entry_ttl` is set, entries older than the TTL are treated as misses. The age of the entry is determined using
+    the given `TimeSource` so that results for time-relative requests can be refreshed periodically.
+    """
+
+    _TABLE_NAME = "mf_compiled_query"
+
+    def __init__(
+        self,
+        time_source: TimeSource,
+        max_memory_cache_items: int = 1000,
+        disk_cache_path: Optional[Path] = None,
+        max_disk_cache_items: int = 100000,
+        entry_ttl: Optional[datetime.timedelta] = None,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            time_source: Used to determine when entries were created.
+            max_memory_cache_items: Limit of entries to store in memory. Once the limit is hit, the least-recently used
+                entry is evicted.
+            disk_cache_path: If specified, the path to the SQLite database file for the on-disk tier.
+            max_disk_cache_items: Limit of entries to store on disk. Once the limit is hit, the oldest entries are
+                evicted.
+            entry_ttl: If specified, entries older than this are not used.
+        """
+        if max_memory_cache_items < 1:
+            raise ValueError(f"`max_memory_cache_items` should be at least 1. Got: {max_memory_cache_items}")
+        if max_disk_cache_items < 1:
+            raise ValueError(f"`max_disk_cache_items` should be at least 1. Got: {max_disk_cache_items}")
+        self._time_source = time_source
+        self._disk_cache_path = disk_cache_path
+        self._max_disk_cache_items = max_disk_cache_items
+        self._entry_ttl = entry_ttl
+
+        self._lock = threading.Lock()
+        self._memory_cache = BoundedCache[CompiledQueryCacheKey, Tuple[datetime.datetime, CompiledQuery]](
+            max_items=max_memory_cache_items, cache_name="CompiledQueryCache.memory"
+        )
+        self._memory_hit_count = 0
+        self._disk_hit_count = 0
+        self._miss_count = 0
+
+        if self._disk_cache_path is not None:
+            self._create_disk_cache_table()
+
+    def _connect(self) -> sqlite3.Connection:
+        assert self._disk_cache_path is not None
+        # A new connection is used for each operation as connections can't be shared between threads.
+        return sqlite3.connect(str(self._disk_cache_path), timeout=30.0)
+
+    def _create_disk_cache_table(self) -> None:
+        assert self._disk_cache_path is not None
+        self._disk_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            # WAL mode allows reads to proceed while another process is writing.
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {CompiledQueryCache._TABLE_NAME} "
+                "(cache_key TEXT PRIMARY KEY, created_at TEXT NOT NULL, compiled_query BLOB NOT NULL)"
+            )
+
+    def _is_expired(self, created_at: datetime.datetime) -> bool:
+        if self._entry_ttl is None:
+            return False
+        return self._time_source.get_time() - created_at > self._entry_ttl
+
+    def _get_from_memory(self, key: CompiledQueryCacheKey) -> Optional[CompiledQuery]:
+        entry = self._memory_cache.get(key)
+        if entry is None:
+            return None
+        created_at, compiled_query = entry
+        # An expired entry is replaced when the query is compiled again.
+        if self._is_expired(created_at):
+            return None
+        return compiled_query
+
+    def _set_in_memory(self, key: CompiledQueryCacheKey, created_at: datetime.datetime, value: CompiledQuery) -> None:
+        self._memory_cache.set(key, (created_at, value))
+
+    def _get_from_disk(self, key: CompiledQueryCacheKey) -> Optional[Tuple[datetime.datetime, CompiledQuery]]:
+        if self._disk_cache_path is None:
+            return None
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                f"SELECT created_at, compiled_query FROM {CompiledQueryCache._TABLE_NAME} WHERE cache_key = ?",
+                (key.digest,),
+            ).fetchone()
+        if row is None:
+            return None
+        created_at = datetime.datetime.fromisoformat(row[0])
+        if self._is_expired(created_at):
+            return None
+        try:
+            compiled_query = pickle.loads(row[1])
+        except Exception:
+            logger.warning(
+                LazyFormat("Unable to load a compiled query from the disk cache", cache_key=key), exc_info=True
+            )
+            return None
+        if not isinstance(compiled_query, CompiledQuery):
+            logger.warning(LazyFormat("Found an unexpected object in the disk cache", cache_key=key))
+            return None
+        return created_at, compiled_query
+
+    def _set_on_disk(self, key: CompiledQueryCacheKey, created_at: datetime.datetime, value: CompiledQuery) -> None:
+        if self._disk_cache_path is None:
+            return
+        serialized_value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO {CompiledQueryCache._TABLE_NAME} (cache_key, created_at, compiled_query) "
+                "VALUES (?, ?, ?)",
+                (key.digest, created_at.isoformat(), serialized_value),
+            )
+            connection.execute(
+                f"DELETE FROM {CompiledQueryCache._TABLE_NAME} WHERE cache_key NOT IN "
+                f"(SELECT cache_key FROM {CompiledQueryCache._TABLE_NAME} ORDER BY created_at DESC LIMIT ?)",
+                (self._max_disk_cache_items,),
+            )
+
+    def get(self, key: CompiledQueryCacheKey) -> Optional[CompiledQuery]:
+        """Return the compiled query for the given key, or None if it's not in the cache."""
+        compiled_query = self._get_from_memory(key)
+        hit_tier: Optional[CompiledQueryCacheTier] = None
+        if compiled_query is not None:
+            hit_tier = CompiledQueryCacheTier.MEMORY
+        else:
+            disk_entry = self._get_from_disk(key)
+            if disk_entry is not None:
+                created_at, compiled_query = disk_entry
+                self._set_in_memory(key, created_at, compiled_query)
+                hit_tier = CompiledQueryCacheTier.DISK
+
+        with self._lock:
+            if hit_tier is None:
+                self._miss_count += 1
+            elif hit_tier is CompiledQueryCacheTier.MEMORY:
+                self._memory_hit_count += 1
+            elif hit_tier is CompiledQueryCacheTier.DISK:
+                self._disk_hit_count += 1
+            else:
+                assert_values_exhausted(hit_tier)
+
+        logger.debug(LazyFormat("Looked up compiled query", cache_key=key, hit_tier=hit_tier))
+        return compiled_query
+
+    def set(self, key: CompiledQueryCacheKey, value: CompiledQuery) -> None:
+        """Store the compiled query in all tiers."""
+        created_at = self._time_source.get_time()
+        self._set_in_memory(key, created_at, value)
+        self._set_on_disk(key, created_at, value)
+
+    def clear(self) -> None:
+        """Remove all entries from all tiers and reset the counters."""
+        self._memory_cache.clear()
+        with self._lock:
+            self._memory_hit_count = 0
+            self._disk_hit_count = 0
+            self._miss_count = 0
+        if self._disk_cache_path is not None:
+            with closing(self._connect()) as connection, connection:
+                connection.execute(f"DELETE FROM {CompiledQueryCache._TABLE_NAME}")
+
+    @property
+    def stats(self) -> CompiledQueryCacheStats:  # noqa: D102
+        with self._lock:
+            return CompiledQueryCacheStats(
+                memory_hit_count=self._memory_hit_count,
+                disk_hit_count=self._disk_hit_count,
+                miss_count=self._miss_count,
+            )
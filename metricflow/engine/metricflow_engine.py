@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import datetime
+import hashlib
 import logging
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.implementations.elements.dimension import PydanticDimensionTypeParams
 from dbt_semantic_interfaces.implementations.filters.where_filter import PydanticWhereFilter
 from dbt_semantic_interfaces.naming.keywords import METRIC_TIME_ELEMENT_NAME
+from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
 from dbt_semantic_interfaces.references import (
     DimensionReference,
     EntityReference,
@@ -18,7 +23,8 @@ from dbt_semantic_interfaces.references import (
     MetricReference,
     SemanticModelElementReference,
 )
-from dbt_semantic_interfaces.type_enums import DimensionType
+from dbt_semantic_interfaces.type_enums import DimensionType, TimeGranularity
+from metricflow_semantics.collection_helpers.cache_registry import GLOBAL_CACHE_REGISTRY, CacheReport
 from metricflow_semantics.collection_helpers.syntactic_sugar import mf_first_item
 from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
 from metricflow_semantics.errors.error_classes import ExecutionException, InvalidQueryException, UnknownMetricError
@@ -27,6 +33,7 @@ from metricflow_semantics.filters.time_constraint import TimeRangeConstraint
 from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.mf_logging.runtime import log_block_runtime
 from metricflow_semantics.model.linkable_element_property import LinkableElementProperty
+from metricflow_semantics.model.semantic_manifest_diff import SemanticManifestDiff
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow_semantics.model.semantic_model_derivation import SemanticModelDerivation
 from metricflow_semantics.model.semantics.element_filter import LinkableElementFilter
@@ -43,35 +50,49 @@ from metricflow_semantics.query.query_parser import MetricFlowQueryParser
 from metricflow_semantics.random_id import random_id
 from metricflow_semantics.specs.column_assoc import ColumnAssociationResolver
 from metricflow_semantics.specs.dunder_column_association_resolver import DunderColumnAssociationResolver
+from metricflow_semantics.specs.instance_spec import InstanceSpec
 from metricflow_semantics.specs.query_param_implementations import SavedQueryParameter
 from metricflow_semantics.specs.query_spec import MetricFlowQuerySpec
 from metricflow_semantics.specs.spec_set import InstanceSpecSet
 from metricflow_semantics.sql.sql_table import SqlTable
 from metricflow_semantics.time.granularity import ExpandedTimeGranularity
 from metricflow_semantics.time.time_source import TimeSource
-from metricflow_semantics.time.time_spine_source import TimeSpineSource
 from typing_extensions import TypeVar
 
 from metricflow.data_table.mf_table import MetricFlowDataTable
 from metricflow.dataflow.builder.builder_cache import DataflowPlanBuilderCache
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.builder.materialized_aggregate import MaterializedAggregate
 from metricflow.dataflow.builder.source_node import SourceNodeBuilder
 from metricflow.dataflow.dataflow_plan import DataflowPlan
 from metricflow.dataflow.optimizer.dataflow_optimizer_factory import DataflowPlanOptimization
 from metricflow.dataset.convert_semantic_model import SemanticModelToDataSetConverter
 from metricflow.dataset.dataset_classes import DataSet
 from metricflow.dataset.semantic_model_adapter import SemanticModelDataSet
+from metricflow.engine.compiled_query_cache import (
+    CompiledQuery,
+    CompiledQueryCache,
+    CompiledQueryCacheKey,
+    create_canonical_text,
+)
 from metricflow.engine.models import Dimension, Entity, Measure, Metric, SavedQuery, SearchableElement
 from metricflow.engine.time_source import ServerTimeSource
 from metricflow.execution.convert_to_execution_plan import ConvertToExecutionPlanResult
 from metricflow.execution.dataflow_to_execution import (
     DataflowToExecutionPlanConverter,
 )
-from metricflow.execution.execution_plan import ExecutionPlan, SqlStatement
-from metricflow.execution.executor import SequentialPlanExecutor
+from metricflow.execution.execution_plan import ExecutionPlan, SelectSqlQueryToDataTableTask, SqlStatement
+from metricflow.execution.executor import (
+    AsyncioPlanExecutor,
+    ExecutionPlanExecutor,
+    ExecutionResults,
+    SequentialPlanExecutor,
+)
+from metricflow.execution.query_result_cache import QueryResultCache, TimePartitionedQueryResult
 from metricflow.plan_conversion.to_sql_plan.dataflow_to_sql import DataflowToSqlPlanConverter
 from metricflow.plan_conversion.to_sql_plan.dataflow_to_subquery import DataflowNodeToSqlSubqueryVisitor
-from metricflow.protocols.sql_client import SqlClient
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.sql_client import DEFAULT_QUERY_BATCH_SIZE, SqlClient
 from metricflow.sql.optimizer.optimization_levels import SqlOptimizationLevel
 from metricflow.telemetry.models import TelemetryLevel
 from metricflow.telemetry.reporter import TelemetryReporter, log_call
@@ -199,6 +220,17 @@ class MetricFlowQueryRequest:
             order_output_columns_by_input_order=order_output_columns_by_input_order,
         )
 
+    @property
+    def canonical_text(self) -> str:
+        """Return a string that describes the parameters of this request, excluding the request ID.
+
+        Requests with the same canonical text produce the same query. Raises a `TypeError` if a parameter has a type
+        that is not supported by `create_canonical_text`.
+        """
+        return create_canonical_text(
+            {field.name: getattr(self, field.name) for field in dataclasses.fields(self) if field.name != "request_id"}
+        )
+
 
 @dataclass(frozen=True)
 class MetricFlowQueryResult:
@@ -211,6 +243,20 @@ class MetricFlowQueryResult:
     result_table: Optional[SqlTable] = None
 
 
+@dataclass(frozen=True)
+class MetricFlowQueryStreamResult:
+    """Similar to `MetricFlowQueryResult`, but the result data is returned in batches.
+
+    The query runs in the warehouse when `result_batches` is first advanced, and rows are fetched from the warehouse as
+    the batches are consumed. The iterator can only be consumed once.
+    """
+
+    query_spec: MetricFlowQuerySpec
+    dataflow_plan: DataflowPlan
+    sql: str
+    result_batches: Iterator[MetricFlowDataTable]
+
+
 @dataclass(frozen=True)
 class MetricFlowExplainResult:
     """Returns plans for resolving a query."""
@@ -259,6 +305,15 @@ class AbstractMetricFlowEngine(ABC):
         """Query for metrics."""
         pass
 
+    @abstractmethod
+    def query_stream(
+        self,
+        mf_request: MetricFlowQueryRequest,
+        batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+    ) -> MetricFlowQueryStreamResult:
+        """Similar to query - returns the result in batches of at most `batch_size` rows to bound memory usage."""
+        pass
+
     @abstractmethod
     def explain(
         self,
@@ -267,6 +322,22 @@ class AbstractMetricFlowEngine(ABC):
         """Similar to query - returns the query that would have been executed."""
         pass
 
+    @abstractmethod
+    async def aquery(
+        self,
+        mf_request: MetricFlowQueryRequest,
+    ) -> MetricFlowQueryResult:
+        """Similar to query - for use in an `asyncio` event loop."""
+        pass
+
+    @abstractmethod
+    async def aexplain(
+        self,
+        mf_request: MetricFlowQueryRequest,
+    ) -> MetricFlowExplainResult:
+        """Similar to explain - for use in an `asyncio` event loop."""
+        pass
+
     @abstractmethod
     def simple_dimensions_for_metrics(
         self,
@@ -375,11 +446,34 @@ class AbstractMetricFlowEngine(ABC):
         pass
 
 
+@dataclass(frozen=True)
+class _ManifestState:
+    """The objects in `MetricFlowEngine` that are derived from the semantic manifest.
+
+    These are kept together so that they can be replaced at once when the manifest is updated.
+    """
+
+    semantic_manifest_lookup: SemanticManifestLookup
+    source_data_sets: Tuple[SemanticModelDataSet, ...]
+    dataflow_plan_builder_cache: DataflowPlanBuilderCache
+    dataflow_plan_builder: DataflowPlanBuilder
+    to_sql_plan_converter: DataflowToSqlPlanConverter
+    query_parser: MetricFlowQueryParser
+
+
 class MetricFlowEngine(AbstractMetricFlowEngine):
     """Main entry point for queries.
 
     Attributes on this class should be treated as in use by our APIs.
     TODO: provide a more stable API layer instead of assuming this class is stable.
+
+    Concurrency: after initialization, a single instance can serve requests from multiple threads or asyncio tasks
+    (e.g. tenants of a server that share the same manifest). Objects created during initialization are only read
+    while handling requests, state specific to a request (e.g. the numbering of generated IDs) is stored in context
+    variables, and the caches that are shared between requests are thread-safe with lookups that don't block on
+    other requests. The SQL client and the plan executor are shared, so they need to be thread-safe as well for
+    queries to run concurrently. Initialization itself is not thread-safe and should complete before the instance is
+    shared. The semantic manifest can be updated while serving requests using `update_semantic_manifest`.
     """
 
     # When generating IDs in the initializer, start from this value.
@@ -395,6 +489,11 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         query_parser: Optional[MetricFlowQueryParser] = None,
         column_association_resolver: Optional[ColumnAssociationResolver] = None,
         consistent_id_enumeration: Optional[bool] = True,
+        plan_executor: Optional[ExecutionPlanExecutor] = None,
+        compiled_query_cache: Optional[CompiledQueryCache] = None,
+        async_sql_client: Optional[AsyncSqlClient] = None,
+        materialized_aggregates: Sequence[MaterializedAggregate] = (),
+        query_result_cache: Optional[QueryResultCache] = None,
     ) -> None:
         """Initializer for MetricFlowEngine.
 
@@ -407,6 +506,21 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         - time_spine_source
 
         These parameters are mainly there to be overridden during tests.
+
+        plan_executor can be set to run the tasks in the execution plan concurrently (e.g. `ThreadPoolPlanExecutor`). By
+        default, tasks are run one at a time.
+
+        compiled_query_cache can be set to reuse the SQL generated for identical requests instead of recompiling it.
+
+        async_sql_client can be set so that `aquery` runs queries without blocking a thread. It should connect to the
+        same warehouse as sql_client.
+
+        materialized_aggregates can be set to tables with pre-aggregated measures. Queries that only need the group-by
+        items and the filters that are covered by one of these tables will read the measures from it.
+
+        query_result_cache can be set to reuse the results of queries that were previously run in the warehouse. If it's
+        configured for time-partitioned refresh, repeated queries grouped by `metric_time` only query the latest time
+        buckets.
         """
         self._reset_id_enumeration = consistent_id_enumeration
         if self._reset_id_enumeration:
@@ -419,69 +533,370 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                 )
             )
             SequentialIdGenerator.reset(MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_INITIALIZER)
-        self._semantic_manifest_lookup = semantic_manifest_lookup
         self._sql_client = sql_client
         self._column_association_resolver = column_association_resolver or (DunderColumnAssociationResolver())
         self._time_source = time_source
-        self._time_spine_sources = TimeSpineSource.build_standard_time_spine_sources(
-            semantic_manifest_lookup.semantic_manifest
+        self._materialized_aggregates = tuple(materialized_aggregates)
+        # Included in the compiled-query cache keys as the cache may be shared with engines with other aggregates.
+        self._materialized_aggregates_fingerprint = hashlib.sha256(
+            create_canonical_text(self._materialized_aggregates).encode("utf-8")
+        ).hexdigest()
+        self._manifest_state = self._create_manifest_state(
+            semantic_manifest_lookup=semantic_manifest_lookup, query_parser=query_parser
         )
-        self._source_data_sets: List[SemanticModelDataSet] = []
+        self._manifest_update_lock = threading.Lock()
+        self._executor = plan_executor or SequentialPlanExecutor()
+        self._compiled_query_cache = compiled_query_cache
+        self._query_result_cache = query_result_cache
+        if async_sql_client is not None and async_sql_client.sql_engine_type is not sql_client.sql_engine_type:
+            raise ValueError(
+                f"The async SQL client is for {async_sql_client.sql_engine_type}, but the SQL client is for "
+                f"{sql_client.sql_engine_type}."
+            )
+        self._async_sql_client = async_sql_client
+
+    def _create_manifest_state(
+        self,
+        semantic_manifest_lookup: SemanticManifestLookup,
+        query_parser: Optional[MetricFlowQueryParser],
+        reusable_source_data_sets: Sequence[SemanticModelDataSet] = (),
+    ) -> _ManifestState:
+        """Create the objects derived from the manifest.
+
+        `reusable_source_data_sets` are data sets for semantic models that are the same in the given manifest, so they
+        are used instead of converting those semantic models again.
+        """
+        semantic_model_name_to_reusable_data_set = {
+            data_set.semantic_model_reference.semantic_model_name: data_set for data_set in reusable_source_data_sets
+        }
+        source_data_sets: List[SemanticModelDataSet] = []
         converter = SemanticModelToDataSetConverter(column_association_resolver=self._column_association_resolver)
         for semantic_model in sorted(
-            self._semantic_manifest_lookup.semantic_manifest.semantic_models, key=lambda model: model.name
+            semantic_manifest_lookup.semantic_manifest.semantic_models, key=lambda model: model.name
         ):
-            data_set = converter.create_sql_source_data_set(semantic_model)
-            self._source_data_sets.append(data_set)
-            logger.debug(LazyFormat(lambda: f"Created source dataset from semantic model '{semantic_model.name}'"))
+            data_set = semantic_model_name_to_reusable_data_set.get(semantic_model.name)
+            if data_set is None:
+                data_set = converter.create_sql_source_data_set(semantic_model)
+                logger.debug(LazyFormat(lambda: f"Created source dataset from semantic model '{semantic_model.name}'"))
+            source_data_sets.append(data_set)
 
         source_node_builder = SourceNodeBuilder(
             column_association_resolver=self._column_association_resolver,
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
+            semantic_manifest_lookup=semantic_manifest_lookup,
+        )
+        source_node_set = source_node_builder.create_from_data_sets(
+            source_data_sets, materialized_aggregates=self._materialized_aggregates
         )
-        source_node_set = source_node_builder.create_from_data_sets(self._source_data_sets)
 
         node_output_resolver = DataflowNodeToSqlSubqueryVisitor(
             column_association_resolver=self._column_association_resolver,
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
+            semantic_manifest_lookup=semantic_manifest_lookup,
         )
         node_output_resolver.cache_output_data_sets(source_node_set.all_nodes)
 
-        self._dataflow_plan_builder_cache = DataflowPlanBuilderCache()
-        self._dataflow_plan_builder = DataflowPlanBuilder(
-            source_node_set=source_node_set,
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
-            column_association_resolver=self._column_association_resolver,
-            node_output_resolver=node_output_resolver,
-            source_node_builder=source_node_builder,
-            dataflow_plan_builder_cache=self._dataflow_plan_builder_cache,
-        )
-        self._to_sql_plan_converter = DataflowToSqlPlanConverter(
-            column_association_resolver=self._column_association_resolver,
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
-        )
-        self._executor = SequentialPlanExecutor()
-        self._query_parser = query_parser or MetricFlowQueryParser(
-            semantic_manifest_lookup=self._semantic_manifest_lookup,
+        dataflow_plan_builder_cache = DataflowPlanBuilderCache()
+        return _ManifestState(
+            semantic_manifest_lookup=semantic_manifest_lookup,
+            source_data_sets=tuple(source_data_sets),
+            dataflow_plan_builder_cache=dataflow_plan_builder_cache,
+            dataflow_plan_builder=DataflowPlanBuilder(
+                source_node_set=source_node_set,
+                semantic_manifest_lookup=semantic_manifest_lookup,
+                column_association_resolver=self._column_association_resolver,
+                node_output_resolver=node_output_resolver,
+                source_node_builder=source_node_builder,
+                dataflow_plan_builder_cache=dataflow_plan_builder_cache,
+            ),
+            to_sql_plan_converter=DataflowToSqlPlanConverter(
+                column_association_resolver=self._column_association_resolver,
+                semantic_manifest_lookup=semantic_manifest_lookup,
+            ),
+            query_parser=query_parser or MetricFlowQueryParser(semantic_manifest_lookup=semantic_manifest_lookup),
         )
 
+    def update_semantic_manifest(
+        self, semantic_manifest: SemanticManifest, query_parser: Optional[MetricFlowQueryParser] = None
+    ) -> SemanticManifestDiff:
+        """Update the engine to use a new version of the semantic manifest, and return the changes.
+
+        The parts of the `LinkableSpecIndex` that are not affected by the changes are reused (see
+        `LinkableSpecIndexBuilder.build_index_using_previous_index`), which is most of the time needed to create an
+        engine when only a few semantic models or metrics change. The data sets for the semantic models that did not
+        change are reused as well. The other objects derived from the manifest (e.g. the source nodes and the cached
+        plans) are replaced, so cached plans are not reused even if the semantic models that they read from did not
+        change. Compiled queries are cached by the manifest fingerprint, so cached queries for the previous manifest are
+        not used either.
+
+        The objects are replaced at once when the update is ready, so this can be called while the engine is serving
+        requests. Queries that started before the replacement use the previous manifest.
+
+        Args:
+            semantic_manifest: The new version of the manifest.
+            query_parser: The query parser to use with the new manifest. If not specified, a parser with the same options
+            as the current one is created for the new manifest.
+        """
+        with self._manifest_update_lock:
+            previous_manifest_state = self._manifest_state
+            previous_semantic_manifest_lookup = previous_manifest_state.semantic_manifest_lookup
+            manifest_diff = SemanticManifestDiff.create(
+                previous_semantic_manifest=previous_semantic_manifest_lookup.semantic_manifest,
+                updated_semantic_manifest=semantic_manifest,
+            )
+            if not manifest_diff.has_changes and query_parser is None:
+                logger.info(LazyFormat("The semantic manifest did not change"))
+                return manifest_diff
+
+            with log_block_runtime("update_semantic_manifest"):
+                # IDs are generated in a separate number space to avoid changing the numbering for the queries that
+                # are running in this thread / task.
+                with SequentialIdGenerator.id_number_space(
+                    MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_INITIALIZER
+                ):
+                    semantic_manifest_lookup = SemanticManifestLookup(
+                        semantic_manifest,
+                        previous_semantic_manifest_lookup=previous_semantic_manifest_lookup,
+                    )
+                    manifest_state = self._create_manifest_state(
+                        semantic_manifest_lookup=semantic_manifest_lookup,
+                        query_parser=query_parser
+                        or previous_manifest_state.query_parser.with_semantic_manifest_lookup(semantic_manifest_lookup),
+                        reusable_source_data_sets=tuple(
+                            data_set
+                            for data_set in previous_manifest_state.source_data_sets
+                            if data_set.semantic_model_reference.semantic_model_name
+                            not in manifest_diff.changed_semantic_model_names
+                        ),
+                    )
+            self._manifest_state = manifest_state
+            logger.info(LazyFormat("Updated the semantic manifest", manifest_diff=manifest_diff))
+            return manifest_diff
+
+    @property
+    def semantic_manifest_lookup(self) -> SemanticManifestLookup:
+        """The lookup for the current version of the semantic manifest."""
+        return self._manifest_state.semantic_manifest_lookup
+
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def query(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:  # noqa: D102
         logger.info(LazyFormat("Starting query request", mf_request=mf_request))
         explain_result = self._create_execution_plan(mf_request)
         execution_plan = explain_result.convert_to_execution_plan_result.execution_plan
 
-        if len(execution_plan.tasks) != 1:
-            raise NotImplementedError("Multiple tasks not yet supported.")
+        # Tasks that the final task depends on (e.g. creating intermediate tables) can run before it, but only a
+        # single output task is supported.
+        if len(execution_plan.sink_nodes) != 1:
+            raise NotImplementedError("Multiple output tasks not yet supported.")
 
-        task = execution_plan.tasks[0]
+        time_partition = self._get_time_partition(mf_request, explain_result)
+        if time_partition is not None:
+            return self._query_with_time_partitioned_refresh(mf_request, explain_result, *time_partition)
 
-        logger.debug(LazyFormat(lambda: f"Sequentially running tasks in:\n" f"{execution_plan.structure_text()}"))
+        logger.debug(LazyFormat(lambda: f"Running tasks in:\n" f"{execution_plan.structure_text()}"))
         execution_results = self._executor.execute_plan(execution_plan)
         logger.debug(LazyFormat(lambda: "Finished running tasks in execution plan"))
+        return self._create_query_result(mf_request, explain_result, execution_results)
+
+    def _get_time_partition(
+        self, mf_request: MetricFlowQueryRequest, explain_result: MetricFlowExplainResult
+    ) -> Optional[Tuple[str, TimeGranularity]]:
+        """Return the `metric_time` column and granularity if the result of the query can be refreshed by time bucket.
+
+        The latest buckets are refreshed by running the query with a later `time_constraint_start`, so this is only
+        possible for queries where the rows for the earlier buckets aren't affected by that change.
+        """
+        if self._query_result_cache is None or not self._query_result_cache.time_partitioned_refresh:
+            return None
+        if (
+            mf_request.query_type is not MetricFlowQueryType.METRIC
+            or mf_request.time_constraint_end is not None
+            or explain_result.query_spec.limit is not None
+            or len(explain_result.query_spec.order_by_specs) > 0
+            or explain_result.query_spec.min_max_only
+            or len(explain_result.execution_plan.tasks) != 1
+            or not isinstance(explain_result.execution_plan.tasks[0], SelectSqlQueryToDataTableTask)
+        ):
+            return None
+        metric_time_specs = tuple(
+            spec
+            for spec in explain_result.query_spec.time_dimension_specs
+            if spec.element_name == METRIC_TIME_ELEMENT_NAME
+        )
+        if len(metric_time_specs) != 1:
+            return None
+        metric_time_spec = metric_time_specs[0]
+        time_granularity = metric_time_spec.time_granularity
+        if (
+            len(metric_time_spec.entity_links) > 0
+            or metric_time_spec.date_part is not None
+            or time_granularity is None
+            or time_granularity.is_custom_granularity
+        ):
+            return None
+        return (
+            self._column_association_resolver.resolve_spec(metric_time_spec).column_name,
+            time_granularity.base_granularity,
+        )
+
+    def _query_with_time_partitioned_refresh(
+        self,
+        mf_request: MetricFlowQueryRequest,
+        explain_result: MetricFlowExplainResult,
+        time_column_name: str,
+        time_granularity: TimeGranularity,
+    ) -> MetricFlowQueryResult:
+        """Run the query, but if there's a cached result for it, only run the query for the latest time buckets."""
+        assert self._query_result_cache is not None
+        cached_result = self._query_result_cache.get_time_partitioned(
+            explain_result.sql_statement, time_column_name=time_column_name, time_granularity=time_granularity
+        )
+        if cached_result is None:
+            return self._cache_time_partitioned_result(
+                explain_result,
+                time_column_name,
+                self._create_query_result(
+                    mf_request, explain_result, self._executor.execute_plan(explain_result.execution_plan)
+                ),
+            )
 
+        refresh_explain_result = self._create_execution_plan(
+            self._create_time_partitioned_refresh_request(mf_request, cached_result)
+        )
+        refresh_query_result = self._create_query_result(
+            mf_request,
+            refresh_explain_result,
+            self._executor.execute_plan(refresh_explain_result.execution_plan),
+        )
+        return self._merge_time_partitioned_refresh(explain_result, cached_result, refresh_query_result)
+
+    async def _aquery_with_time_partitioned_refresh(
+        self,
+        mf_request: MetricFlowQueryRequest,
+        explain_result: MetricFlowExplainResult,
+        time_column_name: str,
+        time_granularity: TimeGranularity,
+    ) -> MetricFlowQueryResult:
+        """Similar to `_query_with_time_partitioned_refresh`, but runs the queries using the async SQL client."""
+        assert self._query_result_cache is not None
+        assert self._async_sql_client is not None
+        executor = AsyncioPlanExecutor(async_sql_client=self._async_sql_client)
+        cached_result = self._query_result_cache.get_time_partitioned(
+            explain_result.sql_statement, time_column_name=time_column_name, time_granularity=time_granularity
+        )
+        if cached_result is None:
+            return self._cache_time_partitioned_result(
+                explain_result,
+                time_column_name,
+                self._create_query_result(
+                    mf_request, explain_result, await executor.execute_plan_async(explain_result.execution_plan)
+                ),
+            )
+
+        refresh_explain_result = await asyncio.to_thread(
+            self._create_execution_plan, self._create_time_partitioned_refresh_request(mf_request, cached_result)
+        )
+        refresh_query_result = self._create_query_result(
+            mf_request,
+            refresh_explain_result,
+            await executor.execute_plan_async(refresh_explain_result.execution_plan),
+        )
+        return self._merge_time_partitioned_refresh(explain_result, cached_result, refresh_query_result)
+
+    def _cache_time_partitioned_result(
+        self, explain_result: MetricFlowExplainResult, time_column_name: str, query_result: MetricFlowQueryResult
+    ) -> MetricFlowQueryResult:
+        """Store the result of the full query so that the next request only needs to query the latest buckets."""
+        assert self._query_result_cache is not None
+        if query_result.result_df is not None and time_column_name in query_result.result_df.column_names:
+            self._query_result_cache.set_time_partitioned(
+                explain_result.sql_statement, time_column_name=time_column_name, data_table=query_result.result_df
+            )
+        return query_result
+
+    @staticmethod
+    def _create_time_partitioned_refresh_request(
+        mf_request: MetricFlowQueryRequest, cached_result: TimePartitionedQueryResult
+    ) -> MetricFlowQueryRequest:
+        """Return the request for the buckets of a cached result that should be queried again."""
+        refresh_start = cached_result.watermark
+        if mf_request.time_constraint_start is not None and mf_request.time_constraint_start > refresh_start:
+            refresh_start = mf_request.time_constraint_start
+        logger.info(LazyFormat("Refreshing the latest time buckets of a cached result", refresh_start=refresh_start))
+        return dataclasses.replace(mf_request, time_constraint_start=refresh_start)
+
+    def _merge_time_partitioned_refresh(
+        self,
+        explain_result: MetricFlowExplainResult,
+        cached_result: TimePartitionedQueryResult,
+        refresh_query_result: MetricFlowQueryResult,
+    ) -> MetricFlowQueryResult:
+        """Replace the refreshed buckets in the cached result, and store the merged result."""
+        assert self._query_result_cache is not None
+        assert refresh_query_result.result_df is not None, "A metric query should have returned a data table"
+        merged_data_table = cached_result.merge(refresh_query_result.result_df)
+        # Keep the time of the full query so that earlier buckets are queried again once the entry expires.
+        self._query_result_cache.set_time_partitioned(
+            explain_result.sql_statement,
+            time_column_name=cached_result.time_column_name,
+            data_table=merged_data_table,
+            created_at=cached_result.created_at,
+        )
+        self._query_result_cache.record_time_partitioned_refresh()
+        return MetricFlowQueryResult(
+            query_spec=explain_result.query_spec,
+            dataflow_plan=explain_result.dataflow_plan,
+            sql=refresh_query_result.sql,
+            result_df=merged_data_table,
+        )
+
+    async def aquery(self, mf_request: MetricFlowQueryRequest) -> MetricFlowQueryResult:
+        """Similar to `query`, but for use in an `asyncio` event loop.
+
+        Planning runs in the event loop's default executor. If the engine was created with an `AsyncSqlClient`, the
+        queries are run using that client without blocking a thread, and cancelling the awaiting task cancels the
+        queries in the warehouse. Otherwise, the whole request runs in the default executor.
+        """
+        if self._async_sql_client is None:
+            return await asyncio.to_thread(self.query, mf_request)
+
+        logger.info(LazyFormat("Starting async query request", mf_request=mf_request))
+        explain_result = await self.aexplain(mf_request)
+        execution_plan = explain_result.convert_to_execution_plan_result.execution_plan
+        if len(execution_plan.sink_nodes) != 1:
+            raise NotImplementedError("Multiple output tasks not yet supported.")
+
+        time_partition = self._get_time_partition(mf_request, explain_result)
+        if time_partition is not None:
+            return await self._aquery_with_time_partitioned_refresh(mf_request, explain_result, *time_partition)
+
+        logger.debug(LazyFormat(lambda: f"Running tasks in:\n" f"{execution_plan.structure_text()}"))
+        execution_results = await AsyncioPlanExecutor(async_sql_client=self._async_sql_client).execute_plan_async(
+            execution_plan
+        )
+        logger.debug(LazyFormat(lambda: "Finished running tasks in execution plan"))
+        return self._create_query_result(mf_request, explain_result, execution_results)
+
+    async def aexplain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
+        """Similar to `explain`, but runs in the event loop's default executor so that planning doesn't block the loop."""
+        return await asyncio.to_thread(self.explain, mf_request)
+
+    def _create_query_result(
+        self,
+        mf_request: MetricFlowQueryRequest,
+        explain_result: MetricFlowExplainResult,
+        execution_results: ExecutionResults,
+    ) -> MetricFlowQueryResult:
+        task = explain_result.convert_to_execution_plan_result.execution_plan.sink_nodes[0]
         if execution_results.contains_task_errors:
-            raise ExecutionException(f"Got errors while executing tasks:\n{execution_results.get_result(task.task_id)}")
+            raise ExecutionException(
+                LazyFormat(
+                    "Got errors while executing tasks",
+                    failed_task_results={
+                        task_id: result
+                        for task_id, result in execution_results.all_results().items()
+                        if len(result.errors) > 0
+                    },
+                )
+            )
 
         task_execution_result = execution_results.get_result(task.task_id)
 
@@ -496,26 +911,144 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             result_table=explain_result.output_table,
         )
 
+    @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
+    def query_stream(  # noqa: D102
+        self, mf_request: MetricFlowQueryRequest, batch_size: int = DEFAULT_QUERY_BATCH_SIZE
+    ) -> MetricFlowQueryStreamResult:
+        logger.info(LazyFormat("Starting streaming query request", mf_request=mf_request, batch_size=batch_size))
+        explain_result = self._create_execution_plan(mf_request)
+        execution_plan = explain_result.convert_to_execution_plan_result.execution_plan
+
+        if len(execution_plan.tasks) != 1:
+            raise NotImplementedError("Multiple tasks not yet supported.")
+
+        task = execution_plan.tasks[0]
+        if not isinstance(task, SelectSqlQueryToDataTableTask):
+            raise NotImplementedError(
+                LazyFormat("Streaming results is only supported for tasks that return a data table.", task=task)
+            )
+        assert task.sql_statement is not None, f"{task.sql_statement=} should have been set during creation."
+
+        return MetricFlowQueryStreamResult(
+            query_spec=explain_result.query_spec,
+            dataflow_plan=explain_result.dataflow_plan,
+            sql=task.sql_statement.sql,
+            result_batches=task.execute_in_batches(batch_size),
+        )
+
     @property
     def all_time_constraint(self) -> TimeRangeConstraint:
         """TimeRangeConstraint representing the min & max dates supported."""
         return TimeRangeConstraint.all_time()
 
+    @property
+    def compiled_query_cache(self) -> Optional[CompiledQueryCache]:  # noqa: D102
+        return self._compiled_query_cache
+
+    @property
+    def query_result_cache(self) -> Optional[QueryResultCache]:  # noqa: D102
+        return self._query_result_cache
+
+    def get_process_cache_report(self, include_size_estimates: bool = False) -> CacheReport:
+        """Return the hit / miss / eviction counts and sizes of the caches in this process (e.g. to tune cache sizes).
+
+        Many caches are shared by all engines (e.g. function caches in the semantic layer), so the caches are tracked in
+        a process-wide registry. The report is not limited to this engine: it includes the caches of all engines in the
+        same process, with caches of the same name combined. The per-tier hit counts of this engine's compiled-query
+        cache are available via `compiled_query_cache.stats`.
+
+        Args:
+            include_size_estimates: If set, estimate the memory used by caches that don't track it. This can be slow as
+                it requires traversing the cached objects.
+        """
+        return GLOBAL_CACHE_REGISTRY.create_report(include_size_estimates=include_size_estimates)
+
+    def _create_to_execution_plan_converter(
+        self, manifest_state: _ManifestState, sql_optimization_level: SqlOptimizationLevel
+    ) -> DataflowToExecutionPlanConverter:
+        return DataflowToExecutionPlanConverter(
+            sql_plan_converter=manifest_state.to_sql_plan_converter,
+            sql_plan_renderer=self._sql_client.sql_plan_renderer,
+            sql_client=self._sql_client,
+            sql_optimization_level=sql_optimization_level,
+            result_cache=self._query_result_cache,
+        )
+
     def _create_execution_plan(self, mf_query_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:
-        if self._reset_id_enumeration:
-            logger.debug(
-                LazyFormat(
-                    lambda: f"Setting ID generation to start at: {MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_QUERIES}"
-                )
+        # Read once so that the same version of the manifest is used for the whole request.
+        manifest_state = self._manifest_state
+        if self._compiled_query_cache is None:
+            return self._compile_and_create_execution_plan(manifest_state, mf_query_request)
+
+        try:
+            request_text = mf_query_request.canonical_text
+        except TypeError:
+            # e.g. a custom implementation of a query-parameter protocol that isn't a dataclass.
+            logger.warning(
+                LazyFormat("Unable to create a cache key for the request, so the compiled-query cache won't be used"),
+                exc_info=True,
             )
-            SequentialIdGenerator.reset(MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_QUERIES)
+            return self._compile_and_create_execution_plan(manifest_state, mf_query_request)
 
+        cache_key = CompiledQueryCacheKey(
+            request_text=request_text,
+            manifest_fingerprint=manifest_state.semantic_manifest_lookup.semantic_manifest_fingerprint,
+            sql_engine=self._sql_client.sql_engine_type,
+            sql_optimization_level=mf_query_request.sql_optimization_level,
+            materialized_aggregates_fingerprint=self._materialized_aggregates_fingerprint,
+        )
+        compiled_query = self._compiled_query_cache.get(cache_key)
+        if compiled_query is not None:
+            logger.info(LazyFormat("Using cached compiled query"))
+            return MetricFlowExplainResult(
+                query_spec=compiled_query.query_spec,
+                dataflow_plan=compiled_query.dataflow_plan,
+                convert_to_execution_plan_result=self._create_to_execution_plan_converter(
+                    manifest_state, mf_query_request.sql_optimization_level
+                ).create_execution_plan_from_rendered_sql(
+                    dataflow_plan=compiled_query.dataflow_plan,
+                    convert_to_sql_plan_result=compiled_query.convert_to_sql_plan_result,
+                    render_sql_result=compiled_query.render_sql_result,
+                ),
+            )
+
+        explain_result = self._compile_and_create_execution_plan(manifest_state, mf_query_request)
+        self._compiled_query_cache.set(
+            cache_key,
+            CompiledQuery(
+                query_spec=explain_result.query_spec,
+                dataflow_plan=explain_result.dataflow_plan,
+                convert_to_sql_plan_result=explain_result.convert_to_execution_plan_result.convert_to_sql_plan_result,
+                render_sql_result=explain_result.convert_to_execution_plan_result.render_sql_result,
+            ),
+        )
+        return explain_result
+
+    def _compile_and_create_execution_plan(
+        self, manifest_state: _ManifestState, mf_query_request: MetricFlowQueryRequest
+    ) -> MetricFlowExplainResult:
+        if not self._reset_id_enumeration:
+            return self._compile_query(manifest_state, mf_query_request)
+
+        logger.debug(
+            LazyFormat(
+                lambda: f"Setting ID generation to start at: {MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_QUERIES}"
+            )
+        )
+        # The ID generation state is stored in a context variable, so using a separate number space for the query
+        # keeps the numbering independent of other queries that are running concurrently in other threads / tasks.
+        with SequentialIdGenerator.id_number_space(MetricFlowEngine._ID_ENUMERATION_START_VALUE_FOR_QUERIES):
+            return self._compile_query(manifest_state, mf_query_request)
+
+    def _compile_query(
+        self, manifest_state: _ManifestState, mf_query_request: MetricFlowQueryRequest
+    ) -> MetricFlowExplainResult:
         if mf_query_request.saved_query_name is not None:
             if mf_query_request.metrics or mf_query_request.metric_names:
                 raise InvalidQueryException("Metrics can't be specified with a saved query.")
             if mf_query_request.group_by or mf_query_request.group_by_names:
                 raise InvalidQueryException("Group by items can't be specified with a saved query.")
-            query_spec = self._query_parser.parse_and_validate_saved_query(
+            query_spec = manifest_state.query_parser.parse_and_validate_saved_query(
                 saved_query_parameter=SavedQueryParameter(mf_query_request.saved_query_name),
                 where_filters=(
                     [
@@ -533,7 +1066,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                 apply_group_by=mf_query_request.apply_group_by,
             ).query_spec
         else:
-            query_spec = self._query_parser.parse_and_validate_query(
+            query_spec = manifest_state.query_parser.parse_and_validate_query(
                 metric_names=mf_query_request.metric_names,
                 metrics=mf_query_request.metrics,
                 group_by_names=mf_query_request.group_by_names,
@@ -564,7 +1097,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                     "Building dataflow plan", dataflow_plan_optimizations=mf_query_request.dataflow_plan_optimizations
                 )
             )
-            dataflow_plan = self._dataflow_plan_builder.build_plan(
+            dataflow_plan = manifest_state.dataflow_plan_builder.build_plan(
                 query_spec=query_spec,
                 output_selection_specs=output_selection_specs,
                 optimizations=mf_query_request.dataflow_plan_optimizations,
@@ -577,7 +1110,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
                 )
             )
 
-            dataflow_plan = self._dataflow_plan_builder.build_plan_for_distinct_values(
+            dataflow_plan = manifest_state.dataflow_plan_builder.build_plan_for_distinct_values(
                 query_spec=query_spec, optimizations=mf_query_request.dataflow_plan_optimizations
             )
 
@@ -588,27 +1121,71 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             )
 
         logger.info(LazyFormat("Building execution plan"))
-        _to_execution_plan_converter = DataflowToExecutionPlanConverter(
-            sql_plan_converter=self._to_sql_plan_converter,
-            sql_plan_renderer=self._sql_client.sql_plan_renderer,
-            sql_client=self._sql_client,
-            sql_optimization_level=mf_query_request.sql_optimization_level,
+        return MetricFlowExplainResult(
+            query_spec=query_spec,
+            dataflow_plan=dataflow_plan,
+            convert_to_execution_plan_result=self._convert_to_execution_plan(
+                manifest_state=manifest_state,
+                sql_optimization_level=mf_query_request.sql_optimization_level,
+                query_spec=query_spec,
+                dataflow_plan=dataflow_plan,
+                spec_output_order=(
+                    query_spec.spec_output_order
+                    # Need to check on how the min/max case should be handled.
+                    if mf_query_request.order_output_columns_by_input_order and not query_spec.min_max_only
+                    else ()
+                ),
+            ),
         )
 
-        convert_to_execution_plan_result = _to_execution_plan_converter.convert_to_execution_plan(
-            dataflow_plan=dataflow_plan,
-            spec_output_order=(
-                query_spec.spec_output_order
-                # Need to check on how the min/max case should be handled.
-                if mf_query_request.order_output_columns_by_input_order and not query_spec.min_max_only
-                else ()
+    def _convert_to_execution_plan(
+        self,
+        manifest_state: _ManifestState,
+        sql_optimization_level: SqlOptimizationLevel,
+        query_spec: MetricFlowQuerySpec,
+        dataflow_plan: DataflowPlan,
+        spec_output_order: Sequence[InstanceSpec],
+    ) -> ConvertToExecutionPlanResult:
+        to_execution_plan_converter = self._create_to_execution_plan_converter(manifest_state, sql_optimization_level)
+        if self._compiled_query_cache is None:
+            return to_execution_plan_converter.convert_to_execution_plan(
+                dataflow_plan=dataflow_plan, spec_output_order=spec_output_order
+            )
+
+        # Different requests can produce the same dataflow plan (e.g. when the same group-by item is specified using
+        # different syntax), so the SQL is also cached using the structural hash of the plan. Unlike the node IDs, the
+        # hash is the same for plans that were built separately or in another process.
+        cache_key = CompiledQueryCacheKey(
+            request_text=create_canonical_text(
+                (DataflowPlan.__name__, dataflow_plan.sink_node.structural_hash, spec_output_order)
             ),
+            manifest_fingerprint=manifest_state.semantic_manifest_lookup.semantic_manifest_fingerprint,
+            sql_engine=self._sql_client.sql_engine_type,
+            sql_optimization_level=sql_optimization_level,
+            materialized_aggregates_fingerprint=self._materialized_aggregates_fingerprint,
         )
-        return MetricFlowExplainResult(
-            query_spec=query_spec,
-            dataflow_plan=dataflow_plan,
-            convert_to_execution_plan_result=convert_to_execution_plan_result,
+        compiled_query = self._compiled_query_cache.get(cache_key)
+        if compiled_query is not None:
+            logger.info(LazyFormat("Using cached SQL for a structurally identical dataflow plan"))
+            return to_execution_plan_converter.create_execution_plan_from_rendered_sql(
+                dataflow_plan=dataflow_plan,
+                convert_to_sql_plan_result=compiled_query.convert_to_sql_plan_result,
+                render_sql_result=compiled_query.render_sql_result,
+            )
+
+        convert_to_execution_plan_result = to_execution_plan_converter.convert_to_execution_plan(
+            dataflow_plan=dataflow_plan, spec_output_order=spec_output_order
+        )
+        self._compiled_query_cache.set(
+            cache_key,
+            CompiledQuery(
+                query_spec=query_spec,
+                dataflow_plan=dataflow_plan,
+                convert_to_sql_plan_result=convert_to_execution_plan_result.convert_to_sql_plan_result,
+                render_sql_result=convert_to_execution_plan_result.render_sql_result,
+            ),
         )
+        return convert_to_execution_plan_result
 
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def explain(self, mf_request: MetricFlowQueryRequest) -> MetricFlowExplainResult:  # noqa: D102
@@ -616,10 +1193,10 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             return self._create_execution_plan(mf_request)
 
     def get_measures_for_metrics(self, metric_names: List[str]) -> List[Measure]:  # noqa: D102
-        metrics = self._semantic_manifest_lookup.metric_lookup.get_metrics(
+        metrics = self.semantic_manifest_lookup.metric_lookup.get_metrics(
             metric_references=[MetricReference(element_name=metric_name) for metric_name in metric_names]
         )
-        semantic_model_lookup = self._semantic_manifest_lookup.semantic_model_lookup
+        semantic_model_lookup = self.semantic_manifest_lookup.semantic_model_lookup
 
         measures = set()
         for metric in metrics:
@@ -672,7 +1249,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         unknown_metric_names = tuple(
             metric_name
             for metric_name in metric_names
-            if MetricReference(metric_name) not in self._semantic_manifest_lookup.metric_lookup.metric_references
+            if MetricReference(metric_name) not in self.semantic_manifest_lookup.metric_lookup.metric_references
         )
 
         if len(unknown_metric_names) > 0:
@@ -685,7 +1262,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
     ) -> List[Dimension]:
         self._check_metric_names(metric_names)
 
-        linkable_element_set = self._semantic_manifest_lookup.metric_lookup.linkable_elements_for_metrics(
+        linkable_element_set = self.semantic_manifest_lookup.metric_lookup.linkable_elements_for_metrics(
             metric_references=tuple(MetricReference(element_name=mname) for mname in metric_names),
             element_set_filter=LinkableElementFilter(
                 without_any_of=frozenset(without_any_property),
@@ -722,7 +1299,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             assert (
                 origin_semantic_model_reference != SemanticModelDerivation.VIRTUAL_SEMANTIC_MODEL_REFERENCE
             ), "Only metric_time can a virtual model ID."
-            semantic_model = self._semantic_manifest_lookup.semantic_model_lookup.get_by_reference(
+            semantic_model = self.semantic_manifest_lookup.semantic_model_lookup.get_by_reference(
                 origin_semantic_model_reference
             )
             if semantic_model is None:
@@ -757,7 +1334,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         if metric_names:
             dimensions = self.simple_dimensions_for_metrics(metric_names=metric_names)
         else:
-            semantic_model_lookup = self._semantic_manifest_lookup.semantic_model_lookup
+            semantic_model_lookup = self.semantic_manifest_lookup.semantic_model_lookup
             for dimension_reference in semantic_model_lookup.get_dimension_references():
                 for semantic_model in semantic_model_lookup.get_semantic_models_for_dimension(dimension_reference):
                     dimension = Dimension.from_pydantic(
@@ -787,7 +1364,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         return sorted(set(dimensions), key=sort_dimensions)
 
     def entities_for_metrics(self, metric_names: List[str]) -> List[Entity]:  # noqa: D102
-        linkable_element_set = self._semantic_manifest_lookup.metric_lookup.linkable_elements_for_metrics(
+        linkable_element_set = self.semantic_manifest_lookup.metric_lookup.linkable_elements_for_metrics(
             metric_references=tuple(MetricReference(element_name=mname) for mname in metric_names),
             element_set_filter=LinkableElementFilter(
                 with_any_of=frozenset(ENTITY_WITH_ANY_PROPERTIES),
@@ -803,11 +1380,11 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
         for annotated_spec in linkable_element_set.annotated_specs:
             element_type = annotated_spec.element_type
             if element_type is LinkableElementType.ENTITY:
-                semantic_model = self._semantic_manifest_lookup.semantic_model_lookup.get_by_reference(
+                semantic_model = self.semantic_manifest_lookup.semantic_model_lookup.get_by_reference(
                     mf_first_item(annotated_spec.origin_model_ids).semantic_model_reference
                 )
                 assert semantic_model
-                pydantic_entity = self._semantic_manifest_lookup.semantic_model_lookup.get_entity_in_semantic_model(
+                pydantic_entity = self.semantic_manifest_lookup.semantic_model_lookup.get_entity_in_semantic_model(
                     SemanticModelElementReference(
                         semantic_model_name=mf_first_item(
                             annotated_spec.origin_semantic_model_references
@@ -836,13 +1413,13 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def list_metrics(self, include_dimensions: bool = True) -> List[Metric]:
         """List all metrics in semantic manifest matching params. Sorted automatically."""
-        metric_lookup = self._semantic_manifest_lookup.metric_lookup
+        metric_lookup = self.semantic_manifest_lookup.metric_lookup
         metrics: List[Metric] = []
         for pydantic_metric in metric_lookup.get_metrics(metric_lookup.metric_references):
             semantic_models = []
             for measure in pydantic_metric.input_measures:
                 semantic_model_reference = (
-                    self._semantic_manifest_lookup.semantic_model_lookup.measure_lookup.get_properties(
+                    self.semantic_manifest_lookup.semantic_model_lookup.measure_lookup.get_properties(
                         measure_reference=measure.measure_reference
                     ).model_reference
                 )
@@ -859,7 +1436,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
     @log_call(module_name=__name__, telemetry_reporter=_telemetry_reporter)
     def list_saved_queries(self) -> List[SavedQuery]:  # noqa: D102
         saved_queries: List[SavedQuery] = []
-        for pydantic_saved_query in self._semantic_manifest_lookup.semantic_manifest.saved_queries:
+        for pydantic_saved_query in self.semantic_manifest_lookup.semantic_manifest.saved_queries:
             saved_query = SavedQuery.from_pydantic(pydantic_saved_query)
             saved_queries.append(saved_query)
         return sorted(saved_queries, key=lambda x: x.default_search_and_sort_attribute)
@@ -926,7 +1503,7 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             without_any_of = SIMPLE_DIMENSIONS_WITHOUT_ANY_PROPERTIES - ENTITY_WITH_ANY_PROPERTIES
             if include_derived_time_granularities:
                 without_any_of = without_any_of - {LinkableElementProperty.DERIVED_TIME_GRANULARITY}
-            linkable_element_set = self._semantic_manifest_lookup.metric_lookup.linkable_elements_for_metrics(
+            linkable_element_set = self.semantic_manifest_lookup.metric_lookup.linkable_elements_for_metrics(
                 metric_references=tuple(MetricReference(element_name=mname) for mname in metric_names),
                 element_set_filter=LinkableElementFilter(
                     without_any_of=frozenset(without_any_of),
@@ -964,10 +1541,10 @@ class MetricFlowEngine(AbstractMetricFlowEngine):
             qualified_name == METRIC_TIME_ELEMENT_NAME
             or (
                 qualified_name
-                in self._semantic_manifest_lookup.semantic_model_lookup.dimension_lookup.dimensions_by_qualified_name
+                in self.semantic_manifest_lookup.semantic_model_lookup.dimension_lookup.dimensions_by_qualified_name
             )
             or (
                 EntityReference(structured_name.element_name)
-                in self._semantic_manifest_lookup.semantic_model_lookup.entity_index
+                in self.semantic_manifest_lookup.semantic_model_lookup.entity_index
             )
         )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Sequence
+from typing import Optional, Sequence
 
 from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.specs.instance_spec import InstanceSpec
@@ -42,6 +42,7 @@ from metricflow.execution.execution_plan import (
     SelectSqlQueryToTableTask,
     SqlStatement,
 )
+from metricflow.execution.query_result_cache import QueryResultCache
 from metricflow.plan_conversion.convert_to_sql_plan import ConvertToSqlPlanResult
 from metricflow.plan_conversion.to_sql_plan.dataflow_to_sql import DataflowToSqlPlanConverter
 from metricflow.protocols.sql_client import SqlClient
@@ -60,6 +61,7 @@ class DataflowToExecutionPlanConverter(DataflowPlanNodeVisitor[ConvertToExecutio
         sql_plan_renderer: SqlPlanRenderer,
         sql_client: SqlClient,
         sql_optimization_level: SqlOptimizationLevel,
+        result_cache: Optional[QueryResultCache] = None,
     ) -> None:
         """Initializer.
 
@@ -68,11 +70,13 @@ class DataflowToExecutionPlanConverter(DataflowPlanNodeVisitor[ConvertToExecutio
             sql_plan_renderer: Converts a SQL query plan to SQL text
             sql_client: The client to use for running queries.
             sql_optimization_level: The optimization level to use for generating the SQL.
+            result_cache: If specified, the results of queries that output a data table are cached.
         """
         self._sql_plan_converter = sql_plan_converter
         self._sql_plan_renderer = sql_plan_renderer
         self._sql_client = sql_client
         self._optimization_level = sql_optimization_level
+        self._result_cache = result_cache
         self._spec_output_order: Sequence[InstanceSpec] = ()
 
     def _convert_to_sql_plan(self, node: DataflowPlanNode) -> ConvertToSqlPlanResult:
@@ -89,15 +93,15 @@ class DataflowToExecutionPlanConverter(DataflowPlanNodeVisitor[ConvertToExecutio
     def _render_sql(self, convert_to_sql_plan_result: ConvertToSqlPlanResult) -> SqlPlanRenderResult:
         return self._sql_plan_renderer.render_sql_plan(convert_to_sql_plan_result.sql_plan)
 
-    @override
-    def visit_write_to_result_data_table_node(self, node: WriteToResultDataTableNode) -> ConvertToExecutionPlanResult:
-        convert_to_sql_plan_result = self._convert_to_sql_plan(node)
-        render_sql_result = self._render_sql(convert_to_sql_plan_result)
+    def _create_result_for_data_table_output(
+        self, convert_to_sql_plan_result: ConvertToSqlPlanResult, render_sql_result: SqlPlanRenderResult
+    ) -> ConvertToExecutionPlanResult:
         execution_plan = ExecutionPlan(
             leaf_tasks=(
                 SelectSqlQueryToDataTableTask.create(
                     sql_client=self._sql_client,
                     sql_statement=SqlStatement(render_sql_result.sql, render_sql_result.bind_parameter_set),
+                    result_cache=self._result_cache,
                 ),
             )
         )
@@ -107,10 +111,12 @@ class DataflowToExecutionPlanConverter(DataflowPlanNodeVisitor[ConvertToExecutio
             execution_plan=execution_plan,
         )
 
-    @override
-    def visit_write_to_result_table_node(self, node: WriteToResultTableNode) -> ConvertToExecutionPlanResult:
-        convert_to_sql_plan_result = self._convert_to_sql_plan(node)
-        render_sql_result = self._render_sql(convert_to_sql_plan_result)
+    def _create_result_for_table_output(
+        self,
+        convert_to_sql_plan_result: ConvertToSqlPlanResult,
+        render_sql_result: SqlPlanRenderResult,
+        node: WriteToResultTableNode,
+    ) -> ConvertToExecutionPlanResult:
         execution_plan = ExecutionPlan(
             leaf_tasks=(
                 SelectSqlQueryToTableTask.create(
@@ -129,6 +135,37 @@ class DataflowToExecutionPlanConverter(DataflowPlanNodeVisitor[ConvertToExecutio
             execution_plan=execution_plan,
         )
 
+    @override
+    def visit_write_to_result_data_table_node(self, node: WriteToResultDataTableNode) -> ConvertToExecutionPlanResult:
+        convert_to_sql_plan_result = self._convert_to_sql_plan(node)
+        render_sql_result = self._render_sql(convert_to_sql_plan_result)
+        return self._create_result_for_data_table_output(convert_to_sql_plan_result, render_sql_result)
+
+    @override
+    def visit_write_to_result_table_node(self, node: WriteToResultTableNode) -> ConvertToExecutionPlanResult:
+        convert_to_sql_plan_result = self._convert_to_sql_plan(node)
+        render_sql_result = self._render_sql(convert_to_sql_plan_result)
+        return self._create_result_for_table_output(convert_to_sql_plan_result, render_sql_result, node)
+
+    def create_execution_plan_from_rendered_sql(
+        self,
+        dataflow_plan: DataflowPlan,
+        convert_to_sql_plan_result: ConvertToSqlPlanResult,
+        render_sql_result: SqlPlanRenderResult,
+    ) -> ConvertToExecutionPlanResult:
+        """Create the execution plan for a dataflow plan that was previously converted to SQL.
+
+        This skips the SQL plan conversion and rendering, so it's used when the results of those steps were cached.
+        """
+        sink_node = dataflow_plan.sink_node
+        if isinstance(sink_node, WriteToResultDataTableNode):
+            return self._create_result_for_data_table_output(convert_to_sql_plan_result, render_sql_result)
+        elif isinstance(sink_node, WriteToResultTableNode):
+            return self._create_result_for_table_output(convert_to_sql_plan_result, render_sql_result, sink_node)
+        raise NotImplementedError(
+            LazyFormat("Creating an execution plan for this sink node is not supported", sink_node=sink_node)
+        )
+
     def convert_to_execution_plan(
         self,
         dataflow_plan: DataflowPlan,
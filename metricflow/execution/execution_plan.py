@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from typing import Iterator, List, Optional, Sequence, Tuple
 
 from metricflow_semantics.dag.id_prefix import IdPrefix, StaticIdPrefix
 from metricflow_semantics.dag.mf_dag import DagId, DagNode, DisplayedProperty, MetricFlowDag, NodeId
@@ -14,7 +15,9 @@ from metricflow_semantics.sql.sql_table import SqlTable
 from metricflow_semantics.visitor import Visitable
 
 from metricflow.data_table.mf_table import MetricFlowDataTable
-from metricflow.protocols.sql_client import SqlClient
+from metricflow.execution.query_result_cache import QueryResultCache
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.sql_client import DEFAULT_QUERY_BATCH_SIZE, SqlClient
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +40,13 @@ class ExecutionPlanTask(DagNode["ExecutionPlanTask"], Visitable, ABC):
         """Execute the actions of this node."""
         raise NotImplementedError
 
+    async def execute_async(self, async_sql_client: AsyncSqlClient) -> TaskExecutionResult:
+        """Similar to `execute`, but runs SQL using the given client without blocking the event loop.
+
+        Tasks that don't run SQL are run in the event loop's default executor.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.execute)
+
     @property
     def task_id(self) -> NodeId:
         """Alias for node ID since the nodes represent a task."""
@@ -95,21 +105,26 @@ class SelectSqlQueryToDataTableTask(ExecutionPlanTask):
         sql_client: The SQL client used to run the query.
         sql_statement: The SQL query to run.
         parent_nodes: The parent tasks for this execution plan task.
+        result_cache: If specified, results are read from and written to this cache instead of always running the
+        query.
     """
 
     sql_client: SqlClient
     parent_nodes: Tuple[ExecutionPlanTask, ...]
+    result_cache: Optional[QueryResultCache] = None
 
     @staticmethod
     def create(  # noqa: D102
         sql_client: SqlClient,
         sql_statement: SqlStatement,
         parent_nodes: Sequence[ExecutionPlanTask] = (),
+        result_cache: Optional[QueryResultCache] = None,
     ) -> SelectSqlQueryToDataTableTask:
         return SelectSqlQueryToDataTableTask(
             sql_client=sql_client,
             sql_statement=sql_statement,
             parent_nodes=tuple(parent_nodes),
+            result_cache=result_cache,
         )
 
     @classmethod
@@ -130,11 +145,38 @@ class SelectSqlQueryToDataTableTask(ExecutionPlanTask):
         sql_statement = self.sql_statement
         assert sql_statement is not None, f"{self.sql_statement=} should have been set during creation."
 
-        df = self.sql_client.query(
-            sql_statement.sql,
-            sql_bind_parameter_set=sql_statement.bind_parameter_set,
+        df = self.result_cache.get(sql_statement) if self.result_cache is not None else None
+        if df is None:
+            df = self.sql_client.query(
+                sql_statement.sql,
+                sql_bind_parameter_set=sql_statement.bind_parameter_set,
+            )
+            if self.result_cache is not None:
+                self.result_cache.set(sql_statement, df)
+
+        end_time = time.perf_counter()
+        return TaskExecutionResult(
+            start_time=start_time,
+            end_time=end_time,
+            sql=sql_statement.sql,
+            bind_params=sql_statement.bind_parameter_set,
+            df=df,
         )
 
+    async def execute_async(self, async_sql_client: AsyncSqlClient) -> TaskExecutionResult:  # noqa: D102
+        start_time = time.perf_counter()
+        sql_statement = self.sql_statement
+        assert sql_statement is not None, f"{self.sql_statement=} should have been set during creation."
+
+        df = self.result_cache.get(sql_statement) if self.result_cache is not None else None
+        if df is None:
+            df = await async_sql_client.query(
+                sql_statement.sql,
+                sql_bind_parameter_set=sql_statement.bind_parameter_set,
+            )
+            if self.result_cache is not None:
+                self.result_cache.set(sql_statement, df)
+
         end_time = time.perf_counter()
         return TaskExecutionResult(
             start_time=start_time,
@@ -144,6 +186,21 @@ class SelectSqlQueryToDataTableTask(ExecutionPlanTask):
             df=df,
         )
 
+    def execute_in_batches(self, batch_size: int = DEFAULT_QUERY_BATCH_SIZE) -> Iterator[MetricFlowDataTable]:
+        """Similar to `execute`, but the results are returned as tables of at most `batch_size` rows.
+
+        This allows the caller to process results that don't fit in memory. The query is run when the iterator is first
+        advanced. The result cache is not used as the results are not held in memory.
+        """
+        sql_statement = self.sql_statement
+        assert sql_statement is not None, f"{self.sql_statement=} should have been set during creation."
+
+        return self.sql_client.query_in_batches(
+            sql_statement.sql,
+            sql_bind_parameter_set=sql_statement.bind_parameter_set,
+            batch_size=batch_size,
+        )
+
     def __repr__(self) -> str:  # noqa: D105
         return f"{self.__class__.__name__}(sql_statement={self.sql_statement!r})"
 
@@ -210,6 +267,21 @@ class SelectSqlQueryToTableTask(ExecutionPlanTask):
         end_time = time.perf_counter()
         return TaskExecutionResult(start_time=start_time, end_time=end_time, sql=sql_statement.sql)
 
+    async def execute_async(self, async_sql_client: AsyncSqlClient) -> TaskExecutionResult:  # noqa: D102
+        sql_statement = self.sql_statement
+        assert sql_statement is not None, f"{self.sql_statement=} should have been set during creation."
+        start_time = time.perf_counter()
+        logger.debug(LazyFormat(lambda: f"Dropping table {self.output_table} in case it already exists"))
+        await async_sql_client.execute(f"DROP TABLE IF EXISTS {self.output_table.sql}")
+        logger.debug(LazyFormat(lambda: f"Creating table {self.output_table} using a query"))
+        await async_sql_client.execute(
+            sql_statement.sql,
+            sql_bind_parameter_set=sql_statement.bind_parameter_set,
+        )
+
+        end_time = time.perf_counter()
+        return TaskExecutionResult(start_time=start_time, end_time=end_time, sql=sql_statement.sql)
+
     def __repr__(self) -> str:  # noqa: D105
         return f"{self.__class__.__name__}(sql_statement={self.sql_statement!r}', output_table={self.output_table})"
 
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
+import time
 from abc import ABC, abstractmethod
 from collections import OrderedDict
-from typing import Dict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Set
 
 from metricflow_semantics.dag.mf_dag import NodeId
 from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 
-from metricflow.execution.execution_plan import ExecutionPlan, ExecutionPlanTask, TaskExecutionResult
+from metricflow.execution.execution_plan import (
+    ExecutionPlan,
+    ExecutionPlanTask,
+    TaskExecutionError,
+    TaskExecutionResult,
+)
+from metricflow.protocols.async_sql_client import AsyncSqlClient
 
 logger = logging.getLogger(__name__)
 
@@ -87,3 +97,212 @@ class SequentialPlanExecutor(ExecutionPlanExecutor):
             self._execute_dfs(leaf_node, results)
 
         return results
+
+
+def _tasks_in_dependency_order(plan: ExecutionPlan) -> Sequence[ExecutionPlanTask]:
+    """Return the unique tasks in the plan, ordered so that a task's parents come before the task."""
+    ordered_tasks: List[ExecutionPlanTask] = []
+    visited_task_ids: Set[NodeId] = set()
+
+    def _visit(task: ExecutionPlanTask) -> None:
+        if task.task_id in visited_task_ids:
+            return
+        visited_task_ids.add(task.task_id)
+        for parent_task in task.parent_nodes:
+            _visit(parent_task)
+        ordered_tasks.append(task)
+
+    for sink_task in plan.sink_nodes:
+        _visit(sink_task)
+    return ordered_tasks
+
+
+def _timed_out_result(task: ExecutionPlanTask, start_time: float, timeout: float) -> TaskExecutionResult:
+    return TaskExecutionResult(
+        start_time=start_time,
+        end_time=time.perf_counter(),
+        errors=(TaskExecutionError(f"Task ID: {task.task_id} did not finish within the timeout of {timeout}s"),),
+        sql=task.sql_statement.sql if task.sql_statement is not None else None,
+    )
+
+
+class ThreadPoolPlanExecutor(ExecutionPlanExecutor):
+    """Execute tasks using a pool of threads, running tasks concurrently when their parent tasks have finished.
+
+    If a task returns errors, raises an exception, or does not finish within `task_timeout` seconds, no further tasks
+    are started and the results so far are returned (or the exception is raised). Python threads can't be interrupted,
+    so a task that is already running when this happens continues in the background, but its result is discarded.
+    """
+
+    def __init__(self, max_workers: int = 4, task_timeout: Optional[float] = None) -> None:
+        """Initializer.
+
+        Args:
+            max_workers: The maximum number of tasks to run at the same time.
+            task_timeout: If specified, the number of seconds a task can run before it's considered to have failed.
+        """
+        if max_workers < 1:
+            raise ValueError(f"`max_workers` should be a positive integer, but got: {max_workers}")
+        self._max_workers = max_workers
+        self._task_timeout = task_timeout
+
+    def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:  # noqa: D102
+        results = ExecutionResults()
+        pending_tasks = list(_tasks_in_dependency_order(plan))
+        finished_task_ids: Set[NodeId] = set()
+        running_futures: Dict[Future[TaskExecutionResult], ExecutionPlanTask] = {}
+        start_times: Dict[NodeId, float] = {}
+
+        thread_pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mf_plan_executor")
+        try:
+            while len(pending_tasks) > 0 or len(running_futures) > 0:
+                # Start tasks where all parents are finished. Since only as many tasks as there are workers are
+                # submitted, a submitted task starts running right away and the timeout can be tracked from here.
+                for task in tuple(pending_tasks):
+                    if len(running_futures) >= self._max_workers:
+                        break
+                    if all(parent_task.task_id in finished_task_ids for parent_task in task.parent_nodes):
+                        pending_tasks.remove(task)
+                        logger.debug(LazyFormat(lambda: f"Started task ID: {task.task_id}"))
+                        start_times[task.task_id] = time.perf_counter()
+                        running_futures[thread_pool.submit(task.execute)] = task
+
+                wait_timeout: Optional[float] = None
+                if self._task_timeout is not None:
+                    earliest_deadline = min(
+                        start_times[task.task_id] + self._task_timeout for task in running_futures.values()
+                    )
+                    wait_timeout = max(0.0, earliest_deadline - time.perf_counter())
+                done_futures, _ = wait(running_futures, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
+                if len(done_futures) == 0:
+                    # A task timed out.
+                    assert self._task_timeout is not None
+                    timed_out_task = min(running_futures.values(), key=lambda task: start_times[task.task_id])
+                    results.add_result(
+                        timed_out_task.task_id,
+                        _timed_out_result(timed_out_task, start_times[timed_out_task.task_id], self._task_timeout),
+                    )
+                    logger.debug(LazyFormat(lambda: f"Task ID: {timed_out_task.task_id} timed out"))
+                    return results
+
+                for done_future in done_futures:
+                    task = running_futures.pop(done_future)
+                    # This raises the exception if the task raised one.
+                    result = done_future.result()
+                    results.add_result(task.task_id, result)
+                    finished_task_ids.add(task.task_id)
+                    logger.debug(
+                        LazyFormat(
+                            lambda: f"Finished task ID: {task.task_id} in {result.end_time - result.start_time:.2f}s"
+                        )
+                    )
+
+                if results.contains_task_errors:
+                    return results
+        finally:
+            # Cancel tasks that haven't started yet and don't wait for the ones that are running.
+            thread_pool.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
+
+class AsyncioPlanExecutor(ExecutionPlanExecutor):
+    """Execute tasks concurrently using `asyncio`, running tasks when their parent tasks have finished.
+
+    If an `AsyncSqlClient` is given, tasks run their SQL using that client. Otherwise, since tasks are synchronous, each
+    task runs in the event loop's default executor. From async code, use `execute_plan_async`. If a task returns
+    errors, raises an exception, or does not finish within `task_timeout` seconds, the remaining tasks are cancelled.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_tasks: int = 4,
+        task_timeout: Optional[float] = None,
+        async_sql_client: Optional[AsyncSqlClient] = None,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            max_concurrent_tasks: The maximum number of tasks to run at the same time.
+            task_timeout: If specified, the number of seconds a task can run before it's considered to have failed.
+            async_sql_client: If specified, the client used to run the SQL for tasks.
+        """
+        if max_concurrent_tasks < 1:
+            raise ValueError(f"`max_concurrent_tasks` should be a positive integer, but got: {max_concurrent_tasks}")
+        self._max_concurrent_tasks = max_concurrent_tasks
+        self._task_timeout = task_timeout
+        self._async_sql_client = async_sql_client
+
+    async def _execute_task(self, task: ExecutionPlanTask) -> TaskExecutionResult:
+        if self._async_sql_client is not None:
+            return await task.execute_async(self._async_sql_client)
+        return await asyncio.get_running_loop().run_in_executor(None, task.execute)
+
+    def execute_plan(self, plan: ExecutionPlan) -> ExecutionResults:
+        """Execute the plan in a new event loop.
+
+        `asyncio.run` can't be called while an event loop is running in the current thread (e.g. in a notebook), so in
+        that case, the new event loop runs in a separate thread and this blocks until the plan finishes. Since an
+        `AsyncSqlClient` may be bound to the running loop, prefer `execute_plan_async` from async code.
+        """
+
+        def _run_in_new_event_loop() -> ExecutionResults:
+            return asyncio.run(self.execute_plan_async(plan))
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return _run_in_new_event_loop()
+
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(max_workers=1) as thread_pool:
+            return thread_pool.submit(context.run, _run_in_new_event_loop).result()
+
+    async def execute_plan_async(self, plan: ExecutionPlan) -> ExecutionResults:
+        """Similar to `execute_plan`, but for use in a running event loop."""
+        results = ExecutionResults()
+        semaphore = asyncio.Semaphore(self._max_concurrent_tasks)
+        task_id_to_asyncio_task: Dict[NodeId, asyncio.Task[None]] = {}
+
+        async def _run_task(task: ExecutionPlanTask) -> None:
+            parent_asyncio_tasks = [task_id_to_asyncio_task[parent_task.task_id] for parent_task in task.parent_nodes]
+            if len(parent_asyncio_tasks) > 0:
+                await asyncio.gather(*parent_asyncio_tasks)
+            async with semaphore:
+                logger.debug(LazyFormat(lambda: f"Started task ID: {task.task_id}"))
+                start_time = time.perf_counter()
+                try:
+                    result = await asyncio.wait_for(self._execute_task(task), timeout=self._task_timeout)
+                except asyncio.TimeoutError:
+                    assert self._task_timeout is not None
+                    result = _timed_out_result(task, start_time, self._task_timeout)
+            results.add_result(task.task_id, result)
+            logger.debug(
+                LazyFormat(lambda: f"Finished task ID: {task.task_id} in {result.end_time - result.start_time:.2f}s")
+            )
+            if len(result.errors) > 0:
+                raise _TaskFailedError(task.task_id)
+
+        for task in _tasks_in_dependency_order(plan):
+            task_id_to_asyncio_task[task.task_id] = asyncio.create_task(_run_task(task))
+
+        asyncio_tasks = tuple(task_id_to_asyncio_task.values())
+        try:
+            await asyncio.gather(*asyncio_tasks)
+        except _TaskFailedError:
+            # The errors are recorded in the results.
+            pass
+        finally:
+            for asyncio_task in asyncio_tasks:
+                asyncio_task.cancel()
+            await asyncio.gather(*asyncio_tasks, return_exceptions=True)
+
+        return results
+
+
+class _TaskFailedError(Exception):
+    """Raised within `AsyncioPlanExecutor` to stop the remaining tasks when a task returns errors."""
+
+    def __init__(self, task_id: NodeId) -> None:  # noqa: D107
+        super().__init__(f"Task ID: {task_id} failed")
@@ -0,0 +1,468 @@
+from __future__ import annotations
+
+import datetime
+import hashlib
+import logging
+import pickle
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from dbt_semantic_interfaces.type_enums import TimeGranularity
+from metricflow_semantics.collection_helpers.cache_registry import (
+    GLOBAL_CACHE_REGISTRY,
+    CacheStats,
+    estimate_deep_size_bytes,
+)
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.time.dateutil_adjuster import DateutilTimePeriodAdjuster
+from metricflow_semantics.time.time_source import TimeSource
+
+from metricflow.data_table.mf_table import MetricFlowDataTable
+from metricflow.engine.compiled_query_cache import create_canonical_text
+
+if TYPE_CHECKING:
+    from metricflow.execution.execution_plan import SqlStatement
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class QueryResultCacheEntry:
+    """A query result that is stored in the cache, along with the time it was created."""
+
+    created_at: datetime.datetime
+    data_table: MetricFlowDataTable
+
+
+class QueryResultCacheStore(ABC):
+    """Stores cached query results by key. Implementations should be safe to use from multiple threads."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[QueryResultCacheEntry]:
+        """Return the entry for the given key, or None if it's not in the store."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, entry: QueryResultCacheEntry) -> None:
+        """Store the entry, replacing any existing entry for the key."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def item_count(self) -> int:
+        """The number of entries in the store."""
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def eviction_count(self) -> int:
+        """The number of entries that were removed by this instance to stay within the limit."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def estimate_size_bytes(self) -> int:
+        """Return the estimated size of the entries. This can be slow for large stores."""
+        raise NotImplementedError
+
+
+class InMemoryQueryResultCacheStore(QueryResultCacheStore):
+    """Stores entries in memory. Once the limit is hit, the least-recently used entry is evicted."""
+
+    def __init__(self, max_items: int = 100) -> None:  # noqa: D107
+        if max_items < 1:
+            raise ValueError(f"`max_items` should be at least 1. Got: {max_items}")
+        self._max_items = max_items
+        self._lock = threading.Lock()
+        self._key_to_entry: Dict[str, QueryResultCacheEntry] = {}
+        self._eviction_count = 0
+
+    def get(self, key: str) -> Optional[QueryResultCacheEntry]:  # noqa: D102
+        with self._lock:
+            entry = self._key_to_entry.pop(key, None)
+            if entry is not None:
+                self._key_to_entry[key] = entry
+            return entry
+
+    def set(self, key: str, entry: QueryResultCacheEntry) -> None:  # noqa: D102
+        with self._lock:
+            self._key_to_entry.pop(key, None)
+            while len(self._key_to_entry) >= self._max_items:
+                del self._key_to_entry[next(iter(self._key_to_entry))]
+                self._eviction_count += 1
+            self._key_to_entry[key] = entry
+
+    def clear(self) -> None:  # noqa: D102
+        with self._lock:
+            self._key_to_entry.clear()
+
+    @property
+    def item_count(self) -> int:  # noqa: D102
+        with self._lock:
+            return len(self._key_to_entry)
+
+    @property
+    def eviction_count(self) -> int:  # noqa: D102
+        with self._lock:
+            return self._eviction_count
+
+    def estimate_size_bytes(self) -> int:  # noqa: D102
+        with self._lock:
+            entries = tuple(self._key_to_entry.values())
+        return estimate_deep_size_bytes(entries)
+
+
+class SqliteQueryResultCacheStore(QueryResultCacheStore):
+    """Stores entries in an SQLite database file so that they can be shared by multiple processes.
+
+    Once the limit is hit, the oldest entries are evicted.
+    """
+
+    _TABLE_NAME = "mf_query_result"
+    _CREATED_AT_INDEX_NAME = "mf_query_result_created_at_epoch_seconds"
+
+    def __init__(self, path: Path, max_items: int = 1000) -> None:  # noqa: D107
+        if max_items < 1:
+            raise ValueError(f"`max_items` should be at least 1. Got: {max_items}")
+        self._path = path
+        self._max_items = max_items
+        self._lock = threading.Lock()
+        self._eviction_count = 0
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            # WAL mode allows reads to proceed while another process is writing.
+            connection.execute("PRAGMA journal_mode=WAL")
+            # `created_at` is stored as text to restore the exact value, and as the number of seconds since the epoch
+            # to order the entries for eviction, as text with different UTC offsets doesn't sort by time.
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {SqliteQueryResultCacheStore._TABLE_NAME} "
+                "(cache_key TEXT PRIMARY KEY, created_at TEXT NOT NULL, created_at_epoch_seconds REAL NOT NULL, "
+                "data_table BLOB NOT NULL)"
+            )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {SqliteQueryResultCacheStore._CREATED_AT_INDEX_NAME} "
+                f"ON {SqliteQueryResultCacheStore._TABLE_NAME} (created_at_epoch_seconds)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # A new connection is used for each operation as connections can't be shared between threads.
+        return sqlite3.connect(str(self._path), timeout=30.0)
+
+    def get(self, key: str) -> Optional[QueryResultCacheEntry]:  # noqa: D102
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                f"SELECT created_at, data_table FROM {SqliteQueryResultCacheStore._TABLE_NAME} WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            data_table = pickle.loads(row[1])
+        except Exception:
+            logger.warning(LazyFormat("Unable to load a query result from the cache", cache_key=key), exc_info=True)
+            return None
+        if not isinstance(data_table, MetricFlowDataTable):
+            logger.warning(LazyFormat("Found an unexpected object in the cache", cache_key=key))
+            return None
+        return QueryResultCacheEntry(created_at=datetime.datetime.fromisoformat(row[0]), data_table=data_table)
+
+    def set(self, key: str, entry: QueryResultCacheEntry) -> None:  # noqa: D102
+        serialized_data_table = pickle.dumps(entry.data_table, protocol=pickle.HIGHEST_PROTOCOL)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                f"INSERT OR REPLACE INTO {SqliteQueryResultCacheStore._TABLE_NAME} "
+                "(cache_key, created_at, created_at_epoch_seconds, data_table) VALUES (?, ?, ?, ?)",
+                (key, entry.created_at.isoformat(), entry.created_at.timestamp(), serialized_data_table),
+            )
+            cursor = connection.execute(
+                f"DELETE FROM {SqliteQueryResultCacheStore._TABLE_NAME} WHERE cache_key NOT IN "
+                f"(SELECT cache_key FROM {SqliteQueryResultCacheStore._TABLE_NAME} "
+                "ORDER BY created_at_epoch_seconds DESC LIMIT ?)",
+                (self._max_items,),
+            )
+        if cursor.rowcount > 0:
+            with self._lock:
+                self._eviction_count += cursor.rowcount
+
+    def clear(self) -> None:  # noqa: D102
+        with closing(self._connect()) as connection, connection:
+            connection.execute(f"DELETE FROM {SqliteQueryResultCacheStore._TABLE_NAME}")
+
+    @property
+    def item_count(self) -> int:  # noqa: D102
+        with closing(self._connect()) as connection:
+            return connection.execute(f"SELECT COUNT(*) FROM {SqliteQueryResultCacheStore._TABLE_NAME}").fetchone()[0]
+
+    @property
+    def eviction_count(self) -> int:  # noqa: D102
+        with self._lock:
+            return self._eviction_count
+
+    def estimate_size_bytes(self) -> int:
+        """Return the size of the serialized results in the database file."""
+        with closing(self._connect()) as connection:
+            return connection.execute(
+                f"SELECT COALESCE(SUM(LENGTH(data_table)), 0) FROM {SqliteQueryResultCacheStore._TABLE_NAME}"
+            ).fetchone()[0]
+
+
+@dataclass(frozen=True)
+class QueryResultCacheStats(CacheStats):
+    """Describes how the query result cache has been used.
+
+    `hit_count` and `miss_count` are for the results that are used as-is, and the other counts are from the store.
+
+    Attributes:
+        time_partitioned_refresh_count: The number of queries where only the latest time buckets were run.
+    """
+
+    time_partitioned_refresh_count: int
+
+
+class QueryResultCache:
+    """Caches the results of queries run in the warehouse, keyed by the SQL and the bind parameters.
+
+    There are two kinds of entries:
+
+    * Results that are used as-is until they are older than `entry_ttl`.
+    * Time-partitioned results for queries that are grouped by `metric_time`. When the result is requested again, only
+      the time buckets starting from the latest one in the cached result (minus `refresh_lookback`) are queried, and
+      those rows replace the rows for the same buckets in the cached result. Since the recent buckets are queried using
+      a time constraint, the engine handles these entries (see `MetricFlowEngine`).
+
+    The store should only be shared by engines that query the same warehouse, as the key doesn't identify the
+    warehouse. The cache registers with `GLOBAL_CACHE_REGISTRY`, so its usage is included in cache reports.
+    """
+
+    _TIME_PARTITIONED_KEY_PREFIX = "time_partitioned"
+    _DEFAULT_TIME_PARTITIONED_ENTRY_TTL = datetime.timedelta(days=1)
+
+    def __init__(
+        self,
+        time_source: TimeSource,
+        store: Optional[QueryResultCacheStore] = None,
+        entry_ttl: Optional[datetime.timedelta] = None,
+        max_rows_per_entry: int = 100000,
+        time_partitioned_refresh: bool = False,
+        refresh_lookback: datetime.timedelta = datetime.timedelta(0),
+        time_partitioned_entry_ttl: Optional[datetime.timedelta] = _DEFAULT_TIME_PARTITIONED_ENTRY_TTL,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            time_source: Used to determine when entries were created.
+            store: Where the entries are stored. Defaults to an `InMemoryQueryResultCacheStore`.
+            entry_ttl: If specified, results older than this are not used.
+            max_rows_per_entry: Results with more rows than this are not cached.
+            time_partitioned_refresh: If set, the results of queries grouped by `metric_time` are refreshed by only
+                querying the latest time buckets.
+            refresh_lookback: When refreshing a time-partitioned result, buckets that start within this period before
+                the latest bucket are also queried (e.g. to pick up late-arriving data).
+            time_partitioned_entry_ttl: Time-partitioned results older than this are queried in full. Buckets before
+                the watermark are only queried again when the result is queried in full, so this limits how long changes
+                to earlier data (e.g. backfills) are not reflected in the result. If None, results are always refreshed
+                from the watermark.
+        """
+        if max_rows_per_entry < 0:
+            raise ValueError(f"`max_rows_per_entry` should be at least 0. Got: {max_rows_per_entry}")
+        self._time_source = time_source
+        self._store = store or InMemoryQueryResultCacheStore()
+        self._entry_ttl = entry_ttl
+        self._max_rows_per_entry = max_rows_per_entry
+        self._time_partitioned_refresh = time_partitioned_refresh
+        self._refresh_lookback = refresh_lookback
+        self._time_partitioned_entry_ttl = time_partitioned_entry_ttl
+        self._time_period_adjuster = DateutilTimePeriodAdjuster()
+
+        self._lock = threading.Lock()
+        self._hit_count = 0
+        self._miss_count = 0
+        self._time_partitioned_refresh_count = 0
+        GLOBAL_CACHE_REGISTRY.register("QueryResultCache", self)
+
+    @staticmethod
+    def _create_key(sql_statement: SqlStatement) -> str:
+        return hashlib.sha256(
+            "\n".join((sql_statement.sql, create_canonical_text(sql_statement.bind_parameter_set))).encode("utf-8")
+        ).hexdigest()
+
+    def _is_expired(self, entry: QueryResultCacheEntry, ttl: Optional[datetime.timedelta]) -> bool:
+        if ttl is None:
+            return False
+        return self._time_source.get_time() - entry.created_at > ttl
+
+    def _set_entry(
+        self, key: str, data_table: MetricFlowDataTable, created_at: Optional[datetime.datetime] = None
+    ) -> None:
+        if data_table.row_count > self._max_rows_per_entry:
+            logger.debug(
+                LazyFormat("Not caching a query result as it has too many rows", row_count=data_table.row_count)
+            )
+            return
+        self._store.set(
+            key,
+            QueryResultCacheEntry(
+                created_at=created_at if created_at is not None else self._time_source.get_time(),
+                data_table=data_table,
+            ),
+        )
+
+    def get(self, sql_statement: SqlStatement) -> Optional[MetricFlowDataTable]:
+        """Return the cached result for the given query, or None if there isn't a result that can be used."""
+        entry = self._store.get(QueryResultCache._create_key(sql_statement))
+        if entry is not None and self._is_expired(entry, self._entry_ttl):
+            entry = None
+        with self._lock:
+            if entry is None:
+                self._miss_count += 1
+            else:
+                self._hit_count += 1
+        logger.debug(LazyFormat("Looked up query result", hit=entry is not None))
+        return entry.data_table if entry is not None else None
+
+    def set(self, sql_statement: SqlStatement, data_table: MetricFlowDataTable) -> None:
+        """Store the result of the given query."""
+        self._set_entry(QueryResultCache._create_key(sql_statement), data_table)
+
+    @property
+    def time_partitioned_refresh(self) -> bool:  # noqa: D102
+        return self._time_partitioned_refresh
+
+    def _create_time_partitioned_key(self, sql_statement: SqlStatement, time_column_name: str) -> str:
+        return ":".join(
+            (
+                QueryResultCache._TIME_PARTITIONED_KEY_PREFIX,
+                time_column_name,
+                QueryResultCache._create_key(sql_statement),
+            )
+        )
+
+    def get_time_partitioned(
+        self, sql_statement: SqlStatement, time_column_name: str, time_granularity: TimeGranularity
+    ) -> Optional[TimePartitionedQueryResult]:
+        """Return the time-partitioned result for the given query, or None if the query needs to be run in full.
+
+        Args:
+            sql_statement: The query without a constraint for the refreshed buckets.
+            time_column_name: The name of the `metric_time` column in the result.
+            time_granularity: The granularity of the `metric_time` column. The watermark is adjusted to the start of a
+                bucket so that a time constraint starting at the watermark doesn't include a partial bucket.
+        """
+        entry = self._store.get(self._create_time_partitioned_key(sql_statement, time_column_name))
+        if entry is None or self._is_expired(entry, self._time_partitioned_entry_ttl):
+            return None
+        if time_column_name not in entry.data_table.column_names:
+            return None
+        time_values = entry.data_table.column_values(entry.data_table.column_name_index(time_column_name))
+        bucket_starts: List[datetime.datetime] = []
+        for time_value in time_values:
+            # Rows without a time bucket can't be refreshed using a time constraint.
+            if not isinstance(time_value, datetime.datetime):
+                return None
+            bucket_starts.append(time_value)
+        if len(bucket_starts) == 0:
+            return None
+        return TimePartitionedQueryResult(
+            data_table=entry.data_table,
+            time_column_name=time_column_name,
+            created_at=entry.created_at,
+            watermark=self._time_period_adjuster.adjust_to_start_of_period(
+                time_granularity, max(bucket_starts) - self._refresh_lookback
+            ),
+        )
+
+    def set_time_partitioned(
+        self,
+        sql_statement: SqlStatement,
+        time_column_name: str,
+        data_table: MetricFlowDataTable,
+        created_at: Optional[datetime.datetime] = None,
+    ) -> None:
+        """Store the time-partitioned result for the given query.
+
+        Args:
+            sql_statement: The query without a constraint for the refreshed buckets.
+            time_column_name: The name of the `metric_time` column in the result.
+            data_table: The result to store.
+            created_at: When the result was last queried in full. Defaults to the current time. When storing a result
+                that was refreshed from a cached result, this should be the `created_at` of the cached result so that
+                `time_partitioned_entry_ttl` is counted from the full query.
+        """
+        self._set_entry(self._create_time_partitioned_key(sql_statement, time_column_name), data_table, created_at)
+
+    def record_time_partitioned_refresh(self) -> None:
+        """Record that the latest buckets of a time-partitioned result were refreshed."""
+        with self._lock:
+            self._time_partitioned_refresh_count += 1
+
+    def clear(self) -> None:
+        """Remove all entries from the store and reset the counters."""
+        self._store.clear()
+        with self._lock:
+            self._hit_count = 0
+            self._miss_count = 0
+            self._time_partitioned_refresh_count = 0
+
+    @property
+    def stats(self) -> QueryResultCacheStats:  # noqa: D102
+        eviction_count = self._store.eviction_count
+        item_count = self._store.item_count
+        with self._lock:
+            return QueryResultCacheStats(
+                hit_count=self._hit_count,
+                miss_count=self._miss_count,
+                eviction_count=eviction_count,
+                item_count=item_count,
+                pinned_item_count=0,
+                estimated_size_bytes=0,
+                time_partitioned_refresh_count=self._time_partitioned_refresh_count,
+            )
+
+    def estimate_size_bytes(self) -> int:  # noqa: D102
+        return self._store.estimate_size_bytes()
+
+
+@dataclass(frozen=True)
+class TimePartitionedQueryResult:
+    """A cached result for a query grouped by `metric_time`.
+
+    Attributes:
+        data_table: The cached result.
+        time_column_name: The name of the `metric_time` column.
+        created_at: When the result was last queried in full.
+        watermark: Buckets starting at or after this time should be queried again.
+    """
+
+    data_table: MetricFlowDataTable
+    time_column_name: str
+    created_at: datetime.datetime
+    watermark: datetime.datetime
+
+    def merge(self, refreshed_data_table: MetricFlowDataTable) -> MetricFlowDataTable:
+        """Replace the rows for the buckets at or after the watermark with the rows from the refreshed result."""
+        if tuple(refreshed_data_table.column_names) != tuple(self.data_table.column_names):
+            raise ValueError(
+                LazyFormat(
+                    "The refreshed result has different columns from the cached result.",
+                    cached_column_names=self.data_table.column_names,
+                    refreshed_column_names=refreshed_data_table.column_names,
+                )
+            )
+        time_column_index = self.data_table.column_name_index(self.time_column_name)
+        kept_rows = []
+        for row in self.data_table.rows:
+            bucket_start = row[time_column_index]
+            if isinstance(bucket_start, datetime.datetime) and bucket_start < self.watermark:
+                kept_rows.append(row)
+        return MetricFlowDataTable.create_from_rows(
+            column_names=self.data_table.column_names, rows=kept_rows + list(refreshed_data_table.rows)
+        )
@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Tuple
 
 from metricflow_semantics.instances import InstanceSet
 
+from metricflow.sql.optimizer.optimizer_pipeline import SqlOptimizerPassStats
 from metricflow.sql.sql_plan import SqlPlan
 
 
 @dataclass(frozen=True)
 class ConvertToSqlPlanResult:
-    """Result object for returning the results of converting to a `SqlQueryPlan`."""
+    """Result object for returning the results of converting to a `SqlQueryPlan`.
+
+    Attributes:
+        instance_set: The instances in the output of the SQL plan.
+        sql_plan: The optimized SQL plan.
+        optimizer_pass_stats: Describes the passes that were made by the SQL plan optimizers.
+    """
 
     instance_set: InstanceSet
     sql_plan: SqlPlan
+    optimizer_pass_stats: Tuple[SqlOptimizerPassStats, ...] = ()
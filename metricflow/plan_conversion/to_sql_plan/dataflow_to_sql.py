@@ -4,7 +4,6 @@ import logging
 from typing import FrozenSet, Optional, Sequence, Set
 
 from metricflow_semantics.dag.mf_dag import DagId
-from metricflow_semantics.helpers.string_helpers import mf_indent
 from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
 from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
 from metricflow_semantics.specs.column_assoc import ColumnAssociationResolver
@@ -24,6 +23,7 @@ from metricflow.sql.optimizer.optimization_levels import (
     SqlGenerationOptionSet,
     SqlOptimizationLevel,
 )
+from metricflow.sql.optimizer.optimizer_pipeline import SqlOptimizerPipeline
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlPlanOptimizer
 from metricflow.sql.sql_plan import (
     SqlPlan,
@@ -205,19 +205,18 @@ class DataflowToSqlPlanConverter:
 
         sql_node: SqlPlanNode = data_set.sql_node
 
-        for optimizer in optimizers:
-            logger.debug(LazyFormat(lambda: f"Applying optimizer: {optimizer.__class__.__name__}"))
-            sql_node = optimizer.optimize(sql_node)
-            logger.debug(
-                LazyFormat(
-                    lambda: f"After applying optimizer {optimizer.__class__.__name__}, the SQL query plan is:\n"
-                    f"{mf_indent(sql_node.structure_text())}"
-                )
+        optimizer_pipeline_result = SqlOptimizerPipeline(optimizers).optimize(sql_node)
+        logger.debug(
+            LazyFormat(
+                "Optimized the SQL query plan",
+                optimizer_pass_stats=optimizer_pipeline_result.pass_stats,
             )
+        )
 
         return ConvertToSqlPlanResult(
             instance_set=data_set.instance_set,
-            sql_plan=SqlPlan(render_node=sql_node, plan_id=sql_query_plan_id),
+            sql_plan=SqlPlan(render_node=optimizer_pipeline_result.optimized_node, plan_id=sql_query_plan_id),
+            optimizer_pass_stats=optimizer_pipeline_result.pass_stats,
         )
 
     def _get_nodes_to_convert_to_cte(
@@ -10,6 +10,8 @@ from dbt_semantic_interfaces.references import MetricModelReference, SemanticMod
 from dbt_semantic_interfaces.type_enums import AggregationType, ConversionCalculationType, MetricType, PeriodAggregation
 from dbt_semantic_interfaces.validations.unique_valid_name import MetricFlowReservedKeywords
 from metricflow_semantics.aggregation_properties import AggregationState
+from metricflow_semantics.collection_helpers.bounded_cache import BoundedCache, CacheEvictionPolicy
+from metricflow_semantics.collection_helpers.cache_registry import CacheStats
 from metricflow_semantics.dag.id_prefix import StaticIdPrefix
 from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
 from metricflow_semantics.errors.error_classes import SemanticManifestConfigurationError
@@ -129,11 +131,47 @@ from metricflow.plan_conversion.to_sql_plan.sql_join_builder import ColumnEquali
 from metricflow.sql.sql_ctas_node import SqlCreateTableAsNode
 from metricflow.sql.sql_cte_node import SqlCteNode
 from metricflow.sql.sql_plan import (
+    SqlPlanNode,
     SqlSelectColumn,
 )
 from metricflow.sql.sql_select_node import SqlJoinDescription, SqlOrderByDescription, SqlSelectStatementNode
 from metricflow.sql.sql_table_node import SqlTableNode
 
+DEFAULT_MAX_CACHED_OUTPUT_DATA_SETS = 10000
+
+# Rough per-object sizes used to estimate the memory used by cached outputs.
+_ESTIMATED_BYTES_PER_SQL_NODE = 2000
+_ESTIMATED_BYTES_PER_SELECT_COLUMN = 500
+_ESTIMATED_BYTES_PER_INSTANCE = 500
+
+
+def estimate_data_set_size_bytes(data_set: SqlDataSet) -> int:
+    """Return a rough estimate of the memory used by the data set.
+
+    This is based on the number of SQL nodes, select columns, and instances as computing the actual size of the object
+    graph would be slow.
+    """
+    node_count = 0
+    select_column_count = 0
+    visited_node_ids: Set[int] = set()
+    nodes_to_visit: List[SqlPlanNode] = [data_set.sql_node]
+    while nodes_to_visit:
+        node = nodes_to_visit.pop()
+        if id(node) in visited_node_ids:
+            continue
+        visited_node_ids.add(id(node))
+        node_count += 1
+        select_node = node.as_select_node
+        if select_node is not None:
+            select_column_count += len(select_node.select_columns)
+        nodes_to_visit.extend(node.parent_nodes)
+
+    return (
+        node_count * _ESTIMATED_BYTES_PER_SQL_NODE
+        + select_column_count * _ESTIMATED_BYTES_PER_SELECT_COLUMN
+        + len(data_set.instance_set.as_tuple) * _ESTIMATED_BYTES_PER_INSTANCE
+    )
+
 
 class DataflowNodeToSqlSubqueryVisitor(DataflowPlanNodeVisitor[SqlDataSet]):
     """Generates a SQL query plan by converting a node's parents to sub-queries.
@@ -146,7 +184,7 @@ class DataflowNodeToSqlSubqueryVisitor(DataflowPlanNodeVisitor[SqlDataSet]):
         column_association_resolver: ColumnAssociationResolver,
         semantic_manifest_lookup: SemanticManifestLookup,
         spec_output_order: Sequence[InstanceSpec] = (),
-        _node_to_output_data_set: Optional[Dict[DataflowPlanNode, SqlDataSet]] = None,
+        output_data_set_cache: Optional[BoundedCache[DataflowPlanNode, SqlDataSet]] = None,
     ) -> None:
         """Initializer.
 
@@ -154,6 +192,9 @@ class DataflowNodeToSqlSubqueryVisitor(DataflowPlanNodeVisitor[SqlDataSet]):
             column_association_resolver: controls how columns for instances are generated and used between nested
             queries.
             semantic_manifest_lookup: Self-explanatory.
+            spec_output_order: See `MetricflowQueryParser`.
+            output_data_set_cache: Cache for the output of nodes. If not specified, a cache with the default limits is
+            used. See `create_output_data_set_cache()`.
         """
         self._column_association_resolver = column_association_resolver
         self._semantic_manifest_lookup = semantic_manifest_lookup
@@ -165,7 +206,9 @@ class DataflowNodeToSqlSubqueryVisitor(DataflowPlanNodeVisitor[SqlDataSet]):
         self._custom_granularity_time_spine_sources = TimeSpineSource.build_custom_time_spine_sources(
             tuple(self._time_spine_sources.values())
         )
-        self._node_to_output_data_set: Dict[DataflowPlanNode, SqlDataSet] = _node_to_output_data_set or {}
+        self._output_data_set_cache = (
+            output_data_set_cache or DataflowNodeToSqlSubqueryVisitor.create_output_data_set_cache()
+        )
         self._spec_output_order = spec_output_order
 
     def _next_unique_table_alias(self) -> str:
@@ -176,30 +219,54 @@ class DataflowNodeToSqlSubqueryVisitor(DataflowPlanNodeVisitor[SqlDataSet]):
         """Return the next unique CTE alias to use in generating queries."""
         return SequentialIdGenerator.create_next_id(StaticIdPrefix.CTE).str_value
 
-    def get_output_data_set(self, node: DataflowPlanNode) -> SqlDataSet:
-        """Cached since this will be called repeatedly during the computation of multiple metrics.
-
-        # TODO: The cache needs to be pruned, but has not yet been an issue.
+    @staticmethod
+    def create_output_data_set_cache(
+        max_items: Optional[int] = DEFAULT_MAX_CACHED_OUTPUT_DATA_SETS,
+        max_size_bytes: Optional[int] = None,
+        eviction_policy: CacheEvictionPolicy = CacheEvictionPolicy.LRU,
+    ) -> BoundedCache[DataflowPlanNode, SqlDataSet]:
+        """Create a cache for the output of nodes that can be passed to the initializer.
+
+        The size of the values is estimated using `estimate_data_set_size_bytes()`.
         """
-        if node not in self._node_to_output_data_set:
+        return BoundedCache(
+            max_items=max_items,
+            max_size_bytes=max_size_bytes,
+            eviction_policy=eviction_policy,
+            size_estimator=estimate_data_set_size_bytes,
+            cache_name="DataflowNodeToSqlSubqueryVisitor.output_data_set",
+        )
+
+    def get_output_data_set(self, node: DataflowPlanNode) -> SqlDataSet:
+        """Cached since this will be called repeatedly during the computation of multiple metrics."""
+        cached_data_set = self._output_data_set_cache.get(node)
+        if cached_data_set is None:
             result = node.accept(self)
-            self._node_to_output_data_set[node] = result
+            self._output_data_set_cache.set(node, result)
             return result
 
-        return self._node_to_output_data_set[node].with_copied_sql_node()
+        return cached_data_set.with_copied_sql_node()
 
     def cache_output_data_sets(self, nodes: Sequence[DataflowPlanNode]) -> None:
-        """Cache the output of the given nodes for consistent retrieval with `get_output_data_set`."""
+        """Cache the output of the given nodes for consistent retrieval with `get_output_data_set`.
+
+        The outputs are pinned in the cache, so they are not evicted when the cache reaches its limits.
+        """
         with log_block_runtime(f"cache_output_data_sets for {len(nodes)} nodes"):
             for node in nodes:
-                self.get_output_data_set(node)
+                self._output_data_set_cache.pin(node, self.get_output_data_set(node))
+
+    @property
+    def output_data_set_cache_stats(self) -> CacheStats:
+        """Return stats for the cache of node outputs."""
+        return self._output_data_set_cache.stats
 
     def copy(self) -> DataflowNodeToSqlSubqueryVisitor:
         """Return a copy of this with the same nodes cached."""
         return DataflowNodeToSqlSubqueryVisitor(
             column_association_resolver=self._column_association_resolver,
             semantic_manifest_lookup=self._semantic_manifest_lookup,
-            _node_to_output_data_set=dict(self._node_to_output_data_set),
+            output_data_set_cache=self._output_data_set_cache.copy(),
         )
 
     # TODO: replace this with a dataflow plan node for cumulative metrics - SL-3324
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+from typing import Protocol
+
+from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
+
+from metricflow.data_table.mf_table import MetricFlowDataTable
+from metricflow.protocols.sql_client import SqlEngine
+
+
+class AsyncSqlClient(Protocol):
+    """Similar to `SqlClient`, but for executing SQL against the data warehouse from an `asyncio` event loop.
+
+    Implementations should not block the event loop while waiting on the warehouse. If the awaiting task is cancelled,
+    the implementation should cancel the statement in the warehouse (e.g. by interrupting the cursor) before
+    re-raising `asyncio.CancelledError`.
+    """
+
+    @property
+    @abstractmethod
+    def sql_engine_type(self) -> SqlEngine:
+        """Enumerated value representing the underlying SqlEngine for this client instance."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def query(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+    ) -> MetricFlowDataTable:
+        """Run a query and return the result as a table."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def execute(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+    ) -> None:
+        """Run a statement that does not return results (e.g. `CREATE TABLE ...`)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def dry_run(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+    ) -> None:
+        """Check that the statement is valid without running it. Raises an exception if it's not."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Close the connections used by this client."""
+        raise NotImplementedError
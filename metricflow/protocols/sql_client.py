@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from enum import Enum
-from typing import Protocol, Set
+from typing import Iterator, Protocol, Set
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
@@ -53,6 +53,10 @@ class SqlEngine(Enum):
             assert_values_exhausted(self)
 
 
+# The default number of rows to fetch at a time when query results are returned in batches.
+DEFAULT_QUERY_BATCH_SIZE = 10000
+
+
 class SqlClient(Protocol):
     """Base interface for SqlClient instances used inside MetricFlow.
 
@@ -84,6 +88,21 @@ class SqlClient(Protocol):
         """Base query method, upon execution will run a query that returns a pandas DataTable."""
         raise NotImplementedError
 
+    @abstractmethod
+    def query_in_batches(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+        batch_size: int = DEFAULT_QUERY_BATCH_SIZE,
+    ) -> Iterator[MetricFlowDataTable]:
+        """Similar to `query`, but returns the result as tables containing at most `batch_size` rows.
+
+        The query is run when the iterator is first advanced, and results are fetched from the warehouse as the
+        iterator is consumed. Since the column types are inferred for each batch, a column that only has `None` values
+        in one batch may have a different type than the same column in another batch.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def execute(
         self,
@@ -8,7 +8,10 @@ from typing import Tuple
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
 
 from metricflow.sql.optimizer.column_pruning.column_pruner import SqlColumnPrunerOptimizer
-from metricflow.sql.optimizer.rewriting_sub_query_reducer import SqlRewritingSubQueryReducer
+from metricflow.sql.optimizer.rewriting_sub_query_reducer import (
+    SqlGroupByRewritingOptimizer,
+    SqlRewritingSubQueryReducer,
+)
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlPlanOptimizer
 from metricflow.sql.optimizer.table_alias_simplifier import SqlTableAliasSimplifier
 
@@ -44,6 +47,19 @@ class SqlGenerationOptionSet:
     # Specifies whether CTEs can be used to simplify generated SQL.
     allow_cte: bool
 
+    @staticmethod
+    def _sub_query_reducing_optimizers(use_column_alias_in_group_by: bool) -> Tuple[SqlPlanOptimizer, ...]:
+        # The GROUP BY rewrite is a separate optimizer instead of a `SqlRewritingSubQueryReducer` option so that it
+        # can be fused with the table alias simplifier.
+        if use_column_alias_in_group_by:
+            return (
+                SqlColumnPrunerOptimizer(),
+                SqlRewritingSubQueryReducer(),
+                SqlGroupByRewritingOptimizer(),
+                SqlTableAliasSimplifier(),
+            )
+        return (SqlColumnPrunerOptimizer(), SqlRewritingSubQueryReducer(), SqlTableAliasSimplifier())
+
     @staticmethod
     def options_for_level(  # noqa: D102
         level: SqlOptimizationLevel, use_column_alias_in_group_by: bool
@@ -59,17 +75,9 @@ class SqlGenerationOptionSet:
         elif level is SqlOptimizationLevel.O3:
             optimizers = (SqlColumnPrunerOptimizer(), SqlTableAliasSimplifier())
         elif level is SqlOptimizationLevel.O4:
-            optimizers = (
-                SqlColumnPrunerOptimizer(),
-                SqlRewritingSubQueryReducer(use_column_alias_in_group_bys=use_column_alias_in_group_by),
-                SqlTableAliasSimplifier(),
-            )
+            optimizers = SqlGenerationOptionSet._sub_query_reducing_optimizers(use_column_alias_in_group_by)
         elif level is SqlOptimizationLevel.O5:
-            optimizers = (
-                SqlColumnPrunerOptimizer(),
-                SqlRewritingSubQueryReducer(use_column_alias_in_group_bys=use_column_alias_in_group_by),
-                SqlTableAliasSimplifier(),
-            )
+            optimizers = SqlGenerationOptionSet._sub_query_reducing_optimizers(use_column_alias_in_group_by)
             allow_cte = True
         else:
             assert_values_exhausted(level)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import List, Sequence, Set, Tuple
+
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+
+from metricflow.sql.optimizer.select_node_rewriter import SqlSelectNodeRewriter, SqlSelectNodeRewritingVisitor
+from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlPlanOptimizer
+from metricflow.sql.sql_plan import SqlPlanNode
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SqlOptimizerPassStats:
+    """Describes a pass over the SQL query plan by one or more optimizers.
+
+    Attributes:
+        optimizer_names: The names of the optimizers that were run in the pass. There are multiple names if the
+        optimizers were fused into a single traversal.
+        runtime: The runtime of the pass in seconds.
+        rewritten_node_count: The number of nodes in the output plan that are not in the input plan.
+    """
+
+    optimizer_names: Tuple[str, ...]
+    runtime: float
+    rewritten_node_count: int
+
+
+@dataclass(frozen=True)
+class SqlOptimizerPipelineResult:
+    """The result of running the `SqlOptimizerPipeline`."""
+
+    optimized_node: SqlPlanNode
+    pass_stats: Tuple[SqlOptimizerPassStats, ...]
+
+
+class SqlOptimizerPipeline:
+    """Runs a sequence of SQL query plan optimizers, fusing them into a single traversal where possible.
+
+    An optimizer that provides a `SqlSelectNodeRewriter` for the plan can be fused with the following optimizers that
+    provide a plan-independent rewriter. e.g. with the column pruner followed by the table alias simplifier, the plan
+    is traversed once to remove the unnecessary columns and the table aliases instead of twice.
+    """
+
+    def __init__(self, optimizers: Sequence[SqlPlanOptimizer], fuse_optimizers: bool = True) -> None:
+        """Initializer.
+
+        Args:
+            optimizers: The optimizers to run, in order.
+            fuse_optimizers: Whether compatible optimizers should be fused. Mainly for comparison in tests.
+        """
+        self._optimizers = tuple(optimizers)
+        self._fuse_optimizers = fuse_optimizers
+
+    def optimize(self, node: SqlPlanNode) -> SqlOptimizerPipelineResult:
+        """Run the optimizers on the plan that ends at the given node."""
+        pass_stats: List[SqlOptimizerPassStats] = []
+        optimizer_index = 0
+        while optimizer_index < len(self._optimizers):
+            start_time = time.perf_counter()
+            optimizer = self._optimizers[optimizer_index]
+            fused_optimizers: List[SqlPlanOptimizer] = [optimizer]
+            rewriters: List[SqlSelectNodeRewriter] = []
+
+            first_rewriter = optimizer.create_select_node_rewriter(node) if self._fuse_optimizers else None
+            if first_rewriter is not None:
+                rewriters.append(first_rewriter)
+                for next_optimizer in self._optimizers[optimizer_index + 1 :]:
+                    next_rewriter = next_optimizer.plan_independent_select_node_rewriter
+                    if next_rewriter is None:
+                        break
+                    fused_optimizers.append(next_optimizer)
+                    rewriters.append(next_rewriter)
+
+            optimizer_names = tuple(fused_optimizer.__class__.__name__ for fused_optimizer in fused_optimizers)
+            logger.debug(LazyFormat("Applying optimizers", optimizer_names=optimizer_names))
+            if len(rewriters) > 0:
+                optimized_node = node.accept(SqlSelectNodeRewritingVisitor(rewriters))
+            else:
+                optimized_node = optimizer.optimize(node)
+            runtime = time.perf_counter() - start_time
+
+            pass_stats.append(
+                SqlOptimizerPassStats(
+                    optimizer_names=optimizer_names,
+                    runtime=runtime,
+                    rewritten_node_count=SqlOptimizerPipeline._count_new_nodes(
+                        input_node=node, output_node=optimized_node
+                    ),
+                )
+            )
+            logger.debug(
+                LazyFormat(
+                    "Applied optimizers",
+                    pass_stats=pass_stats[-1],
+                    optimized_plan=lambda: optimized_node.structure_text(),
+                )
+            )
+            node = optimized_node
+            optimizer_index += len(fused_optimizers)
+
+        return SqlOptimizerPipelineResult(optimized_node=node, pass_stats=tuple(pass_stats))
+
+    @staticmethod
+    def _count_new_nodes(input_node: SqlPlanNode, output_node: SqlPlanNode) -> int:
+        """Return the number of nodes in the output plan that are not in the input plan."""
+        if input_node is output_node:
+            return 0
+        input_nodes = SqlOptimizerPipeline._all_nodes(input_node)
+        return sum(1 for node in SqlOptimizerPipeline._all_nodes(output_node) if node not in input_nodes)
+
+    @staticmethod
+    def _all_nodes(sink_node: SqlPlanNode) -> Set[SqlPlanNode]:
+        nodes: Set[SqlPlanNode] = set()
+        nodes_to_visit: List[SqlPlanNode] = [sink_node]
+        while len(nodes_to_visit) > 0:
+            node = nodes_to_visit.pop()
+            if node in nodes:
+                continue
+            nodes.add(node)
+            nodes_to_visit.extend(node.parent_nodes)
+        return nodes
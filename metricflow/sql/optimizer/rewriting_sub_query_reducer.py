@@ -17,6 +17,7 @@ from metricflow_semantics.sql.sql_exprs import (
 )
 from typing_extensions import override
 
+from metricflow.sql.optimizer.select_node_rewriter import SqlSelectNodeRewriter, SqlSelectNodeRewritingVisitor
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlPlanOptimizer
 from metricflow.sql.sql_ctas_node import SqlCreateTableAsNode
 from metricflow.sql.sql_cte_node import SqlCteNode
@@ -94,30 +95,20 @@ class SqlRewritingSubQueryReducerVisitor(SqlPlanNodeVisitor[SqlPlanNode]):
         node: SqlSelectStatementNode,
     ) -> SqlSelectStatementNode:
         """Apply the reducing operation to the parent select statements."""
-        return SqlSelectStatementNode.create(
-            description=node.description,
-            select_columns=node.select_columns,
+        return node.with_new_parts(
             from_source=node.from_source.accept(self),
-            from_source_alias=node.from_source_alias,
-            cte_sources=tuple(
-                cte_source.with_new_select(cte_source.select_statement.accept(self)) for cte_source in node.cte_sources
-            ),
+            cte_sources=tuple(self._reduce_cte_source(cte_source) for cte_source in node.cte_sources),
             join_descs=tuple(
-                SqlJoinDescription(
-                    right_source=join_desc.right_source.accept(self),
-                    right_source_alias=join_desc.right_source_alias,
-                    on_condition=join_desc.on_condition,
-                    join_type=join_desc.join_type,
-                )
-                for join_desc in node.join_descs
+                join_desc.with_right_source(join_desc.right_source.accept(self)) for join_desc in node.join_descs
             ),
-            group_bys=node.group_bys,
-            order_bys=node.order_bys,
-            where=node.where,
-            limit=node.limit,
-            distinct=node.distinct,
         )
 
+    def _reduce_cte_source(self, cte_source: SqlCteNode) -> SqlCteNode:
+        reduced_select_statement = cte_source.select_statement.accept(self)
+        if reduced_select_statement is cte_source.select_statement:
+            return cte_source
+        return cte_source.with_new_select(reduced_select_statement)
+
     @staticmethod
     def _statement_contains_difficult_expressions(node: SqlSelectStatementNode) -> bool:
         combined_lineage = SqlExpressionTreeLineage.merge_iterable(
@@ -276,7 +267,7 @@ class SqlRewritingSubQueryReducerVisitor(SqlPlanNodeVisitor[SqlPlanNode]):
         }
         all_parent_group_bys_used_in_current_select = True
         for group_by in from_source_node_as_select_node.group_bys:
-            parent_group_by_select = SqlGroupByRewritingVisitor._find_matching_select(
+            parent_group_by_select = SqlGroupByRewriter._find_matching_select(
                 expr=group_by.expr, select_columns=from_source_node_as_select_node.select_columns
             )
             if parent_group_by_select and parent_group_by_select.column_alias not in current_select_column_refs:
@@ -599,9 +590,8 @@ class SqlRewritingSubQueryReducerVisitor(SqlPlanNodeVisitor[SqlPlanNode]):
             select_columns=tuple(clauses_to_rewrite.select_columns),
             from_source=from_source,
             from_source_alias=from_source_alias,
-            cte_sources=tuple(
-                cte_source.with_new_select(cte_source.select_statement.accept(self)) for cte_source in node.cte_sources
-            ),
+            # The CTEs were already reduced in `_reduce_parents()`.
+            cte_sources=node.cte_sources,
             join_descs=tuple(new_join_descs),
             group_bys=tuple(clauses_to_rewrite.group_bys),
             order_bys=tuple(clauses_to_rewrite.order_bys),
@@ -719,9 +709,8 @@ class SqlRewritingSubQueryReducerVisitor(SqlPlanNodeVisitor[SqlPlanNode]):
             ),
             from_source=from_source_select_node.from_source,
             from_source_alias=from_source_select_node.from_source_alias,
-            cte_sources=tuple(
-                cte_source.with_new_select(cte_source.select_statement.accept(self)) for cte_source in node.cte_sources
-            ),
+            # The CTEs were already reduced in `_reduce_parents()`.
+            cte_sources=node_with_reduced_parents.cte_sources,
             join_descs=from_source_select_node.join_descs,
             group_bys=new_group_bys,
             order_bys=tuple(new_order_bys),
@@ -768,13 +757,13 @@ class SqlRewritingSubQueryReducerVisitor(SqlPlanNodeVisitor[SqlPlanNode]):
         return node
 
     def visit_create_table_as_node(self, node: SqlCreateTableAsNode) -> SqlPlanNode:  # noqa: D102
-        return SqlCreateTableAsNode.create(
-            sql_table=node.sql_table,
-            parent_node=node.parent_node.accept(self),
-        )
+        parent_node = node.parent_node.accept(self)
+        if parent_node is node.parent_node:
+            return node
+        return SqlCreateTableAsNode.create(sql_table=node.sql_table, parent_node=parent_node)
 
 
-class SqlGroupByRewritingVisitor(SqlPlanNodeVisitor[SqlPlanNode]):
+class SqlGroupByRewriter(SqlSelectNodeRewriter):
     """Re-writes the GROUP BY to use a SqlColumnAliasReferenceExpression."""
 
     @staticmethod
@@ -788,15 +777,10 @@ class SqlGroupByRewritingVisitor(SqlPlanNodeVisitor[SqlPlanNode]):
         return None
 
     @override
-    def visit_cte_node(self, node: SqlCteNode) -> SqlPlanNode:
-        return node.with_new_select(node.select_statement.accept(self))
-
-    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlPlanNode:  # noqa: D102
+    def rewrite_select_node(self, node: SqlSelectStatementNode) -> SqlSelectStatementNode:
         new_group_bys = []
         for group_by in node.group_bys:
-            matching_select_column = SqlGroupByRewritingVisitor._find_matching_select(
-                group_by.expr, node.select_columns
-            )
+            matching_select_column = SqlGroupByRewriter._find_matching_select(group_by.expr, node.select_columns)
             if matching_select_column:
                 new_group_bys.append(
                     SqlSelectColumn(
@@ -812,41 +796,32 @@ class SqlGroupByRewritingVisitor(SqlPlanNodeVisitor[SqlPlanNode]):
                 )
                 new_group_bys.append(group_by)
 
-        return SqlSelectStatementNode.create(
-            description=node.description,
-            select_columns=node.select_columns,
-            from_source=node.from_source.accept(self),
-            from_source_alias=node.from_source_alias,
-            cte_sources=tuple(
-                cte_source.with_new_select(cte_source.select_statement.accept(self)) for cte_source in node.cte_sources
-            ),
-            join_descs=tuple(
-                SqlJoinDescription(
-                    right_source=x.right_source.accept(self),
-                    right_source_alias=x.right_source_alias,
-                    on_condition=x.on_condition,
-                    join_type=x.join_type,
-                )
-                for x in node.join_descs
-            ),
-            group_bys=tuple(new_group_bys),
-            order_bys=node.order_bys,
-            where=node.where,
-            limit=node.limit,
-            distinct=node.distinct,
-        )
+        return node.with_new_parts(group_bys=tuple(new_group_bys))
 
-    def visit_table_node(self, node: SqlTableNode) -> SqlPlanNode:  # noqa: D102
-        return node
 
-    def visit_query_from_clause_node(self, node: SqlSelectTextNode) -> SqlPlanNode:  # noqa: D102
-        return node
+class SqlGroupByRewritingOptimizer(SqlPlanOptimizer):
+    """Re-writes the GROUP BY in SELECT statements to use the column alias of the matching SELECT column.
 
-    def visit_create_table_as_node(self, node: SqlCreateTableAsNode) -> SqlPlanNode:  # noqa: D102
-        return SqlCreateTableAsNode.create(
-            sql_table=node.sql_table,
-            parent_node=node.parent_node.accept(self),
-        )
+    e.g. from
+
+    SELECT SUM(a.col0) AS foo, a.col1 AS bar
+    FROM table0 a
+    GROUP BY a.col1
+
+    to
+
+    SELECT SUM(a.col0) AS foo, a.col1 AS bar
+    FROM table0 a
+    GROUP BY bar
+    """
+
+    def optimize(self, node: SqlPlanNode) -> SqlPlanNode:  # noqa: D102
+        return node.accept(SqlSelectNodeRewritingVisitor((SqlGroupByRewriter(),)))
+
+    @property
+    @override
+    def plan_independent_select_node_rewriter(self) -> SqlSelectNodeRewriter:
+        return SqlGroupByRewriter()
 
 
 class SqlRewritingSubQueryReducer(SqlPlanOptimizer):
@@ -876,5 +851,5 @@ class SqlRewritingSubQueryReducer(SqlPlanOptimizer):
     def optimize(self, node: SqlPlanNode) -> SqlPlanNode:  # noqa: D102
         result = node.accept(SqlRewritingSubQueryReducerVisitor())
         if self._use_column_alias_in_group_bys:
-            return result.accept(SqlGroupByRewritingVisitor())
+            return SqlGroupByRewritingOptimizer().optimize(result)
         return result
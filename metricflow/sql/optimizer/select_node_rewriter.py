@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence
+
+from typing_extensions import override
+
+from metricflow.sql.sql_ctas_node import SqlCreateTableAsNode
+from metricflow.sql.sql_cte_node import SqlCteNode
+from metricflow.sql.sql_plan import SqlPlanNode, SqlPlanNodeVisitor
+from metricflow.sql.sql_select_node import SqlSelectStatementNode
+from metricflow.sql.sql_select_text_node import SqlSelectTextNode
+from metricflow.sql.sql_table_node import SqlTableNode
+
+
+class SqlSelectNodeRewriter(ABC):
+    """Rewrites a single SELECT statement in a SQL query plan without looking at the sources of the statement.
+
+    Optimizers that can be expressed as a rewriter can be fused with other optimizers so that the query plan is
+    traversed once for all of them (see `SqlSelectNodeRewritingVisitor`).
+    """
+
+    @abstractmethod
+    def rewrite_select_node(self, node: SqlSelectStatementNode) -> SqlSelectStatementNode:
+        """Return the rewritten node, or the given node if no changes are needed.
+
+        The sources of the node (FROM / JOIN / CTE) are rewritten separately, so the returned node must have the same
+        sources as the given node.
+        """
+        raise NotImplementedError
+
+
+class SqlSelectNodeRewritingVisitor(SqlPlanNodeVisitor[SqlPlanNode]):
+    """Applies a sequence of rewriters to each SELECT statement in a SQL query plan in a single traversal.
+
+    The rewriters are applied to a node in order, and then the sources of the node are rewritten. A node is only
+    rebuilt if it or one of its sources changed, and nodes that appear more than once in the plan are only rewritten
+    once.
+    """
+
+    def __init__(self, rewriters: Sequence[SqlSelectNodeRewriter]) -> None:
+        """Initializer.
+
+        Args:
+            rewriters: The rewriters to apply. Only the first one is given the nodes of the input plan, so the
+            following ones can't depend on looking up nodes of the input plan (e.g. the column pruner).
+        """
+        self._rewriters = tuple(rewriters)
+        self._node_to_result: Dict[SqlPlanNode, SqlPlanNode] = {}
+
+    def _rewrite(self, node: SqlPlanNode) -> SqlPlanNode:
+        result = self._node_to_result.get(node)
+        if result is None:
+            result = node.accept(self)
+            self._node_to_result[node] = result
+        return result
+
+    @override
+    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlPlanNode:
+        rewritten_node = node
+        for rewriter in self._rewriters:
+            rewritten_node = rewriter.rewrite_select_node(rewritten_node)
+
+        cte_sources = []
+        for cte_source in rewritten_node.cte_sources:
+            rewritten_cte_source = self._rewrite(cte_source)
+            assert isinstance(rewritten_cte_source, SqlCteNode), f"Expected a CTE node but got {rewritten_cte_source}"
+            cte_sources.append(rewritten_cte_source)
+
+        return rewritten_node.with_new_parts(
+            from_source=self._rewrite(rewritten_node.from_source),
+            cte_sources=tuple(cte_sources),
+            join_descs=tuple(
+                join_desc.with_right_source(self._rewrite(join_desc.right_source))
+                for join_desc in rewritten_node.join_descs
+            ),
+        )
+
+    @override
+    def visit_cte_node(self, node: SqlCteNode) -> SqlPlanNode:
+        select_statement = self._rewrite(node.select_statement)
+        if select_statement is node.select_statement:
+            return node
+        return node.with_new_select(select_statement)
+
+    @override
+    def visit_table_node(self, node: SqlTableNode) -> SqlPlanNode:
+        return node
+
+    @override
+    def visit_query_from_clause_node(self, node: SqlSelectTextNode) -> SqlPlanNode:
+        return node
+
+    @override
+    def visit_create_table_as_node(self, node: SqlCreateTableAsNode) -> SqlPlanNode:
+        parent_node = self._rewrite(node.parent_node)
+        if parent_node is node.parent_node:
+            return node
+        return SqlCreateTableAsNode.create(sql_table=node.sql_table, parent_node=parent_node)
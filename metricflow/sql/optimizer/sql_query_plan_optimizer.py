@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
+from metricflow.sql.optimizer.select_node_rewriter import SqlSelectNodeRewriter
 from metricflow.sql.sql_plan import SqlPlanNode
 
 
@@ -14,3 +16,19 @@ class SqlPlanOptimizer(ABC):
     @abstractmethod
     def optimize(self, node: SqlPlanNode) -> SqlPlanNode:  # noqa :D
         pass
+
+    def create_select_node_rewriter(self, node: SqlPlanNode) -> Optional[SqlSelectNodeRewriter]:
+        """If this optimizer can be expressed as a rewrite of each SELECT statement, return the rewriter for the plan.
+
+        This allows the optimizer to be fused with other optimizers (see `SqlOptimizerPipeline`). The rewriter may look
+        up the nodes of the given plan. Returns `None` if it's not supported.
+        """
+        return self.plan_independent_select_node_rewriter
+
+    @property
+    def plan_independent_select_node_rewriter(self) -> Optional[SqlSelectNodeRewriter]:
+        """Similar to `create_select_node_rewriter`, but for rewriters that can rewrite any SELECT statement.
+
+        As the rewriter doesn't depend on the plan, it can be applied to the output of another rewriter.
+        """
+        return None
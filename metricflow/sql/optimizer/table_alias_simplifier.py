@@ -1,95 +1,72 @@
 from __future__ import annotations
 
 import logging
+from typing import Optional
 
+from metricflow_semantics.sql.sql_exprs import SqlExpressionNode
 from typing_extensions import override
 
+from metricflow.sql.optimizer.select_node_rewriter import SqlSelectNodeRewriter, SqlSelectNodeRewritingVisitor
 from metricflow.sql.optimizer.sql_query_plan_optimizer import SqlPlanOptimizer
-from metricflow.sql.sql_ctas_node import SqlCreateTableAsNode
-from metricflow.sql.sql_cte_node import SqlCteNode
 from metricflow.sql.sql_plan import (
     SqlPlanNode,
-    SqlPlanNodeVisitor,
     SqlSelectColumn,
 )
-from metricflow.sql.sql_select_node import SqlJoinDescription, SqlOrderByDescription, SqlSelectStatementNode
-from metricflow.sql.sql_select_text_node import SqlSelectTextNode
-from metricflow.sql.sql_table_node import SqlTableNode
+from metricflow.sql.sql_select_node import SqlOrderByDescription, SqlSelectStatementNode
 
 logger = logging.getLogger(__name__)
 
 
-class SqlTableAliasSimplifierVisitor(SqlPlanNodeVisitor[SqlPlanNode]):
-    """Visits the SQL query plan to see if table aliases can be omitted when rendering column references."""
+class SqlTableAliasSimplifierRewriter(SqlSelectNodeRewriter):
+    """Rewrites a SELECT statement so that table aliases are omitted when rendering column references if possible."""
+
+    @staticmethod
+    def _simplify_expr(expr: SqlExpressionNode) -> SqlExpressionNode:
+        # `rewrite()` always creates new expressions, so check if any of the column references would change first.
+        # A reference to a column named "user" always renders the table alias - see
+        # `SqlColumnReferenceExpression.rewrite()`.
+        if all(
+            column_reference_expr.should_render_table_alias == (column_reference_expr.col_ref.column_name == "user")
+            for column_reference_expr in expr.lineage.column_reference_exprs
+        ):
+            return expr
+        return expr.rewrite(should_render_table_alias=False)
+
+    @staticmethod
+    def _simplify_select_column(select_column: SqlSelectColumn) -> SqlSelectColumn:
+        expr = SqlTableAliasSimplifierRewriter._simplify_expr(select_column.expr)
+        if expr is select_column.expr:
+            return select_column
+        return SqlSelectColumn(expr=expr, column_alias=select_column.column_alias)
+
+    @staticmethod
+    def _simplify_order_by(order_by: SqlOrderByDescription) -> SqlOrderByDescription:
+        expr = SqlTableAliasSimplifierRewriter._simplify_expr(order_by.expr)
+        if expr is order_by.expr:
+            return order_by
+        return SqlOrderByDescription(expr=expr, desc=order_by.desc)
 
     @override
-    def visit_cte_node(self, node: SqlCteNode) -> SqlPlanNode:
-        return node.with_new_select(node.select_statement.accept(self))
-
-    def visit_select_statement_node(self, node: SqlSelectStatementNode) -> SqlPlanNode:  # noqa: D102
+    def rewrite_select_node(self, node: SqlSelectStatementNode) -> SqlSelectStatementNode:
         # If there is only a single source in the SELECT, no table aliases are required since there's no ambiguity.
-        should_simplify_table_aliases = len(node.join_descs) == 0
-
-        if should_simplify_table_aliases:
-            return SqlSelectStatementNode.create(
-                description=node.description,
-                select_columns=tuple(
-                    SqlSelectColumn(expr=x.expr.rewrite(should_render_table_alias=False), column_alias=x.column_alias)
-                    for x in node.select_columns
-                ),
-                from_source=node.from_source.accept(self),
-                from_source_alias=node.from_source_alias,
-                cte_sources=tuple(
-                    cte_source.with_new_select(cte_source.select_statement.accept(self))
-                    for cte_source in node.cte_sources
-                ),
-                group_bys=tuple(
-                    SqlSelectColumn(expr=x.expr.rewrite(should_render_table_alias=False), column_alias=x.column_alias)
-                    for x in node.group_bys
-                ),
-                order_bys=tuple(
-                    SqlOrderByDescription(expr=x.expr.rewrite(should_render_table_alias=False), desc=x.desc)
-                    for x in node.order_bys
-                ),
-                where=node.where.rewrite(should_render_table_alias=False) if node.where else None,
-                limit=node.limit,
-                distinct=node.distinct,
-            )
-
-        return SqlSelectStatementNode.create(
-            description=node.description,
-            select_columns=node.select_columns,
-            from_source=node.from_source.accept(self),
-            from_source_alias=node.from_source_alias,
-            cte_sources=tuple(
-                cte_source.with_new_select(cte_source.select_statement.accept(self)) for cte_source in node.cte_sources
+        if len(node.join_descs) > 0:
+            return node
+
+        where: Optional[SqlExpressionNode] = (
+            SqlTableAliasSimplifierRewriter._simplify_expr(node.where) if node.where else None
+        )
+        return node.with_new_parts(
+            select_columns=tuple(
+                SqlTableAliasSimplifierRewriter._simplify_select_column(select_column)
+                for select_column in node.select_columns
             ),
-            join_descs=tuple(
-                SqlJoinDescription(
-                    right_source=x.right_source.accept(self),
-                    right_source_alias=x.right_source_alias,
-                    on_condition=x.on_condition,
-                    join_type=x.join_type,
-                )
-                for x in node.join_descs
+            group_bys=tuple(
+                SqlTableAliasSimplifierRewriter._simplify_select_column(group_by) for group_by in node.group_bys
             ),
-            group_bys=node.group_bys,
-            order_bys=node.order_bys,
-            where=node.where,
-            limit=node.limit,
-            distinct=node.distinct,
-        )
-
-    def visit_table_node(self, node: SqlTableNode) -> SqlPlanNode:  # noqa: D102
-        return node
-
-    def visit_query_from_clause_node(self, node: SqlSelectTextNode) -> SqlPlanNode:  # noqa: D102
-        return node
-
-    def visit_create_table_as_node(self, node: SqlCreateTableAsNode) -> SqlPlanNode:  # noqa: D102
-        return SqlCreateTableAsNode.create(
-            sql_table=node.sql_table,
-            parent_node=node.parent_node.accept(self),
+            order_bys=tuple(
+                SqlTableAliasSimplifierRewriter._simplify_order_by(order_by) for order_by in node.order_bys
+            ),
+            where=where,
         )
 
 
@@ -112,4 +89,9 @@ class SqlTableAliasSimplifier(SqlPlanOptimizer):
     """
 
     def optimize(self, node: SqlPlanNode) -> SqlPlanNode:  # noqa: D102
-        return node.accept(SqlTableAliasSimplifierVisitor())
+        return node.accept(SqlSelectNodeRewritingVisitor((SqlTableAliasSimplifierRewriter(),)))
+
+    @property
+    @override
+    def plan_independent_select_node_rewriter(self) -> SqlSelectNodeRewriter:
+        return SqlTableAliasSimplifierRewriter()
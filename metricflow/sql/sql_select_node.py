@@ -102,6 +102,55 @@ class SqlSelectStatementNode(SqlPlanNode):
             distinct=distinct,
         )
 
+    def with_new_parts(
+        self,
+        select_columns: Optional[Tuple[SqlSelectColumn, ...]] = None,
+        from_source: Optional[SqlPlanNode] = None,
+        cte_sources: Optional[Tuple[SqlCteNode, ...]] = None,
+        join_descs: Optional[Tuple[SqlJoinDescription, ...]] = None,
+        group_bys: Optional[Tuple[SqlSelectColumn, ...]] = None,
+        order_bys: Optional[Tuple[SqlOrderByDescription, ...]] = None,
+        where: Optional[SqlExpressionNode] = None,
+    ) -> SqlSelectStatementNode:
+        """Return a node with the given parts replaced, or this node if the given parts are the same as the current ones.
+
+        Parts that are not specified are kept. Since expressions and plan nodes are compared by identity, this is a
+        cheap check, and it allows optimizers to avoid rebuilding sub-trees that were not changed. The WHERE clause
+        can't be removed through this method.
+        """
+        new_select_columns = self.select_columns if select_columns is None else select_columns
+        new_from_source = self.from_source if from_source is None else from_source
+        new_cte_sources = self.cte_sources if cte_sources is None else cte_sources
+        new_join_descs = self.join_descs if join_descs is None else join_descs
+        new_group_bys = self.group_bys if group_bys is None else group_bys
+        new_order_bys = self.order_bys if order_bys is None else order_bys
+        new_where = self.where if where is None else where
+
+        if (
+            new_from_source is self.from_source
+            and new_where is self.where
+            and new_select_columns == self.select_columns
+            and new_cte_sources == self.cte_sources
+            and new_join_descs == self.join_descs
+            and new_group_bys == self.group_bys
+            and new_order_bys == self.order_bys
+        ):
+            return self
+
+        return SqlSelectStatementNode.create(
+            description=self._description,
+            select_columns=new_select_columns,
+            from_source=new_from_source,
+            from_source_alias=self.from_source_alias,
+            cte_sources=new_cte_sources,
+            join_descs=new_join_descs,
+            group_bys=new_group_bys,
+            order_bys=new_order_bys,
+            where=new_where,
+            limit=self.limit,
+            distinct=self.distinct,
+        )
+
     @classmethod
     def id_prefix(cls) -> IdPrefix:  # noqa: D102
         return StaticIdPrefix.SQL_PLAN_SELECT_STATEMENT_ID_PREFIX
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import collections
 import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from functools import partial
-from math import floor
 from time import perf_counter
 from typing import Callable, DefaultDict, Dict, List, Optional, Sequence, Tuple, TypeVar
 
@@ -86,6 +86,9 @@ class DataWarehouseValidationTask:
     description: str
     context: Optional[ValidationContext] = None
     on_fail_subtasks: List[DataWarehouseValidationTask] = field(default_factory=lambda: [])
+    # If set, this creates a query that checks the subtasks at the given indexes of `on_fail_subtasks` together. This
+    # allows the failing subtasks to be found by bisection instead of running every subtask.
+    subtask_group_query_and_params_callable: Optional[Callable[[Sequence[int]], Tuple[str, SqlBindParameterSet]]] = None
 
 
 LinkableInstanceSpecT = TypeVar("LinkableInstanceSpecT", bound=LinkableInstanceSpec)
@@ -130,6 +133,27 @@ class DataWarehouseTaskBuilder:
         rendered_plan = sql_client.sql_plan_renderer.render_sql_plan(sql_plan)
         return (rendered_plan.sql, rendered_plan.bind_parameter_set)
 
+    @classmethod
+    def _renderize_subtask_group(
+        cls,
+        subtask_indexes: Sequence[int],
+        sql_client: SqlClient,
+        plan_converter: DataflowToSqlPlanConverter,
+        plan_id: str,
+        source_node: DataflowPlanNode,
+        subtask_spec_sets: Sequence[InstanceSpecSet],
+    ) -> Tuple[str, SqlBindParameterSet]:
+        """Generates the query that selects the elements of the subtasks at the given indexes."""
+        return cls.renderize(
+            sql_client=sql_client,
+            plan_converter=plan_converter,
+            plan_id=plan_id,
+            nodes=FilterElementsNode.create(
+                parent_node=source_node,
+                include_specs=InstanceSpecSet.merge_iterable(subtask_spec_sets[index] for index in subtask_indexes),
+            ),
+        )
+
     @classmethod
     def gen_semantic_model_tasks(
         cls, manifest: SemanticManifest, semantic_model_filters: Optional[Sequence[str]] = None
@@ -193,13 +217,13 @@ class DataWarehouseTaskBuilder:
             )
 
             spec_filter_tuples = []
+            subtask_spec_sets: List[InstanceSpecSet] = []
             for spec in dimension_specs:
+                subtask_spec_sets.append(InstanceSpecSet(dimension_specs=(spec,)))
                 spec_filter_tuples.append(
                     (
                         spec,
-                        FilterElementsNode.create(
-                            parent_node=source_node, include_specs=InstanceSpecSet(dimension_specs=(spec,))
-                        ),
+                        FilterElementsNode.create(parent_node=source_node, include_specs=subtask_spec_sets[-1]),
                     )
                 )
 
@@ -207,12 +231,11 @@ class DataWarehouseTaskBuilder:
                 dataset.instance_set.spec_set.time_dimension_specs
             )
             for spec in time_dimension_specs:
+                subtask_spec_sets.append(InstanceSpecSet(time_dimension_specs=(spec,)))
                 spec_filter_tuples.append(
                     (
                         spec,
-                        FilterElementsNode.create(
-                            parent_node=source_node, include_specs=InstanceSpecSet(time_dimension_specs=(spec,))
-                        ),
+                        FilterElementsNode.create(parent_node=source_node, include_specs=subtask_spec_sets[-1]),
                     )
                 )
 
@@ -260,6 +283,14 @@ class DataWarehouseTaskBuilder:
                     ),
                     error_message=f"Failed to query dimensions in data warehouse for semantic model `{semantic_model.name}`",
                     on_fail_subtasks=semantic_model_sub_tasks,
+                    subtask_group_query_and_params_callable=partial(
+                        cls._renderize_subtask_group,
+                        sql_client=sql_client,
+                        plan_converter=render_tools.plan_converter,
+                        plan_id=f"{semantic_model.name}_dimension_group_validation",
+                        source_node=source_node,
+                        subtask_spec_sets=tuple(subtask_spec_sets),
+                    ),
                     description=f"Validating all dimensions in semantic_model `{semantic_model.name}`",
                 )
             )
@@ -342,6 +373,14 @@ class DataWarehouseTaskBuilder:
                     ),
                     error_message=f"Failed to query entities in data warehouse for semantic model `{semantic_model.name}`",
                     on_fail_subtasks=semantic_model_sub_tasks,
+                    subtask_group_query_and_params_callable=partial(
+                        cls._renderize_subtask_group,
+                        sql_client=sql_client,
+                        plan_converter=render_tools.plan_converter,
+                        plan_id=f"{semantic_model.name}_entity_group_validation",
+                        source_node=source_node,
+                        subtask_spec_sets=tuple(InstanceSpecSet(entity_specs=(spec,)) for spec in semantic_model_specs),
+                    ),
                     description=f"Validating all entities in semantic_model `{semantic_model.name}`",
                 )
             )
@@ -438,6 +477,18 @@ class DataWarehouseTaskBuilder:
                         ),
                         error_message=f"Failed to query measures in data warehouse for semantic model `{semantic_model.name}`",
                         on_fail_subtasks=source_node_to_sub_task[source_node],
+                        subtask_group_query_and_params_callable=partial(
+                            cls._renderize_subtask_group,
+                            sql_client=sql_client,
+                            plan_converter=render_tools.plan_converter,
+                            plan_id=f"{semantic_model.name}_measure_group_validation",
+                            source_node=source_node,
+                            subtask_spec_sets=tuple(
+                                InstanceSpecSet(measure_specs=(spec,))
+                                for spec in semantic_model_specs
+                                if source_node_by_measure_spec[spec] is source_node
+                            ),
+                        ),
                         description=f"Validating all measures in semantic_model `{semantic_model.name}`",
                     )
                 )
@@ -534,14 +585,31 @@ class DataWarehouseModelValidator:
     them (assuming the manifest has passed these validations before use).
     """
 
-    def __init__(self, sql_client: SqlClient) -> None:  # noqa: D107
+    def __init__(self, sql_client: SqlClient, parallelism: int = 1, task_timeout: Optional[float] = None) -> None:
+        """Initializer.
+
+        Args:
+            sql_client: The client used to run the validation queries. If `parallelism` is greater than 1, the client
+            must support running queries from multiple threads.
+            parallelism: The maximum number of validation queries to run at the same time.
+            task_timeout: An optional timeout in seconds for each validation query. A query that doesn't complete in
+            time is reported as an error.
+        """
+        if parallelism < 1:
+            raise ValueError(f"The parallelism should be at least 1. Got: {parallelism}")
         self._sql_client = sql_client
+        self._parallelism = parallelism
+        self._task_timeout = task_timeout
 
     def run_tasks(
         self, tasks: List[DataWarehouseValidationTask], timeout: Optional[int] = None
     ) -> SemanticManifestValidationResults:
         """Runs the list of tasks as queries agains the data warehouse, returning any found issues.
 
+        The queries are run concurrently based on the configured parallelism, but the issues are returned in the
+        order of the tasks. If a task fails, the failing subtasks are found by bisection if the task supports it, or
+        by running all subtasks otherwise.
+
         Args:
             tasks: A list of tasks to run against the data warehouse
             timeout: An optional timeout. Default is None. When the timeout is hit, function will return early.
@@ -549,36 +617,13 @@ class DataWarehouseModelValidator:
         Returns:
             A list of validation issues discovered when running the passed in tasks against the data warehosue
         """
-        # Used for keeping track if we go past the max time
-        start_time = perf_counter()
-
-        issues: List[ValidationIssue] = []
-        # TODO: Asyncio implementation
-        for index, task in enumerate(tasks):
-            if timeout is not None and perf_counter() - start_time > timeout:
-                issues.append(
-                    ValidationWarning(
-                        context=None,
-                        message=f"Hit timeout before completing all tasks. Completed {index}/{len(tasks)} tasks.",
-                    )
-                )
-                break
-            try:
-                (query_string, query_params) = task.query_and_params_callable()
-                self._sql_client.dry_run(stmt=query_string, sql_bind_parameter_set=query_params)
-            except Exception as e:
-                issues.append(
-                    ValidationError(
-                        context=task.context,
-                        message=task.error_message + f"\nReceived following error from data warehouse:\n{e}",
-                        extra_detail="".join(traceback.format_tb(e.__traceback__)),
-                    )
-                )
-                if task.on_fail_subtasks:
-                    sub_task_timeout = floor(timeout - (perf_counter() - start_time)) if timeout else None
-                    issues += self.run_tasks(tasks=task.on_fail_subtasks, timeout=sub_task_timeout).all_issues
-
-        return SemanticManifestValidationResults.from_issues_sequence(issues)
+        runner = _DataWarehouseTaskRunner(
+            sql_client=self._sql_client,
+            parallelism=self._parallelism,
+            task_timeout=self._task_timeout,
+            deadline=perf_counter() + timeout if timeout is not None else None,
+        )
+        return SemanticManifestValidationResults.from_issues_sequence(runner.run(tasks))
 
     def validate_semantic_models(
         self, manifest: SemanticManifest, timeout: Optional[int] = None
@@ -654,3 +699,182 @@ class DataWarehouseModelValidator:
         """
         tasks = DataWarehouseTaskBuilder.gen_metric_tasks(manifest=manifest, sql_client=self._sql_client)
         return self.run_tasks(tasks=tasks, timeout=timeout)
+
+
+# Used to sort the issues found by the task runner so that they're in the order of the tasks. The key for a subtask is
+# the key of the parent task with the index of the subtask appended.
+_TaskKey = Tuple[int, ...]
+
+
+@dataclass(frozen=True, eq=False)
+class _ValidationQuery:
+    """A query that is run by the `_DataWarehouseTaskRunner`.
+
+    Attributes:
+        task_key: The key of the task that the query is for.
+        task: The task that the query is for.
+        subtask_indexes: If set, the query checks these subtasks of the task together as a step of bisection.
+    """
+
+    task_key: _TaskKey
+    task: DataWarehouseValidationTask
+    subtask_indexes: Optional[Tuple[int, ...]] = None
+
+
+class _DataWarehouseTaskRunner:
+    """Runs data warehouse validation tasks concurrently using a thread pool.
+
+    Queries are rendered in the calling thread as query rendering is not thread-safe, so only the dry runs are run in
+    the pool. A dry run that exceeds the task timeout can't be interrupted, so it's reported as an error and the result
+    is ignored.
+    """
+
+    def __init__(  # noqa: D107
+        self, sql_client: SqlClient, parallelism: int, task_timeout: Optional[float], deadline: Optional[float]
+    ) -> None:
+        self._sql_client = sql_client
+        self._parallelism = parallelism
+        self._task_timeout = task_timeout
+        self._deadline = deadline
+        self._key_to_issues: DefaultDict[_TaskKey, List[ValidationIssue]] = collections.defaultdict(list)
+        self._future_to_query: Dict[Future[None], _ValidationQuery] = {}
+        # Set by the worker thread when the dry run starts.
+        self._query_to_start_time: Dict[_ValidationQuery, float] = {}
+
+    def run(self, tasks: Sequence[DataWarehouseValidationTask]) -> Sequence[ValidationIssue]:
+        """Run the tasks and return the issues that were found, in the order of the tasks."""
+        completed_task_count = 0
+        executor = ThreadPoolExecutor(max_workers=self._parallelism, thread_name_prefix="mf_dw_validation")
+        try:
+            for index, task in enumerate(tasks):
+                if not self._submit(executor, _ValidationQuery(task_key=(index,), task=task)):
+                    completed_task_count += 1
+
+            while len(self._future_to_query) > 0:
+                if self._deadline is not None and perf_counter() > self._deadline:
+                    self._key_to_issues[(len(tasks),)].append(
+                        ValidationWarning(
+                            context=None,
+                            message=f"Hit timeout before completing all tasks. Completed {completed_task_count}/"
+                            f"{len(tasks)} tasks.",
+                        )
+                    )
+                    break
+
+                done_futures, _ = wait(self._future_to_query, timeout=self._wait_timeout(), return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    query = self._future_to_query.pop(future)
+                    if len(query.task_key) == 1 and query.subtask_indexes is None:
+                        completed_task_count += 1
+                    exception = future.exception()
+                    if exception is not None:
+                        self._handle_failure(executor, query, exception)
+
+                for future, query in tuple(self._future_to_query.items()):
+                    if self._has_timed_out(query):
+                        self._future_to_query.pop(future)
+                        if len(query.task_key) == 1 and query.subtask_indexes is None:
+                            completed_task_count += 1
+                        self._handle_timeout(executor, query)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return tuple(issue for key in sorted(self._key_to_issues) for issue in self._key_to_issues[key])
+
+    def _submit(self, executor: ThreadPoolExecutor, query: _ValidationQuery) -> bool:
+        """Render the query and submit the dry run. Returns false if the query couldn't be rendered."""
+        try:
+            if query.subtask_indexes is None:
+                query_string, query_params = query.task.query_and_params_callable()
+            else:
+                assert query.task.subtask_group_query_and_params_callable is not None
+                query_string, query_params = query.task.subtask_group_query_and_params_callable(query.subtask_indexes)
+        except Exception as e:
+            self._handle_failure(executor, query, e)
+            return False
+
+        future = executor.submit(self._dry_run, query, query_string, query_params)
+        self._future_to_query[future] = query
+        return True
+
+    def _dry_run(self, query: _ValidationQuery, query_string: str, query_params: SqlBindParameterSet) -> None:
+        self._query_to_start_time[query] = perf_counter()
+        self._sql_client.dry_run(stmt=query_string, sql_bind_parameter_set=query_params)
+
+    def _has_timed_out(self, query: _ValidationQuery) -> bool:
+        if self._task_timeout is None:
+            return False
+        start_time = self._query_to_start_time.get(query)
+        return start_time is not None and perf_counter() - start_time > self._task_timeout
+
+    def _wait_timeout(self) -> Optional[float]:
+        """Return how long to wait for a query to complete before the timeouts need to be checked again."""
+        current_time = perf_counter()
+        wait_timeouts: List[float] = []
+        if self._deadline is not None:
+            wait_timeouts.append(self._deadline - current_time)
+        if self._task_timeout is not None:
+            # A query that starts while waiting can't time out before this.
+            wait_timeouts.append(self._task_timeout)
+            for query in self._future_to_query.values():
+                start_time = self._query_to_start_time.get(query)
+                if start_time is not None:
+                    wait_timeouts.append(start_time + self._task_timeout - current_time)
+        if len(wait_timeouts) == 0:
+            return None
+        return max(0.0, min(wait_timeouts))
+
+    def _handle_failure(self, executor: ThreadPoolExecutor, query: _ValidationQuery, exception: BaseException) -> None:
+        if query.subtask_indexes is not None:
+            # The parent task already reported an error, so continue the bisection.
+            self._check_subtasks(executor, query.task_key, query.task, query.subtask_indexes)
+            return
+
+        task = query.task
+        self._key_to_issues[query.task_key].append(
+            ValidationError(
+                context=task.context,
+                message=task.error_message + f"\nReceived following error from data warehouse:\n{exception}",
+                extra_detail="".join(traceback.format_tb(exception.__traceback__)),
+            )
+        )
+        if task.on_fail_subtasks:
+            self._check_subtasks(executor, query.task_key, task, tuple(range(len(task.on_fail_subtasks))))
+
+    def _handle_timeout(self, executor: ThreadPoolExecutor, query: _ValidationQuery) -> None:
+        if query.subtask_indexes is not None:
+            # Smaller groups might not time out.
+            self._check_subtasks(executor, query.task_key, query.task, query.subtask_indexes)
+            return
+
+        task = query.task
+        self._key_to_issues[query.task_key].append(
+            ValidationError(
+                context=task.context,
+                message=task.error_message
+                + f"\nThe query did not complete within the timeout of {self._task_timeout}s.",
+            )
+        )
+
+    def _check_subtasks(
+        self,
+        executor: ThreadPoolExecutor,
+        task_key: _TaskKey,
+        task: DataWarehouseValidationTask,
+        subtask_indexes: Tuple[int, ...],
+    ) -> None:
+        """Submit queries to find the failing subtasks at the given indexes, which are known to fail as a group."""
+        if task.subtask_group_query_and_params_callable is None or len(subtask_indexes) == 1:
+            subtask_groups: Tuple[Tuple[int, ...], ...] = tuple((index,) for index in subtask_indexes)
+        else:
+            middle = len(subtask_indexes) // 2
+            subtask_groups = (subtask_indexes[:middle], subtask_indexes[middle:])
+
+        for subtask_group in subtask_groups:
+            if len(subtask_group) == 1:
+                index = subtask_group[0]
+                self._submit(
+                    executor, _ValidationQuery(task_key=task_key + (index,), task=task.on_fail_subtasks[index])
+                )
+            else:
+                self._submit(executor, _ValidationQuery(task_key=task_key, task=task, subtask_indexes=subtask_group))
@@ -16,6 +16,8 @@ from typing_extensions import TextIO
 
 from dbt_metricflow.cli.cli_configuration import CLIConfiguration
 from dbt_metricflow.cli.main import (
+    build_index_snapshot,
+    cache_stats,
     dimension_values,
     dimensions,
     entities,
@@ -188,6 +190,16 @@ class ExecutorProcessMainFunction:
                 formatted_exception=formatted_exception,
                 executor_process_log_path=self._starting_parameter_set.log_file_path,
             )
+        elif parameter_set.command_enum is IsolatedCliCommandEnum.MF_BUILD_INDEX_SNAPSHOT:
+            return self._run_mf_cli_command(
+                parameter_set=parameter_set,
+                click_command=build_index_snapshot,
+            )
+        elif parameter_set.command_enum is IsolatedCliCommandEnum.MF_CACHE_STATS:
+            return self._run_mf_cli_command(
+                parameter_set=parameter_set,
+                click_command=cache_stats,
+            )
         elif parameter_set.command_enum is IsolatedCliCommandEnum.MF_DIMENSIONS:
             return self._run_mf_cli_command(
                 parameter_set=parameter_set,
@@ -18,6 +18,8 @@ class IsolatedCliCommandEnum(Enum):
     # `dbt ...` commands
     DBT_BUILD = "dbt_build"
     # `mf ...` commands
+    MF_BUILD_INDEX_SNAPSHOT = "mf_build_index_snapshot"
+    MF_CACHE_STATS = "mf_cache_stats"
     MF_DIMENSIONS = "mf_dimensions"
     MF_DIMENSION_VALUES = "mf_dimension_values"
     MF_ENTITIES = "mf_entities"
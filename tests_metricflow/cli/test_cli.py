@@ -17,6 +17,7 @@ from typing import Iterator
 import pytest
 from _pytest.fixtures import FixtureRequest
 from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.model.semantics.linkable_spec_index_snapshot import LinkableSpecIndexSnapshot
 from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfiguration
 
 from dbt_metricflow.cli.cli_configuration import CLIConfiguration
@@ -367,3 +368,29 @@ def test_csv(
                     snapshot_str=csv_file_contents,
                     expectation_description="A CSV file containing the values for 2 metrics.",
                 )
+
+
+@pytest.mark.slow
+def test_build_index_snapshot(cli_runner: IsolatedCliCommandRunner) -> None:
+    """Tests that the command writes a snapshot containing the index for the project."""
+    with tempfile.TemporaryDirectory() as snapshot_directory:
+        snapshot_path = Path(snapshot_directory, "index.bin")
+        result = cli_runner.run_command(
+            command_enum=IsolatedCliCommandEnum.MF_BUILD_INDEX_SNAPSHOT,
+            command_args=["--output", str(snapshot_path)],
+        )
+        result.raise_exception_on_failure()
+        snapshot = LinkableSpecIndexSnapshot.read(snapshot_path)
+        assert "transactions" in snapshot.linkable_spec_index.metric_to_linkable_element_sets
+
+
+@pytest.mark.slow
+def test_cache_stats(cli_runner: IsolatedCliCommandRunner) -> None:
+    """Tests that the command shows the stats of the caches used to generate the SQL."""
+    result = cli_runner.run_command(
+        command_enum=IsolatedCliCommandEnum.MF_CACHE_STATS,
+        command_args=["--metrics", "transactions", "--group-by", "metric_time", "--repeat", "2"],
+    )
+    result.raise_exception_on_failure()
+    assert "DataflowPlanBuilderCache.build_any_metric_output_node" in result.output
+    assert "Hit Rate" in result.output
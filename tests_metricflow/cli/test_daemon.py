@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import importlib.metadata
+import json
+import socket
+import stat
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import pytest
+from click.testing import CliRunner
+from update_checker import UpdateChecker
+
+from dbt_metricflow.cli import PACKAGE_NAME
+from dbt_metricflow.cli.cli_configuration import CLIConfiguration
+from dbt_metricflow.cli.daemon import DaemonCommandResult, MetricFlowDaemon, run_command_using_daemon
+from dbt_metricflow.cli.main import cli
+from tests_metricflow.fixtures.setup_fixtures import dbt_project_dir
+
+
+@pytest.fixture
+def cli_without_update_check(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Avoid the network request for the update check, and the version lookup that needs the package installed."""
+    original_version_function = importlib.metadata.version
+    monkeypatch.setattr(
+        importlib.metadata,
+        "version",
+        lambda distribution_name: "0.0.0"
+        if distribution_name == PACKAGE_NAME
+        else original_version_function(distribution_name),
+    )
+    monkeypatch.setattr(UpdateChecker, "check", lambda self, package_name, package_version: None)
+
+
+def _run_with_daemon(cfg: CLIConfiguration, socket_path: Path, run_client: Callable[[], None]) -> None:
+    """Run the daemon for the test dbt project until `run_client` returns."""
+
+    def _run_client() -> None:
+        try:
+            while run_command_using_daemon(socket_path, args=None) is None:
+                time.sleep(0.01)
+            run_client()
+        finally:
+            run_command_using_daemon(socket_path, args=None, stop=True)
+
+    client_thread = threading.Thread(target=_run_client)
+    client_thread.start()
+    MetricFlowDaemon(
+        cfg=cfg, cli=cli, socket_path=socket_path, dbt_project_path=Path(dbt_project_dir())
+    ).serve_forever()
+    client_thread.join()
+    assert not socket_path.exists()
+
+
+def test_run_commands_using_daemon(  # noqa: D103
+    cli_context: CLIConfiguration, cli_without_update_check: None, tmp_path: Path
+) -> None:
+    socket_path = tmp_path.joinpath("mf.sock")
+    daemon_results: List[Optional[DaemonCommandResult]] = []
+    forwarded_outputs: List[str] = []
+    socket_modes: List[int] = []
+
+    def _run_client() -> None:
+        socket_modes.append(stat.S_IMODE(socket_path.stat().st_mode))
+        daemon_results.append(
+            run_command_using_daemon(socket_path, args=["list", "metrics"], dbt_project_path=Path(dbt_project_dir()))
+        )
+        # A configuration that's not set up should forward the command to the daemon.
+        forwarded_outputs.append(
+            CliRunner()
+            .invoke(
+                cli,
+                ["list", "metrics"],
+                obj=CLIConfiguration(),
+                env={
+                    CLIConfiguration.DAEMON_SOCKET_PATH_ENV_VAR_NAME: str(socket_path),
+                    CLIConfiguration.DBT_PROJECT_DIR_ENV_VAR_NAME: dbt_project_dir(),
+                },
+            )
+            .output
+        )
+
+    _run_with_daemon(cli_context, socket_path, _run_client)
+
+    assert socket_modes == [0o600]
+    assert len(daemon_results) == 1
+    daemon_result = daemon_results[0]
+    assert daemon_result is not None
+    assert daemon_result.exit_code == 0
+    assert "bookings" in daemon_result.output
+    assert forwarded_outputs == [daemon_result.output]
+
+
+def test_reject_command_for_another_project(  # noqa: D103
+    cli_context: CLIConfiguration, cli_without_update_check: None, tmp_path: Path
+) -> None:
+    socket_path = tmp_path.joinpath("mf.sock")
+    daemon_results: List[Optional[DaemonCommandResult]] = []
+
+    def _run_client() -> None:
+        daemon_results.append(
+            run_command_using_daemon(socket_path, args=["list", "metrics"], dbt_project_path=tmp_path)
+        )
+
+    _run_with_daemon(cli_context, socket_path, _run_client)
+
+    # The client should run the command in its own process.
+    assert daemon_results == [None]
+
+
+def test_invalid_request(  # noqa: D103
+    cli_context: CLIConfiguration, cli_without_update_check: None, tmp_path: Path
+) -> None:
+    socket_path = tmp_path.joinpath("mf.sock")
+    responses: List[str] = []
+
+    def _run_client() -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+            client_socket.connect(str(socket_path))
+            with client_socket.makefile("rwb") as socket_file:
+                socket_file.write(b"{}\n")
+                socket_file.flush()
+                responses.append(socket_file.readline().decode("utf-8"))
+
+    _run_with_daemon(cli_context, socket_path, _run_client)
+
+    assert len(responses) == 1
+    response = json.loads(responses[0])
+    assert response["exit_code"] == 1
+    assert "unable to run the command" in response["output"]
@@ -124,3 +124,49 @@ def test_joined_node_data_set(
         set_id="result0",
         spec_set=join_node_output_data_set.instance_set.spec_set,
     )
+
+
+def test_output_data_set_cache(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture],
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+) -> None:
+    """Tests that the outputs of query-time nodes are evicted while the outputs of pre-cached nodes are kept."""
+    resolver = DataflowNodeToSqlSubqueryVisitor(
+        column_association_resolver=DunderColumnAssociationResolver(),
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        output_data_set_cache=DataflowNodeToSqlSubqueryVisitor.create_output_data_set_cache(max_items=1),
+    )
+    read_node_mapping = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].read_node_mapping
+    revenue_node = read_node_mapping["revenue"]
+    users_node = read_node_mapping["users_latest"]
+    resolver.cache_output_data_sets((revenue_node, users_node))
+
+    join_nodes = tuple(
+        JoinOnEntitiesNode.create(
+            left_node=left_node,
+            join_targets=[
+                JoinDescription(
+                    join_node=users_node,
+                    join_on_entity=LinklessEntitySpec.from_element_name("user"),
+                    join_on_partition_dimensions=(),
+                    join_on_partition_time_dimensions=(),
+                    join_type=join_type,
+                )
+            ],
+        )
+        for left_node, join_type in ((revenue_node, SqlJoinType.LEFT_OUTER), (revenue_node, SqlJoinType.INNER))
+    )
+    for join_node in join_nodes:
+        resolver.get_output_data_set(join_node)
+
+    stats = resolver.output_data_set_cache_stats
+    assert stats.pinned_item_count == 2
+    assert stats.item_count == 3
+    assert stats.eviction_count == 1
+    assert stats.estimated_size_bytes > 0
+
+    # The pre-cached nodes should still be available.
+    miss_count = stats.miss_count
+    resolver.get_output_data_set(revenue_node)
+    resolver.get_output_data_set(users_node)
+    assert resolver.output_data_set_cache_stats.miss_count == miss_count
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 from dbt_semantic_interfaces.references import EntityReference, SemanticModelReference
+from metricflow_semantics.instances import InstanceSet
 from metricflow_semantics.specs.dimension_spec import DimensionSpec
 from metricflow_semantics.specs.metric_spec import MetricSpec
 from metricflow_semantics.specs.query_spec import MetricFlowQuerySpec
+from metricflow_semantics.sql.sql_table import SqlTable
 
 from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.dataflow_plan import DataflowPlan, DataflowPlanNode
+from metricflow.dataflow.dataflow_plan_analyzer import DataflowPlanAnalyzer
+from metricflow.dataflow.nodes.combine_aggregated_outputs import CombineAggregatedOutputsNode
+from metricflow.dataflow.nodes.read_sql_source import ReadSqlSourceNode
+from metricflow.dataset.sql_dataset import SqlDataSet
+from metricflow.plan_conversion.to_sql_plan.dataflow_to_sql import DataflowToSqlPlanConverter
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.sql.sql_table_node import SqlTableNode
 
 
 def test_source_semantic_models_accessor(
@@ -51,3 +61,81 @@ def test_multi_hop_joined_source_semantic_models_accessor(
             SemanticModelReference(semantic_model_name="users_latest"),
         ]
     )
+
+
+def test_structural_hash_of_separately_built_plans(
+    dataflow_plan_builder: DataflowPlanBuilder,
+) -> None:
+    """Tests that plans built separately for the same query have the same structure, but different node IDs."""
+    query_spec = MetricFlowQuerySpec(
+        metric_specs=(MetricSpec(element_name="bookings"), MetricSpec(element_name="bookings_per_booker")),
+        dimension_specs=(DimensionSpec(element_name="country_latest", entity_links=(EntityReference("listing"),)),),
+    )
+    sink_node = dataflow_plan_builder.build_plan(query_spec).sink_node
+    other_sink_node = dataflow_plan_builder.build_plan(query_spec).sink_node
+
+    assert sink_node.node_id != other_sink_node.node_id
+    assert sink_node.structural_hash == other_sink_node.structural_hash
+    assert sink_node.structurally_identical(other_sink_node)
+
+    different_sink_node = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(metric_specs=(MetricSpec(element_name="bookings"),))
+    ).sink_node
+    assert sink_node.structural_hash != different_sink_node.structural_hash
+    assert not sink_node.structurally_identical(different_sink_node)
+
+
+def test_structural_hash_of_separately_converted_sql_plans(
+    dataflow_plan_builder: DataflowPlanBuilder,
+    dataflow_to_sql_converter: DataflowToSqlPlanConverter,
+    sql_client: SqlClient,
+) -> None:
+    """Tests that SQL plans converted from separately built dataflow plans have the same structure."""
+    query_spec = MetricFlowQuerySpec(metric_specs=(MetricSpec(element_name="bookings"),))
+    sql_node, other_sql_node = (
+        dataflow_to_sql_converter.convert_to_sql_plan(
+            sql_engine_type=sql_client.sql_engine_type,
+            dataflow_plan_node=dataflow_plan_builder.build_plan(query_spec).sink_node,
+        ).sql_plan.render_node
+        for _ in range(2)
+    )
+
+    assert sql_node.node_id != other_sql_node.node_id
+    assert sql_node.structurally_identical(other_sql_node)
+
+
+def test_structural_hash_of_source_nodes() -> None:
+    """Tests that source nodes that read from different tables have different structural hashes."""
+
+    def _create_source_node(table_name: str) -> ReadSqlSourceNode:
+        return ReadSqlSourceNode.create(
+            SqlDataSet(
+                instance_set=InstanceSet(),
+                sql_node=SqlTableNode.create(SqlTable(schema_name="demo", table_name=table_name)),
+            )
+        )
+
+    bookings_source_node = _create_source_node("fct_bookings")
+    assert bookings_source_node.structural_hash == _create_source_node("fct_bookings").structural_hash
+    assert bookings_source_node.structural_hash != _create_source_node("fct_views").structural_hash
+
+
+def test_traversal_of_shared_nodes(
+    dataflow_plan_builder: DataflowPlanBuilder,
+) -> None:
+    """Tests plan operations on a deep chain of diamonds, which has an exponential number of paths to the source."""
+    base_plan = dataflow_plan_builder.build_plan(
+        MetricFlowQuerySpec(metric_specs=(MetricSpec(element_name="bookings"),))
+    )
+    diamond_count = 64
+    node: DataflowPlanNode = base_plan.sink_node
+    for _ in range(diamond_count):
+        node = CombineAggregatedOutputsNode.create(parent_nodes=(node, node))
+    dataflow_plan = DataflowPlan(sink_nodes=(node,))
+
+    assert dataflow_plan.unique_node_count == base_plan.unique_node_count + diamond_count
+    # Each diamond doubles the number of paths to the nodes above it.
+    assert dataflow_plan.node_count == 2**diamond_count * (base_plan.node_count + 1) - 1
+    assert dataflow_plan.source_semantic_models == base_plan.source_semantic_models
+    assert DataflowPlanAnalyzer.find_common_branches(dataflow_plan) == (node.parent_nodes[0],)
+    assert node.structural_hash != node.parent_nodes[0].structural_hash
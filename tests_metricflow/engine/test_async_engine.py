@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import time
+from typing import Mapping, Sequence, Tuple
+
+import pytest
+from dbt.adapters.duckdb.connections import DuckDBConnectionManager
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.specs.dunder_column_association_resolver import DunderColumnAssociationResolver
+from metricflow_semantics.test_helpers.time_helpers import ConfigurableTimeSource
+
+from metricflow.data_table.mf_table import CellValue, MetricFlowDataTable
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.execution.query_result_cache import QueryResultCache
+from metricflow.protocols.sql_client import SqlClient
+from tests_metricflow.fixtures.manifest_fixtures import MetricFlowEngineTestFixture, SemanticManifestSetup
+from tests_metricflow.fixtures.sql_clients.duckdb_async_sql_client import DuckDbAsyncSqlClient
+
+
+@pytest.fixture
+def async_sql_client(sql_client: SqlClient, create_source_tables: bool) -> DuckDbAsyncSqlClient:
+    """An async client that uses the same database as the test SQL client."""
+    connection = DuckDBConnectionManager.env().conn  # type: ignore[attr-defined]
+    assert connection is not None
+    return DuckDbAsyncSqlClient(connection)
+
+
+def _normalized_rows(data_table: MetricFlowDataTable) -> Sequence[Tuple[CellValue, ...]]:
+    """Return the sorted rows with numbers as floats, since the clients can return different numeric types."""
+    return sorted(
+        (
+            tuple(
+                float(cell) if isinstance(cell, (int, float)) and not isinstance(cell, bool) else cell for cell in row
+            )
+            for row in data_table.rows
+        ),
+        key=str,
+    )
+
+
+@pytest.mark.duckdb_only
+def test_aquery(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    async_sql_client: DuckDbAsyncSqlClient,
+) -> None:
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+        async_sql_client=async_sql_client,
+    )
+    requests = (
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings", "booking_value"), group_by_names=("metric_time__month",)
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=("listings",), group_by_names=("user",)),
+    )
+
+    async def _run_queries() -> Sequence[MetricFlowDataTable]:
+        results = await asyncio.gather(*(mf_engine.aquery(request) for request in requests))
+        data_tables = []
+        for result in results:
+            assert result.result_df is not None
+            data_tables.append(result.result_df)
+        return data_tables
+
+    for request, async_result in zip(requests, asyncio.run(_run_queries())):
+        result = mf_engine.query(request)
+        assert result.result_df is not None
+        assert async_result.column_names == result.result_df.column_names
+        assert async_result.row_count > 0
+        assert _normalized_rows(async_result) == _normalized_rows(result.result_df)
+
+
+@pytest.mark.duckdb_only
+def test_aquery_with_time_partitioned_refresh(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    async_sql_client: DuckDbAsyncSqlClient,
+) -> None:
+    query_result_cache = QueryResultCache(
+        time_source=ConfigurableTimeSource(datetime.datetime(2020, 1, 1)), time_partitioned_refresh=True
+    )
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+        async_sql_client=async_sql_client,
+        query_result_cache=query_result_cache,
+    )
+    request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=("bookings",), group_by_names=("metric_time__day",)
+    )
+    expected_result = mf_engine.query(request).result_df
+    assert expected_result is not None
+    query_result_cache.clear()
+
+    # The first query stores the result, and the second one only queries the latest bucket.
+    for expected_refresh_count in (0, 1):
+        async_result = asyncio.run(mf_engine.aquery(request)).result_df
+        assert async_result is not None
+        assert _normalized_rows(async_result) == _normalized_rows(expected_result)
+        assert query_result_cache.stats.time_partitioned_refresh_count == expected_refresh_count
+
+
+def test_aexplain(  # noqa: D103
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture]
+) -> None:
+    mf_engine = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].metricflow_engine
+    request = MetricFlowQueryRequest.create_with_random_request_id(saved_query_name="p0_booking")
+    async_explain_result = asyncio.run(mf_engine.aexplain(request))
+    assert async_explain_result.sql_statement.sql == mf_engine.explain(request).sql_statement.sql
+
+
+@pytest.mark.duckdb_only
+def test_cancellation_interrupts_query(async_sql_client: DuckDbAsyncSqlClient) -> None:
+    """Tests that cancelling the awaiting task stops the query in DuckDB."""
+
+    async def _cancel_query() -> None:
+        query_task = asyncio.create_task(async_sql_client.query("SELECT SUM(i) FROM range(1000000000000) t(i)"))
+        await asyncio.sleep(0.5)
+        query_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await query_task
+
+    start_time = time.perf_counter()
+    asyncio.run(_cancel_query())
+    # Without the interrupt, the query would run for much longer.
+    assert time.perf_counter() - start_time < 10
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.specs.dunder_column_association_resolver import DunderColumnAssociationResolver
+from metricflow_semantics.test_helpers.time_helpers import ConfigurableTimeSource
+from metricflow_semantics.time.time_constants import ISO8601_PYTHON_FORMAT
+
+from metricflow.engine.compiled_query_cache import CompiledQueryCache, CompiledQueryCacheStats, create_canonical_text
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.protocols.sql_client import SqlClient
+
+_START_TIME = datetime.datetime.strptime("2020-01-01", ISO8601_PYTHON_FORMAT)
+
+
+def _create_engine(
+    semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    time_source: ConfigurableTimeSource,
+    disk_cache_path: Optional[Path] = None,
+    entry_ttl: Optional[datetime.timedelta] = None,
+) -> MetricFlowEngine:
+    return MetricFlowEngine(
+        semantic_manifest_lookup=semantic_manifest_lookup,
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+        time_source=time_source,
+        compiled_query_cache=CompiledQueryCache(
+            time_source=time_source, disk_cache_path=disk_cache_path, entry_ttl=entry_ttl
+        ),
+    )
+
+
+def _create_request() -> MetricFlowQueryRequest:
+    return MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=("bookings", "booking_value"),
+        group_by_names=("metric_time",),
+        where_constraints=("{{ Dimension('booking__is_instant') }}",),
+    )
+
+
+def test_memory_cache_hit(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup, sql_client: SqlClient
+) -> None:
+    mf_engine = _create_engine(simple_semantic_manifest_lookup, sql_client, ConfigurableTimeSource(_START_TIME))
+    compiled_query_cache = mf_engine.compiled_query_cache
+    assert compiled_query_cache is not None
+
+    first_result = mf_engine.explain(_create_request())
+    # The request ID differs between the requests, but it should not be a part of the key.
+    second_result = mf_engine.explain(_create_request())
+
+    assert second_result.sql_statement == first_result.sql_statement
+    assert second_result.query_spec == first_result.query_spec
+    # The first request is looked up using the request and then using the dataflow plan.
+    assert compiled_query_cache.stats == CompiledQueryCacheStats(memory_hit_count=1, disk_hit_count=0, miss_count=2)
+
+    mf_engine.explain(MetricFlowQueryRequest.create_with_random_request_id(metric_names=("bookings",)))
+    assert compiled_query_cache.stats.miss_count == 4
+    assert mf_engine.get_process_cache_report().get_entry("CompiledQueryCache.memory").stats.item_count >= 2
+
+
+def test_disk_cache_shared_between_engines(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    create_source_tables: bool,
+    tmp_path: Path,
+) -> None:
+    disk_cache_path = tmp_path.joinpath("compiled_query_cache.sqlite")
+    first_engine = _create_engine(
+        simple_semantic_manifest_lookup, sql_client, ConfigurableTimeSource(_START_TIME), disk_cache_path
+    )
+    second_engine = _create_engine(
+        simple_semantic_manifest_lookup, sql_client, ConfigurableTimeSource(_START_TIME), disk_cache_path
+    )
+    first_result = first_engine.explain(_create_request())
+    second_result = second_engine.explain(_create_request())
+
+    assert second_result.sql_statement == first_result.sql_statement
+    assert second_engine.compiled_query_cache is not None
+    assert second_engine.compiled_query_cache.stats == CompiledQueryCacheStats(
+        memory_hit_count=0, disk_hit_count=1, miss_count=0
+    )
+
+    # The executed query should be the same as one generated without the cache.
+    result = second_engine.query(_create_request())
+    assert result.result_df is not None
+    assert result.result_df.row_count > 0
+
+
+def test_expired_entries(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup, sql_client: SqlClient
+) -> None:
+    time_source = ConfigurableTimeSource(_START_TIME)
+    mf_engine = _create_engine(
+        simple_semantic_manifest_lookup, sql_client, time_source, entry_ttl=datetime.timedelta(minutes=5)
+    )
+    compiled_query_cache = mf_engine.compiled_query_cache
+    assert compiled_query_cache is not None
+
+    mf_engine.explain(_create_request())
+    time_source.set_time(_START_TIME + datetime.timedelta(minutes=1))
+    mf_engine.explain(_create_request())
+    time_source.set_time(_START_TIME + datetime.timedelta(minutes=10))
+    mf_engine.explain(_create_request())
+
+    assert compiled_query_cache.stats == CompiledQueryCacheStats(memory_hit_count=1, disk_hit_count=0, miss_count=4)
+
+
+def test_structurally_identical_dataflow_plan(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup, sql_client: SqlClient
+) -> None:
+    mf_engine = _create_engine(simple_semantic_manifest_lookup, sql_client, ConfigurableTimeSource(_START_TIME))
+    compiled_query_cache = mf_engine.compiled_query_cache
+    assert compiled_query_cache is not None
+
+    first_result = mf_engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings",), group_by_names=("metric_time",)
+        )
+    )
+    # A different request that resolves to the same query, so the SQL is found using the dataflow plan.
+    second_result = mf_engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings",), group_by_names=("metric_time__day",)
+        )
+    )
+
+    assert second_result.sql_statement == first_result.sql_statement
+    assert compiled_query_cache.stats == CompiledQueryCacheStats(memory_hit_count=1, disk_hit_count=0, miss_count=3)
+
+
+def test_canonical_text_of_unsupported_type() -> None:  # noqa: D103
+    assert create_canonical_text({"b": frozenset((2, 1)), "a": None}) == "{'a': None, 'b': {1, 2}}"
+    with pytest.raises(TypeError):
+        create_canonical_text(object())
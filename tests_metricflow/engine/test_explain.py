@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Mapping, Sequence
 
 import pytest
 from _pytest.fixtures import FixtureRequest
+from metricflow_semantics.dag.id_prefix import DynamicIdPrefix
+from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
 from metricflow_semantics.mf_logging.pretty_print import PrettyFormatDictOption, mf_pformat_dict
 from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfiguration
 
@@ -41,6 +44,48 @@ def test_concurrent_explain_consistency(
             assert result == results[0], "Expected only one unique result / results to be the same"
 
 
+def test_concurrent_explain_of_different_queries(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture]
+) -> None:
+    """Tests that different queries running concurrently in threads and tasks generate the same SQL as sequential runs."""
+    mf_engine = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].metricflow_engine
+    requests = (
+        MetricFlowQueryRequest.create_with_random_request_id(saved_query_name="p0_booking"),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings", "booking_value"), group_by_names=("metric_time__month",)
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=("listings",), group_by_names=("user",)),
+    )
+    expected_sqls = [mf_engine.explain(request).sql_statement.sql for request in requests]
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        futures: Sequence[Future] = [
+            executor.submit(mf_engine.explain, request) for _ in range(4) for request in requests
+        ]
+        thread_sqls = [future.result().sql_statement.sql for future in futures]
+    assert thread_sqls == expected_sqls * 4
+
+    async def _explain_in_tasks() -> Sequence[str]:
+        explain_results = await asyncio.gather(
+            *(asyncio.to_thread(mf_engine.explain, request) for _ in range(4) for request in requests)
+        )
+        return [explain_result.sql_statement.sql for explain_result in explain_results]
+
+    assert asyncio.run(_explain_in_tasks()) == expected_sqls * 4
+
+
+def test_explain_does_not_change_caller_id_numbering(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture]
+) -> None:
+    """Tests that the numbering of IDs generated by the caller is not affected by queries."""
+    mf_engine = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].metricflow_engine
+    id_prefix = DynamicIdPrefix("test")
+    with SequentialIdGenerator.id_number_space(100):
+        assert SequentialIdGenerator.create_next_id(id_prefix).index == 100
+        _explain_one_query(mf_engine)
+        assert SequentialIdGenerator.create_next_id(id_prefix).index == 101
+
+
 @pytest.mark.sql_engine_snapshot
 @pytest.mark.duckdb_only
 def test_optimization_level(
@@ -77,3 +122,19 @@ def test_optimization_level(
         ),
         expectation_description=f"The result for {SqlOptimizationLevel.O5} should be SQL uses a CTE.",
     )
+
+
+def test_cache_report(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture]
+) -> None:
+    """Tests that generating the SQL for a query is reflected in the stats of the caches."""
+    mf_engine = mf_engine_test_fixture_mapping[SemanticManifestSetup.SIMPLE_MANIFEST].metricflow_engine
+    cache_name = "DataflowPlanBuilderCache.find_source_node_recipe"
+    hit_count_before = mf_engine.get_process_cache_report().get_entry(cache_name).stats.hit_count
+    _explain_one_query(mf_engine)
+    _explain_one_query(mf_engine)
+
+    cache_report = mf_engine.get_process_cache_report(include_size_estimates=True)
+    assert cache_report.get_entry(cache_name).stats.hit_count > hit_count_before
+    assert cache_report.get_entry(cache_name).stats.estimated_size_bytes > 0
+    assert "DataflowNodeToSqlSubqueryVisitor.output_data_set" in cache_report.cache_names
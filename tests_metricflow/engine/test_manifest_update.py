@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from dbt_semantic_interfaces.call_parameter_sets import DimensionCallParameterSet
+from dbt_semantic_interfaces.implementations.elements.dimension import PydanticDimension
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from dbt_semantic_interfaces.type_enums import DimensionType
+from metricflow_semantics.errors.error_classes import InvalidQueryException
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.query.group_by_item.filter_spec_resolution.filter_pattern_factory import (
+    DefaultWhereFilterPatternFactory,
+)
+from metricflow_semantics.query.query_parser import MetricFlowQueryParser
+from metricflow_semantics.specs.dunder_column_association_resolver import DunderColumnAssociationResolver
+from metricflow_semantics.specs.patterns.spec_pattern import SpecPattern
+from typing_extensions import override
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.protocols.sql_client import SqlClient
+
+
+class _RecordingWhereFilterPatternFactory(DefaultWhereFilterPatternFactory):
+    """Records the dimensions in filters to check that the factory is used."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.dimension_names: List[str] = []
+
+    @override
+    def create_for_dimension_call_parameter_set(
+        self, dimension_call_parameter_set: DimensionCallParameterSet
+    ) -> SpecPattern:
+        self.dimension_names.append(dimension_call_parameter_set.dimension_reference.element_name)
+        return super().create_for_dimension_call_parameter_set(dimension_call_parameter_set)
+
+
+def _updated_semantic_manifest(semantic_manifest: PydanticSemanticManifest) -> PydanticSemanticManifest:
+    """Return a copy of the manifest with a dimension added to `listings_latest`."""
+    updated_semantic_manifest = semantic_manifest.copy(deep=True)
+    listings_semantic_model = next(
+        semantic_model
+        for semantic_model in updated_semantic_manifest.semantic_models
+        if semantic_model.name == "listings_latest"
+    )
+    listings_semantic_model.dimensions.append(
+        PydanticDimension(name="capacity_tier", type=DimensionType.CATEGORICAL, expr="capacity / 4")
+    )
+    return updated_semantic_manifest
+
+
+def _create_request() -> MetricFlowQueryRequest:
+    return MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=("bookings", "listings"),
+        group_by_names=("metric_time__day", "listing__country_latest", "listing__capacity_tier"),
+    )
+
+
+def test_update_semantic_manifest(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+) -> None:
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+    )
+    with pytest.raises(InvalidQueryException):
+        mf_engine.explain(_create_request())
+
+    updated_semantic_manifest = _updated_semantic_manifest(simple_semantic_manifest)
+    manifest_diff = mf_engine.update_semantic_manifest(updated_semantic_manifest)
+    assert manifest_diff.changed_semantic_model_names == {"listings_latest"}
+    assert mf_engine.semantic_manifest_lookup.semantic_manifest is updated_semantic_manifest
+
+    # The result should be the same as with an engine created for the updated manifest.
+    new_mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=SemanticManifestLookup(updated_semantic_manifest),
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+    )
+    assert mf_engine.explain(_create_request()).sql_statement == new_mf_engine.explain(_create_request()).sql_statement
+
+    # Updating with the same manifest is a no-op.
+    semantic_manifest_lookup = mf_engine.semantic_manifest_lookup
+    assert not mf_engine.update_semantic_manifest(updated_semantic_manifest).has_changes
+    assert mf_engine.semantic_manifest_lookup is semantic_manifest_lookup
+
+
+def test_update_keeps_query_parser_options(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+) -> None:
+    where_filter_pattern_factory = _RecordingWhereFilterPatternFactory()
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+        query_parser=MetricFlowQueryParser(
+            semantic_manifest_lookup=simple_semantic_manifest_lookup,
+            where_filter_pattern_factory=where_filter_pattern_factory,
+        ),
+    )
+    mf_engine.update_semantic_manifest(_updated_semantic_manifest(simple_semantic_manifest))
+
+    mf_engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings",),
+            group_by_names=("metric_time__day",),
+            where_constraints=("{{ Dimension('listing__capacity_tier') }} > 1",),
+        )
+    )
+    assert where_filter_pattern_factory.dimension_names == ["capacity_tier"]
+
+
+def test_update_reuses_unchanged_data_sets(  # noqa: D103
+    simple_semantic_manifest: PydanticSemanticManifest,
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+) -> None:
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+    )
+    previous_data_sets = mf_engine._manifest_state.source_data_sets
+    mf_engine.update_semantic_manifest(_updated_semantic_manifest(simple_semantic_manifest))
+
+    for previous_data_set, data_set in zip(previous_data_sets, mf_engine._manifest_state.source_data_sets):
+        assert data_set.semantic_model_reference == previous_data_set.semantic_model_reference
+        if data_set.semantic_model_reference.semantic_model_name == "listings_latest":
+            assert data_set is not previous_data_set
+        else:
+            assert data_set is previous_data_set
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import datetime
+from typing import Iterator
+
+import pytest
+from dbt_semantic_interfaces.references import EntityReference, MeasureReference
+from dbt_semantic_interfaces.type_enums import TimeGranularity
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.specs.dimension_spec import DimensionSpec
+from metricflow_semantics.specs.dunder_column_association_resolver import DunderColumnAssociationResolver
+from metricflow_semantics.sql.sql_table import SqlTable
+from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfiguration
+from metricflow_semantics.test_helpers.time_helpers import ConfigurableTimeSource
+from metricflow_semantics.time.granularity import ExpandedTimeGranularity
+
+from metricflow.dataflow.builder.materialized_aggregate import MaterializedAggregate
+from metricflow.dataset.dataset_classes import DataSet
+from metricflow.engine.compiled_query_cache import CompiledQueryCache
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.protocols.sql_client import SqlClient
+from tests_metricflow.sql.compare_data_table import assert_data_tables_equal
+
+
+@pytest.fixture
+def bookings_aggregate(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    mf_test_configuration: MetricFlowTestConfiguration,
+    create_source_tables: bool,
+) -> Iterator[MaterializedAggregate]:
+    """An aggregate of the bookings measures by day and by whether the booking is instant."""
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+    )
+    sql_table = SqlTable(schema_name=mf_test_configuration.mf_system_schema, table_name="bookings_by_day")
+    sql_statement = mf_engine.explain(
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings", "booking_value"),
+            group_by_names=("metric_time__day", "booking__is_instant"),
+        )
+    ).sql_statement
+    sql_client.execute(
+        f"CREATE TABLE {sql_table.sql} AS {sql_statement.sql}", sql_bind_parameter_set=sql_statement.bind_parameter_set
+    )
+    yield MaterializedAggregate(
+        sql_table=sql_table,
+        measure_references=(MeasureReference("bookings"), MeasureReference("booking_value")),
+        group_by_specs=(
+            DataSet.metric_time_dimension_spec(ExpandedTimeGranularity.from_time_granularity(TimeGranularity.DAY)),
+            DimensionSpec(element_name="is_instant", entity_links=(EntityReference("booking"),)),
+        ),
+    )
+    sql_client.execute(f"DROP TABLE {sql_table.sql}")
+
+
+def _query_with_and_without_aggregate(
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    materialized_aggregate: MaterializedAggregate,
+    request: MetricFlowQueryRequest,
+) -> bool:
+    """Check that the query has the same result with and without the aggregate, and return whether it was used."""
+    mf_engine = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+    )
+    mf_engine_with_aggregate = MetricFlowEngine(
+        semantic_manifest_lookup=simple_semantic_manifest_lookup,
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+        materialized_aggregates=(materialized_aggregate,),
+    )
+    result = mf_engine.query(request).result_df
+    result_with_aggregate = mf_engine_with_aggregate.query(request).result_df
+    assert result is not None and result_with_aggregate is not None
+    assert_data_tables_equal(actual=result_with_aggregate, expected=result)
+    return materialized_aggregate.sql_table.table_name in mf_engine_with_aggregate.explain(request).sql_statement.sql
+
+
+def test_query_using_aggregate(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    bookings_aggregate: MaterializedAggregate,
+) -> None:
+    # A coarser grain, a filter on a group-by item in the aggregate, and a time constraint can use the aggregate.
+    assert _query_with_and_without_aggregate(
+        simple_semantic_manifest_lookup,
+        sql_client,
+        bookings_aggregate,
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings", "booking_value", "instant_booking_value_ratio"),
+            group_by_names=("metric_time__month",),
+            where_constraints=("{{ Dimension('booking__is_instant') }}",),
+            time_constraint_start=datetime.datetime(2019, 12, 1),
+            time_constraint_end=datetime.datetime(2020, 1, 2),
+            order_by_names=("metric_time__month",),
+        ),
+    )
+    # Joining to the time spine happens after aggregation.
+    assert _query_with_and_without_aggregate(
+        simple_semantic_manifest_lookup,
+        sql_client,
+        bookings_aggregate,
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings_join_to_time_spine_with_tiered_filters",),
+            group_by_names=("metric_time__day",),
+            order_by_names=("metric_time__day",),
+        ),
+    )
+
+
+def test_query_not_covered_by_aggregate(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    bookings_aggregate: MaterializedAggregate,
+) -> None:
+    # The aggregate doesn't have the group-by item.
+    assert not _query_with_and_without_aggregate(
+        simple_semantic_manifest_lookup,
+        sql_client,
+        bookings_aggregate,
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings",),
+            group_by_names=("metric_time__day", "listing__country_latest"),
+            order_by_names=("metric_time__day", "listing__country_latest"),
+        ),
+    )
+    # The offset is applied to the rows before aggregation, so an input metric with an offset can't use the aggregate.
+    assert not _query_with_and_without_aggregate(
+        simple_semantic_manifest_lookup,
+        sql_client,
+        bookings_aggregate,
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings_offset_once",),
+            group_by_names=("metric_time__day",),
+            order_by_names=("metric_time__day",),
+        ),
+    )
+    # When only some of the input metrics have an offset, the ones without an offset still use the aggregate.
+    assert _query_with_and_without_aggregate(
+        simple_semantic_manifest_lookup,
+        sql_client,
+        bookings_aggregate,
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings_growth_2_weeks",),
+            group_by_names=("metric_time__day",),
+            order_by_names=("metric_time__day",),
+        ),
+    )
+
+
+def test_compiled_query_cache_shared_with_engine_without_aggregate(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    bookings_aggregate: MaterializedAggregate,
+) -> None:
+    compiled_query_cache = CompiledQueryCache(time_source=ConfigurableTimeSource(datetime.datetime(2020, 1, 1)))
+    mf_engine, mf_engine_with_aggregate = (
+        MetricFlowEngine(
+            semantic_manifest_lookup=simple_semantic_manifest_lookup,
+            sql_client=sql_client,
+            column_association_resolver=DunderColumnAssociationResolver(),
+            compiled_query_cache=compiled_query_cache,
+            materialized_aggregates=materialized_aggregates,
+        )
+        for materialized_aggregates in ((), (bookings_aggregate,))
+    )
+    request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=("bookings",), group_by_names=("metric_time__month",)
+    )
+
+    # Compile using the engine without the aggregate first so that the SQL without the aggregate is in the cache.
+    sql = mf_engine.explain(request).sql_statement.sql
+    sql_with_aggregate = mf_engine_with_aggregate.explain(request).sql_statement.sql
+
+    assert bookings_aggregate.sql_table.table_name not in sql
+    assert bookings_aggregate.sql_table.table_name in sql_with_aggregate
+    assert mf_engine.explain(request).sql_statement.sql == sql
+
+
+def test_invalid_aggregate(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    bookings_aggregate: MaterializedAggregate,
+) -> None:
+    # An average can't be computed from averages.
+    with pytest.raises(ValueError, match="additive measures"):
+        MetricFlowEngine(
+            semantic_manifest_lookup=simple_semantic_manifest_lookup,
+            sql_client=sql_client,
+            materialized_aggregates=(
+                MaterializedAggregate(
+                    sql_table=bookings_aggregate.sql_table,
+                    measure_references=(MeasureReference("average_booking_value"),),
+                    group_by_specs=bookings_aggregate.group_by_specs,
+                ),
+            ),
+        )
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from dbt_semantic_interfaces.type_enums import TimeGranularity
+from metricflow_semantics.collection_helpers.cache_registry import GLOBAL_CACHE_REGISTRY
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.specs.dunder_column_association_resolver import DunderColumnAssociationResolver
+from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
+from metricflow_semantics.test_helpers.time_helpers import ConfigurableTimeSource
+from metricflow_semantics.time.time_constants import ISO8601_PYTHON_FORMAT
+
+from metricflow.data_table.mf_table import MetricFlowDataTable
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from metricflow.execution.execution_plan import SqlStatement
+from metricflow.execution.query_result_cache import (
+    InMemoryQueryResultCacheStore,
+    QueryResultCache,
+    QueryResultCacheEntry,
+    QueryResultCacheStats,
+    QueryResultCacheStore,
+    SqliteQueryResultCacheStore,
+)
+from metricflow.protocols.sql_client import SqlClient
+from tests_metricflow.sql.compare_data_table import assert_data_tables_equal
+
+_START_TIME = datetime.datetime.strptime("2020-01-01", ISO8601_PYTHON_FORMAT)
+
+
+def _create_engine(
+    semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    query_result_cache: Optional[QueryResultCache] = None,
+) -> MetricFlowEngine:
+    return MetricFlowEngine(
+        semantic_manifest_lookup=semantic_manifest_lookup,
+        sql_client=sql_client,
+        column_association_resolver=DunderColumnAssociationResolver(),
+        query_result_cache=query_result_cache,
+    )
+
+
+def _create_request() -> MetricFlowQueryRequest:
+    return MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=("bookings", "booking_value"),
+        group_by_names=("metric_time__day",),
+    )
+
+
+def _query(mf_engine: MetricFlowEngine, request: MetricFlowQueryRequest) -> MetricFlowDataTable:
+    result_df = mf_engine.query(request).result_df
+    assert result_df is not None
+    return result_df
+
+
+def test_cache_hit_and_expiry(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup, sql_client: SqlClient, create_source_tables: bool
+) -> None:
+    time_source = ConfigurableTimeSource(_START_TIME)
+    query_result_cache = QueryResultCache(time_source=time_source, entry_ttl=datetime.timedelta(hours=1))
+    mf_engine = _create_engine(simple_semantic_manifest_lookup, sql_client, query_result_cache)
+
+    first_result = _query(mf_engine, _create_request())
+    second_result = _query(mf_engine, _create_request())
+    assert_data_tables_equal(actual=second_result, expected=first_result)
+    assert query_result_cache.stats == QueryResultCacheStats(
+        hit_count=1,
+        miss_count=1,
+        eviction_count=0,
+        item_count=1,
+        pinned_item_count=0,
+        estimated_size_bytes=0,
+        time_partitioned_refresh_count=0,
+    )
+
+    time_source.set_time(_START_TIME + datetime.timedelta(hours=2))
+    _query(mf_engine, _create_request())
+    assert query_result_cache.stats.miss_count == 2
+
+
+def test_result_too_large_to_cache(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup, sql_client: SqlClient, create_source_tables: bool
+) -> None:
+    query_result_cache = QueryResultCache(time_source=ConfigurableTimeSource(_START_TIME), max_rows_per_entry=1)
+    mf_engine = _create_engine(simple_semantic_manifest_lookup, sql_client, query_result_cache)
+
+    _query(mf_engine, _create_request())
+    _query(mf_engine, _create_request())
+    assert query_result_cache.stats == QueryResultCacheStats(
+        hit_count=0,
+        miss_count=2,
+        eviction_count=0,
+        item_count=0,
+        pinned_item_count=0,
+        estimated_size_bytes=0,
+        time_partitioned_refresh_count=0,
+    )
+
+
+def test_store_eviction(tmp_path: Path) -> None:  # noqa: D103
+    data_table = MetricFlowDataTable.create_from_rows(column_names=("bookings",), rows=((1,),))
+    time_source = ConfigurableTimeSource(_START_TIME)
+    stores: Tuple[QueryResultCacheStore, ...] = (
+        InMemoryQueryResultCacheStore(max_items=2),
+        SqliteQueryResultCacheStore(path=tmp_path.joinpath("query_result_cache.sqlite"), max_items=2),
+    )
+    for store in stores:
+        query_result_cache = QueryResultCache(time_source=time_source, store=store)
+        for i in range(3):
+            time_source.set_time(_START_TIME + datetime.timedelta(seconds=i))
+            store.set(str(i), QueryResultCacheEntry(created_at=time_source.get_time(), data_table=data_table))
+        assert store.get("0") is None
+        cached_entry = store.get("2")
+        assert cached_entry is not None
+        assert_data_tables_equal(actual=cached_entry.data_table, expected=data_table)
+        assert query_result_cache.stats.eviction_count == 1
+        assert query_result_cache.stats.item_count == 2
+        assert query_result_cache.estimate_size_bytes() > 0
+        query_result_cache.clear()
+        assert store.get("2") is None
+
+
+def test_sqlite_store_eviction_order_with_utc_offsets(tmp_path: Path) -> None:
+    """Check that entries are evicted by time when the text of the times doesn't sort in the same order."""
+    data_table = MetricFlowDataTable.create_from_rows(column_names=("bookings",), rows=((1,),))
+    store = SqliteQueryResultCacheStore(path=tmp_path.joinpath("query_result_cache.sqlite"), max_items=1)
+    # 10:00 at UTC+5 is before 06:00 at UTC, but the text sorts after it.
+    store.set(
+        "older",
+        QueryResultCacheEntry(
+            created_at=datetime.datetime(2020, 1, 1, 10, tzinfo=datetime.timezone(datetime.timedelta(hours=5))),
+            data_table=data_table,
+        ),
+    )
+    store.set(
+        "newer",
+        QueryResultCacheEntry(
+            created_at=datetime.datetime(2020, 1, 1, 6, tzinfo=datetime.timezone.utc), data_table=data_table
+        ),
+    )
+    assert store.get("older") is None
+    assert store.get("newer") is not None
+
+
+def test_cache_registration() -> None:  # noqa: D103
+    query_result_cache = QueryResultCache(time_source=ConfigurableTimeSource(_START_TIME))
+    query_result_cache.set(
+        SqlStatement(sql="SELECT 1 AS bookings", bind_parameter_set=SqlBindParameterSet()),
+        MetricFlowDataTable.create_from_rows(column_names=("bookings",), rows=((1,),)),
+    )
+    report_entry = GLOBAL_CACHE_REGISTRY.create_report(include_size_estimates=True).get_entry("QueryResultCache")
+    assert report_entry.instance_count >= 1
+    assert report_entry.stats.item_count >= 1
+    assert report_entry.stats.estimated_size_bytes > 0
+
+
+def test_time_partitioned_entry_expiry() -> None:
+    """Check that time-partitioned results are queried in full after the default TTL."""
+    time_source = ConfigurableTimeSource(_START_TIME)
+    query_result_cache = QueryResultCache(time_source=time_source, time_partitioned_refresh=True)
+    sql_statement = SqlStatement(sql="SELECT metric_time__day, bookings", bind_parameter_set=SqlBindParameterSet())
+    query_result_cache.set_time_partitioned(
+        sql_statement,
+        time_column_name="metric_time__day",
+        data_table=MetricFlowDataTable.create_from_rows(
+            column_names=("metric_time__day", "bookings"), rows=((_START_TIME, 1),)
+        ),
+    )
+    assert (
+        query_result_cache.get_time_partitioned(
+            sql_statement, time_column_name="metric_time__day", time_granularity=TimeGranularity.DAY
+        )
+        is not None
+    )
+
+    time_source.set_time(_START_TIME + datetime.timedelta(days=2))
+    assert (
+        query_result_cache.get_time_partitioned(
+            sql_statement, time_column_name="metric_time__day", time_granularity=TimeGranularity.DAY
+        )
+        is None
+    )
+
+
+def test_sqlite_store_shared_between_engines(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup,
+    sql_client: SqlClient,
+    create_source_tables: bool,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path.joinpath("query_result_cache.sqlite")
+    first_cache = QueryResultCache(
+        time_source=ConfigurableTimeSource(_START_TIME), store=SqliteQueryResultCacheStore(path)
+    )
+    second_cache = QueryResultCache(
+        time_source=ConfigurableTimeSource(_START_TIME), store=SqliteQueryResultCacheStore(path)
+    )
+    first_result = _query(_create_engine(simple_semantic_manifest_lookup, sql_client, first_cache), _create_request())
+    second_result = _query(_create_engine(simple_semantic_manifest_lookup, sql_client, second_cache), _create_request())
+
+    assert_data_tables_equal(actual=second_result, expected=first_result)
+    assert second_cache.stats == QueryResultCacheStats(
+        hit_count=1,
+        miss_count=0,
+        eviction_count=0,
+        item_count=1,
+        pinned_item_count=0,
+        estimated_size_bytes=0,
+        time_partitioned_refresh_count=0,
+    )
+
+
+def test_time_partitioned_refresh(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup, sql_client: SqlClient, create_source_tables: bool
+) -> None:
+    expected_result = _query(_create_engine(simple_semantic_manifest_lookup, sql_client), _create_request())
+
+    query_result_cache = QueryResultCache(
+        time_source=ConfigurableTimeSource(_START_TIME),
+        time_partitioned_refresh=True,
+        refresh_lookback=datetime.timedelta(days=1),
+    )
+    mf_engine = _create_engine(simple_semantic_manifest_lookup, sql_client, query_result_cache)
+    # Simulate a result that was cached before the rows for the latest days were added to the warehouse.
+    time_column_index = expected_result.column_name_index("metric_time__day")
+    bucket_starts: List[datetime.datetime] = []
+    for bucket_start in expected_result.column_values(time_column_index):
+        assert isinstance(bucket_start, datetime.datetime)
+        bucket_starts.append(bucket_start)
+    query_result_cache.set_time_partitioned(
+        mf_engine.explain(_create_request()).sql_statement,
+        time_column_name="metric_time__day",
+        data_table=MetricFlowDataTable.create_from_rows(
+            column_names=expected_result.column_names,
+            rows=[
+                row
+                for row, bucket_start in zip(expected_result.rows, bucket_starts)
+                if bucket_start < max(bucket_starts)
+            ],
+        ),
+    )
+
+    query_result = mf_engine.query(_create_request())
+    assert query_result.result_df is not None
+    assert_data_tables_equal(actual=query_result.result_df, expected=expected_result)
+    assert query_result_cache.stats.time_partitioned_refresh_count == 1
+    # Only the latest days should have been queried.
+    assert query_result.sql != mf_engine.explain(_create_request()).sql_statement.sql
+
+
+def test_time_partitioned_entry_expiry_after_refresh(  # noqa: D103
+    simple_semantic_manifest_lookup: SemanticManifestLookup, sql_client: SqlClient, create_source_tables: bool
+) -> None:
+    time_source = ConfigurableTimeSource(_START_TIME)
+    query_result_cache = QueryResultCache(
+        time_source=time_source,
+        time_partitioned_refresh=True,
+        time_partitioned_entry_ttl=datetime.timedelta(hours=12),
+    )
+    mf_engine = _create_engine(simple_semantic_manifest_lookup, sql_client, query_result_cache)
+    full_query_sql = mf_engine.explain(_create_request()).sql_statement.sql
+
+    assert mf_engine.query(_create_request()).sql == full_query_sql
+    time_source.set_time(_START_TIME + datetime.timedelta(hours=8))
+    assert mf_engine.query(_create_request()).sql != full_query_sql
+    assert query_result_cache.stats.time_partitioned_refresh_count == 1
+
+    # The refresh doesn't extend the TTL, so the result is queried in full even though it was refreshed recently.
+    time_source.set_time(_START_TIME + datetime.timedelta(hours=16))
+    assert mf_engine.query(_create_request()).sql == full_query_sql
+    assert query_result_cache.stats.time_partitioned_refresh_count == 1
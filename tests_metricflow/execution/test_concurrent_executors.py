@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from metricflow_semantics.dag.mf_dag import DagId
+
+from metricflow.execution.execution_plan import ExecutionPlan
+from metricflow.execution.executor import (
+    AsyncioPlanExecutor,
+    ExecutionPlanExecutor,
+    ExecutionResults,
+    ThreadPoolPlanExecutor,
+)
+from tests_metricflow.execution.noop_task import NoOpExecutionPlanTask
+
+
+@pytest.fixture(params=["thread_pool", "asyncio"])
+def executor(request: pytest.FixtureRequest) -> ExecutionPlanExecutor:  # noqa: D103
+    if request.param == "thread_pool":
+        return ThreadPoolPlanExecutor(max_workers=4, task_timeout=1.0)
+    return AsyncioPlanExecutor(max_concurrent_tasks=4, task_timeout=1.0)
+
+
+def test_task_with_parents(executor: ExecutionPlanExecutor) -> None:
+    """Tests a plan with a task that has 2 direct parents that should run concurrently."""
+    parent_task1 = NoOpExecutionPlanTask.create(duration=0.2)
+    parent_task2 = NoOpExecutionPlanTask.create(duration=0.2)
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+    results = executor.execute_plan(execution_plan)
+
+    parent_result1 = results.get_result(parent_task1.task_id)
+    parent_result2 = results.get_result(parent_task2.task_id)
+    leaf_result = results.get_result(leaf_task.task_id)
+
+    # Check that parents completed before the leaf started.
+    assert parent_result1.end_time <= leaf_result.start_time
+    assert parent_result2.end_time <= leaf_result.start_time
+    # Check that the parents overlapped.
+    assert parent_result1.start_time < parent_result2.end_time
+    assert parent_result2.start_time < parent_result1.end_time
+
+    assert not results.contains_task_errors
+
+
+def test_shared_parent_runs_once(executor: ExecutionPlanExecutor) -> None:
+    """Tests that a task that is the parent of multiple tasks only runs once."""
+    shared_task = NoOpExecutionPlanTask.create()
+    task1 = NoOpExecutionPlanTask.create(parent_tasks=[shared_task])
+    task2 = NoOpExecutionPlanTask.create(parent_tasks=[shared_task])
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[task1, task2])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+    results = executor.execute_plan(execution_plan)
+
+    assert len(results.all_results()) == 4
+    assert not results.contains_task_errors
+
+
+def test_parent_task_error(executor: ExecutionPlanExecutor) -> None:
+    """Check that a child task is not run and that other tasks are stopped if a parent task fails."""
+    parent_task1 = NoOpExecutionPlanTask.create(should_error=True)
+    parent_task2 = NoOpExecutionPlanTask.create(duration=0.5)
+    leaf_task = NoOpExecutionPlanTask.create(parent_tasks=[parent_task1, parent_task2])
+    execution_plan = ExecutionPlan(leaf_tasks=[leaf_task], dag_id=DagId.from_str("plan0"))
+
+    results = executor.execute_plan(execution_plan)
+    assert tuple(results.all_results()) == (parent_task1.task_id,)
+    assert results.get_result(parent_task1.task_id).errors[0] == NoOpExecutionPlanTask.EXAMPLE_ERROR
+
+
+def test_task_timeout() -> None:
+    """Check that a task that runs for too long results in an error."""
+    for executor in (
+        ThreadPoolPlanExecutor(task_timeout=0.1),
+        AsyncioPlanExecutor(task_timeout=0.1),
+    ):
+        task = NoOpExecutionPlanTask.create(duration=0.5)
+        execution_plan = ExecutionPlan(leaf_tasks=[task], dag_id=DagId.from_str("plan0"))
+        results = executor.execute_plan(execution_plan)
+        assert results.contains_task_errors
+        assert "timeout" in results.get_result(task.task_id).errors[0].error_str
+
+
+def test_execute_plan_async() -> None:
+    """Check that the async executor can be used from a running event loop."""
+    task = NoOpExecutionPlanTask.create()
+    execution_plan = ExecutionPlan(leaf_tasks=[task], dag_id=DagId.from_str("plan0"))
+    results = asyncio.run(AsyncioPlanExecutor().execute_plan_async(execution_plan))
+    assert not results.contains_task_errors
+
+
+def test_execute_plan_in_running_event_loop() -> None:
+    """Check that the synchronous method of the async executor can be called while an event loop is running."""
+    task = NoOpExecutionPlanTask.create()
+    execution_plan = ExecutionPlan(leaf_tasks=[task], dag_id=DagId.from_str("plan0"))
+
+    async def _execute_plan() -> ExecutionResults:
+        return AsyncioPlanExecutor().execute_plan(execution_plan)
+
+    results = asyncio.run(_execute_plan())
+    assert not results.contains_task_errors
+    assert tuple(results.all_results()) == (task.task_id,)
@@ -65,3 +65,20 @@ def test_write_table_task(  # noqa: D103
         compare_names_using_lowercase=sql_client.sql_engine_type is SqlEngine.SNOWFLAKE,
     )
     sql_client.execute(f"DROP TABLE IF EXISTS {output_table.sql}")
+
+
+def test_read_sql_task_in_batches(sql_client: SqlClient) -> None:  # noqa: D103
+    task = SelectSqlQueryToDataTableTask.create(
+        sql_client,
+        SqlStatement(
+            "SELECT foo FROM (SELECT 1 AS foo UNION ALL SELECT 2 AS foo) numbers ORDER BY foo", SqlBindParameterSet()
+        ),
+    )
+    batches = tuple(task.execute_in_batches(batch_size=1))
+    assert len(batches) == 2
+    for batch, expected_rows in zip(batches, ([(1,)], [(2,)])):
+        assert_data_tables_equal(
+            actual=batch,
+            expected=MetricFlowDataTable.create_from_rows(column_names=["foo"], rows=expected_rows),
+            compare_names_using_lowercase=sql_client.sql_engine_type is SqlEngine.SNOWFLAKE,
+        )
@@ -53,6 +53,10 @@ class FakeCLIConfiguration(CLIConfiguration):
         # For tests, a dbt project is not needed, so don't try to configure it.
         return
 
+    @override
+    def reload_semantic_manifest_if_changed(self) -> bool:
+        return False
+
     @property
     @override
     def dbt_artifacts(self) -> dbtArtifacts:
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Optional
+
+import duckdb
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
+from typing_extensions import override
+
+from metricflow.data_table.mf_table import MetricFlowDataTable
+from metricflow.protocols.async_sql_client import AsyncSqlClient
+from metricflow.protocols.sql_client import SqlEngine
+
+logger = logging.getLogger(__name__)
+
+
+class DuckDbAsyncSqlClient(AsyncSqlClient):
+    """A reference implementation of `AsyncSqlClient` for DuckDB, used for testing the async engine APIs.
+
+    DuckDB only provides a blocking API, so each statement runs on a separate cursor in the event loop's default
+    executor. If the awaiting task is cancelled, the cursor is interrupted so that the statement stops running.
+    """
+
+    def __init__(self, connection: duckdb.DuckDBPyConnection) -> None:
+        """Initializer.
+
+        Args:
+            connection: The connection to the database. A cursor is created from this connection for each statement.
+        """
+        self._connection = connection
+
+    @property
+    @override
+    def sql_engine_type(self) -> SqlEngine:
+        return SqlEngine.DUCKDB
+
+    @staticmethod
+    def _run_blocking(
+        cursor: duckdb.DuckDBPyConnection, stmt: str, sql_bind_parameter_set: SqlBindParameterSet, fetch: bool
+    ) -> Optional[MetricFlowDataTable]:
+        param_dict = sql_bind_parameter_set.param_dict
+        if len(param_dict) > 0:
+            cursor.execute(stmt, dict(param_dict))
+        else:
+            cursor.execute(stmt)
+        if not fetch:
+            return None
+        column_names = [column_description[0] for column_description in cursor.description or ()]
+        return MetricFlowDataTable.create_from_rows(column_names=column_names, rows=cursor.fetchall())
+
+    async def _run(
+        self, stmt: str, sql_bind_parameter_set: SqlBindParameterSet, fetch: bool
+    ) -> Optional[MetricFlowDataTable]:
+        start_time = time.perf_counter()
+        logger.info(LazyFormat("Running statement", statement=stmt, param_dict=sql_bind_parameter_set.param_dict))
+        cursor = self._connection.cursor()
+        try:
+            statement_future = asyncio.get_running_loop().run_in_executor(
+                None, DuckDbAsyncSqlClient._run_blocking, cursor, stmt, sql_bind_parameter_set, fetch
+            )
+            try:
+                # Shielded so that the statement can be interrupted and awaited if this task is cancelled.
+                result = await asyncio.shield(statement_future)
+            except asyncio.CancelledError:
+                logger.info(LazyFormat("Interrupting statement as the task was cancelled", statement=stmt))
+                cursor.interrupt()
+                with contextlib.suppress(Exception):
+                    await statement_future
+                raise
+        finally:
+            cursor.close()
+        logger.info(LazyFormat("Finished running statement", runtime=f"{time.perf_counter() - start_time:.2f}s"))
+        return result
+
+    @override
+    async def query(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+    ) -> MetricFlowDataTable:
+        result = await self._run(stmt, sql_bind_parameter_set, fetch=True)
+        assert result is not None
+        return result
+
+    @override
+    async def execute(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+    ) -> None:
+        await self._run(stmt, sql_bind_parameter_set, fetch=False)
+
+    @override
+    async def dry_run(
+        self,
+        stmt: str,
+        sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(),
+    ) -> None:
+        await self._run(f"EXPLAIN {stmt}", sql_bind_parameter_set, fetch=False)
+
+    @override
+    async def close(self) -> None:
+        self._connection.close()
@@ -4,7 +4,7 @@ from _pytest.fixtures import FixtureRequest
 from metricflow_semantics.naming.linkable_spec_name import StructuredLinkableSpecName
 from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfiguration
 
-from metricflow.engine.metricflow_engine import GroupByOrderByAttribute
+from metricflow.engine.metricflow_engine import GroupByOrderByAttribute, MetricFlowQueryRequest
 from tests_metricflow.integration.conftest import IntegrationTestHelpers
 from tests_metricflow.snapshot_utils import assert_object_snapshot_equal
 
@@ -185,3 +185,22 @@ def test_group_by_exists(  # noqa: D103
     assert not it_helpers.mf_engine.group_by_exists(
         StructuredLinkableSpecName(element_name="ds", entity_link_names=("not_real_entity",))
     )
+
+
+def test_query_stream(it_helpers: IntegrationTestHelpers) -> None:
+    """Test that the results of a streaming query match the results of a regular query."""
+    mf_request = MetricFlowQueryRequest.create_with_random_request_id(
+        metric_names=["bookings"],
+        group_by_names=["metric_time__day"],
+        order_by_names=["metric_time__day"],
+    )
+    query_result = it_helpers.mf_engine.query(mf_request)
+    query_stream_result = it_helpers.mf_engine.query_stream(mf_request, batch_size=2)
+
+    assert query_stream_result.sql == query_result.sql
+    batches = tuple(query_stream_result.result_batches)
+    assert all(batch.row_count <= 2 for batch in batches)
+
+    assert query_result.result_df is not None
+    assert query_result.result_df.row_count > 2
+    assert tuple(row for batch in batches for row in batch.rows) == query_result.result_df.rows
@@ -32,6 +32,18 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default="performance-report.json",
         help="where to store performance results as JSON",
     )
+    parser.addoption(
+        "--overwrite-planning-benchmark-baseline",
+        action="store_true",
+        help="Overwrite the planning benchmark baseline with the results of the run instead of comparing against it.",
+    )
+    parser.addoption(
+        "--planning-benchmark-tolerance",
+        action="store",
+        type=float,
+        default=0.5,
+        help="The relative increase over the planning benchmark baseline that is considered a regression.",
+    )
 
 
 @pytest.fixture(scope="session")
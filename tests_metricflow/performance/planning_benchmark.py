@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import gc
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from dbt_semantic_interfaces.implementations.base import FrozenBaseModel
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+from dbt_semantic_interfaces.test_utils import as_datetime
+from dbt_semantic_interfaces.transformations.semantic_manifest_transformer import PydanticSemanticManifestTransformer
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.model.semantic_manifest_lookup import SemanticManifestLookup
+from metricflow_semantics.model.semantics.linkable_spec_index import LinkableSpecIndex
+from metricflow_semantics.model.semantics.linkable_spec_index_builder import LinkableSpecIndexBuilder
+from metricflow_semantics.model.semantics.manifest_object_lookup import SemanticManifestObjectLookup
+from metricflow_semantics.model.semantics.semantic_model_join_evaluator import MAX_JOIN_HOPS
+from metricflow_semantics.model.semantics.semantic_model_lookup import SemanticModelLookup
+from metricflow_semantics.query.query_parser import MetricFlowQueryParser
+from metricflow_semantics.specs.dunder_column_association_resolver import DunderColumnAssociationResolver
+from metricflow_semantics.specs.query_param_implementations import SavedQueryParameter
+from metricflow_semantics.test_helpers.synthetic_manifest.semantic_manifest_generator import SyntheticManifestGenerator
+from metricflow_semantics.test_helpers.synthetic_manifest.synthetic_manifest_parameter_set import (
+    SyntheticManifestParameterSet,
+)
+from metricflow_semantics.test_helpers.time_helpers import ConfigurableTimeSource
+from metricflow_semantics.time.time_spine_source import TimeSpineSource
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.builder.source_node import SourceNodeBuilder
+from metricflow.dataflow.dataflow_plan_analyzer import DataflowPlanAnalyzer
+from metricflow.dataflow.optimizer.dataflow_optimizer_factory import DataflowPlanOptimization
+from metricflow.dataset.convert_semantic_model import SemanticModelToDataSetConverter
+from metricflow.engine.metricflow_engine import MetricFlowEngine
+from metricflow.plan_conversion.to_sql_plan.dataflow_to_sql import DataflowToSqlPlanConverter
+from metricflow.plan_conversion.to_sql_plan.dataflow_to_subquery import DataflowNodeToSqlSubqueryVisitor
+from metricflow.protocols.sql_client import SqlClient
+from metricflow.sql.optimizer.optimization_levels import SqlGenerationOptionSet, SqlOptimizationLevel
+from metricflow.sql.optimizer.optimizer_pipeline import SqlOptimizerPipeline
+from metricflow.sql.sql_plan import SqlPlan
+
+logger = logging.getLogger(__name__)
+
+ResultT = TypeVar("ResultT")
+
+
+class PlanningPhase(Enum):
+    """The phases of planning a query that are measured by the benchmark."""
+
+    LINKABLE_SPEC_INDEX = "linkable_spec_index"
+    ENGINE_STARTUP = "engine_startup"
+    QUERY_RESOLUTION = "query_resolution"
+    DATAFLOW_PLANNING = "dataflow_planning"
+    SQL_CONVERSION = "sql_conversion"
+    SQL_OPTIMIZATION = "sql_optimization"
+    SQL_RENDERING = "sql_rendering"
+
+
+@dataclass(frozen=True)
+class PlanningBenchmarkCase:
+    """A manifest size to run the benchmark with.
+
+    The benchmark query is the first saved query in the generated manifest, so the parameter set should generate at
+    least one saved query.
+    """
+
+    name: str
+    parameter_set: SyntheticManifestParameterSet
+
+
+class PhaseMeasurement(FrozenBaseModel):
+    """The measurements for a phase.
+
+    Attributes:
+        runtime: The shortest runtime of the phase across repetitions, in seconds.
+        peak_memory: The peak memory allocated by Python during the phase, in bytes.
+    """
+
+    runtime: float
+    peak_memory: int
+
+
+class PlanningBenchmarkResult(FrozenBaseModel):
+    """The measurements for each phase (keyed by the value of `PlanningPhase`) for a case.
+
+    Attributes:
+        case_name: The name of the benchmark case.
+        phase_measurements: The measurements for each phase.
+        reference_runtime: The shortest runtime of a fixed, pure-Python workload, measured in the same run as the
+            phases. Runtimes are scaled by this when compared with results from another run so that the comparison does
+            not depend on the speed of the machine.
+    """
+
+    case_name: str
+    phase_measurements: Dict[str, PhaseMeasurement]
+    reference_runtime: float
+
+
+@dataclass(frozen=True)
+class PlanningBenchmarkRegression:
+    """Describes a measurement that increased by more than the tolerance relative to the baseline."""
+
+    case_name: str
+    phase_name: str
+    measurement_name: str
+    baseline_value: float
+    current_value: float
+
+    @property
+    def ui_description(self) -> str:  # noqa: D102
+        return (
+            f"{self.case_name} / {self.phase_name}: {self.measurement_name} increased from {self.baseline_value:.4g} to "
+            f"{self.current_value:.4g}"
+        )
+
+
+class PlanningBenchmarkBaseline(FrozenBaseModel):
+    """The results that new results are compared against, keyed by the case name. Stored as JSON."""
+
+    results: Dict[str, PlanningBenchmarkResult] = {}
+
+    @staticmethod
+    def read(file_path: Path) -> PlanningBenchmarkBaseline:  # noqa: D102
+        return PlanningBenchmarkBaseline.parse_raw(file_path.read_text())
+
+    def write(self, file_path: Path) -> None:  # noqa: D102
+        file_path.write_text(self.to_pretty_json() + "\n")
+
+    def find_regressions(
+        self,
+        results: Sequence[PlanningBenchmarkResult],
+        tolerance: float,
+        min_runtime_increase: float = 0.01,
+        min_peak_memory_increase: int = 1_000_000,
+    ) -> Sequence[PlanningBenchmarkRegression]:
+        """Return the measurements in the results that increased by more than the tolerance relative to the baseline.
+
+        The baseline runtimes are first scaled by the ratio of the reference runtimes, so a baseline recorded on a faster
+        or slower machine can be used. Peak memory is measured by `tracemalloc`, so it's compared as-is.
+
+        Args:
+            results: The results to compare.
+            tolerance: The allowed relative increase. e.g. 0.5 allows measurements to be up to 50% larger.
+            min_runtime_increase: Runtime increases smaller than this (in seconds) are considered noise.
+            min_peak_memory_increase: Peak memory increases smaller than this (in bytes) are considered noise.
+        """
+        regressions: List[PlanningBenchmarkRegression] = []
+        for result in results:
+            baseline_result = self.results.get(result.case_name)
+            if baseline_result is None:
+                logger.warning(LazyFormat("Missing baseline for benchmark case", case_name=result.case_name))
+                continue
+            runtime_scale = result.reference_runtime / baseline_result.reference_runtime
+            for phase_name, measurement in result.phase_measurements.items():
+                baseline_measurement = baseline_result.phase_measurements.get(phase_name)
+                if baseline_measurement is None:
+                    continue
+                scaled_baseline_runtime = baseline_measurement.runtime * runtime_scale
+                if measurement.runtime > max(
+                    scaled_baseline_runtime * (1 + tolerance),
+                    scaled_baseline_runtime + min_runtime_increase,
+                ):
+                    regressions.append(
+                        PlanningBenchmarkRegression(
+                            case_name=result.case_name,
+                            phase_name=phase_name,
+                            measurement_name="runtime",
+                            baseline_value=scaled_baseline_runtime,
+                            current_value=measurement.runtime,
+                        )
+                    )
+                if measurement.peak_memory > max(
+                    baseline_measurement.peak_memory * (1 + tolerance),
+                    baseline_measurement.peak_memory + min_peak_memory_increase,
+                ):
+                    regressions.append(
+                        PlanningBenchmarkRegression(
+                            case_name=result.case_name,
+                            phase_name=phase_name,
+                            measurement_name="peak_memory",
+                            baseline_value=baseline_measurement.peak_memory,
+                            current_value=measurement.peak_memory,
+                        )
+                    )
+        return regressions
+
+
+@contextmanager
+def _garbage_collection_disabled() -> Iterator[None]:
+    """Disable garbage collection while measuring runtimes.
+
+    Collection pauses depend on the objects allocated earlier (e.g. by other benchmark cases or tests), so they increase
+    the variance of the measurements.
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def _run_reference_workload() -> None:
+    """Run a fixed amount of pure-Python work that is similar to planning (creating, hashing, and sorting objects)."""
+    items = [(f"element_{i % 1000}", i % 5000) for i in range(200_000)]
+    sorted(set(items))
+    item_to_count: Dict[Tuple[str, int], int] = {}
+    for item in items:
+        item_to_count[item] = item_to_count.get(item, 0) + 1
+
+
+class _PhaseRecorder:
+    """Records the runtime or the peak memory of the phases in a run of the benchmark."""
+
+    def __init__(self, trace_memory: bool) -> None:
+        self._trace_memory = trace_memory
+        self.phase_to_value: Dict[PlanningPhase, float] = {}
+
+    def measure(self, phase: PlanningPhase, function: Callable[[], ResultT]) -> ResultT:
+        with self._measure_phase(phase):
+            return function()
+
+    @contextmanager
+    def _measure_phase(self, phase: PlanningPhase) -> Iterator[None]:
+        if self._trace_memory:
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+            yield
+            self.phase_to_value[phase] = tracemalloc.get_traced_memory()[1] - start_memory
+        else:
+            with _garbage_collection_disabled():
+                start_time = time.perf_counter()
+                yield
+                self.phase_to_value[phase] = time.perf_counter() - start_time
+
+
+class PlanningBenchmark:
+    """Measures the runtime and memory usage of the phases of planning a query with a synthetic manifest.
+
+    Planning runs offline - the SQL client is only used to initialize the engine and to render the SQL.
+    """
+
+    def __init__(self, sql_client: SqlClient, repetitions: int = 3) -> None:
+        """Initializer.
+
+        Args:
+            sql_client: The client for the engine.
+            repetitions: The number of times to run the phases for measuring the runtime.
+        """
+        if repetitions < 1:
+            raise ValueError(f"`repetitions` should be at least 1. Got: {repetitions}")
+        self._sql_client = sql_client
+        self._repetitions = repetitions
+
+    def run(self, case: PlanningBenchmarkCase) -> PlanningBenchmarkResult:
+        """Run the benchmark for the case."""
+        semantic_manifest = PydanticSemanticManifestTransformer.transform(
+            SyntheticManifestGenerator(case.parameter_set).generate_manifest()
+        )
+        if len(semantic_manifest.saved_queries) == 0:
+            raise ValueError(f"The manifest for {case.name} does not contain a saved query to use for the benchmark.")
+
+        min_phase_to_runtime: Dict[PlanningPhase, float] = {}
+        reference_runtimes: List[float] = []
+        for _ in range(self._repetitions):
+            # The reference workload is run between the phases so that both are affected by the same machine load.
+            with _garbage_collection_disabled():
+                start_time = time.perf_counter()
+                _run_reference_workload()
+                reference_runtimes.append(time.perf_counter() - start_time)
+
+            recorder = _PhaseRecorder(trace_memory=False)
+            self._run_phases(semantic_manifest, recorder)
+            for phase, runtime in recorder.phase_to_value.items():
+                min_phase_to_runtime[phase] = min(runtime, min_phase_to_runtime.get(phase, runtime))
+
+        # Tracing memory allocations slows down execution, so the peak memory is measured in a separate run.
+        recorder = _PhaseRecorder(trace_memory=True)
+        tracemalloc.start()
+        try:
+            self._run_phases(semantic_manifest, recorder)
+        finally:
+            tracemalloc.stop()
+
+        result = PlanningBenchmarkResult(
+            case_name=case.name,
+            phase_measurements={
+                phase.value: PhaseMeasurement(
+                    runtime=min_phase_to_runtime[phase], peak_memory=int(recorder.phase_to_value[phase])
+                )
+                for phase in PlanningPhase
+            },
+            reference_runtime=min(reference_runtimes),
+        )
+        logger.info(LazyFormat("Finished planning benchmark", result=result))
+        return result
+
+    def _run_phases(self, semantic_manifest: PydanticSemanticManifest, recorder: _PhaseRecorder) -> None:
+        linkable_spec_index = recorder.measure(
+            PlanningPhase.LINKABLE_SPEC_INDEX, lambda: self._build_linkable_spec_index(semantic_manifest)
+        )
+        semantic_manifest_lookup = recorder.measure(
+            PlanningPhase.ENGINE_STARTUP, lambda: self._create_engine(semantic_manifest, linkable_spec_index)
+        )
+
+        # The engine doesn't expose the objects used for each phase, so they are created separately using the same
+        # arguments as the engine.
+        dataflow_plan_builder, to_sql_plan_converter = self._create_planners(semantic_manifest_lookup)
+        query_parser = MetricFlowQueryParser(semantic_manifest_lookup)
+        saved_query_name = semantic_manifest.saved_queries[0].name
+
+        query_spec = recorder.measure(
+            PlanningPhase.QUERY_RESOLUTION,
+            lambda: query_parser.parse_and_validate_saved_query(SavedQueryParameter(saved_query_name)).query_spec,
+        )
+        dataflow_plan = recorder.measure(
+            PlanningPhase.DATAFLOW_PLANNING,
+            lambda: dataflow_plan_builder.build_plan(
+                query_spec, optimizations=DataflowPlanOptimization.enabled_optimizations()
+            ),
+        )
+        unoptimized_sql_node = recorder.measure(
+            PlanningPhase.SQL_CONVERSION,
+            lambda: to_sql_plan_converter.convert_using_specifics(
+                dataflow_plan_node=dataflow_plan.sink_node,
+                sql_query_plan_id=None,
+                nodes_to_convert_to_cte=frozenset(DataflowPlanAnalyzer.find_common_branches(dataflow_plan)),
+                optimizers=(),
+                spec_output_order=(),
+            ).sql_plan.render_node,
+        )
+        optimizer_pipeline = SqlOptimizerPipeline(
+            SqlGenerationOptionSet.options_for_level(
+                SqlOptimizationLevel.O4, use_column_alias_in_group_by=False
+            ).optimizers
+        )
+        optimized_sql_node = recorder.measure(
+            PlanningPhase.SQL_OPTIMIZATION, lambda: optimizer_pipeline.optimize(unoptimized_sql_node).optimized_node
+        )
+        recorder.measure(
+            PlanningPhase.SQL_RENDERING,
+            lambda: self._sql_client.sql_plan_renderer.render_sql_plan(SqlPlan(optimized_sql_node)),
+        )
+
+    @staticmethod
+    def _build_linkable_spec_index(semantic_manifest: PydanticSemanticManifest) -> LinkableSpecIndex:
+        return LinkableSpecIndexBuilder(
+            semantic_manifest=semantic_manifest,
+            semantic_model_lookup=SemanticModelLookup(
+                model=semantic_manifest,
+                custom_granularities=TimeSpineSource.build_custom_granularities(
+                    list(TimeSpineSource.build_standard_time_spine_sources(semantic_manifest).values())
+                ),
+            ),
+            manifest_object_lookup=SemanticManifestObjectLookup(semantic_manifest),
+            max_entity_links=MAX_JOIN_HOPS,
+        ).build_index()
+
+    def _create_engine(
+        self, semantic_manifest: PydanticSemanticManifest, linkable_spec_index: Optional[LinkableSpecIndex]
+    ) -> SemanticManifestLookup:
+        semantic_manifest_lookup = SemanticManifestLookup(semantic_manifest, linkable_spec_index=linkable_spec_index)
+        MetricFlowEngine(
+            semantic_manifest_lookup=semantic_manifest_lookup,
+            sql_client=self._sql_client,
+            time_source=ConfigurableTimeSource(as_datetime("2020-01-01")),
+            column_association_resolver=DunderColumnAssociationResolver(),
+        )
+        return semantic_manifest_lookup
+
+    @staticmethod
+    def _create_planners(
+        semantic_manifest_lookup: SemanticManifestLookup,
+    ) -> Tuple[DataflowPlanBuilder, DataflowToSqlPlanConverter]:
+        column_association_resolver = DunderColumnAssociationResolver()
+        data_set_converter = SemanticModelToDataSetConverter(column_association_resolver=column_association_resolver)
+        source_node_builder = SourceNodeBuilder(
+            column_association_resolver=column_association_resolver,
+            semantic_manifest_lookup=semantic_manifest_lookup,
+        )
+        source_node_set = source_node_builder.create_from_data_sets(
+            [
+                data_set_converter.create_sql_source_data_set(semantic_model)
+                for semantic_model in semantic_manifest_lookup.semantic_manifest.semantic_models
+            ]
+        )
+        node_output_resolver = DataflowNodeToSqlSubqueryVisitor(
+            column_association_resolver=column_association_resolver,
+            semantic_manifest_lookup=semantic_manifest_lookup,
+        )
+        node_output_resolver.cache_output_data_sets(source_node_set.all_nodes)
+        dataflow_plan_builder = DataflowPlanBuilder(
+            source_node_set=source_node_set,
+            semantic_manifest_lookup=semantic_manifest_lookup,
+            node_output_resolver=node_output_resolver,
+            column_association_resolver=column_association_resolver,
+            source_node_builder=source_node_builder,
+        )
+        to_sql_plan_converter = DataflowToSqlPlanConverter(
+            column_association_resolver=column_association_resolver,
+            semantic_manifest_lookup=semantic_manifest_lookup,
+        )
+        return dataflow_plan_builder, to_sql_plan_converter
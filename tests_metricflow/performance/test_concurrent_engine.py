@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Mapping, Sequence, Tuple
+
+import pytest
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+
+from metricflow.engine.metricflow_engine import MetricFlowEngine, MetricFlowQueryRequest
+from tests_metricflow.fixtures.manifest_fixtures import MetricFlowEngineTestFixture, SemanticManifestSetup
+
+logger = logging.getLogger(__name__)
+
+_WORKER_COUNTS = (1, 2, 4, 8)
+_REQUESTS_PER_RUN = 64
+
+
+def _create_requests() -> Sequence[MetricFlowQueryRequest]:
+    return (
+        MetricFlowQueryRequest.create_with_random_request_id(saved_query_name="p0_booking"),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings", "booking_value"), group_by_names=("metric_time__month",)
+        ),
+        MetricFlowQueryRequest.create_with_random_request_id(metric_names=("listings",), group_by_names=("user",)),
+        MetricFlowQueryRequest.create_with_random_request_id(
+            metric_names=("bookings",),
+            group_by_names=("metric_time__day", "listing__country_latest"),
+            where_constraints=("{{ Dimension('booking__is_instant') }}",),
+        ),
+    )
+
+
+def _measure_throughput(
+    handle_request: Callable[[MetricFlowQueryRequest], str], worker_count: int
+) -> Tuple[float, Sequence[str]]:
+    """Run a fixed number of requests using the given number of threads and return the requests / second and results."""
+    requests = _create_requests()
+    requests_to_run = [requests[i % len(requests)] for i in range(_REQUESTS_PER_RUN)]
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        results = list(executor.map(handle_request, requests_to_run))
+    return _REQUESTS_PER_RUN / (time.perf_counter() - start_time), results
+
+
+def _run_stress_test(handle_request: Callable[[MetricFlowQueryRequest], str], description: str) -> None:
+    expected_results = [handle_request(request) for request in _create_requests()]
+    worker_count_to_throughput: Dict[int, float] = {}
+    for worker_count in _WORKER_COUNTS:
+        throughput, results = _measure_throughput(handle_request, worker_count)
+        worker_count_to_throughput[worker_count] = throughput
+        # Results should not depend on the other requests that are running concurrently.
+        for i, result in enumerate(results):
+            assert result == expected_results[i % len(expected_results)]
+
+    logger.info(
+        LazyFormat(
+            "Measured throughput of the engine",
+            description=description,
+            worker_count_to_requests_per_second={
+                worker_count: f"{throughput:.1f}" for worker_count, throughput in worker_count_to_throughput.items()
+            },
+        )
+    )
+    # Shared state should not serialize requests to the point where adding workers reduces the throughput
+    # significantly. Planning is CPU-bound, so the throughput of explain requests is limited by the GIL.
+    assert worker_count_to_throughput[max(_WORKER_COUNTS)] > 0.5 * worker_count_to_throughput[min(_WORKER_COUNTS)]
+
+
+@pytest.mark.slow
+def test_concurrent_explain_throughput(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture]
+) -> None:
+    """Measure the throughput of a shared engine generating SQL for requests from a varying number of threads."""
+    mf_engine: MetricFlowEngine = mf_engine_test_fixture_mapping[
+        SemanticManifestSetup.SIMPLE_MANIFEST
+    ].metricflow_engine
+    _run_stress_test(
+        handle_request=lambda request: mf_engine.explain(request).sql_statement.sql,
+        description="explain",
+    )
+
+
+@pytest.mark.slow
+def test_concurrent_query_throughput(
+    mf_engine_test_fixture_mapping: Mapping[SemanticManifestSetup, MetricFlowEngineTestFixture],
+    create_source_tables: bool,
+) -> None:
+    """Measure the throughput of a shared engine running queries from a varying number of threads."""
+    mf_engine: MetricFlowEngine = mf_engine_test_fixture_mapping[
+        SemanticManifestSetup.SIMPLE_MANIFEST
+    ].metricflow_engine
+
+    def _run_query(request: MetricFlowQueryRequest) -> str:
+        result = mf_engine.query(request)
+        assert result.result_df is not None
+        return result.result_df.sorted().text_format()
+
+    _run_stress_test(handle_request=_run_query, description="query")
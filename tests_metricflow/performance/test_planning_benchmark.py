@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+
+import pytest
+from metricflow_semantics.test_helpers.config_helpers import DirectoryPathAnchor
+from metricflow_semantics.test_helpers.synthetic_manifest.synthetic_manifest_parameter_set import (
+    SyntheticManifestParameterSet,
+)
+
+from metricflow.protocols.sql_client import SqlClient, SqlEngine
+from tests_metricflow.performance.planning_benchmark import (
+    PhaseMeasurement,
+    PlanningBenchmark,
+    PlanningBenchmarkBaseline,
+    PlanningBenchmarkCase,
+    PlanningBenchmarkResult,
+    PlanningPhase,
+)
+
+logger = logging.getLogger(__name__)
+
+_BASELINE_FILE_PATH = DirectoryPathAnchor().directory.joinpath("planning_benchmark_baseline.json")
+
+
+def _create_case(
+    name: str, semantic_model_count: int, elements_per_semantic_model: int, max_metric_depth: int, max_metric_width: int
+) -> PlanningBenchmarkCase:
+    return PlanningBenchmarkCase(
+        name=name,
+        parameter_set=SyntheticManifestParameterSet(
+            measure_semantic_model_count=semantic_model_count,
+            measures_per_semantic_model=elements_per_semantic_model,
+            dimension_semantic_model_count=semantic_model_count,
+            categorical_dimensions_per_semantic_model=elements_per_semantic_model,
+            max_metric_depth=max_metric_depth,
+            max_metric_width=max_metric_width,
+            saved_query_count=1,
+            metrics_per_saved_query=3,
+            categorical_dimensions_per_saved_query=3,
+        ),
+    )
+
+
+# The synthetic manifests join every semantic model through a common entity, so the sweep varies the number of
+# semantic models, the number of elements in each, and the depth / width of the derived metrics.
+_BENCHMARK_CASES = (
+    _create_case(
+        "small", semantic_model_count=5, elements_per_semantic_model=5, max_metric_depth=1, max_metric_width=5
+    ),
+    _create_case(
+        "medium", semantic_model_count=10, elements_per_semantic_model=10, max_metric_depth=2, max_metric_width=10
+    ),
+    _create_case(
+        "large", semantic_model_count=20, elements_per_semantic_model=10, max_metric_depth=2, max_metric_width=20
+    ),
+)
+
+
+@pytest.mark.slow
+def test_planning_benchmark(request: pytest.FixtureRequest, sql_client: SqlClient) -> None:
+    """Check the planning performance against the baseline.
+
+    This is marked as slow, so it's not a part of the default test runs. Runtimes are compared after scaling them by a
+    reference workload measured in the same run, so the baseline can be used on other machines.
+
+    To update the baseline after an expected change (or a change to the benchmark cases), run:
+
+        pytest --overwrite-planning-benchmark-baseline tests_metricflow/performance/test_planning_benchmark.py
+    """
+    if sql_client.sql_engine_type is not SqlEngine.DUCKDB:
+        pytest.skip("The planning benchmark baseline was recorded with DuckDB.")
+
+    planning_benchmark = PlanningBenchmark(sql_client)
+    results = tuple(planning_benchmark.run(case) for case in _BENCHMARK_CASES)
+
+    if request.config.getoption("overwrite_planning_benchmark_baseline"):
+        PlanningBenchmarkBaseline(results={result.case_name: result for result in results}).write(_BASELINE_FILE_PATH)
+        return
+
+    regressions = PlanningBenchmarkBaseline.read(_BASELINE_FILE_PATH).find_regressions(
+        results, tolerance=request.config.getoption("planning_benchmark_tolerance")
+    )
+    assert len(regressions) == 0, "Found planning performance regressions:\n" + "\n".join(
+        regression.ui_description for regression in regressions
+    )
+
+
+def test_planning_benchmark_phases(sql_client: SqlClient) -> None:  # noqa: D103
+    result = PlanningBenchmark(sql_client, repetitions=1).run(_BENCHMARK_CASES[0])
+
+    assert set(result.phase_measurements) == {phase.value for phase in PlanningPhase}
+    assert all(measurement.runtime > 0 for measurement in result.phase_measurements.values())
+    assert result.phase_measurements[PlanningPhase.ENGINE_STARTUP.value].peak_memory > 0
+
+
+def test_find_regressions() -> None:  # noqa: D103
+    baseline = PlanningBenchmarkBaseline(
+        results={
+            "case": PlanningBenchmarkResult(
+                case_name="case",
+                phase_measurements={
+                    "slow_phase": PhaseMeasurement(runtime=1.0, peak_memory=10_000_000),
+                    "fast_phase": PhaseMeasurement(runtime=0.001, peak_memory=1000),
+                },
+                reference_runtime=0.1,
+            )
+        }
+    )
+    result = PlanningBenchmarkResult(
+        case_name="case",
+        phase_measurements={
+            "slow_phase": PhaseMeasurement(runtime=1.6, peak_memory=14_000_000),
+            # Large relative increases in small measurements are considered noise.
+            "fast_phase": PhaseMeasurement(runtime=0.005, peak_memory=5000),
+        },
+        reference_runtime=0.1,
+    )
+    other_result = PlanningBenchmarkResult(
+        case_name="case_without_baseline", phase_measurements={}, reference_runtime=0.1
+    )
+
+    regressions = baseline.find_regressions((result, other_result), tolerance=0.5)
+    assert tuple(
+        (regression.phase_name, regression.measurement_name, regression.current_value) for regression in regressions
+    ) == (
+        ("slow_phase", "runtime", 1.6),
+    )
+    assert len(baseline.find_regressions((result,), tolerance=1.0)) == 0
+
+
+def test_find_regressions_on_slower_machine() -> None:
+    """Check that runtimes are compared relative to the reference runtime."""
+    baseline = PlanningBenchmarkBaseline(
+        results={
+            "case": PlanningBenchmarkResult(
+                case_name="case",
+                phase_measurements={"phase": PhaseMeasurement(runtime=1.0, peak_memory=0)},
+                reference_runtime=0.1,
+            )
+        }
+    )
+
+    def _create_result(runtime: float) -> PlanningBenchmarkResult:
+        # The reference workload is twice as slow as when the baseline was recorded.
+        return PlanningBenchmarkResult(
+            case_name="case",
+            phase_measurements={"phase": PhaseMeasurement(runtime=runtime, peak_memory=0)},
+            reference_runtime=0.2,
+        )
+
+    assert len(baseline.find_regressions((_create_result(2.5),), tolerance=0.5)) == 0
+    regressions = baseline.find_regressions((_create_result(3.5),), tolerance=0.5)
+    assert tuple((regression.baseline_value, regression.current_value) for regression in regressions) == ((2.0, 3.5),)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import logging
+import re
+import time
+from typing import Tuple
+
+import pytest
+from metricflow_semantics.dag.sequential_id import SequentialIdGenerator
+from metricflow_semantics.mf_logging.lazy_formattable import LazyFormat
+from metricflow_semantics.query.query_parser import MetricFlowQueryParser
+from typing_extensions import override
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.dataflow_plan import DataflowPlan, DataflowPlanNode
+from metricflow.dataflow.optimizer.source_scan.branch_signature import BranchSignature, BranchSignatureResolver
+from metricflow.dataflow.optimizer.source_scan.source_scan_optimizer import SourceScanOptimizer
+
+logger = logging.getLogger(__name__)
+
+# Simple, derived, and ratio metrics that are computed from a handful of semantic models.
+_WIDE_QUERY_METRIC_NAMES = (
+    "bookings",
+    "booking_value",
+    "instant_bookings",
+    "instant_booking_value",
+    "bookers",
+    "listings",
+    "views",
+    "booking_fees",
+    "booking_fees_per_booker",
+    "views_times_booking_value",
+    "booking_value_sub_instant",
+    "booking_value_sub_instant_add_10",
+    "booking_value_per_view",
+    "derived_bookings_0",
+    "derived_bookings_1",
+    "bookings_per_view",
+    "bookings_per_listing",
+    "bookings_offset_once",
+    "bookings_growth_2_weeks_fill_nulls_with_0",
+    "double_counted_delayed_bookings",
+)
+_ITERATION_COUNT = 20
+
+
+class _UngroupedBranchSignatureResolver(BranchSignatureResolver):
+    """Returns the same signature for all branches, so the optimizer tries to combine every pair of branches."""
+
+    @override
+    def get_signature(self, branch: DataflowPlanNode) -> BranchSignature:
+        return ()
+
+
+class _UngroupedSourceScanOptimizer(SourceScanOptimizer):
+    def __init__(self) -> None:  # noqa: D107
+        super().__init__()
+        self._branch_signature_resolver = _UngroupedBranchSignatureResolver()
+
+
+def _optimize(dataflow_plan: DataflowPlan, use_signature_groups: bool) -> Tuple[float, str]:
+    """Optimize the plan and return the average runtime and the structure of the optimized plan without node IDs."""
+    start_time = time.perf_counter()
+    optimized_plan = dataflow_plan
+    for _ in range(_ITERATION_COUNT):
+        optimizer = SourceScanOptimizer() if use_signature_groups else _UngroupedSourceScanOptimizer()
+        with SequentialIdGenerator.id_number_space(0):
+            optimized_plan = optimizer.optimize(dataflow_plan)
+    runtime = (time.perf_counter() - start_time) / _ITERATION_COUNT
+    # Node IDs can differ as the ungrouped optimizer creates nodes when trying to combine branches that can't be
+    # combined.
+    return runtime, re.sub(r"id_str='[a-z_]+\d+'", "id_str=''", optimized_plan.structure_text())
+
+
+@pytest.mark.slow
+def test_wide_derived_metric_query(
+    dataflow_plan_builder: DataflowPlanBuilder,
+    query_parser: MetricFlowQueryParser,
+) -> None:
+    """Compare the optimizer runtime with and without grouping branches by signature for a query with many metrics."""
+    query_spec = query_parser.parse_and_validate_query(
+        metric_names=_WIDE_QUERY_METRIC_NAMES,
+        group_by_names=("metric_time__day",),
+    ).query_spec
+    dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
+
+    grouped_runtime, grouped_plan_text = _optimize(dataflow_plan, use_signature_groups=True)
+    ungrouped_runtime, ungrouped_plan_text = _optimize(dataflow_plan, use_signature_groups=False)
+    logger.info(
+        LazyFormat(
+            "Measured source scan optimizer runtime",
+            metric_count=len(_WIDE_QUERY_METRIC_NAMES),
+            runtime_with_signature_groups=f"{grouped_runtime * 1000:.2f}ms",
+            runtime_without_signature_groups=f"{ungrouped_runtime * 1000:.2f}ms",
+        )
+    )
+    assert grouped_plan_text == ungrouped_plan_text
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pytest
+from metricflow_semantics.query.query_parser import MetricFlowQueryParser
+
+from metricflow.dataflow.builder.dataflow_plan_builder import DataflowPlanBuilder
+from metricflow.dataflow.dataflow_plan_analyzer import DataflowPlanAnalyzer
+from metricflow.plan_conversion.to_sql_plan.dataflow_to_sql import DataflowToSqlPlanConverter
+from metricflow.sql.optimizer.column_pruning.column_pruner import SqlColumnPrunerOptimizer
+from metricflow.sql.optimizer.optimization_levels import SqlGenerationOptionSet, SqlOptimizationLevel
+from metricflow.sql.optimizer.optimizer_pipeline import SqlOptimizerPipeline
+from metricflow.sql.optimizer.rewriting_sub_query_reducer import SqlRewritingSubQueryReducer
+from metricflow.sql.optimizer.table_alias_simplifier import SqlTableAliasSimplifier
+from metricflow.sql.render.sql_plan_renderer import DefaultSqlPlanRenderer
+from metricflow.sql.sql_plan import SqlPlan, SqlPlanNode
+
+
+@pytest.fixture
+def unoptimized_sql_node(
+    dataflow_plan_builder: DataflowPlanBuilder,
+    query_parser: MetricFlowQueryParser,
+    dataflow_to_sql_converter: DataflowToSqlPlanConverter,
+) -> SqlPlanNode:
+    """The SQL for a query with joins and CTEs, before optimization."""
+    query_spec = query_parser.parse_and_validate_query(
+        metric_names=("bookings", "views", "bookings_per_view"),
+        group_by_names=("metric_time__day", "listing__country_latest"),
+    ).query_spec
+    dataflow_plan = dataflow_plan_builder.build_plan(query_spec)
+    return dataflow_to_sql_converter.convert_using_specifics(
+        dataflow_plan_node=dataflow_plan.sink_node,
+        sql_query_plan_id=None,
+        nodes_to_convert_to_cte=frozenset(DataflowPlanAnalyzer.find_common_branches(dataflow_plan)),
+        optimizers=(),
+        spec_output_order=(),
+    ).sql_plan.render_node
+
+
+def _render(node: SqlPlanNode) -> str:
+    return DefaultSqlPlanRenderer().render_sql_plan(SqlPlan(node)).sql
+
+
+@pytest.mark.parametrize("use_column_alias_in_group_by", [False, True])
+@pytest.mark.parametrize("optimization_level", list(SqlOptimizationLevel))
+def test_fused_optimizers(  # noqa: D103
+    unoptimized_sql_node: SqlPlanNode,
+    optimization_level: SqlOptimizationLevel,
+    use_column_alias_in_group_by: bool,
+) -> None:
+    optimizers = SqlGenerationOptionSet.options_for_level(
+        optimization_level, use_column_alias_in_group_by=use_column_alias_in_group_by
+    ).optimizers
+
+    fused_result = SqlOptimizerPipeline(optimizers).optimize(unoptimized_sql_node)
+    unfused_result = SqlOptimizerPipeline(optimizers, fuse_optimizers=False).optimize(unoptimized_sql_node)
+
+    assert _render(fused_result.optimized_node) == _render(unfused_result.optimized_node)
+    assert len(unfused_result.pass_stats) == len(optimizers)
+    assert sum(len(pass_stats.optimizer_names) for pass_stats in fused_result.pass_stats) == len(optimizers)
+
+
+def test_pass_stats(unoptimized_sql_node: SqlPlanNode) -> None:  # noqa: D103
+    result = SqlOptimizerPipeline(
+        (SqlColumnPrunerOptimizer(), SqlRewritingSubQueryReducer(), SqlTableAliasSimplifier())
+    ).optimize(unoptimized_sql_node)
+
+    assert tuple(pass_stats.optimizer_names for pass_stats in result.pass_stats) == (
+        ("SqlColumnPrunerOptimizer",),
+        ("SqlRewritingSubQueryReducer",),
+        ("SqlTableAliasSimplifier",),
+    )
+    assert all(pass_stats.rewritten_node_count > 0 for pass_stats in result.pass_stats)
+    assert all(pass_stats.runtime >= 0 for pass_stats in result.pass_stats)
+
+    # The pruner and the simplifier are fused when they are next to each other.
+    result = SqlOptimizerPipeline((SqlColumnPrunerOptimizer(), SqlTableAliasSimplifier())).optimize(
+        unoptimized_sql_node
+    )
+    assert tuple(pass_stats.optimizer_names for pass_stats in result.pass_stats) == (
+        ("SqlColumnPrunerOptimizer", "SqlTableAliasSimplifier"),
+    )
+
+
+def test_unchanged_plan_is_not_rebuilt(unoptimized_sql_node: SqlPlanNode) -> None:
+    """Check that optimizing a plan that can't be optimized further returns the same node."""
+    optimizer_pipeline = SqlOptimizerPipeline((SqlColumnPrunerOptimizer(), SqlTableAliasSimplifier()))
+    optimized_node = optimizer_pipeline.optimize(unoptimized_sql_node).optimized_node
+
+    result = optimizer_pipeline.optimize(optimized_node)
+    assert result.optimized_node is optimized_node
+    assert tuple(pass_stats.rewritten_node_count for pass_stats in result.pass_stats) == (0,)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import datetime
 import logging
 from decimal import Decimal
 
 import pytest
 
-from metricflow.data_table.mf_table import MetricFlowDataTable
+from metricflow.data_table.mf_table import MetricFlowDataTable, _MetricFlowDataTableBuilder
 from tests_metricflow.sql.compare_data_table import check_data_tables_are_equal
 
 logger = logging.getLogger(__name__)
@@ -122,3 +123,55 @@ def test_get_cell_value(example_table: MetricFlowDataTable) -> None:  # noqa: D1
 def test_column_values_iterator(example_table: MetricFlowDataTable) -> None:  # noqa: D103
     assert tuple(example_table.column_values_iterator(0)) == (0, 1)
     assert tuple(example_table.column_values_iterator(1)) == ("a", "b")
+
+
+def test_create_from_columns(example_table: MetricFlowDataTable) -> None:  # noqa: D103
+    table_from_columns = MetricFlowDataTable.create_from_columns(
+        column_names=["col_0", "col_1"],
+        columns=[
+            (0, 1),
+            ("a", "b"),
+        ],
+    )
+    check_data_tables_are_equal(
+        expected_table=example_table,
+        actual_table=table_from_columns,
+        ignore_order=False,
+    )
+    assert table_from_columns.rows == example_table.rows == ((0, "a"), (1, "b"))
+
+
+def test_create_from_columns_converts_types() -> None:  # noqa: D103
+    table = MetricFlowDataTable.create_from_columns(
+        column_names=["col_0", "col_1"],
+        columns=[
+            (Decimal(0), None),
+            (None, datetime.date(2020, 1, 1)),
+        ],
+    )
+    assert tuple(column_description.column_type for column_description in table.column_descriptions) == (
+        float,
+        datetime.datetime,
+    )
+    assert table.rows == ((0.0, None), (None, datetime.datetime(2020, 1, 1)))
+
+
+def test_invalid_column_length() -> None:  # noqa: D103
+    with pytest.raises(ValueError):
+        MetricFlowDataTable.create_from_columns(
+            column_names=["col_0", "col_1"],
+            columns=[
+                (1, 2),
+                ("a",),
+            ],
+        )
+
+
+def test_mixed_rows_and_columns() -> None:  # noqa: D103
+    builder = _MetricFlowDataTableBuilder(["col_0", "col_1"])
+    builder.add_row((0, "a"))
+    builder.add_columns([(1, 2), ("b", None)])
+    builder.add_row((3, "d"))
+    table = builder.build()
+    assert table.rows == ((0, "a"), (1, "b"), (2, None), (3, "d"))
+    assert table.column_descriptions[1].column_type is str
@@ -134,3 +134,13 @@ def test_update_params_with_same_key_different_values() -> None:  # noqa: D103
 
     with pytest.raises(RuntimeError):
         bind_params0.merge(bind_params1)
+
+
+def test_query_in_batches(sql_client: SqlClient) -> None:  # noqa: D103
+    stmt = "SELECT 1 AS y UNION ALL SELECT 2 AS y UNION ALL SELECT 3 AS y"
+    batches = tuple(sql_client.query_in_batches(stmt, batch_size=2))
+    assert sum(batch.row_count for batch in batches) == 3
+    assert all(batch.row_count <= 2 for batch in batches)
+    for batch in batches:
+        assert tuple(column_name.lower() for column_name in batch.column_names) == ("y",)
+    assert {value for batch in batches for value in batch.column_values_iterator(0)} == {1, 2, 3}
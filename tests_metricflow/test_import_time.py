@@ -0,0 +1,104 @@
+"""Tests that the modules loaded on startup stay within a budget so that the CLI and the library start quickly.
+
+The number of loaded modules is used as the budget instead of the time as it doesn't depend on the machine. Modules
+that are only needed by some commands should be imported when they're first used.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import textwrap
+from typing import Sequence, Set
+
+
+def _get_loaded_modules(python_code: str) -> Set[str]:
+    """Run the code in a new interpreter and return the names of the modules that were loaded."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            textwrap.dedent(python_code)
+            + "\n"
+            + textwrap.dedent(
+                """\
+                import json as _json
+                import sys as _sys
+
+                print(_json.dumps(sorted(_sys.modules)))
+                """
+            ),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    # `mf --help` also writes to stdout, so the module names are on the last line.
+    return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+def _check_modules(
+    loaded_modules: Set[str], max_module_count: int, unexpected_module_prefixes: Sequence[str] = ()
+) -> None:
+    unexpected_modules = sorted(
+        module
+        for module in loaded_modules
+        for prefix in unexpected_module_prefixes
+        if module == prefix or module.startswith(prefix + ".")
+    )
+    assert len(unexpected_modules) == 0, f"These modules should be imported when first used: {unexpected_modules}"
+    assert len(loaded_modules) <= max_module_count, (
+        f"{len(loaded_modules)} modules were loaded, but the budget is {max_module_count}. If the new modules are only "
+        f"needed by some commands, import them when they're first used."
+    )
+
+
+def test_cli_help_import_budget() -> None:  # noqa: D103
+    loaded_modules = _get_loaded_modules(
+        """\
+        from dbt_metricflow.cli.main import cli
+
+        try:
+            cli(["--help"])
+        except SystemExit:
+            pass
+        """
+    )
+    _check_modules(
+        loaded_modules,
+        max_module_count=400,
+        unexpected_module_prefixes=(
+            "dbt",
+            "dbt_metricflow.cli.dbt_connectors",
+            "dbt_metricflow.cli.tutorial",
+            "dbt_semantic_interfaces.validations",
+            "graphviz",
+            "jinja2",
+            "metricflow.engine",
+            "metricflow.sql.render",
+            "metricflow.validation",
+            "metricflow_semantics.model",
+            "update_checker",
+        ),
+    )
+
+
+def test_library_import_budget() -> None:  # noqa: D103
+    _check_modules(_get_loaded_modules("import metricflow"), max_module_count=60)
+    _check_modules(
+        _get_loaded_modules("import metricflow.engine.metricflow_engine"),
+        max_module_count=950,
+        unexpected_module_prefixes=(
+            "dbt",
+            "graphviz",
+            "metricflow.sql.render.big_query",
+            "metricflow.sql.render.databricks",
+            "metricflow.sql.render.duckdb_renderer",
+            "metricflow.sql.render.postgres",
+            "metricflow.sql.render.redshift",
+            "metricflow.sql.render.snowflake",
+            "metricflow.sql.render.trino",
+            "rapidfuzz",
+            "tabulate",
+        ),
+    )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import threading
 from copy import deepcopy
-from typing import Tuple
+from typing import Iterator, List, Tuple
 
 import pytest
 from _pytest.fixtures import FixtureRequest
@@ -17,7 +18,9 @@ from dbt_semantic_interfaces.type_enums.aggregation_type import AggregationType
 from metricflow_semantics.sql.sql_bind_parameters import SqlBindParameterSet
 from metricflow_semantics.test_helpers.config_helpers import MetricFlowTestConfiguration
 
-from metricflow.protocols.sql_client import SqlClient
+from metricflow.data_table.mf_table import MetricFlowDataTable
+from metricflow.protocols.sql_client import SqlClient, SqlEngine
+from metricflow.sql.render.sql_plan_renderer import SqlPlanRenderer
 from metricflow.validation.data_warehouse_model_validator import (
     DataWarehouseModelValidator,
     DataWarehouseTaskBuilder,
@@ -86,6 +89,101 @@ def test_task_runner(sql_client: SqlClient, mf_test_configuration: MetricFlowTes
     assert err_msg_bad in issues.errors[0].message
 
 
+class _RecordingSqlClient(SqlClient):
+    """Records the dry runs, and blocks dry runs of statements containing `blocked` until the test finishes."""
+
+    def __init__(self, sql_client: SqlClient) -> None:  # noqa: D107
+        self._sql_client = sql_client
+        self.dry_run_statements: List[str] = []
+        self.unblock_event = threading.Event()
+
+    @property
+    def sql_engine_type(self) -> SqlEngine:  # noqa: D102
+        return self._sql_client.sql_engine_type
+
+    @property
+    def sql_plan_renderer(self) -> SqlPlanRenderer:  # noqa: D102
+        return self._sql_client.sql_plan_renderer
+
+    def query(  # noqa: D102
+        self, stmt: str, sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet()
+    ) -> MetricFlowDataTable:
+        return self._sql_client.query(stmt, sql_bind_parameter_set)
+
+    def query_in_batches(  # noqa: D102
+        self, stmt: str, sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet(), batch_size: int = 1
+    ) -> Iterator[MetricFlowDataTable]:
+        return self._sql_client.query_in_batches(stmt, sql_bind_parameter_set, batch_size)
+
+    def execute(
+        self, stmt: str, sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet()
+    ) -> None:  # noqa: D102
+        self._sql_client.execute(stmt, sql_bind_parameter_set)
+
+    def dry_run(
+        self, stmt: str, sql_bind_parameter_set: SqlBindParameterSet = SqlBindParameterSet()
+    ) -> None:  # noqa: D102
+        self.dry_run_statements.append(stmt)
+        if "blocked" in stmt:
+            self.unblock_event.wait()
+        self._sql_client.dry_run(stmt, sql_bind_parameter_set)
+
+    def close(self) -> None:  # noqa: D102
+        self._sql_client.close()
+
+    def render_bind_parameter_key(self, bind_parameter_key: str) -> str:  # noqa: D102
+        return self._sql_client.render_bind_parameter_key(bind_parameter_key)
+
+
+def _create_task(query: str, subtasks: Tuple[DataWarehouseValidationTask, ...] = ()) -> DataWarehouseValidationTask:
+    return DataWarehouseValidationTask(
+        query_and_params_callable=lambda: (query, SqlBindParameterSet()),
+        description=f"Validating {query}",
+        error_message=f"Failed: {query}",
+        on_fail_subtasks=list(subtasks),
+    )
+
+
+def test_task_runner_parallelism(sql_client: SqlClient) -> None:
+    """Check that the issues are in the order of the tasks when running tasks concurrently."""
+    tasks = []
+    for i in range(10):
+        good_query = f"SELECT {i} AS col0"
+        bad_query = f"SELECT {i} AS col0 FROM doesnt_exist_{i}"
+        tasks.append(_create_task(good_query))
+        tasks.append(_create_task(bad_query, subtasks=(_create_task(good_query), _create_task(bad_query))))
+
+    issue_messages = [
+        issue.message.split("\n")[0]
+        for issue in DataWarehouseModelValidator(sql_client=sql_client, parallelism=4).run_tasks(tasks).all_issues
+    ]
+    assert issue_messages == [
+        issue.message.split("\n")[0]
+        for issue in DataWarehouseModelValidator(sql_client=sql_client).run_tasks(tasks).all_issues
+    ]
+    assert len(issue_messages) == 20
+    assert issue_messages[:2] == ["Failed: SELECT 0 AS col0 FROM doesnt_exist_0"] * 2
+
+
+def test_task_runner_timeouts(sql_client: SqlClient) -> None:  # noqa: D103
+    recording_sql_client = _RecordingSqlClient(sql_client)
+    tasks = [_create_task("SELECT 'blocked' AS col0"), _create_task("SELECT 'foo' AS col0")]
+    try:
+        issues = DataWarehouseModelValidator(
+            sql_client=recording_sql_client, parallelism=2, task_timeout=0.1
+        ).run_tasks(tasks)
+        assert len(issues.errors) == 1
+        assert "did not complete within the timeout" in issues.errors[0].message
+        assert "blocked" in issues.errors[0].message
+
+        tasks.append(_create_task("SELECT 'blocked' AS col1"))
+        issues = DataWarehouseModelValidator(sql_client=recording_sql_client, parallelism=2).run_tasks(tasks, timeout=0)
+        assert len(issues.warnings) == 1
+        assert "Hit timeout before completing all tasks" in issues.warnings[0].message
+    finally:
+        recording_sql_client.unblock_event.set()
+
+
 def test_validate_semantic_models(  # noqa: D103
     dw_backed_warehouse_validation_model: PydanticSemanticManifest,
     sql_client: SqlClient,
@@ -154,6 +252,30 @@ def test_validate_dimensions(  # noqa: D103
     assert len(issues.all_issues) == 2
 
 
+def test_validate_dimensions_with_bisection(  # noqa: D103
+    dw_backed_warehouse_validation_model: PydanticSemanticManifest,
+    sql_client: SqlClient,
+) -> None:
+    model = deepcopy(dw_backed_warehouse_validation_model)
+    dimensions = list(model.semantic_models[0].dimensions)
+    dimensions.append(PydanticDimension(name="doesnt_exist", type=DimensionType.CATEGORICAL))
+    model.semantic_models[0].dimensions = dimensions
+
+    recording_sql_client = _RecordingSqlClient(sql_client)
+    dw_validator = DataWarehouseModelValidator(sql_client=recording_sql_client, parallelism=4)
+    issues = dw_validator.validate_dimensions(model)
+
+    assert len(issues.all_issues) == 2
+    assert "Failed to query dimensions" in issues.all_issues[0].message
+    assert "Unable to query dimension `doesnt_exist`" in issues.all_issues[1].message
+    # The failing dimension should be found with fewer queries than checking each of the 13 dimensions.
+    subtask_count = len(
+        DataWarehouseTaskBuilder.gen_dimension_tasks(manifest=model, sql_client=sql_client)[0].on_fail_subtasks
+    )
+    assert subtask_count == 13
+    assert len(recording_sql_client.dry_run_statements) < 1 + subtask_count
+
+
 def test_build_entities_tasks(  # noqa: D103
     data_warehouse_validation_model: PydanticSemanticManifest,
     sql_client: SqlClient,